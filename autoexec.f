@@ -29,6 +29,11 @@ PROVIDED autoexec.f
 
 AUTOEXEC-NET
 
+\ ── Frozen image support ──────────────────────────────────────────────
+\ Loaded into the system dictionary, ahead of everything a frozen image
+\ is restored over.  See freeze.f.
+REQUIRE freeze.f
+
 \ ── Switch to userland ────────────────────────────────────────────────
 \ Switch to userland so subsequent modules and interactive definitions
 \ go to ext mem, conserving the system dictionary.
@@ -36,16 +41,28 @@ AUTOEXEC-NET
 _ENTER-UL
 
 \ ── Load user modules (into userland dictionary) ──────────────────────
+\ bsky-tui.f is the whole client: bsky.f, its write and profile modules
+\ and the TUI.  (A headless reader would REQUIRE bsky.f alone; the rest
+\ then loads on first use.)  bsky.img, when the disk builder made one
+\ with freeze.py, is all of it already loaded; it is restored while the
+\ sources it was built from are unchanged, else the client is loaded
+\ from source.  Everything above this line went into building the
+\ image: edit it and the image must be rebuilt (a stale one is simply
+\ not used).
 
-REQUIRE bsky.f
+FRZ-LOAD bsky.img bsky-tui.f
 
 REQUIRE config.f
 
 \ --- Login and enter TUI ---
+\ Resumes the session saved in bsky.ses with one refreshSession when
+\ it can, and only logs in from scratch when it cannot.
 ." [autoexec] Logging in..." CR
-BSK-MY-HANDLE BSK-MY-PASS BSK-LOGIN-WITH
+BSK-MY-HANDLE BSK-MY-PASS BSK-LOGIN-RESUME
 ." [autoexec] Fetching timeline..." CR
 0 BSK-TL-CURSOR-LEN !
 _BSK-TL-FETCH
+." [autoexec] Starting background refresh..." CR
+BSK-BG-START
 ." [autoexec] Ready.  Entering SCREENS..." CR
 SCREENS
@@ -36,10 +36,10 @@ echo "=========================================="
 echo ""
 echo "Boot sequence:"
 echo "  1. BIOS loads kdos.f from disk (first file)"
-echo "  2. KDOS runs autoexec.f → tools.f → bsky.f → config.f"
-echo "  3. BSK-LOGIN → SCREENS TUI"
+echo "  2. KDOS runs autoexec.f → bsky-tui.f (or bsky.img) → config.f"
+echo "  3. Resume bsky.ses (or BSK-LOGIN) → SCREENS TUI"
 echo ""
-echo "Topology: 1 full core + 1 micro-core cluster (4 MCUs)"
+echo "Topology: 2 full cores (UI + background refresh) + 1 micro-core cluster (4 MCUs)"
 echo ""
 echo "Controls:"
 echo "  [f]     → fetch / refresh"
@@ -56,6 +56,6 @@ exec $PYTHON cli.py \
     --bios bios.asm \
     --storage bsky-disk.img \
     --nic-tap mp64tap0 \
-    --cores 1 \
+    --cores 2 \
     --clusters 1 \
     "$@"
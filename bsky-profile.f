@@ -0,0 +1,82 @@
+\ bsky-profile.f — Profile viewer for bsky.f (§4.2)
+\
+\ Depends on: bsky.f
+\
+\ Deferred module: bsky.f's BSK-PROFILE stub loads this on first use.
+\
+\ Load with:   REQUIRE bsky-profile.f
+
+PROVIDED bsky-profile.f
+REQUIRE bsky.f
+
+\ ── §4.2  Profile Viewer ─────────────────────────────────────────
+\
+\  BSK-PROFILE ( "handle" -- )  View a user's profile.
+\
+\  Endpoint: GET /xrpc/app.bsky.actor.getProfile?actor=<handle>
+\  Response: {"did":"...","handle":"...","displayName":"...",
+\             "description":"...","followersCount":N,
+\             "followsCount":N,"postsCount":N,...}
+
+\ _BSK-PROFILE-PATH ( actor-addr actor-len -- path-addr path-len )
+\   Build profile request path with URL-encoded actor parameter.
+: _BSK-PROFILE-PATH  ( addr len -- path-addr path-len )
+    BSK-RESET
+    S" /xrpc/app.bsky.actor.getProfile?actor=" BSK-APPEND
+    URL-ENCODE
+    _BSK-SAVE-PATH ;
+
+\ Profile field plan — six top-level keys in one walk of the body.
+BSK-FP-PLAN _BSK-PR-PLAN
+BSK-FP-SLOT _BSK-PRF-NAME
+BSK-FP-SLOT _BSK-PRF-HANDLE
+BSK-FP-SLOT _BSK-PRF-DESC
+BSK-FP-SLOT _BSK-PRF-FC
+BSK-FP-SLOT _BSK-PRF-FG
+BSK-FP-SLOT _BSK-PRF-PC
+
+: _BSK-PR-PLAN-BUILD  ( -- )
+    _BSK-PR-PLAN BSK-FP-BEGIN
+    BSK-FP-ROOT S" displayName" _BSK-PRF-NAME BSK-FP-FIELD
+    BSK-FP-ROOT S" handle" _BSK-PRF-HANDLE BSK-FP-FIELD
+    BSK-FP-ROOT S" description" _BSK-PRF-DESC BSK-FP-FIELD
+    BSK-FP-ROOT S" followersCount" _BSK-PRF-FC BSK-FP-FIELD
+    BSK-FP-ROOT S" followsCount" _BSK-PRF-FG BSK-FP-FIELD
+    BSK-FP-ROOT S" postsCount" _BSK-PRF-PC BSK-FP-FIELD ;
+_BSK-PR-PLAN-BUILD
+
+\ _BSK-PR-PRINT ( body-addr body-len -- )
+\   Print a getProfile response body.
+: _BSK-PR-PRINT  ( addr len -- )
+    _BSK-PR-PLAN BSK-FP-WALK
+    _BSK-PRF-NAME BSK-FP-STR
+    DUP 0> IF 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
+    CR
+    _BSK-PRF-HANDLE BSK-FP-STR
+    DUP 0> IF ." @" 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
+    CR
+    _BSK-PRF-DESC BSK-FP-STR
+    DUP 0> IF 200 _BSK-TYPE-TRUNC ELSE 2DROP THEN
+    CR
+    _BSK-PRF-FC BSK-FP@ NIP IF _BSK-PRF-FC BSK-FP-NUM . ." followers  " THEN
+    _BSK-PRF-FG BSK-FP@ NIP IF _BSK-PRF-FG BSK-FP-NUM . ." following  " THEN
+    _BSK-PRF-PC BSK-FP@ NIP IF _BSK-PRF-PC BSK-FP-NUM . ." posts" THEN
+    CR ;
+
+\ _BSK-PROFILE-WITH ( actor-addr actor-len -- )
+\   Stack-based profile viewer (no input stream parsing).
+: _BSK-PROFILE-WITH  ( addr len -- )
+    BSK-ACCESS-LEN @ 0= IF 2DROP ." bsky: login first" CR EXIT THEN
+    _BSK-PROFILE-PATH BSK-GET      ( body-addr body-len )
+    DUP 0= IF 2DROP ." bsky: profile fetch failed" CR EXIT THEN
+    BSK-HTTP-STATUS @ 200 <> IF
+        ." bsky: profile error (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+        2DROP EXIT
+    THEN
+    _BSK-PR-PRINT ;
+
+: BSK-PROFILE  ( "handle" -- )
+    BSK-ACCESS-LEN @ 0= IF ." bsky: login first" CR EXIT THEN
+    BL WORD COUNT                   ( addr len )
+    DUP 0= IF 2DROP ." Usage: BSK-PROFILE handle" CR EXIT THEN
+    ['] _BSK-PROFILE-WITH _BSK-UI-RUN ;
@@ -0,0 +1,1998 @@
+\ bsky-tui.f — Interactive TUI for bsky.f (§6): caches, background
+\              refresh and the KDOS Bluesky screen
+\
+\ Depends on: bsky.f, bsky-write.f, bsky-profile.f, tools.f (TUI)
+\
+\ Loading this loads the whole client.  bsky.f's BSK-BG-START and
+\ BSK-MEM stubs also load it on first use.
+\
+\ Load with:   REQUIRE bsky-tui.f
+
+PROVIDED bsky-tui.f
+REQUIRE bsky.f
+REQUIRE bsky-write.f
+REQUIRE bsky-profile.f
+
+\ =====================================================================
+\  §6  Interactive TUI (KDOS Screens Integration)
+\ =====================================================================
+\
+\  Registers a Bluesky screen [9] with three subscreens:
+\    [Timeline]  [Notifs]  [Profile]
+\
+\  The screen is selectable (flag=1) — n/p navigates posts/items,
+\  Enter activates.  Per-screen key handler:
+\    f = fetch/refresh   l = like   t = repost   d = delete
+\    c = compose post    y = reply to selected post
+\
+\  Data is cached (§6.1) to avoid re-fetching on each screen
+\  redraw.  Press 'f' to fetch fresh data from the API; the
+\  fetch runs on a second core when there is one (§6.4).
+\  Timeline and Notifs are drawn as frames that resend only the
+\  rows a key changed (§6.5).
+
+\ ── §6.1  Cache Data Model ────────────────────────────────────────
+\
+\  Timeline posts and notifications are cached as index entries of
+\  (offset, length) cell pairs into a string arena (below); strings
+\  are stored whole, at their own length.  Author handles and DIDs
+\  are interned (below) and cached as 1-cell IDs.  The profile keeps
+\  its small fixed buffers.
+\
+\  The timeline and notification caches are double-buffered: two
+\  generations of each block live in XMEM, and one generation index
+\  (_BSK-TL-GEN) says which the screens read.  A fetch fills the
+\  other generation (_BSK-TL-WG is the store target) and publishes it
+\  with a single store to _BSK-TL-GEN — nothing is copied on publish,
+\  and a failed or partial fetch never touches what is on screen.
+\
+\  On the UI core a fetch publishes at once.  The background worker
+\  (§6.4) instead sets _BSK-TL-FRESH and the UI publishes at the
+\  start of its next render, so a render always reads one snapshot;
+\  the worker leaves the back generation alone until FRESH clears.
+\
+\  Timeline history.  A timeline generation holds pages of posts, not
+\  a fixed 10 slots.  Each post's index entry is the author's handle
+\  and DID IDs, then three pairs — text, URI, CID.  [f] starts a new
+\  history with the newest page; scrolling past the last post appends
+\  the next page by cursor (_BSK-TL-MORE), carrying the current pages
+\  over and evicting the oldest ones first so _BSK-TL-PG-RESERVE bytes
+\  stay free under BSK-TL-BUDGET.  Scrolling back reads the cache,
+\  never the network.
+\
+\  Timeline block layout:
+\    +N +NP +DROP  header cells   +PG +PB  page starts (post index,
+\    arena offset)   +IX  index entries   +AR  string arena
+
+\ ── String arena ──
+\   A bump-allocated byte region.  Header: +USED bytes handed out,
+\   +LIM bytes it may hand out; the bytes follow.  Strings are named
+\   by (offset, length) pairs, so a generation resets with one store
+\   and a run of strings moves with one CMOVE.
+
+0       CONSTANT _BSK-AR-USED
+1 CELLS CONSTANT _BSK-AR-LIM
+2 CELLS CONSTANT _BSK-AR-HDR
+
+\ _BSK-AR-RESET ( lim ar -- )  Empty the arena; allow lim bytes
+: _BSK-AR-RESET  ( lim ar -- )
+    TUCK _BSK-AR-LIM + !  0 SWAP _BSK-AR-USED + ! ;
+
+\ _BSK-AR-BYTES ( ar -- addr )  First byte
+: _BSK-AR-BYTES  ( ar -- addr )  _BSK-AR-HDR + ;
+
+\ _BSK-AR-ROOM ( ar -- n )  Bytes still free
+: _BSK-AR-ROOM  ( ar -- n )
+    DUP _BSK-AR-LIM + @ SWAP _BSK-AR-USED + @ - 0 MAX ;
+
+\ _BSK-AR-STR@ ( pair ar -- addr len )
+: _BSK-AR-STR@  ( pair ar -- addr len )
+    _BSK-AR-BYTES OVER @ +  SWAP 1 CELLS + @ ;
+
+VARIABLE _BSK-AR-A    \ arena temp
+VARIABLE _BSK-AR-P    \ pair temp
+
+\ _BSK-AR-STR! ( addr len pair ar -- )  Copy a string in, fill pair
+\   Clipped to the room left; callers check _BSK-AR-ROOM per item.
+: _BSK-AR-STR!  ( addr len pair ar -- )
+    _BSK-AR-A !  _BSK-AR-P !
+    _BSK-AR-A @ _BSK-AR-ROOM MIN
+    _BSK-AR-A @ _BSK-AR-USED + @           ( addr len off )
+    DUP _BSK-AR-P @ !
+    OVER _BSK-AR-P @ 1 CELLS + !
+    _BSK-AR-A @ _BSK-AR-BYTES +            ( addr len dst )
+    SWAP DUP _BSK-AR-A @ _BSK-AR-USED + +!
+    CMOVE ;
+
+\ _BSK-ITEM-LEN ( addr len -- n )  Bytes of the JSON value at addr
+: _BSK-ITEM-LEN  ( addr len -- n )
+    DUP >R JSON-SKIP-VALUE NIP R> SWAP - ;
+
+\ ── Intern table ──
+\   Author handles and DIDs are stored once and named by an ID (entry
+\   number + 1; 0 = none), so caches keep one cell per author and
+\   "same author" is one compare.  Lookup hashes the bytes (FNV-1a)
+\   into an open-addressed table of IDs; the strings sit in an arena.
+\   Entries are only appended and a slot is filled last, so IDs the
+\   UI holds stay valid while the worker interns more.  A full table
+\   interns nothing new rather than reusing IDs still cached: the
+\   cache keeps the string in its own arena instead, under an inline
+\   ID (_BSK-IN-KEEP).
+
+1024  CONSTANT _BSK-IN-CAP     \ entries
+2048  CONSTANT _BSK-IN-SLOTS   \ hash slots (power of 2, > 2 x CAP)
+32768 CONSTANT _BSK-IN-ARENA   \ string bytes
+3 CELLS CONSTANT _BSK-INE-SIZE \ entry: hash, then (offset, length)
+
+0                                    CONSTANT _BSK-INB-SL
+_BSK-IN-SLOTS CELLS                  CONSTANT _BSK-INB-E
+_BSK-INB-E _BSK-IN-CAP _BSK-INE-SIZE * + CONSTANT _BSK-INB-AR
+_BSK-INB-AR _BSK-AR-HDR + _BSK-IN-ARENA + CONSTANT _BSK-INB-SIZE
+
+VARIABLE _BSK-IN-BASE     0 _BSK-IN-BASE !    \ table (XMEM)
+VARIABLE _BSK-IN-N        0 _BSK-IN-N !       \ entries in use
+
+: _BSK-IN-SLOT  ( h -- addr )
+    _BSK-IN-SLOTS 1- AND CELLS _BSK-IN-BASE @ _BSK-INB-SL + + ;
+: _BSK-IN-E  ( id -- entry )
+    1- _BSK-INE-SIZE * _BSK-IN-BASE @ _BSK-INB-E + + ;
+: _BSK-IN-AR  ( -- ar )  _BSK-IN-BASE @ _BSK-INB-AR + ;
+
+\ _BSK-IN-HASH ( addr len -- h )  32-bit FNV-1a
+: _BSK-IN-HASH  ( addr len -- h )
+    DUP 0= IF 2DROP 2166136261 EXIT THEN
+    2166136261 SWAP 0 DO
+        OVER I + C@ XOR 16777619 * 4294967295 AND
+    LOOP NIP ;
+
+\ _BSK-IN-STR ( id -- addr len )  String of an ID (0: empty)
+: _BSK-IN-STR  ( id -- addr len )
+    DUP 0= IF 0 EXIT THEN
+    _BSK-IN-E 1 CELLS + _BSK-IN-AR _BSK-AR-STR@ ;
+
+VARIABLE _BSK-IN-A    \ key address
+VARIABLE _BSK-IN-L    \ key length
+VARIABLE _BSK-IN-H    \ key hash
+
+\ _BSK-IN-MATCH? ( id -- flag )  Entry id holds the key
+: _BSK-IN-MATCH?  ( id -- flag )
+    _BSK-IN-E DUP @ _BSK-IN-H @ <> IF DROP 0 EXIT THEN
+    1 CELLS + _BSK-IN-AR _BSK-AR-STR@
+    _BSK-IN-A @ _BSK-IN-L @ COMPARE 0= ;
+
+\ _BSK-IN-FULL? ( len -- flag )  No room to add a string of len bytes
+: _BSK-IN-FULL?  ( len -- flag )
+    _BSK-IN-N @ _BSK-IN-CAP >=  SWAP _BSK-IN-AR _BSK-AR-ROOM > OR ;
+
+\ _BSK-IN-NEED ( len -- n )  Cache arena bytes a string of len may take
+: _BSK-IN-NEED  ( len -- n )  DUP _BSK-IN-FULL? AND ;
+
+\ _BSK-INTERN ( addr len -- id )  ID of a string, adding it if new
+\   0 for an empty string or a full table.
+: _BSK-INTERN  ( addr len -- id )
+    DUP 0= IF 2DROP 0 EXIT THEN
+    2DUP _BSK-IN-L !  _BSK-IN-A !
+    _BSK-IN-HASH DUP _BSK-IN-H !
+    BEGIN
+        DUP _BSK-IN-SLOT @ ?DUP
+    WHILE
+        _BSK-IN-MATCH? IF _BSK-IN-SLOT @ EXIT THEN
+        1+
+    REPEAT                                 ( h' )  free slot
+    _BSK-IN-L @ _BSK-IN-FULL? IF DROP 0 EXIT THEN
+    1 _BSK-IN-N +!
+    _BSK-IN-H @ _BSK-IN-N @ _BSK-IN-E !
+    _BSK-IN-A @ _BSK-IN-L @
+    _BSK-IN-N @ _BSK-IN-E 1 CELLS + _BSK-IN-AR _BSK-AR-STR!
+    _BSK-IN-N @ TUCK SWAP _BSK-IN-SLOT ! ;
+
+\ Inline IDs.  A string the table has no room for is copied into
+\ the cache's arena ar and named by its (offset, length) packed in
+\ one cell and inverted, so inline IDs are negative.  They name one
+\ copy, so they never match another post's author.
+
+\ _BSK-IN-KEEP ( addr len ar -- id )  Intern, else keep inline in ar
+\   0 for an empty string or no room in either.
+: _BSK-IN-KEEP  ( addr len ar -- id )
+    >R DUP 0= IF 2DROP R> DROP 0 EXIT THEN
+    _BSK-INTERN ?DUP IF R> DROP EXIT THEN
+    _BSK-IN-L @ DUP R@ _BSK-AR-ROOM > SWAP 65535 > OR IF
+        R> DROP 0 EXIT
+    THEN
+    R@ _BSK-AR-USED + @                              ( off )
+    _BSK-IN-A @ OVER R@ _BSK-AR-BYTES + _BSK-IN-L @ CMOVE
+    _BSK-IN-L @ R> _BSK-AR-USED + +!
+    16 LSHIFT _BSK-IN-L @ OR INVERT ;
+
+\ _BSK-IN-AT ( id ar -- addr len )  String of an ID kept with arena ar
+: _BSK-IN-AT  ( id ar -- addr len )
+    OVER 0< IF
+        SWAP INVERT DUP 16 RSHIFT ROT _BSK-AR-BYTES + SWAP 65535 AND
+    ELSE DROP _BSK-IN-STR THEN ;
+
+\ _BSK-IN-REBASE ( delta addr -- )  Inline ID at addr: its string
+\   moved by delta arena bytes.
+: _BSK-IN-REBASE  ( delta addr -- )
+    DUP @ 0< IF
+        DUP @ INVERT ROT 16 LSHIFT + INVERT SWAP !
+    ELSE 2DROP THEN ;
+
+\ ── Timeline block ──
+
+10    CONSTANT _BSK-TL-MAX   \ posts per page (getTimeline limit)
+200   CONSTANT _BSK-TL-CAP   \ index entries per generation
+20    CONSTANT _BSK-TL-PMAX  \ pages per generation
+65536 CONSTANT _BSK-TL-ARENA \ arena bytes per generation
+16384 CONSTANT _BSK-TL-PG-RESERVE   \ kept free for the next page
+20    CONSTANT _BSK-TL-FOLD  \ top page takes in the next up to this
+VARIABLE BSK-TL-BUDGET   32768 BSK-TL-BUDGET !   \ arena bytes to use
+
+\ Index entry: handle ID, DID ID, then pairs 1 = text, 2 = URI, 3 = CID
+8 CELLS CONSTANT _BSK-TLE-SIZE
+
+\ Page cursor: what follows the page — cursor length, resume flag,
+\ then the cursor.  With the flag set, the next page is asked for
+\ by that cursor (none: the newest page) and resumes after the
+\ page's last post (§6.3).
+2 CELLS 128 + CONSTANT _BSK-TLP-SIZE
+
+0                                   CONSTANT _BSK-TLB-N
+1 CELLS                             CONSTANT _BSK-TLB-NP
+2 CELLS                             CONSTANT _BSK-TLB-DROP
+3 CELLS                             CONSTANT _BSK-TLB-PG
+_BSK-TLB-PG _BSK-TL-PMAX CELLS +    CONSTANT _BSK-TLB-PB
+_BSK-TLB-PB _BSK-TL-PMAX CELLS +    CONSTANT _BSK-TLB-PC
+_BSK-TLB-PC _BSK-TL-PMAX _BSK-TLP-SIZE * + CONSTANT _BSK-TLB-IX
+_BSK-TLB-IX _BSK-TL-CAP _BSK-TLE-SIZE * + CONSTANT _BSK-TLB-AR
+_BSK-TLB-AR _BSK-AR-HDR + _BSK-TL-ARENA + CONSTANT _BSK-TLB-SIZE
+
+VARIABLE _BSK-TL-BASE     0 _BSK-TL-BASE !    \ 2 generations (XMEM)
+VARIABLE _BSK-TL-GEN      0 _BSK-TL-GEN !     \ generation on screen
+VARIABLE _BSK-TL-WG       0 _BSK-TL-WG !      \ generation stores go to
+VARIABLE _BSK-TL-FRESH    0 _BSK-TL-FRESH !   \ back generation is newer
+CREATE _BSK-TL-RCID 128 ALLOT      \ resume post: last one stored from
+VARIABLE _BSK-TL-RCL  0 _BSK-TL-RCL !   \ the cursor's page (0 = none)
+
+\ _BSK-TL-BLK ( gen -- addr )  Block of a generation
+: _BSK-TL-BLK  ( gen -- addr )  _BSK-TLB-SIZE * _BSK-TL-BASE @ + ;
+\ _BSK-TL-N ( -- addr )  Cached count (current generation)
+: _BSK-TL-N   ( -- addr )  _BSK-TL-GEN @ _BSK-TL-BLK _BSK-TLB-N + ;
+\ _BSK-TL-WN ( -- addr )  Count of the generation being filled
+: _BSK-TL-WN  ( -- addr )  _BSK-TL-WG @ _BSK-TL-BLK _BSK-TLB-N + ;
+
+\ ── Notification block ──
+\   +N count   +IX entries (reason pair, handle ID, DID ID)   +AR arena
+
+10   CONSTANT _BSK-NF-MAX
+32   CONSTANT _BSK-NF-RMAX    \ reason bytes kept (longest today: 18)
+\ Arena bytes per notification: the reason, and with the intern table
+\ full the handle (at most 253 bytes) and a did:plc (32) inline.
+_BSK-NF-MAX _BSK-NF-RMAX 253 + 32 + * CONSTANT _BSK-NF-ARENA
+4 CELLS CONSTANT _BSK-NFE-SIZE
+
+0                                   CONSTANT _BSK-NFB-N
+1 CELLS                             CONSTANT _BSK-NFB-IX
+_BSK-NFB-IX _BSK-NF-MAX _BSK-NFE-SIZE * + CONSTANT _BSK-NFB-AR
+_BSK-NFB-AR _BSK-AR-HDR + _BSK-NF-ARENA + CONSTANT _BSK-NFB-SIZE
+
+VARIABLE _BSK-NF-BASE     0 _BSK-NF-BASE !
+VARIABLE _BSK-NF-GEN      0 _BSK-NF-GEN !
+VARIABLE _BSK-NF-WG       0 _BSK-NF-WG !
+VARIABLE _BSK-NF-FRESH    0 _BSK-NF-FRESH !
+
+: _BSK-NF-BLK  ( gen -- addr )  _BSK-NFB-SIZE * _BSK-NF-BASE @ + ;
+: _BSK-NF-N   ( -- addr )  _BSK-NF-GEN @ _BSK-NF-BLK _BSK-NFB-N + ;
+: _BSK-NF-WN  ( -- addr )  _BSK-NF-WG @ _BSK-NF-BLK _BSK-NFB-N + ;
+
+\ Fixed slot sizes of the layout the arenas replaced (BSK-MEM)
+32 CONSTANT _BSK-HS          \ handle
+600 CONSTANT _BSK-TS         \ text
+100 CONSTANT _BSK-US         \ URI
+64 CONSTANT _BSK-CS          \ CID
+20 CONSTANT _BSK-RS          \ reason
+
+\ _BSK-TL-PUBLISH ( -- )  Make the other generation current
+\   If older pages were evicted, the timeline selection moves with
+\   the post it was on.
+: _BSK-TL-PUBLISH  ( -- )
+    _BSK-TL-GEN @ 1 XOR DUP _BSK-TL-WG !  _BSK-TL-GEN !
+    _BSK-TL-GEN @ _BSK-TL-BLK _BSK-TLB-DROP + @ ?DUP IF
+        SUBSCREEN-ID @ 0= IF SCR-SEL @ SWAP - 0 MAX SCR-SEL ! ELSE DROP THEN
+    THEN ;
+: _BSK-NF-PUBLISH  ( -- )
+    _BSK-NF-GEN @ 1 XOR DUP _BSK-NF-WG !  _BSK-NF-GEN ! ;
+
+\ Profile cache
+CREATE _BSK-PR-DN   64 ALLOT   VARIABLE _BSK-PR-DNL  0 _BSK-PR-DNL !
+VARIABLE _BSK-PR-HID  0 _BSK-PR-HID !   \ handle (interned)
+VARIABLE _BSK-PR-DID  0 _BSK-PR-DID !   \ our DID (interned)
+320 CONSTANT _BSK-PR-ARENA              \ both, if the table is full
+CREATE _BSK-PR-AR  _BSK-AR-HDR _BSK-PR-ARENA + ALLOT
+_BSK-PR-ARENA _BSK-PR-AR _BSK-AR-RESET
+CREATE _BSK-PR-D   200 ALLOT   VARIABLE _BSK-PR-DL   0 _BSK-PR-DL !
+VARIABLE _BSK-PR-FC  0 _BSK-PR-FC !    \ followersCount
+VARIABLE _BSK-PR-FG  0 _BSK-PR-FG !    \ followsCount
+VARIABLE _BSK-PR-PC  0 _BSK-PR-PC !    \ postsCount
+VARIABLE _BSK-PR-OK  0 _BSK-PR-OK !    \ profile loaded?
+
+\ Compose buffer
+CREATE _BSK-COMP-BUF 300 ALLOT
+
+\ Status message for feedback
+CREATE _BSK-STATUS 64 ALLOT
+VARIABLE _BSK-STATUS-LEN  0 _BSK-STATUS-LEN !
+CREATE _BSK-BG-STATUS 64 ALLOT                      \ the worker's, until
+VARIABLE _BSK-BG-STATUS-LEN  -1 _BSK-BG-STATUS-LEN ! \ taken (-1 = none)
+
+\ ── §6.2  Cache Accessors ─────────────────────────────────────────
+\
+\  Store:  _BSK-TL-H!  ( addr len i -- )   copy string into entry i
+\  Fetch:  _BSK-TL-HANDLE  ( i -- addr len )   return pointer+length
+
+\  Stores go to generation WG; reads come from generation GEN.
+
+\ Timeline store.  Strings are bump-allocated from the arena of the
+\ generation being filled; overwriting a post's field allocates
+\ afresh (space comes back when the generation is rebuilt).
+
+\ _BSK-TL-E ( i blk -- entry )  Index entry of post i
+: _BSK-TL-E  ( i blk -- entry )
+    _BSK-TLB-IX + SWAP _BSK-TLE-SIZE * + ;
+
+\ _BSK-TL-PAIR ( i fld blk -- pair )  (offset, length) cells, fld 1-3
+: _BSK-TL-PAIR  ( i fld blk -- pair )
+    _BSK-TLB-IX + SWAP 2* CELLS + SWAP _BSK-TLE-SIZE * + ;
+
+\ _BSK-TL-AR ( blk -- ar )  String arena of a block
+: _BSK-TL-AR  ( blk -- ar )  _BSK-TLB-AR + ;
+
+\ _BSK-TL-USED ( blk -- n )  Arena bytes in use
+: _BSK-TL-USED  ( blk -- n )  _BSK-TL-AR _BSK-AR-USED + @ ;
+
+\ _BSK-TL-F@ ( i fld blk -- addr len )
+: _BSK-TL-F@  ( i fld blk -- addr len )
+    DUP >R _BSK-TL-PAIR R> _BSK-TL-AR _BSK-AR-STR@ ;
+
+\ _BSK-TL-F! ( addr len i fld blk -- )  Copy a string into the arena
+: _BSK-TL-F!  ( addr len i fld blk -- )
+    DUP >R _BSK-TL-PAIR R> _BSK-TL-AR _BSK-AR-STR! ;
+
+\ _BSK-TL-WB ( -- blk )  Block being filled
+: _BSK-TL-WB  ( -- blk )  _BSK-TL-WG @ _BSK-TL-BLK ;
+\ _BSK-TL-RB ( -- blk )  Block on screen
+: _BSK-TL-RB  ( -- blk )  _BSK-TL-GEN @ _BSK-TL-BLK ;
+
+\ Timeline author: handle and DID IDs (intern table, §6.1)
+: _BSK-TL-H!  ( addr len i -- )
+    >R _BSK-TL-WB _BSK-TL-AR _BSK-IN-KEEP R> _BSK-TL-WB _BSK-TL-E ! ;
+: _BSK-TL-D!  ( addr len i -- )
+    >R _BSK-TL-WB _BSK-TL-AR _BSK-IN-KEEP
+    R> _BSK-TL-WB _BSK-TL-E 1 CELLS + ! ;
+: _BSK-TL-HID  ( i -- id )  _BSK-TL-RB _BSK-TL-E @ ;
+: _BSK-TL-DID  ( i -- id )  _BSK-TL-RB _BSK-TL-E 1 CELLS + @ ;
+: _BSK-TL-HANDLE  ( i -- addr len )
+    _BSK-TL-HID _BSK-TL-RB _BSK-TL-AR _BSK-IN-AT ;
+
+\ _BSK-TL-AUTHOR ( i -- id )  Author of post i: DID, else handle
+: _BSK-TL-AUTHOR  ( i -- id )
+    DUP _BSK-TL-DID ?DUP IF NIP ELSE _BSK-TL-HID THEN ;
+
+\ _BSK-TL-SAME? ( i j -- flag )  Posts i and j share a known author
+: _BSK-TL-SAME?  ( i j -- flag )
+    _BSK-TL-AUTHOR SWAP _BSK-TL-AUTHOR
+    OVER = SWAP 0> AND ;
+
+\ Timeline text
+: _BSK-TL-T!  ( addr len i -- )  1 _BSK-TL-WB _BSK-TL-F! ;
+: _BSK-TL-TEXT  ( i -- addr len )  1 _BSK-TL-RB _BSK-TL-F@ ;
+
+\ Timeline URI
+: _BSK-TL-U!  ( addr len i -- )  2 _BSK-TL-WB _BSK-TL-F! ;
+: _BSK-TL-URI  ( i -- addr len )  2 _BSK-TL-RB _BSK-TL-F@ ;
+
+\ Timeline CID
+: _BSK-TL-C!  ( addr len i -- )  3 _BSK-TL-WB _BSK-TL-F! ;
+: _BSK-TL-CID  ( i -- addr len )  3 _BSK-TL-RB _BSK-TL-F@ ;
+
+\ ── Timeline pages ──
+\   +PG / +PB hold each page's first post and arena offset, +PC its
+\   page cursor.  Pages are appended in order, so pages k.. own the
+\   index entries from PG[k] and the arena bytes from PB[k] to the
+\   arena's +USED.
+
+: _BSK-TL-PG@  ( k blk -- post )  _BSK-TLB-PG + SWAP CELLS + @ ;
+: _BSK-TL-PB@  ( k blk -- off )   _BSK-TLB-PB + SWAP CELLS + @ ;
+: _BSK-TL-PC  ( k blk -- entry )  _BSK-TLB-PC + SWAP _BSK-TLP-SIZE * + ;
+
+\ _BSK-TL-PEND ( k blk -- post )  First post after pages ..k-1
+: _BSK-TL-PEND  ( k blk -- post )
+    2DUP _BSK-TLB-NP + @ < IF _BSK-TL-PG@ ELSE NIP _BSK-TLB-N + @ THEN ;
+
+\ _BSK-TL-OEND ( k blk -- off )  First arena byte after pages ..k-1
+: _BSK-TL-OEND  ( k blk -- off )
+    2DUP _BSK-TLB-NP + @ < IF _BSK-TL-PB@ ELSE NIP _BSK-TL-USED THEN ;
+
+\ _BSK-TL-PC! ( blk -- )  Note BSK-TL-CURSOR and the resume post as
+\   the last page's cursor.
+: _BSK-TL-PC!  ( blk -- )
+    DUP _BSK-TLB-NP + @ DUP 0= IF 2DROP EXIT THEN
+    1- SWAP _BSK-TL-PC
+    BSK-TL-CURSOR-LEN @ OVER !
+    _BSK-TL-RCL @ 0<> OVER 1 CELLS + !
+    BSK-TL-CURSOR SWAP 2 CELLS + BSK-TL-CURSOR-LEN @ CMOVE ;
+
+\ _BSK-TL-RESUME! ( blk -- )  Make the last post the resume post
+: _BSK-TL-RESUME!  ( blk -- )
+    DUP _BSK-TLB-N + @ DUP 0= IF 2DROP 0 _BSK-TL-RCL ! EXIT THEN
+    1- 3 ROT _BSK-TL-F@
+    128 MIN DUP _BSK-TL-RCL !  _BSK-TL-RCID SWAP CMOVE ;
+
+\ _BSK-TL-PC@ ( blk -- )  Take up the last page's cursor
+: _BSK-TL-PC@  ( blk -- )
+    DUP _BSK-TLB-NP + @ 1- OVER _BSK-TL-PC       ( blk entry )
+    DUP @ BSK-TL-CURSOR-LEN !
+    DUP 2 CELLS + BSK-TL-CURSOR BSK-TL-CURSOR-LEN @ CMOVE
+    1 CELLS + @ IF _BSK-TL-RESUME! ELSE DROP 0 _BSK-TL-RCL ! THEN ;
+
+\ _BSK-TL-LIM ( -- n )  Arena bytes a generation may use
+: _BSK-TL-LIM  ( -- n )  BSK-TL-BUDGET @ _BSK-TL-ARENA MIN ;
+
+\ _BSK-TL-CLEAR ( blk -- )  Empty history
+: _BSK-TL-CLEAR  ( blk -- )
+    DUP _BSK-TLB-N + 0 SWAP !
+    DUP _BSK-TLB-NP + 0 SWAP !
+    DUP _BSK-TLB-DROP + 0 SWAP !
+    _BSK-TL-LIM SWAP _BSK-TL-AR _BSK-AR-RESET ;
+
+\ _BSK-TL-PAGE+ ( blk -- )  Open a new page after the last post
+: _BSK-TL-PAGE+  ( blk -- )
+    >R
+    R@ _BSK-TLB-N + @     R@ _BSK-TLB-NP + @ CELLS R@ _BSK-TLB-PG + + !
+    R@ _BSK-TL-USED       R@ _BSK-TLB-NP + @ CELLS R@ _BSK-TLB-PB + + !
+    1 R> _BSK-TLB-NP + +! ;
+
+VARIABLE _BSK-TL-CB    \ carry: source block
+VARIABLE _BSK-TL-SB    \ carry: destination block
+VARIABLE _BSK-TL-CK    \ carry: first page kept
+VARIABLE _BSK-TL-CO    \ carry: its arena offset
+VARIABLE _BSK-TL-CP    \ carry: its first post
+VARIABLE _BSK-TL-CN    \ carry: destination posts before
+VARIABLE _BSK-TL-CU    \ carry: destination arena bytes before
+VARIABLE _BSK-TL-CQ    \ carry: destination pages before
+VARIABLE _BSK-TL-CE    \ carry: first page not kept
+
+\ _BSK-TL-OVER? ( k -- flag )  Pages k.. of the carry source would
+\   leave no room for a new page (pages, index entries, or fewer
+\   than _BSK-TL-PG-RESERVE arena bytes free).
+: _BSK-TL-OVER?  ( k -- flag )
+    DUP _BSK-TL-CB @ _BSK-TLB-NP + @ SWAP - _BSK-TL-PMAX >=
+    OVER _BSK-TL-CB @ _BSK-TL-PB@
+    _BSK-TL-CB @ _BSK-TL-USED SWAP - _BSK-TL-PG-RESERVE +
+    _BSK-TL-LIM > OR
+    SWAP _BSK-TL-CB @ _BSK-TL-PG@
+    _BSK-TL-CB @ _BSK-TLB-N + @ SWAP - _BSK-TL-MAX +
+    _BSK-TL-CAP > OR ;
+
+\ _BSK-TL-APPEND ( -- )  Append carry source pages CK..CE-1 after the
+\   destination's own posts.  The kept strings and index entries
+\   move with one CMOVE each; offsets and page starts are then
+\   rebased.  Destination +DROP = how far the source's posts moved
+\   up (negative when they moved down).
+: _BSK-TL-APPEND  ( -- )
+    _BSK-TL-SB @ _BSK-TLB-N + @ _BSK-TL-CN !
+    _BSK-TL-SB @ _BSK-TL-USED _BSK-TL-CU !
+    _BSK-TL-SB @ _BSK-TLB-NP + @ _BSK-TL-CQ !
+    _BSK-TL-CK @ _BSK-TL-CE @ >= IF                   \ nothing kept
+        _BSK-TL-CB @ _BSK-TLB-N + @ _BSK-TL-CN @ -
+        _BSK-TL-SB @ _BSK-TLB-DROP + !
+        EXIT
+    THEN
+    _BSK-TL-CK @ _BSK-TL-CB @ _BSK-TL-PB@ _BSK-TL-CO !
+    _BSK-TL-CK @ _BSK-TL-CB @ _BSK-TL-PG@ _BSK-TL-CP !
+    _BSK-TL-CP @ _BSK-TL-CN @ - _BSK-TL-SB @ _BSK-TLB-DROP + !
+    \ Strings
+    _BSK-TL-CB @ _BSK-TL-AR _BSK-AR-BYTES _BSK-TL-CO @ +
+    _BSK-TL-SB @ _BSK-TL-AR _BSK-AR-BYTES _BSK-TL-CU @ +
+    _BSK-TL-CE @ _BSK-TL-CB @ _BSK-TL-OEND _BSK-TL-CO @ -
+    DUP _BSK-TL-SB @ _BSK-TL-AR _BSK-AR-USED + +!
+    CMOVE
+    \ Index entries, then rebase their offsets
+    _BSK-TL-CP @ _BSK-TL-CB @ _BSK-TL-E
+    _BSK-TL-CN @ _BSK-TL-SB @ _BSK-TL-E
+    _BSK-TL-CE @ _BSK-TL-CB @ _BSK-TL-PEND _BSK-TL-CP @ -
+    DUP _BSK-TL-SB @ _BSK-TLB-N + +!
+    _BSK-TLE-SIZE * CMOVE
+    _BSK-TL-SB @ _BSK-TLB-N + @ _BSK-TL-CN @ - 3 * 0 DO
+        _BSK-TL-CU @ _BSK-TL-CO @ -
+        I 3 /MOD _BSK-TL-CN @ + SWAP 1+ _BSK-TL-SB @ _BSK-TL-PAIR +!
+    LOOP
+    _BSK-TL-SB @ _BSK-TLB-N + @ _BSK-TL-CN @ - 0 DO       \ inline IDs
+        I _BSK-TL-CN @ + _BSK-TL-SB @ _BSK-TL-E
+        _BSK-TL-CU @ _BSK-TL-CO @ - OVER _BSK-IN-REBASE
+        _BSK-TL-CU @ _BSK-TL-CO @ - SWAP 1 CELLS + _BSK-IN-REBASE
+    LOOP
+    \ Page cursors, then page starts
+    _BSK-TL-CK @ _BSK-TL-CB @ _BSK-TL-PC
+    _BSK-TL-CQ @ _BSK-TL-SB @ _BSK-TL-PC
+    _BSK-TL-CE @ _BSK-TL-CK @ - _BSK-TLP-SIZE * CMOVE
+    _BSK-TL-CE @ _BSK-TL-CK @ -
+    DUP _BSK-TL-SB @ _BSK-TLB-NP + +!
+    0 DO
+        I _BSK-TL-CK @ + _BSK-TL-CB @ _BSK-TL-PG@
+        _BSK-TL-CP @ - _BSK-TL-CN @ +
+        _BSK-TL-SB @ _BSK-TLB-PG + I _BSK-TL-CQ @ + CELLS + !
+        I _BSK-TL-CK @ + _BSK-TL-CB @ _BSK-TL-PB@
+        _BSK-TL-CO @ - _BSK-TL-CU @ +
+        _BSK-TL-SB @ _BSK-TLB-PB + I _BSK-TL-CQ @ + CELLS + !
+    LOOP ;
+
+\ _BSK-TL-CARRY ( src dst -- )  Start dst with src's newest pages
+\   Oldest pages are dropped until a new page has room.
+: _BSK-TL-CARRY  ( src dst -- )
+    DUP _BSK-TL-CLEAR
+    _BSK-TL-SB !  _BSK-TL-CB !
+    0 BEGIN
+        DUP _BSK-TL-CB @ _BSK-TLB-NP + @ < IF DUP _BSK-TL-OVER? ELSE 0 THEN
+    WHILE 1+ REPEAT
+    _BSK-TL-CK !
+    _BSK-TL-CB @ _BSK-TLB-NP + @ _BSK-TL-CE !
+    _BSK-TL-APPEND ;
+
+\ _BSK-TL-FIT? ( e -- flag )  Carry source pages ..e-1 fit after the
+\   destination's posts.
+: _BSK-TL-FIT?  ( e -- flag )
+    DUP _BSK-TL-CB @ _BSK-TL-OEND
+    _BSK-TL-SB @ _BSK-TL-AR _BSK-AR-ROOM <=
+    OVER _BSK-TL-CB @ _BSK-TL-PEND  _BSK-TL-SB @ _BSK-TLB-N + @ +
+    _BSK-TL-CAP <= AND
+    SWAP _BSK-TL-SB @ _BSK-TLB-NP + @ +  _BSK-TL-PMAX <= AND ;
+
+\ _BSK-TL-JOIN ( blk -- )  Fold the second page into the top one
+\   when together they hold at most _BSK-TL-FOLD posts; the top
+\   page takes over its cursor.
+: _BSK-TL-JOIN  ( blk -- )
+    >R
+    R@ _BSK-TLB-NP + @ 2 <
+    2 R@ _BSK-TL-PEND _BSK-TL-FOLD > OR IF R> DROP EXIT THEN
+    1 R@ _BSK-TL-PC  0 R@ _BSK-TL-PC
+    R@ _BSK-TLB-NP + @ 1- _BSK-TLP-SIZE * CMOVE
+    R@ _BSK-TLB-PG + 2 CELLS +  R@ _BSK-TLB-PG + 1 CELLS +
+    R@ _BSK-TLB-NP + @ 2 - CELLS CMOVE
+    R@ _BSK-TLB-PB + 2 CELLS +  R@ _BSK-TLB-PB + 1 CELLS +
+    R@ _BSK-TLB-NP + @ 2 - CELLS CMOVE
+    -1 R> _BSK-TLB-NP + +! ;
+
+\ _BSK-TL-MERGE ( src dst -- )  Put src's pages under dst's posts
+\   dst holds the newest posts, on one page that resumes after its
+\   last post.  src's oldest pages are dropped until the rest fit,
+\   and the cursor then follows the last page kept; a small refresh
+\   is folded into the top page (_BSK-TL-JOIN), so polling does not
+\   use up pages.
+: _BSK-TL-MERGE  ( src dst -- )
+    _BSK-TL-SB !  _BSK-TL-CB !
+    _BSK-TL-SB @ _BSK-TLB-NP + @ 1- _BSK-TL-SB @ _BSK-TL-PC
+    0 OVER !  -1 SWAP 1 CELLS + !
+    0 _BSK-TL-CK !
+    _BSK-TL-CB @ _BSK-TLB-NP + @
+    BEGIN DUP 0> IF DUP _BSK-TL-FIT? 0= ELSE 0 THEN WHILE 1- REPEAT
+    DUP _BSK-TL-CE !
+    _BSK-TL-APPEND
+    _BSK-TL-CB @ _BSK-TLB-NP + @ < IF _BSK-TL-SB @ _BSK-TL-PC@ THEN
+    _BSK-TL-SB @ _BSK-TL-JOIN ;
+
+\ Notification store: the same scheme, one page, reset per fetch.
+
+\ _BSK-NF-E ( i blk -- entry )  Entry i; the reason pair comes first
+: _BSK-NF-E  ( i blk -- entry )
+    _BSK-NFB-IX + SWAP _BSK-NFE-SIZE * + ;
+
+: _BSK-NF-WB  ( -- blk )  _BSK-NF-WG @ _BSK-NF-BLK ;
+: _BSK-NF-RB  ( -- blk )  _BSK-NF-GEN @ _BSK-NF-BLK ;
+
+\ _BSK-NF-CLEAR ( blk -- )
+: _BSK-NF-CLEAR  ( blk -- )
+    DUP _BSK-NFB-N + 0 SWAP !
+    _BSK-NF-ARENA SWAP _BSK-NFB-AR + _BSK-AR-RESET ;
+
+\ Notification reason, clipped to _BSK-NF-RMAX
+: _BSK-NF-R!  ( addr len i -- )
+    >R _BSK-NF-RMAX MIN R>
+    _BSK-NF-WB _BSK-NF-E _BSK-NF-WB _BSK-NFB-AR + _BSK-AR-STR! ;
+: _BSK-NF-REASON  ( i -- addr len )
+    _BSK-NF-RB _BSK-NF-E _BSK-NF-RB _BSK-NFB-AR + _BSK-AR-STR@ ;
+
+\ Notification author: handle and DID IDs
+: _BSK-NF-H!  ( addr len i -- )
+    >R _BSK-NF-WB _BSK-NFB-AR + _BSK-IN-KEEP
+    R> _BSK-NF-WB _BSK-NF-E 2 CELLS + ! ;
+: _BSK-NF-D!  ( addr len i -- )
+    >R _BSK-NF-WB _BSK-NFB-AR + _BSK-IN-KEEP
+    R> _BSK-NF-WB _BSK-NF-E 3 CELLS + ! ;
+: _BSK-NF-HID  ( i -- id )  _BSK-NF-RB _BSK-NF-E 2 CELLS + @ ;
+: _BSK-NF-DID  ( i -- id )  _BSK-NF-RB _BSK-NF-E 3 CELLS + @ ;
+: _BSK-NF-HANDLE  ( i -- addr len )
+    _BSK-NF-HID _BSK-NF-RB _BSK-NFB-AR + _BSK-IN-AT ;
+
+\ _BSK-CACHE-ALLOT ( -- )  Reserve both generations of each cache
+: _BSK-CACHE-ALLOT  ( -- )
+    _BSK-TLB-SIZE 2 * XMEM-ALLOT _BSK-TL-BASE !
+    _BSK-TL-BASE @ _BSK-TLB-SIZE 2 * 0 FILL
+    0 _BSK-TL-BLK _BSK-TL-CLEAR  1 _BSK-TL-BLK _BSK-TL-CLEAR
+    _BSK-NFB-SIZE 2 * XMEM-ALLOT _BSK-NF-BASE !
+    _BSK-NF-BASE @ _BSK-NFB-SIZE 2 * 0 FILL
+    0 _BSK-NF-BLK _BSK-NF-CLEAR  1 _BSK-NF-BLK _BSK-NF-CLEAR
+    _BSK-INB-SIZE XMEM-ALLOT _BSK-IN-BASE !
+    _BSK-IN-BASE @ _BSK-INB-SIZE 0 FILL
+    _BSK-IN-ARENA _BSK-IN-AR _BSK-AR-RESET ;
+_BSK-CACHE-ALLOT
+
+\ BSK-MEM ( -- )  Report cache memory: bytes in use (arena + index)
+\   against what the fixed-slot layout needs for the same entries.
+: BSK-MEM  ( -- )
+    ." TL " _BSK-TL-N @ . ." posts  "
+    _BSK-TL-RB _BSK-TL-USED _BSK-TL-N @ _BSK-TLE-SIZE * + .
+    ." bytes (slots "
+    _BSK-TL-N @ _BSK-HS _BSK-TS + _BSK-US + _BSK-CS + 4 CELLS + * .
+    ." )" CR
+    ." NF " _BSK-NF-N @ . ." items  "
+    _BSK-NF-RB _BSK-NFB-AR + _BSK-AR-USED + @
+    _BSK-NF-N @ _BSK-NFE-SIZE * + .
+    ." bytes (slots "
+    _BSK-NF-N @ _BSK-RS _BSK-HS + 2 CELLS + * .
+    ." )" CR
+    ." IN " _BSK-IN-N @ . ." handles/DIDs  "
+    _BSK-IN-AR _BSK-AR-USED + @ _BSK-IN-N @ _BSK-INE-SIZE * + .
+    ." bytes" CR
+    ." XMEM " _BSK-TLB-SIZE _BSK-NFB-SIZE + 2 * _BSK-INB-SIZE + .
+    ." bytes reserved" CR ;
+
+\ Status message.  The worker's goes to a buffer of its own, which
+\ the UI core takes over on its next tick (_BSK-BG-TICK); until then
+\ later ones from the worker are dropped.
+: _BSK-SET-STATUS  ( addr len -- )
+    64 MIN
+    _BSK-CORE IF
+        _BSK-BG-STATUS-LEN @ 0< 0= IF 2DROP EXIT THEN
+        DUP >R _BSK-BG-STATUS SWAP CMOVE  R> _BSK-BG-STATUS-LEN ! EXIT
+    THEN
+    DUP _BSK-STATUS-LEN !
+    _BSK-STATUS SWAP CMOVE ;
+: _BSK-CLR-STATUS  ( -- )  0 _BSK-STATUS-LEN ! ;
+
+\ _BSK-HTTP-ERR-STATUS ( -- )  Set status to "HTTP <code>".
+: _BSK-HTTP-ERR-STATUS  ( -- )
+    BSK-RESET
+    S" HTTP " BSK-APPEND
+    BSK-HTTP-STATUS @ NUM>APPEND
+    BSK-BUF BSK-LEN @ _BSK-SET-STATUS ;
+
+\ ── §6.3  Fetch & Populate ────────────────────────────────────────
+\
+\  Fetch data from the API, parse JSON, fill cache arrays.
+
+VARIABLE _BSK-FI
+VARIABLE _BSK-IL     \ length of the item being cached
+
+\ _BSK-TL-CACHE-SLOTS ( idx -- )
+\   Cache handle, DID, text, URI, CID from the _BSK-TL-PLAN slots
+\   of the item just walked.
+: _BSK-TL-CACHE-SLOTS  ( idx -- )
+    _BSK-MX-FILL
+    DUP _BSK-FI !
+    _BSK-TL-WB _BSK-TL-E _BSK-TLE-SIZE 0 FILL
+    _BSK-TLF-URI BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-TL-U! ELSE 2DROP THEN
+    _BSK-TLF-CID BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-TL-C! ELSE 2DROP THEN
+    _BSK-TLF-HANDLE BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-TL-H! ELSE 2DROP THEN
+    _BSK-TLF-DID BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-TL-D! ELSE 2DROP THEN
+    _BSK-TLF-TEXT BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-TL-T! ELSE 2DROP THEN ;
+
+\ _BSK-TL-CACHE-ITEM ( item-addr item-len idx -- )
+\   Parse one feed item JSON and cache it.
+\   One walk of the item via _BSK-TL-PLAN (§4.1).
+: _BSK-TL-CACHE-ITEM  ( addr len idx -- )
+    >R _BSK-TL-PLAN BSK-FP-WALK R> _BSK-TL-CACHE-SLOTS ;
+
+\ _BSK-TL-LOAD ( more? -- )   Fetch a timeline page into the cache.
+\   more? <> 0: the page after BSK-TL-CURSOR, appended (§6.1).
+\   more? = 0: the newest page.  With a history cached this is
+\   incremental: items are parsed only down to the cached head post
+\   (matched by CID) and spliced on top of the history, which keeps
+\   its cursor; its oldest pages are dropped if they no longer fit
+\   (_BSK-TL-MERGE).  If the head is not on the page, more than a
+\   page of posts is new and the page replaces the history.
+\
+\   The feed array is streamed (§1.2, §2.4): each item is cached as
+\   soon as it has arrived and its bytes are reused, so the page is
+\   not bounded by BSK-RECV-BUF.  Items still land in the back
+\   generation, which is published once the page is complete: the
+\   parser reached the closing } (_BSK-SA-DONE?).  A streamed body
+\   is used up by then, so its length says nothing; a page cut
+\   short is dropped whole, cursor included.
+\
+\   A page stored short for want of arena room keeps the cursor it
+\   was fetched with and notes its last post stored (_BSK-TL-RCID):
+\   the next page asks for the same posts again and resumes after
+\   that one, so no post is passed over.  If not one post of the
+\   page fitted, nothing changes and the next fetch asks again.
+VARIABLE _BSK-TL-MORE?
+VARIABLE _BSK-TL-P0        \ first post of the page being read
+VARIABLE _BSK-TL-INC       \ looking for the cached head
+VARIABLE _BSK-TL-HIT       \ found it: splice
+VARIABLE _BSK-TL-STOP      \ page complete: skip further items
+VARIABLE _BSK-TL-OCL       \ cursor length, kept over the request
+VARIABLE _BSK-TL-CUT       \ a post had no room: page stored short
+VARIABLE _BSK-TL-SKIP      \ skipping down to the resume post
+
+\ _BSK-TL-HEAD? ( -- flag )  Item just walked is the cached head
+: _BSK-TL-HEAD?  ( -- flag )
+    _BSK-TL-INC @ 0= IF 0 EXIT THEN
+    _BSK-TLF-CID BSK-FP-STR DUP 0= IF 2DROP 0 EXIT THEN
+    0 _BSK-TL-CID COMPARE 0= ;
+
+\ _BSK-TL-NEED ( -- n )  Arena bytes the item just walked takes
+\   Text, URI and CID; handle and DID only if the intern table is full.
+: _BSK-TL-NEED  ( -- n )
+    _BSK-TLF-TEXT BSK-FP-STR NIP
+    _BSK-TLF-URI BSK-FP-STR NIP +
+    _BSK-TLF-CID BSK-FP-STR NIP +
+    _BSK-TLF-HANDLE BSK-FP-STR NIP _BSK-IN-NEED +
+    _BSK-TLF-DID BSK-FP-STR NIP _BSK-IN-NEED + ;
+
+\ _BSK-TL-RESUME? ( -- flag )  Item just walked is the resume post
+: _BSK-TL-RESUME?  ( -- flag )
+    _BSK-TLF-CID BSK-FP-STR _BSK-TL-RCID _BSK-TL-RCL @ COMPARE 0= ;
+
+\ _BSK-TL-ITEM ( addr len -- )  Cache one feed item (stream handler)
+\   Stops the page at _BSK-TL-MAX posts, at the cached head, or at
+\   the first post the arena has no room for, so no post is stored
+\   cut short (_BSK-TL-CUT).  Resuming a page stored short, posts
+\   down to the resume post are already cached and skipped.
+: _BSK-TL-ITEM  ( addr len -- )
+    _BSK-TL-STOP @ IF 2DROP EXIT THEN
+    _BSK-TL-WN @ _BSK-TL-P0 @ - _BSK-TL-MAX >= IF
+        2DROP -1 _BSK-TL-STOP ! EXIT
+    THEN
+    _BSK-TL-PLAN BSK-FP-WALK
+    _BSK-TL-SKIP @ IF
+        _BSK-TL-RESUME? IF 0 _BSK-TL-SKIP ! THEN EXIT
+    THEN
+    _BSK-TL-HEAD? IF
+        -1 _BSK-TL-HIT !  -1 _BSK-TL-STOP ! EXIT
+    THEN
+    _BSK-TL-NEED _BSK-TL-WB _BSK-TL-AR _BSK-AR-ROOM > IF
+        -1 _BSK-TL-CUT !  -1 _BSK-TL-STOP ! EXIT
+    THEN
+    _BSK-TL-WN @ _BSK-TL-CACHE-SLOTS
+    1 _BSK-TL-WN +! ;
+
+\ _BSK-TL-NEW-STATUS ( -- )  "<n> new posts"
+: _BSK-TL-NEW-STATUS  ( -- )
+    BSK-RESET
+    _BSK-TL-WN @ NUM>APPEND
+    S"  new posts" BSK-APPEND
+    BSK-BUF BSK-LEN @ _BSK-SET-STATUS ;
+
+: _BSK-TL-LOAD  ( more? -- )
+    _BSK-TL-MORE? !
+    BSK-ACCESS-LEN @ 0= IF
+        S" Not logged in" _BSK-SET-STATUS EXIT
+    THEN
+    _BSK-TL-MORE? @ IF
+        BSK-TL-CURSOR-LEN @ 0= _BSK-TL-RCL @ 0= AND IF
+            S" No more posts" _BSK-SET-STATUS EXIT
+        THEN
+        0 _BSK-TL-INC !
+        _BSK-TL-PATH
+    ELSE
+        _BSK-TL-RB _BSK-TLB-N + @ 0> _BSK-TL-INC !
+        BSK-TL-CURSOR-LEN @ _BSK-TL-OCL !     \ newest page: no cursor
+        0 BSK-TL-CURSOR-LEN !  _BSK-TL-PATH
+        _BSK-TL-OCL @ BSK-TL-CURSOR-LEN !
+    THEN
+    \ Build the back generation as items arrive (§6.1)
+    _BSK-TL-GEN @ 1 XOR _BSK-TL-WG !
+    _BSK-TL-MORE? @ IF
+        _BSK-TL-RB _BSK-TL-WB _BSK-TL-CARRY
+    ELSE
+        _BSK-TL-WB _BSK-TL-CLEAR
+    THEN
+    _BSK-TL-WN @ _BSK-TL-P0 !
+    _BSK-TL-WB _BSK-TL-PAGE+
+    0 _BSK-TL-HIT !  0 _BSK-TL-STOP !  0 _BSK-TL-CUT !
+    _BSK-TL-MORE? @ _BSK-TL-RCL @ 0<> AND _BSK-TL-SKIP !
+    S" feed" S" cursor" ['] _BSK-TL-ITEM _BSK-SA-BEGIN
+    0 _BSK-SX-ON !  ['] _BSK-SA-FEED _BSK-RX-SINK !
+    BSK-GET
+    0 _BSK-RX-SINK !
+    BSK-HTTP-STATUS @ 0= IF 2DROP
+        _BSK-TL-GEN @ _BSK-TL-WG !
+        S" Fetch failed" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-HTTP-STATUS @ 200 <> IF 2DROP
+        _BSK-TL-GEN @ _BSK-TL-WG !
+        _BSK-HTTP-ERR-STATUS EXIT
+    THEN
+    \ Not streamed (akashic path): scan the whole body the same way
+    _BSK-SX-ON @ IF 2DROP ELSE _BSK-SA-FEED DROP THEN
+    _BSK-SA-DONE? _BSK-RX-FULL @ AND 0= IF
+        _BSK-TL-GEN @ _BSK-TL-WG !
+        S" Page cut short" _BSK-SET-STATUS EXIT
+    THEN
+    _BSK-SA-SEEN @ 0= IF
+        _BSK-TL-GEN @ _BSK-TL-WG !
+        S" No feed data" _BSK-SET-STATUS EXIT
+    THEN
+    _BSK-TL-CUT @ _BSK-TL-WN @ _BSK-TL-P0 @ = AND IF
+        \ Not even its first post fitted: there is no last post to
+        \ resume after, so keep the cache, cursor and resume post
+        _BSK-TL-GEN @ _BSK-TL-WG !
+        S" No room for the next post" _BSK-SET-STATUS EXIT
+    THEN
+    _BSK-TL-HIT @ IF
+        _BSK-TL-WN @ 0= IF                 \ nothing new
+            _BSK-TL-GEN @ _BSK-TL-WG !
+            S" No new posts" _BSK-SET-STATUS EXIT
+        THEN
+        _BSK-TL-RB _BSK-TL-WB _BSK-TL-MERGE    \ history underneath
+    ELSE
+        _BSK-TL-CUT @ IF
+            \ Stored short: come back to this page after its last post
+            _BSK-TL-MORE? @ 0= IF 0 BSK-TL-CURSOR-LEN ! THEN
+            _BSK-TL-WB _BSK-TL-RESUME!
+        ELSE
+            \ Cursor for pagination (none = end of timeline).  Also
+            \ taken if the resume post never came: the page moved.
+            _BSK-SA-SLEN @ DUP BSK-TL-CURSOR-LEN !
+            _BSK-SA-STR BSK-TL-CURSOR ROT CMOVE
+            0 _BSK-TL-RCL !
+        THEN
+        _BSK-TL-WN @ _BSK-TL-P0 @ = IF      \ empty page
+            -1 _BSK-TL-WB _BSK-TLB-NP + +!
+        THEN
+        _BSK-TL-WB _BSK-TL-PC!
+    THEN
+    _BSK-TL-GEN @ _BSK-TL-WG !
+    _BSK-BG-ON @ IF -1 _BSK-TL-FRESH ! ELSE _BSK-TL-PUBLISH THEN
+    _BSK-TL-HIT @ IF _BSK-TL-NEW-STATUS EXIT THEN
+    _BSK-TL-MORE? @ IF
+        S" More posts loaded" _BSK-SET-STATUS
+    ELSE
+        S" Timeline loaded" _BSK-SET-STATUS
+    THEN ;
+
+\ _BSK-TL-FETCH ( -- )   Newest timeline posts (incremental, above).
+: _BSK-TL-FETCH  ( -- )  0 _BSK-TL-LOAD _BSK-MX-PARSED ;
+
+\ _BSK-TL-MORE ( -- )   Append the next page to the history.
+: _BSK-TL-MORE  ( -- )  -1 _BSK-TL-LOAD _BSK-MX-PARSED ;
+
+\ _BSK-NF-CACHE-SLOTS ( idx -- )
+\   Cache reason, handle, DID from the _BSK-NF-PLAN slots of the
+\   notification just walked.
+: _BSK-NF-CACHE-SLOTS  ( idx -- )
+    _BSK-MX-FILL
+    DUP _BSK-FI !
+    _BSK-NF-WB _BSK-NF-E _BSK-NFE-SIZE 0 FILL
+    _BSK-NFF-REASON BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-NF-R! ELSE 2DROP THEN
+    _BSK-NFF-HANDLE BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-NF-H! ELSE 2DROP THEN
+    _BSK-NFF-DID BSK-FP-STR
+    DUP 0> IF _BSK-FI @ _BSK-NF-D! ELSE 2DROP THEN ;
+
+\ _BSK-NF-CACHE-ITEM ( item-addr item-len idx -- )
+\   Parse one notification and cache reason + handle.
+: _BSK-NF-CACHE-ITEM  ( addr len idx -- )
+    >R _BSK-NF-PLAN BSK-FP-WALK R> _BSK-NF-CACHE-SLOTS ;
+
+\ _BSK-NF-FETCH ( -- )   Fetch notifications and populate cache.
+: _BSK-NF-FETCH  ( -- )
+    BSK-ACCESS-LEN @ 0= IF
+        S" Not logged in" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-RESET
+    S" /xrpc/app.bsky.notification.listNotifications?limit=10" BSK-APPEND
+    _BSK-SAVE-PATH BSK-GET
+    DUP 0= IF 2DROP
+        S" Fetch failed" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-HTTP-STATUS @ 200 <> IF 2DROP
+        _BSK-HTTP-ERR-STATUS EXIT
+    THEN
+    2DUP S" notifications" JSON-FIND-KEY
+    DUP 0= IF 2DROP 2DROP
+        S" No notifications" _BSK-SET-STATUS EXIT
+    THEN
+    JSON-SKIP-WS
+    OVER C@ 91 <> IF 2DROP 2DROP EXIT THEN
+    1 /STRING JSON-SKIP-WS
+    _BSK-NF-GEN @ 1 XOR _BSK-NF-WG !  _BSK-NF-WB _BSK-NF-CLEAR
+    BEGIN
+        DUP 0> IF OVER C@ 93 <> ELSE 0 THEN
+        _BSK-NF-WN @ _BSK-NF-MAX < AND
+        DUP IF DROP 2DUP _BSK-ITEM-LEN _BSK-IL !
+            \ Room for the strings kept in the arena (_BSK-NF-R!)
+            2DUP _BSK-NF-PLAN BSK-FP-WALK
+            _BSK-NFF-REASON BSK-FP-STR NIP _BSK-NF-RMAX MIN
+            _BSK-NFF-HANDLE BSK-FP-STR NIP _BSK-IN-NEED +
+            _BSK-NFF-DID BSK-FP-STR NIP _BSK-IN-NEED +
+            _BSK-NF-WB _BSK-NFB-AR + _BSK-AR-ROOM <= THEN
+    WHILE
+        _BSK-NF-WN @ _BSK-NF-CACHE-SLOTS
+        1 _BSK-NF-WN +!
+        _BSK-IL @ /STRING
+        JSON-SKIP-WS
+        DUP 0> IF
+            OVER C@ 44 = IF 1 /STRING JSON-SKIP-WS THEN
+        THEN
+    REPEAT
+    2DROP 2DROP
+    _BSK-NF-GEN @ _BSK-NF-WG !
+    _BSK-BG-ON @ IF -1 _BSK-NF-FRESH ! ELSE _BSK-NF-PUBLISH THEN
+    _BSK-MX-PARSED
+    S" Notifications loaded" _BSK-SET-STATUS ;
+
+\ _BSK-PR-FETCH ( -- )   Fetch own profile and populate cache.
+: _BSK-PR-FETCH  ( -- )
+    BSK-ACCESS-LEN @ 0= IF
+        S" Not logged in" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-DID BSK-DID-LEN @ _BSK-PROFILE-PATH BSK-GET
+    DUP 0= IF 2DROP
+        S" Fetch failed" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-HTTP-STATUS @ 200 <> IF 2DROP
+        _BSK-HTTP-ERR-STATUS EXIT
+    THEN
+    \ One walk of the body fills every profile slot (§4.2)
+    _BSK-PR-PLAN BSK-FP-WALK
+    _BSK-PRF-NAME BSK-FP-STR
+    64 MIN DUP _BSK-PR-DNL !  _BSK-PR-DN SWAP CMOVE
+    _BSK-PR-ARENA _BSK-PR-AR _BSK-AR-RESET
+    _BSK-PRF-HANDLE BSK-FP-STR
+    _BSK-PR-AR _BSK-IN-KEEP _BSK-PR-HID !
+    BSK-DID BSK-DID-LEN @ _BSK-PR-AR _BSK-IN-KEEP _BSK-PR-DID !
+    _BSK-PRF-DESC BSK-FP-STR
+    200 MIN DUP _BSK-PR-DL !  _BSK-PR-D SWAP CMOVE
+    _BSK-PRF-FC BSK-FP-NUM _BSK-PR-FC !
+    _BSK-PRF-FG BSK-FP-NUM _BSK-PR-FG !
+    _BSK-PRF-PC BSK-FP-NUM _BSK-PR-PC !
+    -1 _BSK-PR-OK !
+    _BSK-MX-FILL _BSK-MX-PARSED
+    S" Profile loaded" _BSK-SET-STATUS ;
+
+\ ── §6.4  Background Refresh ──────────────────────────────────────
+\
+\  All TUI network work — fetches and write-queue flushes — goes
+\  through _BSK-BG-STEP.  BSK-BG-START runs it in a loop on core 1
+\  (CORE-RUN and NCORES are looked up by name, like COREID in §0.1),
+\  so keys and renders on the UI core never wait on the network.
+\  With a single core, or without those words, the UI runs the step
+\  itself from _BSK-BG-TICK on every key and data-screen render.
+\
+\  The UI asks for work through the _BSK-BG-WANT-* flags (set by the
+\  UI, cleared by the step).  The step also refreshes the timeline
+\  and notifications every BSK-BG-INTERVAL ms (0 = on request only).
+\  A timeline refresh only parses posts newer than the cached head
+\  and splices them on top (§6.3), so polling is cheap and paging
+\  back through older posts is not reset under the reader: history
+\  that no longer fits loses its oldest pages, and a small refresh
+\  joins the top page.  Only a refresh with more than a page of new
+\  posts starts the history over.
+\  Worker fetches fill the back generation (§6.1); _BSK-CACHE-SWAP,
+\  called at render time, publishes it.
+\
+\  The step renews the session first when the access token is due
+\  (BSK-TOKEN-DUE?, §2.6), so the renewal happens here, on the
+\  worker or in the UI's idle ticks, and not inside a fetch.
+\
+\  The worker owns the transport while it runs (bsky.f §2.4); a REPL
+\  word on the UI core takes it over for itself, and the next tick
+\  gives it back.  The profile is filled in place, so a render
+\  mid-fetch can show a mix of old and new.
+
+VARIABLE BSK-BG-INTERVAL   60000 BSK-BG-INTERVAL !   \ ms, 0 = off
+
+VARIABLE _BSK-BG-WANT-TL   0 _BSK-BG-WANT-TL !
+VARIABLE _BSK-BG-WANT-MORE 0 _BSK-BG-WANT-MORE ! \ next timeline page
+VARIABLE _BSK-BG-WANT-NF   0 _BSK-BG-WANT-NF !
+VARIABLE _BSK-BG-WANT-PR   0 _BSK-BG-WANT-PR !
+VARIABLE _BSK-BG-WANT-Q    0 _BSK-BG-WANT-Q !    \ flush queue now
+VARIABLE _BSK-BG-TL-T      0 _BSK-BG-TL-T !      \ MS@ of last TL fetch
+VARIABLE _BSK-BG-NF-T      0 _BSK-BG-NF-T !      \ MS@ of last NF fetch
+VARIABLE _BSK-BG-QDONE     0 _BSK-BG-QDONE !     \ flush result to show
+
+VARIABLE _BSK-CORE-RUN-XT  0 _BSK-CORE-RUN-XT !
+VARIABLE _BSK-NCORES-XT    0 _BSK-NCORES-XT !
+: _BSK-BG-INIT  ( -- )
+    S" CORE-RUN" _BSK-FIND _BSK-CORE-RUN-XT !
+    S" NCORES"   _BSK-FIND _BSK-NCORES-XT ! ;
+_BSK-BG-INIT
+
+\ _BSK-BG-DUE? ( var -- flag )  Interval refresh due since MS@ in var
+: _BSK-BG-DUE?  ( var -- flag )
+    BSK-ACCESS-LEN @ 0= BSK-BG-INTERVAL @ 0= OR IF DROP 0 EXIT THEN
+    MS@ SWAP @ - BSK-BG-INTERVAL @ >= ;
+
+\ _BSK-Q-DUE? ( -- flag )  Debounce window since last enqueue passed
+: _BSK-Q-DUE?  ( -- flag )
+    BSK-ACCESS-LEN @ 0= IF 0 EXIT THEN
+    MS@ _BSK-Q-T @ - BSK-Q-DELAY-MS @ >= ;
+
+\ _BSK-BG-STEP ( -- )  Do whatever network work is due
+\   A cache is only refetched once the UI has taken the last result
+\   (FRESH clear), so a generation is never written while on screen.
+: _BSK-BG-STEP  ( -- )
+    BSK-TOKEN-DUE? IF BSK-RENEW DROP THEN
+    BSK-PENDING 0> IF
+        _BSK-BG-WANT-Q @ _BSK-Q-DUE? OR IF
+            BSK-FLUSH  -1 _BSK-BG-QDONE !
+        THEN
+    THEN
+    0 _BSK-BG-WANT-Q !
+    _BSK-TL-FRESH @ 0= IF
+        _BSK-BG-WANT-TL @ _BSK-BG-TL-T _BSK-BG-DUE? OR IF
+            0 _BSK-BG-WANT-TL !  0 _BSK-BG-WANT-MORE !
+            MS@ _BSK-BG-TL-T !
+            _BSK-TL-FETCH
+        THEN
+    THEN
+    _BSK-TL-FRESH @ 0= _BSK-BG-WANT-MORE @ AND IF
+        0 _BSK-BG-WANT-MORE !
+        _BSK-TL-MORE
+    THEN
+    _BSK-NF-FRESH @ 0= IF
+        _BSK-BG-WANT-NF @ _BSK-BG-NF-T _BSK-BG-DUE? OR IF
+            0 _BSK-BG-WANT-NF !  MS@ _BSK-BG-NF-T !
+            _BSK-NF-FETCH
+        THEN
+    THEN
+    _BSK-BG-WANT-PR @ IF
+        0 _BSK-BG-WANT-PR !
+        _BSK-PR-FETCH
+    THEN ;
+
+\ _BSK-CACHE-SWAP ( -- )  Publish generations the worker filled
+: _BSK-CACHE-SWAP  ( -- )
+    _BSK-TL-FRESH @ IF
+        _BSK-TL-PUBLISH
+        0 _BSK-TL-FRESH !
+    THEN
+    _BSK-NF-FRESH @ IF
+        _BSK-NF-PUBLISH
+        0 _BSK-NF-FRESH !
+    THEN ;
+
+\ _BSK-BG-TICK ( -- )  UI side: step if no worker, swap, show results
+\   Also writes the session file a renewal on the worker left owed
+\   (§3.2 in bsky.f).
+: _BSK-BG-TICK  ( -- )
+    _BSK-GIVE-BACK
+    _BSK-BG-ON @ 0= IF _BSK-BG-STEP THEN
+    _BSK-BG-STATUS-LEN @ 0< 0= IF
+        _BSK-BG-STATUS _BSK-BG-STATUS-LEN @ _BSK-SET-STATUS
+        -1 _BSK-BG-STATUS-LEN !
+    THEN
+    _BSK-SS-DIRTY @ IF BSK-SAVE-SESSION DROP THEN
+    _BSK-CACHE-SWAP
+    _BSK-BG-QDONE @ IF
+        0 _BSK-BG-QDONE !
+        _BSK-Q-MSG _BSK-Q-MSG-LEN @ _BSK-SET-STATUS
+    THEN ;
+
+\ _BSK-BG-IDLE ( -- )  Poll the network ~100 ms
+: _BSK-BG-IDLE  ( -- )
+    MS@
+    BEGIN
+        NET-IDLE
+        MS@ OVER - 100 >=  _BSK-BG-HALT @ OR  _BSK-BG-HOLD @ OR
+    UNTIL
+    DROP ;
+
+\ _BSK-BG-PARK ( -- )  Keep off the network while the UI holds it
+: _BSK-BG-PARK  ( -- )
+    BEGIN _BSK-BG-HOLD @ _BSK-BG-HALT @ 0= AND WHILE REPEAT ;
+
+\ _BSK-BG-LOOP ( -- )  Worker body: step and idle, or park
+\   HELD is cleared before HOLD is read (bsky.f §2.4).
+: _BSK-BG-LOOP  ( -- )
+    BEGIN _BSK-BG-HALT @ 0= WHILE
+        0 _BSK-BG-HELD !
+        _BSK-BG-HOLD @ IF
+            -1 _BSK-BG-HELD !  _BSK-BG-PARK
+        ELSE
+            _BSK-BG-STEP  _BSK-BG-IDLE
+        THEN
+    REPEAT
+    0 _BSK-BG-ON ! ;
+
+\ _BSK-BG-CORES ( -- n )  Cores available (1 if NCORES is missing)
+: _BSK-BG-CORES  ( -- n )
+    _BSK-NCORES-XT @ DUP IF EXECUTE ELSE DROP 1 THEN ;
+
+\ BSK-BG-START ( -- )  Start the worker on core 1, if there is one
+\   Otherwise the TUI keeps refreshing from _BSK-BG-TICK.  Either
+\   way the first interval refresh is BSK-BG-INTERVAL from now.
+: BSK-BG-START  ( -- )
+    _BSK-BG-ON @ IF EXIT THEN
+    MS@ DUP _BSK-BG-TL-T ! _BSK-BG-NF-T !
+    _BSK-CORE-RUN-XT @ 0= _BSK-BG-CORES 2 < OR IF EXIT THEN
+    0 _BSK-BG-HALT !  0 _BSK-BG-HOLD !  0 _BSK-BG-HELD !
+    -1 _BSK-BG-ON !
+    ['] _BSK-BG-LOOP 1 _BSK-CORE-RUN-XT @ EXECUTE ;
+
+\ ── §6.5  Frame Output ────────────────────────────────────────────
+\
+\  RENDER-SCREEN clears the terminal and paints everything again, so
+\  moving the selection one row resends the title, every row, the
+\  detail pane and the hints.  The Timeline and Notifs subscreens
+\  are instead drawn as a frame: numbered lines at fixed terminal
+\  rows from BSK-FR-TOP down, each sent as
+\      ESC[row;1H  text  ESC[K
+\  A hash of what every row last showed is kept, and a frame drawn
+\  again sends only the rows whose hash changed.  Moving the
+\  selection is then the two rows that swap highlight and the detail
+\  pane.  The frame a real RENDER-SCREEN asks for (subscreen switch,
+\  [r], SCREENS auto-refresh) follows a clear, so it goes out whole.
+\
+\  A frame is assembled in _BSK-FR-OUT and sent with one TYPE:
+\      _BSK-FR-BEGIN
+\      _BSK-FR-OPEN ...append text... _BSK-FR-CLOSE     one row
+\      ...
+\      _BSK-FR-END         blank rows the last frame used, send
+\
+\  BSK-FR-TOP must be the first row below the SCREENS tab bars, and
+\  BSK-FR-ROWS no more than fit under it.  BSK-FR-ON off puts both
+\  subscreens back on the W.xxx widgets.
+\
+\  Counters (bytes):
+\    BSK-FR-LAST    sent by the last frame
+\    BSK-FR-WHOLE   the same frame sent whole
+\    BSK-FR-SENT    sent since BSK-FR-RESET, over BSK-FR-KEYS frames
+
+VARIABLE BSK-FR-ON      -1 BSK-FR-ON !
+VARIABLE BSK-FR-TOP      4 BSK-FR-TOP !     \ first frame row (1-based)
+VARIABLE BSK-FR-ROWS    20 BSK-FR-ROWS !    \ rows the frame may use
+VARIABLE BSK-FR-COLS    80 BSK-FR-COLS !
+VARIABLE BSK-FR-LIST     8 BSK-FR-LIST !    \ list items on screen
+VARIABLE BSK-FR-WRAP     3 BSK-FR-WRAP !    \ detail pane text rows
+
+VARIABLE BSK-FR-LAST
+VARIABLE BSK-FR-WHOLE
+VARIABLE BSK-FR-SENT
+VARIABLE BSK-FR-KEYS
+
+48   CONSTANT _BSK-FR-MAX                   \ rows tracked
+4096 CONSTANT _BSK-FR-OMAX
+CREATE _BSK-FR-SHADOW  _BSK-FR-MAX CELLS ALLOT   \ row hash, 0 = unknown
+CREATE _BSK-FR-OUT     _BSK-FR-OMAX ALLOT
+VARIABLE _BSK-FR-LEN                        \ bytes in _BSK-FR-OUT
+VARIABLE _BSK-FR-MARK                       \ where the open row starts
+VARIABLE _BSK-FR-ROW                        \ next frame row (0-based)
+VARIABLE _BSK-FR-USED                       \ rows the last frame drew
+VARIABLE _BSK-FR-W                          \ whole-frame byte count
+VARIABLE _BSK-FR-SCROLL                     \ first list item on screen
+VARIABLE _BSK-FR-XT                         \ list item builder
+VARIABLE _BSK-FR-SUB    -1 _BSK-FR-SUB !    \ subscreen on screen as a frame
+
+\ _BSK-FR-C ( c -- )   Append one byte to the frame
+: _BSK-FR-C  ( c -- )
+    _BSK-FR-LEN @ _BSK-FR-OMAX >= IF DROP EXIT THEN
+    _BSK-FR-OUT _BSK-FR-LEN @ + C!  1 _BSK-FR-LEN +! ;
+
+\ _BSK-FR+ ( addr len -- )   Append a string to the frame
+: _BSK-FR+  ( addr len -- )
+    _BSK-FR-OMAX _BSK-FR-LEN @ - MIN  0 MAX
+    DUP >R _BSK-FR-OUT _BSK-FR-LEN @ + SWAP CMOVE  R> _BSK-FR-LEN +! ;
+
+\ _BSK-FR-NUM ( u -- )   Append a number, no trailing space
+: _BSK-FR-NUM  ( u -- )
+    DUP 10 < IF 48 + _BSK-FR-C EXIT THEN
+    DUP 10 / RECURSE  10 MOD 48 + _BSK-FR-C ;
+
+\ _BSK-FR-SGR ( n -- )   Append ESC[n m (1 bold, 2 dim, 7 reverse, 0 reset)
+: _BSK-FR-SGR  ( n -- )
+    27 _BSK-FR-C 91 _BSK-FR-C _BSK-FR-NUM 109 _BSK-FR-C ;
+
+\ _BSK-FR-TRUNC ( addr len max -- )   Append, "..." if it is cut
+: _BSK-FR-TRUNC  ( addr len max -- )
+    2DUP > IF
+        NIP 3 - _BSK-FR+ S" ..." _BSK-FR+
+    ELSE DROP _BSK-FR+ THEN ;
+
+\ _BSK-FR-TYPE ( i xt -- )   Run a row builder and TYPE what it built,
+\   for the W.xxx path; the frame is left as it was
+: _BSK-FR-TYPE  ( i xt -- )
+    _BSK-FR-LEN @ >R  EXECUTE
+    _BSK-FR-OUT R@ +  _BSK-FR-LEN @ R@ - TYPE
+    R> _BSK-FR-LEN ! ;
+
+\ _BSK-FR-HASH ( addr len -- h )   Row hash, never 0
+: _BSK-FR-HASH  ( addr len -- h )
+    0 SWAP DUP 0> IF
+        0 DO 31 * OVER I + C@ + LOOP
+    ELSE DROP THEN
+    NIP DUP 0= IF 1+ THEN ;
+
+: _BSK-FR-LIM  ( -- n )  BSK-FR-ROWS @ _BSK-FR-MAX MIN ;
+
+\ _BSK-FR-AT ( row -- )   Append cursor-to for a frame row
+: _BSK-FR-AT  ( row -- )
+    27 _BSK-FR-C 91 _BSK-FR-C
+    BSK-FR-TOP @ + _BSK-FR-NUM  S" ;1H" _BSK-FR+ ;
+
+\ _BSK-FR-INVALIDATE ( -- )   The terminal was cleared: forget every row
+: _BSK-FR-INVALIDATE  ( -- )
+    _BSK-FR-SHADOW _BSK-FR-MAX CELLS 0 FILL
+    0 _BSK-FR-USED ! ;
+
+: _BSK-FR-BEGIN  ( -- )  0 _BSK-FR-LEN !  0 _BSK-FR-ROW !  0 _BSK-FR-W ! ;
+
+\ _BSK-FR-OPEN ( -- )   Start the next row
+: _BSK-FR-OPEN  ( -- )
+    _BSK-FR-LEN @ _BSK-FR-MARK !
+    _BSK-FR-ROW @ _BSK-FR-AT ;
+
+\ _BSK-FR-CLOSE ( -- )   End the row; keep it only if it changed
+: _BSK-FR-CLOSE  ( -- )
+    27 _BSK-FR-C S" [K" _BSK-FR+
+    _BSK-FR-ROW @ _BSK-FR-LIM < IF
+        _BSK-FR-OUT _BSK-FR-MARK @ +  _BSK-FR-LEN @ _BSK-FR-MARK @ -
+        DUP _BSK-FR-W +!
+        _BSK-FR-HASH  _BSK-FR-ROW @ CELLS _BSK-FR-SHADOW +
+        2DUP @ = IF 2DROP _BSK-FR-MARK @ _BSK-FR-LEN ! ELSE ! THEN
+    ELSE
+        _BSK-FR-MARK @ _BSK-FR-LEN !        \ past the bottom
+    THEN
+    1 _BSK-FR-ROW +! ;
+
+\ _BSK-FR-END ( -- )   Blank what the last frame had below this one,
+\   park the cursor under the frame and send; nothing at all when
+\   no row changed
+: _BSK-FR-END  ( -- )
+    _BSK-FR-W @
+    BEGIN _BSK-FR-ROW @ _BSK-FR-USED @ < WHILE
+        _BSK-FR-OPEN _BSK-FR-CLOSE
+    REPEAT
+    _BSK-FR-W !
+    _BSK-FR-ROW @ _BSK-FR-LIM MIN DUP _BSK-FR-USED !
+    _BSK-FR-LEN @ IF _BSK-FR-AT ELSE DROP THEN
+    _BSK-FR-OUT _BSK-FR-LEN @ TYPE
+    _BSK-FR-LEN @ DUP BSK-FR-LAST !  BSK-FR-SENT +!
+    _BSK-FR-W @ BSK-FR-WHOLE !
+    1 BSK-FR-KEYS +! ;
+
+\ ── Frame pieces ──
+
+: _BSK-FR-BLANK  ( -- )  _BSK-FR-OPEN _BSK-FR-CLOSE ;
+
+\ _BSK-FR-HINT ( addr len -- )   One dim row
+: _BSK-FR-HINT  ( addr len -- )
+    _BSK-FR-OPEN 2 _BSK-FR-SGR
+    BSK-FR-COLS @ _BSK-FR-TRUNC
+    0 _BSK-FR-SGR _BSK-FR-CLOSE ;
+
+\ _BSK-FR-TITLE ( addr len n -- )   Bold title, "(n)" unless n < 0;
+\   the row is left open
+: _BSK-FR-TITLE  ( addr len n -- )
+    _BSK-FR-OPEN 1 _BSK-FR-SGR >R _BSK-FR+
+    R> DUP 0< IF DROP ELSE
+        S"  (" _BSK-FR+ _BSK-FR-NUM 41 _BSK-FR-C
+    THEN
+    0 _BSK-FR-SGR ;
+
+\ _BSK-FR-STATUS ( -- )   Status line, when there is one
+: _BSK-FR-STATUS  ( -- )
+    _BSK-STATUS-LEN @ 0> IF
+        _BSK-FR-BLANK
+        _BSK-STATUS _BSK-STATUS-LEN @ _BSK-FR-HINT
+    THEN ;
+
+\ _BSK-FR-FIRST ( n -- first )   First item on screen: the window
+\   moves only as far as it must to keep SCR-SEL in it
+: _BSK-FR-FIRST  ( n -- first )
+    BSK-FR-LIST @ 1 MAX                     ( n k )
+    _BSK-FR-SCROLL @                        ( n k s )
+    SCR-SEL @ OVER < IF DROP SCR-SEL @ THEN
+    SCR-SEL @ OVER - 2 PICK >= IF DROP SCR-SEL @ OVER - 1+ THEN
+    ROT ROT - 0 MAX MIN  0 MAX
+    DUP _BSK-FR-SCROLL ! ;
+
+\ _BSK-FR-ITEM ( i -- )   One list row, reversed when selected
+: _BSK-FR-ITEM  ( i -- )
+    _BSK-FR-OPEN
+    DUP SCR-SEL @ = DUP >R IF
+        7 _BSK-FR-SGR S" > "
+    ELSE S"   " THEN _BSK-FR+
+    _BSK-FR-XT @ EXECUTE
+    R> IF 0 _BSK-FR-SGR THEN
+    _BSK-FR-CLOSE ;
+
+\ _BSK-FR-LIST ( n xt -- )   Up to BSK-FR-LIST rows of a list;
+\   xt ( i -- ) appends item i
+: _BSK-FR-LIST  ( n xt -- )
+    _BSK-FR-XT !
+    DUP SCR-MAX !
+    DUP _BSK-FR-FIRST                       ( n first )
+    SWAP OVER BSK-FR-LIST @ 1 MAX + MIN     ( first last )
+    SWAP 2DUP > IF
+        DO I _BSK-FR-ITEM LOOP
+    ELSE 2DROP THEN ;
+
+\ _BSK-FR-DECODE ( addr len -- addr' len' )
+\   Copy a raw JSON string into _BSK-FR-TXT with its escapes decoded:
+\   \n -> line feed   \t \r -> space   \\ -> \   \" -> "
+\   \uXXXX -> that character in UTF-8 (a \uD8xx\uDCxx pair as one),
+\   ? for a control character or an unpaired surrogate
+1024 CONSTANT _BSK-FR-TMAX
+CREATE _BSK-FR-TXT _BSK-FR-TMAX ALLOT
+
+\ _BSK-FR-HEX4 ( addr -- n | -1 )   Four hex digits at addr
+: _BSK-FR-HEX4  ( addr -- n | -1 )
+    0 4 0 DO
+        OVER I + C@ _BSK-HEXVAL
+        DUP 0< IF 2DROP DROP -1 UNLOOP EXIT THEN
+        SWAP 16 * +
+    LOOP
+    NIP ;
+
+\ _BSK-FR-PAIR ( addr len hi -- addr' len' c )   Join high surrogate
+\   hi, whose last digit is at addr, with the \uDCxx after it
+: _BSK-FR-PAIR  ( addr len hi -- addr' len' c )
+    OVER 7 < IF DROP 63 EXIT THEN
+    2 PICK 1+ C@ 92 <>  3 PICK 2 + C@ 117 <> OR IF DROP 63 EXIT THEN
+    2 PICK 3 + _BSK-FR-HEX4
+    DUP 64512 AND 56320 <> IF 2DROP 63 EXIT THEN      ( a l hi lo )
+    SWAP 55296 - 10 LSHIFT + 56320 - 65536 +
+    >R 6 /STRING R> ;
+
+\ _BSK-FR-ESC ( addr len -- addr' len' c )   Decode the escape whose
+\   letter is at addr; addr' is at its last character, c a code point
+: _BSK-FR-ESC  ( addr len -- addr' len' c )
+    OVER C@
+    DUP 110 = IF DROP 10 EXIT THEN
+    DUP 116 = OVER 114 = OR IF DROP 32 EXIT THEN
+    DUP 117 <> IF EXIT THEN
+    DROP DUP 5 < IF 63 EXIT THEN
+    OVER 1+ _BSK-FR-HEX4 DUP 0< IF DROP 63 EXIT THEN
+    >R 4 /STRING R>
+    DUP 63488 AND 55296 = IF                \ D800-DFFF
+        DUP 1024 AND IF DROP 63 EXIT THEN
+        _BSK-FR-PAIR EXIT
+    THEN
+    DUP 32 <  OVER 127 < 0= 2 PICK 160 < AND  OR
+    IF DROP 63 THEN ;
+
+\ _BSK-FR-U8 ( c i -- i' )   Store code point c as UTF-8 at offset i
+\   of _BSK-FR-TXT; one that does not fit ends the text there
+: _BSK-FR-U8  ( c i -- i' )
+    OVER 128 < IF TUCK _BSK-FR-TXT + C! 1+ EXIT THEN
+    OVER 2048 < IF 2 ELSE OVER 65536 < IF 3 ELSE 4 THEN THEN
+    2DUP + DUP _BSK-FR-TMAX > IF 2DROP 2DROP _BSK-FR-TMAX EXIT THEN
+    >R  256 OVER RSHIFT 256 SWAP - >R      ( c i n ) ( R: i' lead )
+    SWAP _BSK-FR-TXT + TUCK + 1-            ( c p q )
+    BEGIN 2DUP < WHILE
+        ROT DUP 63 AND 128 OR  2 PICK C!  6 RSHIFT  ROT ROT  1-
+    REPEAT
+    DROP SWAP R> OR SWAP C!  R> ;
+
+: _BSK-FR-DECODE  ( addr len -- addr' len' )
+    0 >R
+    BEGIN DUP 0> R@ _BSK-FR-TMAX < AND WHILE
+        OVER C@ DUP 92 = 2 PICK 1 > AND IF
+            DROP 1 /STRING _BSK-FR-ESC  R> _BSK-FR-U8 >R
+        ELSE
+            _BSK-FR-TXT R@ + C!  R> 1+ >R
+        THEN
+        1 /STRING
+    REPEAT 2DROP
+    _BSK-FR-TXT R> ;
+
+\ _BSK-FR-BREAK ( addr len width -- n )   Bytes for the next line:
+\   up to a line feed, else the last space that fits, else width
+VARIABLE _BSK-FR-BA
+
+: _BSK-FR-BREAK  ( addr len width -- n )
+    ROT _BSK-FR-BA !                        ( len width )
+    OVER MIN                                ( len m )
+    DUP 0> IF
+        DUP 0 DO
+            _BSK-FR-BA @ I + C@ 10 = IF 2DROP I UNLOOP EXIT THEN
+        LOOP
+    THEN
+    2DUP > 0= IF NIP EXIT THEN              \ the rest fits
+    NIP DUP                                 ( m i )
+    BEGIN DUP 0> WHILE
+        _BSK-FR-BA @ OVER + C@ 32 = IF NIP EXIT THEN
+        1-
+    REPEAT
+    DROP ;
+
+\ _BSK-FR-SKIP ( addr len -- addr' len' )   Past spaces and line feeds
+: _BSK-FR-SKIP  ( addr len -- addr' len' )
+    BEGIN
+        DUP 0> IF OVER C@ DUP 32 = SWAP 10 = OR ELSE 0 THEN
+    WHILE 1 /STRING REPEAT ;
+
+\ _BSK-FR-WRAP ( addr len width rows -- )
+\   Exactly rows rows of word-wrapped text, indented two; "..." ends
+\   the last when there is more.  A fixed height keeps the rows below
+\   where they were, so they are not sent again.
+VARIABLE _BSK-FR-WA   VARIABLE _BSK-FR-WU
+VARIABLE _BSK-FR-WW   VARIABLE _BSK-FR-WN
+
+: _BSK-FR-WRAP  ( addr len width rows -- )
+    _BSK-FR-WN ! _BSK-FR-WW ! _BSK-FR-WU ! _BSK-FR-WA !
+    _BSK-FR-WN @ 0> 0= IF EXIT THEN
+    _BSK-FR-WN @ 0 DO
+        _BSK-FR-OPEN S"   " _BSK-FR+
+        _BSK-FR-WA @ _BSK-FR-WU @
+        2DUP _BSK-FR-WW @ _BSK-FR-BREAK     ( a u n )
+        I 1+ _BSK-FR-WN @ = OVER 3 PICK < AND IF
+            NIP _BSK-FR-WW @ 3 - MIN _BSK-FR+ S" ..." _BSK-FR+
+            0 _BSK-FR-WU !
+        ELSE
+            >R OVER R@ _BSK-FR+  R> /STRING
+            _BSK-FR-SKIP _BSK-FR-WU ! _BSK-FR-WA !
+        THEN
+        _BSK-FR-CLOSE
+    LOOP ;
+
+\ BSK-FR-STATS ( -- )   Print the frame byte counters
+: BSK-FR-STATS  ( -- )
+    ." frame: last " BSK-FR-LAST @ . ." of " BSK-FR-WHOLE @ .
+    ." bytes, " BSK-FR-SENT @ . ." bytes over "
+    BSK-FR-KEYS @ . ." frames" CR ;
+
+: BSK-FR-RESET  ( -- )  0 BSK-FR-SENT !  0 BSK-FR-KEYS ! ;
+
+\ ── §6.6  Row Renderers ───────────────────────────────────────────
+\
+\  Called by W.LIST for each item.  Signature: ( i -- )
+\  The timeline and notification rows are built into the frame
+\  (§6.5) by _BSK-TL-ROW$ and _BSK-NF-ROW$, so both paths print
+\  the same row.
+
+\ _BSK-TL-ROW$ ( i -- )   Append one timeline post row to the frame
+: _BSK-TL-ROW$  ( i -- )
+    DUP _BSK-TL-HANDLE
+    DUP 0> IF
+        S" @" _BSK-FR+ 20 _BSK-FR-TRUNC
+    ELSE 2DROP THEN
+    S"  " _BSK-FR+
+    _BSK-TL-TEXT
+    DUP 0> IF
+        50 _BSK-FR-TRUNC
+    ELSE 2DROP THEN ;
+
+\ _BSK-NF-ROW$ ( i -- )   Append one notification row to the frame
+: _BSK-NF-ROW$  ( i -- )
+    DUP _BSK-NF-REASON
+    DUP 0> IF
+        18 _BSK-FR-TRUNC
+    ELSE 2DROP THEN
+    S"  @" _BSK-FR+
+    _BSK-NF-HANDLE
+    DUP 0> IF
+        40 _BSK-FR-TRUNC
+    ELSE 2DROP THEN ;
+
+\ .BSK-TL-ROW ( i -- )   Print one timeline post row.
+: .BSK-TL-ROW  ( i -- )  ['] _BSK-TL-ROW$ _BSK-FR-TYPE ;
+
+\ .BSK-NF-ROW ( i -- )   Print one notification row.
+: .BSK-NF-ROW  ( i -- )  ['] _BSK-NF-ROW$ _BSK-FR-TYPE ;
+
+\ .BSK-MX-ROW ( i -- )   Print one endpoint's metrics row.
+: .BSK-MX-ROW  ( i -- )
+    _BSK-MX-ROW >R
+    R@ _BSK-MX-NAME + R@ _BSK-MX-NLEN + @ 30 _BSK-TYPE-TRUNC
+    ."  x" R@ _BSK-MX-CALLS + @ .
+    R@ _BSK-MX-AVG . ." ms avg "
+    R@ _BSK-MX-MAXMS + @ . ." max "
+    R@ _BSK-MX-PARSE + @ . ." parse "
+    R@ _BSK-MX-BYTES + @ 1023 + 1024 / . ." KB "
+    R> _BSK-MX-FILLS + @ . ." fills" ;
+
+\ .BSK-TL-DETAIL ( -- )   Show detail for selected timeline post.
+: .BSK-TL-DETAIL  ( -- )
+    SCR-SEL @
+    DUP _BSK-TL-HANDLE
+    DUP 0> IF
+        BOLD ."   @" TYPE RESET-COLOR CR
+    ELSE 2DROP THEN
+    DUP _BSK-TL-TEXT
+    DUP 0> IF
+        CR ."   " TYPE CR
+    ELSE 2DROP THEN
+    CR
+    _BSK-TL-URI
+    DUP 0> IF
+        DIM ."   " 78 _BSK-TYPE-TRUNC RESET-COLOR CR
+    ELSE 2DROP THEN ;
+
+\ ── §6.7  Screen Renderers ────────────────────────────────────────
+\
+\  Each subscreen is a word that calls W.xxx widgets.  Timeline and
+\  Notifs send a frame (§6.5) instead while BSK-FR-ON is set.
+
+\ Profile value printers (for W.KV-XT)
+: .BSK-PR-DN  ( -- )  _BSK-PR-DN _BSK-PR-DNL @ TYPE ;
+: .BSK-PR-HA  ( -- )  ." @" _BSK-PR-HID @ _BSK-PR-AR _BSK-IN-AT TYPE ;
+
+\ Show whose feed this is in the title
+: .BSK-TL-TITLE  ( -- )
+    _BSK-TL-N @ 0> IF
+        ." @" BSK-HANDLE BSK-HANDLE-LEN @ TYPE ."  "
+    THEN ;
+
+\ Common hint bar for timeline subscreen
+: _BSK-TL-HINT$  ( -- a u )
+    S" [l]Like [t]Repost [y]Reply [d]Delete [c]Compose [f]Refresh  [Enter]Open" ;
+: .BSK-TL-HINTS  ( -- )
+    _BSK-TL-N @ 0> IF
+        _BSK-TL-HINT$ W.HINT
+    THEN ;
+
+\ ── Frames (§6.5) ──
+
+\ _BSK-FR-HANDLE ( i -- )   "@handle" row, bold
+: _BSK-FR-HANDLE  ( i -- )
+    _BSK-FR-OPEN 1 _BSK-FR-SGR S"   @" _BSK-FR+
+    _BSK-TL-HANDLE BSK-FR-COLS @ 4 - _BSK-FR-TRUNC
+    0 _BSK-FR-SGR _BSK-FR-CLOSE ;
+
+\ _BSK-FR-URI ( i -- )   at:// URI row, dim
+: _BSK-FR-URI  ( i -- )
+    _BSK-FR-OPEN 2 _BSK-FR-SGR S"   " _BSK-FR+
+    _BSK-TL-URI BSK-FR-COLS @ 4 - _BSK-FR-TRUNC
+    0 _BSK-FR-SGR _BSK-FR-CLOSE ;
+
+\ _BSK-FR-TL-DETAIL ( -- )   Detail pane for the selected post,
+\   BSK-FR-WRAP + 2 rows whatever is selected
+: _BSK-FR-TL-DETAIL  ( -- )
+    SCR-SEL @ DUP 0< OVER _BSK-TL-N @ >= OR IF
+        DROP BSK-FR-WRAP @ 2 + 0 DO _BSK-FR-BLANK LOOP EXIT
+    THEN
+    DUP _BSK-FR-HANDLE
+    DUP _BSK-TL-TEXT _BSK-FR-DECODE
+    BSK-FR-COLS @ 4 - BSK-FR-WRAP @ _BSK-FR-WRAP
+    _BSK-FR-URI ;
+
+\ _BSK-FR-TL ( -- )   Timeline frame
+: _BSK-FR-TL  ( -- )
+    _BSK-FR-BEGIN
+    _BSK-TL-N @ 0= IF
+        S" Timeline" -1 _BSK-FR-TITLE _BSK-FR-CLOSE
+        S" Press [f] to fetch your timeline" _BSK-FR-HINT
+    ELSE
+        S" Timeline" _BSK-TL-N @ _BSK-FR-TITLE
+        S"   @" _BSK-FR+ BSK-HANDLE BSK-HANDLE-LEN @ _BSK-FR+
+        _BSK-FR-CLOSE
+        _BSK-FR-BLANK
+        _BSK-TL-N @ ['] _BSK-TL-ROW$ _BSK-FR-LIST
+        _BSK-FR-BLANK
+        _BSK-FR-TL-DETAIL
+        _BSK-FR-BLANK
+        _BSK-TL-HINT$ _BSK-FR-HINT
+    THEN
+    _BSK-FR-STATUS
+    _BSK-FR-END ;
+
+\ _BSK-FR-NF ( -- )   Notifications frame
+: _BSK-FR-NF  ( -- )
+    _BSK-FR-BEGIN
+    _BSK-NF-N @ 0= IF
+        S" Notifications" -1 _BSK-FR-TITLE _BSK-FR-CLOSE
+        S" Press [f] to fetch notifications" _BSK-FR-HINT
+    ELSE
+        S" Notifications" _BSK-NF-N @ _BSK-FR-TITLE _BSK-FR-CLOSE
+        _BSK-FR-BLANK
+        _BSK-NF-N @ ['] _BSK-NF-ROW$ _BSK-FR-LIST
+        _BSK-FR-BLANK
+        S" [f]Refresh  [n/p]Navigate" _BSK-FR-HINT
+    THEN
+    _BSK-FR-STATUS
+    _BSK-FR-END ;
+
+\ _BSK-FR-VIEW ( i -- )   One post in full, in place of the timeline
+: _BSK-FR-VIEW  ( i -- )
+    _BSK-FR-BEGIN
+    DUP _BSK-FR-HANDLE
+    _BSK-FR-BLANK
+    DUP _BSK-TL-TEXT _BSK-FR-DECODE
+    BSK-FR-COLS @ 4 - _BSK-FR-LIM 6 - 1 MAX _BSK-FR-WRAP
+    _BSK-FR-BLANK
+    _BSK-FR-URI
+    _BSK-FR-BLANK
+    S" [y] Reply    any other key returns" _BSK-FR-HINT
+    _BSK-FR-END ;
+
+\ _BSK-FR-PAINT ( sub -- )   A RENDER-SCREEN has just cleared the
+\   terminal: send the frame whole
+: _BSK-FR-PAINT  ( sub -- )
+    DUP _BSK-FR-SUB !  _BSK-FR-INVALIDATE
+    IF _BSK-FR-NF ELSE _BSK-FR-TL THEN ;
+
+\ _BSK-FR? ( -- flag )   The subscreen showing is a frame
+: _BSK-FR?  ( -- flag )
+    BSK-FR-ON @  SUBSCREEN-ID @ _BSK-FR-SUB @ = AND ;
+
+\ _BSK-FR-UPDATE ( -- )   Draw the frame again; only changes are sent
+: _BSK-FR-UPDATE  ( -- )
+    _BSK-BG-TICK
+    SUBSCREEN-ID @ 1 = IF _BSK-FR-NF ELSE _BSK-FR-TL THEN ;
+
+\ SCR-BSKY-TL ( -- )   Timeline subscreen
+: SCR-BSKY-TL  ( -- )
+    _BSK-BG-TICK
+    BSK-FR-ON @ IF 0 _BSK-FR-PAINT EXIT THEN
+    -1 _BSK-FR-SUB !
+    _BSK-TL-N @ 0= IF
+        S" Timeline" W.TITLE
+        S" Press [f] to fetch your timeline" W.HINT
+    ELSE
+        _BSK-TL-N @ S" Timeline" W.TITLE-N
+        W.GAP
+        ['] .BSK-TL-TITLE W.CUSTOM
+        _BSK-TL-N @ ['] .BSK-TL-ROW W.LIST
+        _BSK-TL-N @ ['] .BSK-TL-DETAIL W.DETAIL
+        W.GAP
+        .BSK-TL-HINTS
+    THEN
+    _BSK-STATUS-LEN @ 0> IF
+        W.GAP
+        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
+    THEN ;
+
+\ SCR-BSKY-NF ( -- )   Notifications subscreen
+: SCR-BSKY-NF  ( -- )
+    _BSK-BG-TICK
+    BSK-FR-ON @ IF 1 _BSK-FR-PAINT EXIT THEN
+    -1 _BSK-FR-SUB !
+    _BSK-NF-N @ 0= IF
+        S" Notifications" W.TITLE
+        S" Press [f] to fetch notifications" W.HINT
+    ELSE
+        _BSK-NF-N @ S" Notifications" W.TITLE-N
+        _BSK-NF-N @ ['] .BSK-NF-ROW W.LIST
+        W.GAP
+        S" [f]Refresh  [n/p]Navigate" W.HINT
+    THEN
+    _BSK-STATUS-LEN @ 0> IF
+        W.GAP
+        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
+    THEN ;
+
+\ SCR-BSKY-PR ( -- )   Profile subscreen
+: SCR-BSKY-PR  ( -- )
+    _BSK-BG-TICK
+    _BSK-PR-OK @ 0= IF
+        S" Profile" W.TITLE
+        S" Press [f] to fetch your profile" W.HINT
+    ELSE
+        S" Profile" W.TITLE
+        ['] .BSK-PR-DN S" Name" W.KV-XT
+        ['] .BSK-PR-HA S" Handle" W.KV-XT
+        _BSK-PR-FC @ S" Followers" W.KV
+        _BSK-PR-FG @ S" Following" W.KV
+        _BSK-PR-PC @ S" Posts" W.KV
+        W.GAP
+        _BSK-PR-DL @ 0> IF
+            S" Bio" W.SECTION
+            _BSK-PR-D _BSK-PR-DL @ W.LINE
+        THEN
+        W.GAP
+        S" [f]Refresh" W.HINT
+    THEN
+    _BSK-STATUS-LEN @ 0> IF
+        W.GAP
+        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
+    THEN ;
+
+\ SCR-BSKY-STATS ( -- )   Metrics subscreen (§2.5)
+: SCR-BSKY-STATS  ( -- )
+    _BSK-BG-TICK
+    _BSK-MX-N @ 0= IF
+        S" Stats" W.TITLE
+        BSK-METRICS? @ IF
+            S" No requests yet: press [f] on another subscreen" W.HINT
+        ELSE
+            S" Metrics are off: press [m] to start" W.HINT
+        THEN
+    ELSE
+        _BSK-MX-N @ S" Stats" W.TITLE-N
+        _BSK-MX-N @ ['] .BSK-MX-ROW W.LIST
+        W.GAP
+        BSK-POOL-HITS @ S" Pool hits" W.KV
+        BSK-POOL-MISSES @ BSK-POOL-REDIALS @ + S" Handshakes" W.KV
+        BSK-FR-LAST @ S" Frame bytes" W.KV
+        BSK-FR-WHOLE @ S" Whole frame" W.KV
+        W.GAP
+        BSK-METRICS? @ IF
+            S" [m]Stop  [z]Zero counters" W.HINT
+        ELSE
+            S" Paused  [m]Resume  [z]Zero counters" W.HINT
+        THEN
+    THEN ;
+
+\ SCR-BSKY-HELP ( -- )   Help / controls subscreen
+: SCR-BSKY-HELP  ( -- )
+    S" Bluesky Controls" W.TITLE
+    W.GAP
+    S" Navigation" W.SECTION
+    S" [n/p] Select next / previous post" W.LINE
+    S"       [n] on the last post loads older posts" W.LINE
+    S" [[/]] Switch subscreen ([ = prev, ] = next)" W.LINE
+    S" Enter  Open selected post full-screen" W.LINE
+    S" [0-9] Switch to another KDOS screen" W.LINE
+    W.GAP
+    S" Timeline Actions" W.SECTION
+    S" [f]   Fetch / refresh current view" W.LINE
+    S" [l]   Like selected post" W.LINE
+    S" [t]   Repost selected post" W.LINE
+    S" [y]   Reply to selected post (Esc to cancel)" W.LINE
+    S" [d]   Delete selected post (yours only)" W.LINE
+    S"       Writes are queued and sent in batches; [f] sends now" W.LINE
+    S"       Timeline and notifications also refresh in the background" W.LINE
+    W.GAP
+    S" Compose" W.SECTION
+    S" [c]   Write a new post (Enter to send, Esc to cancel)" W.LINE
+    W.GAP
+    S" Stats" W.SECTION
+    S" [m]   Start / stop collecting request metrics" W.LINE
+    S" [z]   Zero the metrics" W.LINE
+    W.GAP
+    S" System" W.SECTION
+    S" [q]   Quit SCREENS, return to Forth prompt" W.LINE
+    S" [r]   Force screen redraw" W.LINE
+    S" [A]   Toggle auto-refresh" W.LINE ;
+
+\ SCR-BSKY ( -- )   Main screen (fallback if no subscreens)
+: SCR-BSKY  ( -- )
+    SCR-BSKY-TL ;
+
+\ ── §6.8  Key Handler & Actions ──────────────────────────────────
+\
+\  BSKY-KEYS ( c -- consumed )
+\  Per-screen key handler.  Priority dispatch via CALL-SCREEN-KEY.
+\  On a frame (§6.5) keys end in _BSK-REDRAW, which sends only the
+\  rows they changed, and n/p are handled here rather than by
+\  SCREENS.  Compose and reply read a line with W.INPUT under the
+\  frame, so they still finish with a full RENDER-SCREEN.
+
+\ _BSK-SWITCH-SUB ( delta -- )
+\   Move to adjacent subscreen (wrapping), reset selection state.
+: _BSK-SWITCH-SUB  ( delta -- )
+    SUBSCREEN-ID @ + DUP 0 < IF DROP SCREEN-SUBS 1- THEN
+    DUP SCREEN-SUBS >= IF DROP 0 THEN
+    SUBSCREEN-ID !
+    0 SCR-SEL !  0 SCR-MAX !
+    RENDER-SCREEN ;
+
+\ Writes from the TUI go through the write queue (§5.7) so a burst
+\ of keypresses never waits on the network; the refresh step (§6.4)
+\ sends the queue once BSK-Q-DELAY-MS has passed since the last
+\ enqueue, or at once on [f].
+
+\ _BSK-Q-STATUS ( ok? label-addr label-len -- )
+\   Status line after an enqueue: "like queued (3 pending)".
+: _BSK-Q-STATUS  ( ok? laddr llen -- )
+    ROT 0= IF
+        2DROP S" Write queue unavailable" _BSK-SET-STATUS EXIT
+    THEN
+    BSK-RESET BSK-APPEND
+    S"  queued (" BSK-APPEND
+    BSK-PENDING NUM>APPEND
+    S"  pending)" BSK-APPEND
+    BSK-BUF BSK-LEN @ _BSK-SET-STATUS ;
+
+\ _BSK-ACT-LIKE ( -- )   Like the selected post
+: _BSK-ACT-LIKE  ( -- )
+    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
+        DUP _BSK-TL-URI ROT _BSK-TL-CID
+        _BSK-Q-LIKE S" Like" _BSK-Q-STATUS
+    ELSE DROP THEN ;
+
+\ _BSK-ACT-REPOST ( -- )   Repost the selected post
+: _BSK-ACT-REPOST  ( -- )
+    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
+        DUP _BSK-TL-URI ROT _BSK-TL-CID
+        _BSK-Q-REPOST S" Repost" _BSK-Q-STATUS
+    ELSE DROP THEN ;
+
+\ _BSK-ACT-DELETE ( -- )   Delete the selected post
+: _BSK-ACT-DELETE  ( -- )
+    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
+        _BSK-TL-URI _BSK-Q-DEL S" Delete" _BSK-Q-STATUS
+    ELSE DROP THEN ;
+
+\ _BSK-ACT-REPLY ( -- )   Reply to the selected post
+: _BSK-ACT-REPLY  ( -- )
+    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
+        DUP _BSK-TL-URI ROT _BSK-TL-CID
+        _BSK-COMP-BUF 280 S" Reply> " W.INPUT
+        DUP 0> IF
+            _BSK-COMP-BUF SWAP _BSK-Q-REPLY S" Reply" _BSK-Q-STATUS
+        ELSE DROP 2DROP 2DROP THEN
+    ELSE DROP THEN ;
+
+\ _BSK-ACT-COMPOSE ( -- )   Compose a new post
+: _BSK-ACT-COMPOSE  ( -- )
+    _BSK-COMP-BUF 280 S" Post> " W.INPUT
+    DUP 0> IF
+        _BSK-COMP-BUF SWAP _BSK-Q-POST-TEXT S" Post" _BSK-Q-STATUS
+    ELSE DROP THEN ;
+
+\ _BSK-TYPE-DECODED ( addr len -- )
+\   TYPE a raw JSON string, decoding backslash escapes:
+\   \n -> newline+indent   \t -> space   \\ -> \   \" -> "
+: _BSK-TYPE-DECODED  ( addr len -- )
+    BEGIN DUP 0> WHILE
+        OVER C@ 92 = IF              \ backslash
+            1 /STRING DUP 0> IF
+                OVER C@
+                DUP 110 = IF DROP CR ."   " ELSE  \ \n -> newline
+                DUP 116 = IF DROP SPACE       ELSE  \ \t -> space
+                DUP  92 = IF DROP 92 EMIT     ELSE  \ \\
+                DUP  34 = IF DROP 34 EMIT     ELSE  \ \"
+                              EMIT                   \ other: pass through
+                THEN THEN THEN THEN
+                1 /STRING
+            THEN
+        ELSE
+            OVER C@ EMIT
+            1 /STRING
+        THEN
+    REPEAT 2DROP ;
+
+\ _BSK-REDRAW ( -- )   Show what a key changed: the changed rows of a
+\   frame, else a full RENDER-SCREEN
+: _BSK-REDRAW  ( -- )
+    _BSK-FR? IF _BSK-FR-UPDATE ELSE RENDER-SCREEN THEN ;
+
+\ _BSK-FR-STEP ( delta -- )   n/p on a frame: move the selection and
+\   send the rows that changed.  Past the last post asks for the
+\   next page.
+: _BSK-FR-STEP  ( delta -- )
+    SUBSCREEN-ID @ 1 = IF _BSK-NF-N ELSE _BSK-TL-N THEN @   ( d n )
+    DUP 0= IF 2DROP EXIT THEN
+    SWAP SCR-SEL @ +                                        ( n sel )
+    2DUP <= IF
+        SUBSCREEN-ID @ 0= IF
+            -1 _BSK-BG-WANT-MORE !
+            S" Loading older posts..." _BSK-SET-STATUS
+        THEN
+        DROP 1-
+    ELSE NIP THEN
+    0 MAX SCR-SEL !
+    _BSK-FR-UPDATE ;
+
+\ _BSK-VIEW-POST ( -- )   Show full text of selected post, full-screen.
+\   On a frame the post is drawn over the timeline rows and the
+\   timeline comes back as a frame update.
+: _BSK-VIEW-POST  ( -- )
+    SUBSCREEN-ID @ 0 <> IF EXIT THEN      \ only on Timeline subscreen
+    SCR-SEL @ DUP -1 = IF DROP EXIT THEN
+    DUP _BSK-TL-N @ >= IF DROP EXIT THEN
+    _BSK-FR? IF
+        _BSK-FR-VIEW
+        KEY 121 = IF _BSK-ACT-REPLY RENDER-SCREEN ELSE _BSK-FR-UPDATE THEN
+        EXIT
+    THEN
+    PAGE
+    CR
+    DUP _BSK-TL-HANDLE DUP 0> IF BOLD ."   @" TYPE RESET-COLOR ELSE 2DROP THEN
+    CR CR
+    ."   "
+    _BSK-TL-TEXT DUP 0> IF
+        _BSK-TYPE-DECODED CR
+    ELSE 2DROP THEN
+    CR
+    SCR-SEL @ _BSK-TL-URI DUP 0> IF
+        DIM ."   " TYPE RESET-COLOR CR
+    ELSE 2DROP THEN
+    CR HBAR CR
+    DIM ."   [y] Reply    any other key returns" RESET-COLOR CR
+    KEY DUP 121 = IF DROP _BSK-ACT-REPLY ELSE DROP THEN
+    RENDER-SCREEN ;
+
+\ BSKY-KEYS ( c -- consumed )
+\   Key handler for the Bluesky screen.
+: BSKY-KEYS  ( c -- consumed )
+    _BSK-BG-TICK
+    \ '['  = previous subscreen (with state reset)
+    DUP 91 = IF DROP -1 _BSK-SWITCH-SUB -1 EXIT THEN
+    \ ']'  = next subscreen (with state reset)
+    DUP 93 = IF DROP  1 _BSK-SWITCH-SUB -1 EXIT THEN
+    \ 'f' = fetch/refresh (subscreen-dependent), via §6.4
+    DUP 102 = IF DROP
+        _BSK-CLR-STATUS
+        -1 _BSK-BG-WANT-Q !            \ send queued writes first
+        SUBSCREEN-ID @ 0 = IF -1 _BSK-BG-WANT-TL ! THEN
+        SUBSCREEN-ID @ 1 = IF -1 _BSK-BG-WANT-NF ! THEN
+        SUBSCREEN-ID @ 2 = IF -1 _BSK-BG-WANT-PR ! THEN
+        _BSK-BG-ON @ IF S" Refreshing..." _BSK-SET-STATUS THEN
+        _BSK-REDRAW -1 EXIT
+    THEN
+    \ 'c' = compose (any subscreen)
+    DUP 99 = IF DROP
+        _BSK-ACT-COMPOSE
+        RENDER-SCREEN -1 EXIT
+    THEN
+    \ Stats subscreen: 'm' = metrics on/off, 'z' = zero them
+    SUBSCREEN-ID @ 3 = IF
+        DUP 109 = IF DROP
+            BSK-METRICS? @ IF BSK-METRICS-OFF ELSE BSK-METRICS-ON THEN
+            RENDER-SCREEN -1 EXIT
+        THEN
+        DUP 122 = IF DROP
+            BSK-STATS-RESET RENDER-SCREEN -1 EXIT
+        THEN
+    THEN
+    \ 'n'/'p' on a frame: move here and send only what changed
+    _BSK-FR? IF
+        DUP 110 = IF DROP  1 _BSK-FR-STEP -1 EXIT THEN
+        DUP 112 = IF DROP -1 _BSK-FR-STEP -1 EXIT THEN
+    THEN
+    \ Post actions (timeline subscreen only)
+    SUBSCREEN-ID @ 0 <> IF DROP 0 EXIT THEN
+    \ 'n' on the last post = append the next page; SCREENS still
+    \ moves the selection, so the key is not consumed
+    DUP 110 = IF
+        _BSK-TL-N @ 0>  SCR-SEL @ 1+ _BSK-TL-N @ >= AND IF
+            -1 _BSK-BG-WANT-MORE !
+            S" Loading older posts..." _BSK-SET-STATUS
+        THEN
+        DROP 0 EXIT
+    THEN
+    \ 'l' = like
+    DUP 108 = IF DROP
+        _BSK-ACT-LIKE _BSK-REDRAW -1 EXIT
+    THEN
+    \ 't' = repost
+    DUP 116 = IF DROP
+        _BSK-ACT-REPOST _BSK-REDRAW -1 EXIT
+    THEN
+    \ 'd' = delete
+    DUP 100 = IF DROP
+        _BSK-ACT-DELETE _BSK-REDRAW -1 EXIT
+    THEN
+    \ 'y' = reply
+    DUP 121 = IF DROP
+        _BSK-ACT-REPLY RENDER-SCREEN -1 EXIT
+    THEN
+    DROP 0 ;       \ not consumed
+
+\ ── §6.9  Screen Registration ─────────────────────────────────────
+\
+\  Register Bluesky as screen [9] with five subscreens.
+
+: LBL-BSKY     ." Bsky" ;
+: LBL-BSKY-TL  ." Timeline" ;
+: LBL-BSKY-NF  ." Notifs" ;
+: LBL-BSKY-PR  ." Profile" ;
+: LBL-BSKY-ST  ." Stats" ;
+: LBL-BSKY-HLP ." Help" ;
+
+VARIABLE _BSK-SCR-ID
+
+' SCR-BSKY ' LBL-BSKY 1 REGISTER-SCREEN _BSK-SCR-ID !
+
+' BSKY-KEYS      _BSK-SCR-ID @ SET-SCREEN-KEYS
+' _BSK-VIEW-POST _BSK-SCR-ID @ SET-SCREEN-ACT
+
+' SCR-BSKY-TL   ' LBL-BSKY-TL  _BSK-SCR-ID @ ADD-SUBSCREEN
+' SCR-BSKY-NF   ' LBL-BSKY-NF  _BSK-SCR-ID @ ADD-SUBSCREEN
+' SCR-BSKY-PR   ' LBL-BSKY-PR  _BSK-SCR-ID @ ADD-SUBSCREEN
+' SCR-BSKY-STATS ' LBL-BSKY-ST _BSK-SCR-ID @ ADD-SUBSCREEN
+' SCR-BSKY-HELP ' LBL-BSKY-HLP _BSK-SCR-ID @ ADD-SUBSCREEN
+
+\ =====================================================================
+\  §6 — End of Interactive TUI
+\ =====================================================================
@@ -0,0 +1,654 @@
+\ bsky-write.f — Write features for bsky.f (§5): posts, replies,
+\                likes, reposts, follows, deletes and the write queue
+\
+\ Depends on: bsky.f
+\             Akashic libraries (base64, uri, aturi, repo)
+\
+\ Deferred module: bsky.f's stubs for the public words below load
+\ this on first use.  A read-only client never does, and neither
+\ this file nor the akashic libraries it pulls in are compiled.
+\
+\ Load with:   REQUIRE bsky-write.f
+
+PROVIDED bsky-write.f
+REQUIRE bsky.f
+
+\ ── Akashic library dependencies ──────────────────────────────
+\ Only the write path needs these; see bsky.f for the others.
+REQUIRE net/base64.f
+REQUIRE net/uri.f
+REQUIRE atproto/aturi.f
+REQUIRE atproto/repo.f
+
+\ =====================================================================
+\  §5  Write Features
+\ =====================================================================
+\
+\  BSK-POST   — post a new skeet
+\  BSK-REPLY  — reply to a post
+\  BSK-LIKE   — like a post
+\  BSK-REPOST — repost
+\
+\  All four use POST /xrpc/com.atproto.repo.createRecord with
+\  different collection and record schemas.
+
+\ ── §5.1  JSON Body Builder ───────────────────────────────────────
+\
+\  Staging buffer: JSON body is built in BSK-BUF, then copied here
+\  before BSK-BUILD-POST overwrites BSK-BUF with HTTP headers.
+
+CREATE _BSK-POST-BUF 2048 ALLOT
+VARIABLE _BSK-POST-LEN   0 _BSK-POST-LEN !
+
+\ _BSK-STAGE-BODY ( -- )  Copy BSK-BUF → _BSK-POST-BUF
+: _BSK-STAGE-BODY  ( -- )
+    BSK-LEN @ 2048 MIN DUP _BSK-POST-LEN !
+    BSK-BUF _BSK-POST-BUF ROT CMOVE ;
+
+\ _BSK-QK ( addr len -- )  Append "key":  (quoted key + colon)
+: _BSK-QK  ( addr len -- )
+    34 BSK-EMIT  BSK-APPEND  34 BSK-EMIT  58 BSK-EMIT ;
+
+\ _BSK-QV ( addr len -- )  Append "value" (quoted value)
+: _BSK-QV  ( addr len -- )
+    34 BSK-EMIT  BSK-APPEND  34 BSK-EMIT ;
+
+\ _BSK-QV-ESC ( addr len -- )  Append "value" with JSON escaping
+: _BSK-QV-ESC  ( addr len -- )
+    34 BSK-EMIT  JSON-COPY-ESCAPED  34 BSK-EMIT ;
+
+\ _BSK-COMMA ( -- )  Append comma
+: _BSK-COMMA  ( -- )  44 BSK-EMIT ;
+
+\ _BSK-CR-HEAD ( collection-addr collection-len -- )
+\   Emits: {"repo":"<DID>","collection":"<col>","record":
+: _BSK-CR-HEAD  ( caddr clen -- )
+    123 BSK-EMIT                      \ {
+    S" repo" _BSK-QK
+    BSK-DID BSK-DID-LEN @ _BSK-QV
+    _BSK-COMMA
+    S" collection" _BSK-QK
+    _BSK-QV
+    _BSK-COMMA
+    S" record" _BSK-QK ;
+
+\ _BSK-REC-OPEN ( collection-addr collection-len -- )
+\   Begin a bare record.  Emits: {"$type":"<col>",
+: _BSK-REC-OPEN  ( caddr clen -- )
+    123 BSK-EMIT                      \ {
+    S" $type" _BSK-QK
+    _BSK-QV
+    _BSK-COMMA ;
+
+\ _BSK-CR-OPEN ( collection-addr collection-len -- )
+\   Begin a createRecord JSON body with common fields.
+\   Emits: {"repo":"<DID>","collection":"<col>","record":{"$type":"<col>",
+: _BSK-CR-OPEN  ( caddr clen -- )
+    BSK-RESET
+    2DUP _BSK-CR-HEAD
+    _BSK-REC-OPEN ;
+
+\ _BSK-CREATED-AT ( -- )  Append "createdAt":"<ISO8601>"
+: _BSK-CREATED-AT  ( -- )
+    S" createdAt" _BSK-QK
+    BSK-NOW _BSK-QV ;
+
+\ _BSK-CR-CLOSE ( -- )  Close record and outer braces: }}
+: _BSK-CR-CLOSE  ( -- )
+    125 BSK-EMIT  125 BSK-EMIT ;  \ }}
+
+\ _BSK-SUBJECT ( uri-addr uri-len cid-addr cid-len -- )
+\   Append "subject":{"uri":"...","cid":"..."}
+: _BSK-SUBJECT  ( uaddr ulen caddr clen -- )
+    2>R
+    S" subject" _BSK-QK
+    123 BSK-EMIT
+    S" uri" _BSK-QK  _BSK-QV  _BSK-COMMA
+    S" cid" _BSK-QK  2R> _BSK-QV
+    125 BSK-EMIT ;
+
+\ _BSK-POST-FIELDS ( text-addr text-len -- )
+\   Append "text":"...","createdAt":"..."
+: _BSK-POST-FIELDS  ( taddr tlen -- )
+    S" text" _BSK-QK
+    _BSK-QV-ESC
+    _BSK-COMMA
+    _BSK-CREATED-AT ;
+
+\ _BSK-SUBJ-FIELDS ( uri-addr uri-len cid-addr cid-len -- )
+\   Append "subject":{...},"createdAt":"..."  (like / repost)
+: _BSK-SUBJ-FIELDS  ( uaddr ulen caddr clen -- )
+    _BSK-SUBJECT
+    _BSK-COMMA
+    _BSK-CREATED-AT ;
+
+\ _BSK-DO-CREATE ( -- ok? )  Stage body, POST, check response.
+: _BSK-DO-CREATE  ( -- ok? )
+    BSK-ACCESS-LEN @ 0= IF
+        ." bsky: login first" CR 0 EXIT
+    THEN
+    _BSK-STAGE-BODY
+    S" /xrpc/com.atproto.repo.createRecord"
+    _BSK-POST-BUF _BSK-POST-LEN @
+    BSK-POST-JSON
+    DUP 0= IF 2DROP ." bsky: create failed (network)" CR 0 EXIT THEN
+    2DROP
+    BSK-HTTP-STATUS @ 200 = ;
+
+\ ── §5.2  BSK-POST ────────────────────────────────────────────────
+\
+\  BSK-POST ( text-addr text-len -- )
+\  Post a new skeet.
+
+: _BSK-POST-DO  ( addr len -- )
+    S" app.bsky.feed.post" _BSK-CR-OPEN
+    _BSK-POST-FIELDS
+    _BSK-CR-CLOSE
+    _BSK-DO-CREATE IF
+        ." Posted!" CR
+    ELSE
+        ." bsky: post failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-POST  ( addr len -- )  ['] _BSK-POST-DO _BSK-UI-RUN ;
+
+\ ── §5.3  BSK-REPLY ───────────────────────────────────────────────
+\
+\  BSK-REPLY ( uri-addr uri-len cid-addr cid-len text-addr text-len -- )
+\  Reply to a post.  For simplicity, root = parent (no deep threading).
+
+VARIABLE _BSK-REPLY-UADDR   VARIABLE _BSK-REPLY-ULEN
+VARIABLE _BSK-REPLY-CADDR   VARIABLE _BSK-REPLY-CLEN
+
+\ _BSK-REPLY-FIELDS ( uaddr ulen caddr clen taddr tlen -- )
+\   Append text, reply refs and createdAt to an open post record.
+: _BSK-REPLY-FIELDS  ( uaddr ulen caddr clen taddr tlen -- )
+    \ Save reply target
+    2>R 2>R
+    _BSK-REPLY-ULEN !  _BSK-REPLY-UADDR !
+    2R> _BSK-REPLY-CLEN !  _BSK-REPLY-CADDR !
+    2R>                               ( text-addr text-len )
+    S" text" _BSK-QK
+    _BSK-QV-ESC
+    _BSK-COMMA
+    \ Build reply object (root = parent for simplicity)
+    S" reply" _BSK-QK
+    123 BSK-EMIT                      \ {
+    \ root
+    S" root" _BSK-QK
+    123 BSK-EMIT
+    S" uri" _BSK-QK
+    _BSK-REPLY-UADDR @ _BSK-REPLY-ULEN @ _BSK-QV  _BSK-COMMA
+    S" cid" _BSK-QK
+    _BSK-REPLY-CADDR @ _BSK-REPLY-CLEN @ _BSK-QV
+    125 BSK-EMIT  _BSK-COMMA         \ },
+    \ parent = root
+    S" parent" _BSK-QK
+    123 BSK-EMIT
+    S" uri" _BSK-QK
+    _BSK-REPLY-UADDR @ _BSK-REPLY-ULEN @ _BSK-QV  _BSK-COMMA
+    S" cid" _BSK-QK
+    _BSK-REPLY-CADDR @ _BSK-REPLY-CLEN @ _BSK-QV
+    125 BSK-EMIT                      \ }
+    125 BSK-EMIT  _BSK-COMMA         \ },  (close reply)
+    _BSK-CREATED-AT ;
+
+: _BSK-REPLY-DO  ( uaddr ulen caddr clen taddr tlen -- )
+    S" app.bsky.feed.post" _BSK-CR-OPEN
+    _BSK-REPLY-FIELDS
+    _BSK-CR-CLOSE
+    _BSK-DO-CREATE IF
+        ." Replied!" CR
+    ELSE
+        ." bsky: reply failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-REPLY  ( uaddr ulen caddr clen taddr tlen -- )
+    ['] _BSK-REPLY-DO _BSK-UI-RUN ;
+
+\ ── §5.4  BSK-LIKE ────────────────────────────────────────────────
+\
+\  BSK-LIKE ( uri-addr uri-len cid-addr cid-len -- )
+\  Like a post.
+
+: _BSK-LIKE-DO  ( uaddr ulen caddr clen -- )
+    S" app.bsky.feed.like" _BSK-CR-OPEN
+    _BSK-SUBJ-FIELDS
+    _BSK-CR-CLOSE
+    _BSK-DO-CREATE IF
+        ." Liked!" CR
+    ELSE
+        ." bsky: like failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-LIKE  ( uaddr ulen caddr clen -- )  ['] _BSK-LIKE-DO _BSK-UI-RUN ;
+
+\ ── §5.5  BSK-REPOST ─────────────────────────────────────────────
+\
+\  BSK-REPOST ( uri-addr uri-len cid-addr cid-len -- )
+\  Repost (reshare).
+
+: _BSK-REPOST-DO  ( uaddr ulen caddr clen -- )
+    S" app.bsky.feed.repost" _BSK-CR-OPEN
+    _BSK-SUBJ-FIELDS
+    _BSK-CR-CLOSE
+    _BSK-DO-CREATE IF
+        ." Reposted!" CR
+    ELSE
+        ." bsky: repost failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-REPOST  ( uaddr ulen caddr clen -- )
+    ['] _BSK-REPOST-DO _BSK-UI-RUN ;
+
+\ ── §5.5  BSK-FOLLOW / BSK-UNFOLLOW ───────────────────────────────
+\
+\  BSK-FOLLOW ( did-addr did-len -- )
+\  Follow a user by DID.
+
+: _BSK-FOLLOW-DO  ( addr len -- )
+    S" app.bsky.graph.follow" _BSK-CR-OPEN
+    S" subject" _BSK-QK
+    _BSK-QV
+    _BSK-COMMA
+    _BSK-CREATED-AT
+    _BSK-CR-CLOSE
+    _BSK-DO-CREATE IF
+        ." Followed!" CR
+    ELSE
+        ." bsky: follow failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-FOLLOW  ( addr len -- )  ['] _BSK-FOLLOW-DO _BSK-UI-RUN ;
+
+\ _BSK-DO-DELETE ( -- ok? )  Stage body, POST deleteRecord, check.
+: _BSK-DO-DELETE  ( -- ok? )
+    BSK-ACCESS-LEN @ 0= IF
+        ." bsky: login first" CR 0 EXIT
+    THEN
+    _BSK-STAGE-BODY
+    S" /xrpc/com.atproto.repo.deleteRecord"
+    _BSK-POST-BUF _BSK-POST-LEN @
+    BSK-POST-JSON
+    DUP 0= IF 2DROP ." bsky: delete failed (network)" CR 0 EXIT THEN
+    2DROP
+    BSK-HTTP-STATUS @ 200 = ;
+
+\ _BSK-DR-OPEN ( collection-addr collection-len rkey-addr rkey-len -- )
+\   Build deleteRecord JSON: {"repo":"<DID>","collection":"...","rkey":"..."}
+: _BSK-DR-OPEN  ( caddr clen rkaddr rklen -- )
+    2>R
+    BSK-RESET
+    123 BSK-EMIT
+    S" repo" _BSK-QK
+    BSK-DID BSK-DID-LEN @ _BSK-QV  _BSK-COMMA
+    S" collection" _BSK-QK
+    _BSK-QV  _BSK-COMMA
+    S" rkey" _BSK-QK
+    2R> _BSK-QV
+    125 BSK-EMIT ;
+
+\ BSK-UNFOLLOW ( rkey-addr rkey-len -- )
+\   Unfollow by rkey (the record key of the follow record).
+: _BSK-UNFOLLOW-DO  ( addr len -- )
+    S" app.bsky.graph.follow" 2SWAP
+    _BSK-DR-OPEN
+    _BSK-DO-DELETE IF
+        ." Unfollowed!" CR
+    ELSE
+        ." bsky: unfollow failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-UNFOLLOW  ( addr len -- )  ['] _BSK-UNFOLLOW-DO _BSK-UI-RUN ;
+
+\ ── §5.6  BSK-DELETE ──────────────────────────────────────────────
+\
+\  BSK-DELETE ( uri-addr uri-len -- )
+\  Delete a record by AT URI.
+\  AT URI format: at://did:plc:xxx/app.bsky.feed.post/3abc...
+\  We extract the collection and rkey from the last two path segments.
+
+\ _BSK-RFIND-SLASH ( addr len -- offset | -1 )
+\   Find the last '/' in string.  Returns offset from addr.
+: _BSK-RFIND-SLASH  ( addr len -- offset )
+    1- BEGIN
+        DUP 0< IF NIP EXIT THEN
+        2DUP + C@ 47 = IF NIP EXIT THEN
+        1-
+    AGAIN ;
+
+\ _BSK-URI-PARSE ( uri-addr uri-len -- col-a col-l rkey-a rkey-l ok? )
+\   Extract collection and rkey from AT URI.
+\   Returns addresses pointing into the original string.
+VARIABLE _BUP-ADDR   VARIABLE _BUP-LEN
+VARIABLE _BUP-S2     VARIABLE _BUP-S1
+
+: _BSK-URI-PARSE  ( uaddr ulen -- ca cl ra rl flag )
+    _BUP-LEN !  _BUP-ADDR !
+    \ Find last slash (separates collection/rkey)
+    _BUP-ADDR @  _BUP-LEN @  _BSK-RFIND-SLASH
+    DUP 0< IF 0 0 0 0 0 EXIT THEN
+    _BUP-S2 !
+    \ Find second-to-last slash (separates repo/collection)
+    _BUP-ADDR @  _BUP-S2 @  _BSK-RFIND-SLASH
+    DUP 0< IF 0 0 0 0 0 EXIT THEN
+    _BUP-S1 !
+    \ collection = addr+s1+1, length = s2-s1-1
+    _BUP-ADDR @ _BUP-S1 @ + 1+
+    _BUP-S2 @ _BUP-S1 @ - 1-
+    \ rkey = addr+s2+1, length = total-s2-1
+    _BUP-ADDR @ _BUP-S2 @ + 1+
+    _BUP-LEN @ _BUP-S2 @ - 1-
+    -1 ;
+
+\ BSK-DELETE ( uri-addr uri-len -- )
+\   Delete any record by AT-URI.
+: _BSK-DELETE-DO  ( uaddr ulen -- )
+    _BSK-URI-PARSE 0= IF
+        ." bsky: invalid AT-URI" CR EXIT
+    THEN
+    \ ( col-a col-l rkey-a rkey-l )
+    _BSK-DR-OPEN
+    _BSK-DO-DELETE IF
+        ." Deleted!" CR
+    ELSE
+        ." bsky: delete failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
+    THEN ;
+: BSK-DELETE  ( uaddr ulen -- )  ['] _BSK-DELETE-DO _BSK-UI-RUN ;
+
+\ ── §5.7  Write Queue ─────────────────────────────────────────────
+\
+\  Each write above blocks for a full round trip.  The TUI instead
+\  queues its writes here and sends them in batches: one
+\  com.atproto.repo.applyWrites call carries every queued op that
+\  fits in BSK-BUF (at most BSK-Q-BATCH).  applyWrites is atomic, so
+\  if a batch is refused (a 4xx answer) none of it was applied and
+\  each op is resent on its own with createRecord / deleteRecord and
+\  reports its own result.  A batch whose answer was lost, or was a
+\  5xx, may have been applied: its ops are reported "unconfirmed",
+\  counted in BSK-Q-FAILED and never sent twice.  A send that never
+\  reached the server (no session, or one closed with no answer;
+\  _BSK-RQ-UNSENT) applied nothing: the flush stops there, the op
+\  and those after it stay queued, and the worker tries again
+\  BSK-Q-DELAY-MS later.
+\
+\  The ring lives in XMEM, allocated on first use.  Entries hold the
+\  finished record JSON, so createdAt is the time of the keypress.
+\  Entry layout (_BSK-QE-SIZE bytes):
+\    +KIND  1 = create, 2 = delete
+\    +LBL   len cell + 16 bytes   short label for the status line
+\    +COL   len cell + 48 bytes   collection NSID
+\    +PAY   len cell + rest       record JSON (create) / rkey (delete)
+\
+\  Per-op results are collected in _BSK-Q-MSG ("like ok, post
+\  failed ...") and BSK-Q-SENT / BSK-Q-FAILED.
+
+32   CONSTANT BSK-Q-MAX            \ ring entries
+1024 CONSTANT _BSK-QE-SIZE         \ bytes per entry
+
+0              CONSTANT _BSK-QE-KIND
+1 CELLS        CONSTANT _BSK-QE-LBL
+2 CELLS 16 +   CONSTANT _BSK-QE-COL
+3 CELLS 64 +   CONSTANT _BSK-QE-PAY
+_BSK-QE-SIZE _BSK-QE-PAY - 1 CELLS - CONSTANT _BSK-QE-PAY-MAX
+
+VARIABLE _BSK-Q-BASE      0 _BSK-Q-BASE !   \ ring (XMEM), then body
+VARIABLE _BSK-Q-HEAD      0 _BSK-Q-HEAD !   \ next op to send
+VARIABLE _BSK-Q-TAIL      0 _BSK-Q-TAIL !   \ next free op
+VARIABLE _BSK-Q-T         0 _BSK-Q-T !      \ MS@ of last enqueue
+VARIABLE _BSK-Q-N                           \ ops in current batch
+
+VARIABLE BSK-Q-BATCH      10 BSK-Q-BATCH !
+VARIABLE BSK-Q-DELAY-MS   1500 BSK-Q-DELAY-MS !
+VARIABLE BSK-Q-SENT       0 BSK-Q-SENT !
+VARIABLE BSK-Q-FAILED     0 BSK-Q-FAILED !
+
+CREATE _BSK-Q-MSG 64 ALLOT
+VARIABLE _BSK-Q-MSG-LEN   0 _BSK-Q-MSG-LEN !
+
+\ BSK-PENDING ( -- n )  Ops waiting to be sent
+: BSK-PENDING  ( -- n )  _BSK-Q-TAIL @ _BSK-Q-HEAD @ - ;
+
+\ _BSK-Q-BODY ( -- addr )  Staging buffer for the request body
+: _BSK-Q-BODY  ( -- addr )
+    _BSK-Q-BASE @ BSK-Q-MAX _BSK-QE-SIZE * + ;
+
+\ _BSK-QE ( n -- entry )  Address of ring entry n
+: _BSK-QE  ( n -- entry )
+    BSK-Q-MAX MOD _BSK-QE-SIZE * _BSK-Q-BASE @ + ;
+
+\ _BSK-Q-STR! ( addr len max field -- )  Store a clamped string
+: _BSK-Q-STR!  ( addr len max field -- )
+    >R MIN DUP R@ !
+    R> 1 CELLS + SWAP CMOVE ;
+
+\ _BSK-Q-STR@ ( field -- addr len )
+: _BSK-Q-STR@  ( field -- addr len )
+    DUP 1 CELLS + SWAP @ ;
+
+\ _BSK-Q-NEW ( kind -- entry | 0 )  Reserve the tail entry
+: _BSK-Q-NEW  ( kind -- entry | 0 )
+    _BSK-Q-BASE @ 0= IF
+        BSK-Q-MAX _BSK-QE-SIZE * BSK-BUF-MAX + XMEM-ALLOT _BSK-Q-BASE !
+    THEN
+    _BSK-Q-BASE @ 0= IF DROP 0 EXIT THEN
+    BSK-PENDING BSK-Q-MAX >= IF DROP 0 EXIT THEN
+    _BSK-Q-TAIL @ _BSK-QE TUCK ! ;
+
+\ _BSK-Q-COMMIT ( -- )  Publish the reserved entry
+: _BSK-Q-COMMIT  ( -- )
+    1 _BSK-Q-TAIL +!
+    MS@ _BSK-Q-T ! ;
+
+\ _BSK-Q-CREATE ( caddr clen laddr llen -- ok? )
+\   Queue the record JSON in BSK-BUF for collection c.
+: _BSK-Q-CREATE  ( caddr clen laddr llen -- ok? )
+    BSK-LEN @ _BSK-QE-PAY-MAX > IF 2DROP 2DROP 0 EXIT THEN
+    1 _BSK-Q-NEW DUP 0= IF NIP NIP NIP NIP EXIT THEN
+    >R
+    16 R@ _BSK-QE-LBL + _BSK-Q-STR!
+    48 R@ _BSK-QE-COL + _BSK-Q-STR!
+    BSK-BUF BSK-LEN @ _BSK-QE-PAY-MAX R> _BSK-QE-PAY + _BSK-Q-STR!
+    _BSK-Q-COMMIT -1 ;
+
+\ _BSK-Q-DELETE ( uaddr ulen laddr llen -- ok? )
+\   Queue a deleteRecord for an AT-URI.
+: _BSK-Q-DELETE  ( uaddr ulen laddr llen -- ok? )
+    2SWAP _BSK-URI-PARSE 0= IF 2DROP 2DROP 2DROP 0 EXIT THEN
+    2 _BSK-Q-NEW DUP 0= IF >R 2DROP 2DROP 2DROP R> EXIT THEN
+    >R
+    _BSK-QE-PAY-MAX R@ _BSK-QE-PAY + _BSK-Q-STR!
+    48 R@ _BSK-QE-COL + _BSK-Q-STR!
+    16 R> _BSK-QE-LBL + _BSK-Q-STR!
+    _BSK-Q-COMMIT -1 ;
+
+\ _BSK-Q-MSG+ ( addr len -- )  Append to the result line
+: _BSK-Q-MSG+  ( addr len -- )
+    64 _BSK-Q-MSG-LEN @ - MIN 0 MAX
+    DUP >R _BSK-Q-MSG _BSK-Q-MSG-LEN @ + SWAP CMOVE
+    R> _BSK-Q-MSG-LEN +! ;
+
+\ _BSK-Q-REPORT ( entry ok? -- )  Record one op's result
+: _BSK-Q-REPORT  ( entry ok? -- )
+    _BSK-Q-MSG-LEN @ IF S" , " _BSK-Q-MSG+ THEN
+    SWAP _BSK-QE-LBL + _BSK-Q-STR@ _BSK-Q-MSG+
+    IF
+        1 BSK-Q-SENT +!    S"  ok" _BSK-Q-MSG+
+    ELSE
+        1 BSK-Q-FAILED +!  S"  failed" _BSK-Q-MSG+
+    THEN ;
+
+\ _BSK-Q-POST ( path-a path-u -- ok? )  POST the body in BSK-BUF
+\   The body is staged first: the akashic fallback in BSK-POST-JSON
+\   rebuilds BSK-BUF as a URL.
+: _BSK-Q-POST  ( path-a path-u -- ok? )
+    BSK-LEN @ >R
+    BSK-BUF _BSK-Q-BODY R@ CMOVE
+    _BSK-Q-BODY R> BSK-POST-JSON
+    NIP 0= IF 0 EXIT THEN
+    BSK-HTTP-STATUS @ 200 = ;
+
+\ _BSK-Q-SEND-ONE ( entry -- ok? )  createRecord / deleteRecord
+: _BSK-Q-SEND-ONE  ( entry -- ok? )
+    DUP _BSK-QE-KIND + @ 1 = IF
+        BSK-RESET
+        DUP _BSK-QE-COL + _BSK-Q-STR@ _BSK-CR-HEAD
+        _BSK-QE-PAY + _BSK-Q-STR@ BSK-APPEND
+        125 BSK-EMIT
+        S" /xrpc/com.atproto.repo.createRecord"
+    ELSE
+        DUP _BSK-QE-COL + _BSK-Q-STR@
+        ROT _BSK-QE-PAY + _BSK-Q-STR@
+        _BSK-DR-OPEN
+        S" /xrpc/com.atproto.repo.deleteRecord"
+    THEN
+    _BSK-Q-POST ;
+
+\ _BSK-Q-WSIZE ( entry -- n )  Upper bound of its applyWrites element
+: _BSK-Q-WSIZE  ( entry -- n )
+    DUP _BSK-QE-PAY + @ SWAP _BSK-QE-COL + @ + 80 + ;
+
+\ _BSK-Q-WRITE ( entry -- )  Append one applyWrites element
+: _BSK-Q-WRITE  ( entry -- )
+    >R
+    123 BSK-EMIT
+    S" $type" _BSK-QK
+    R@ _BSK-QE-KIND + @ 1 = IF
+        S" com.atproto.repo.applyWrites#create"
+    ELSE
+        S" com.atproto.repo.applyWrites#delete"
+    THEN _BSK-QV  _BSK-COMMA
+    S" collection" _BSK-QK
+    R@ _BSK-QE-COL + _BSK-Q-STR@ _BSK-QV  _BSK-COMMA
+    R@ _BSK-QE-KIND + @ 1 = IF
+        S" value" _BSK-QK  R@ _BSK-QE-PAY + _BSK-Q-STR@ BSK-APPEND
+    ELSE
+        S" rkey" _BSK-QK   R@ _BSK-QE-PAY + _BSK-Q-STR@ _BSK-QV
+    THEN
+    R> DROP
+    125 BSK-EMIT ;
+
+\ _BSK-Q-BUILD ( -- n )  applyWrites body for the next n ops
+: _BSK-Q-BUILD  ( -- n )
+    BSK-RESET
+    123 BSK-EMIT
+    S" repo" _BSK-QK
+    BSK-DID BSK-DID-LEN @ _BSK-QV  _BSK-COMMA
+    S" writes" _BSK-QK
+    91 BSK-EMIT                       \ [
+    0
+    BEGIN
+        DUP BSK-PENDING < OVER BSK-Q-BATCH @ < AND IF
+            DUP _BSK-Q-HEAD @ + _BSK-QE _BSK-Q-WSIZE
+            BSK-LEN @ + 4 + BSK-BUF-MAX <
+        ELSE 0 THEN
+    WHILE
+        DUP IF _BSK-COMMA THEN
+        DUP _BSK-Q-HEAD @ + _BSK-QE _BSK-Q-WRITE
+        1+
+    REPEAT
+    93 BSK-EMIT  125 BSK-EMIT ;      \ ]}
+
+\ _BSK-Q-VERDICT ( ok? -- v )  What became of a posted batch
+\   -1 applied, 0 refused (safe to resend), 1 unknown, 2 never
+\   reached the server (_BSK-RQ-UNSENT: keep it queued).
+: _BSK-Q-VERDICT  ( ok? -- v )
+    IF -1 EXIT THEN
+    _BSK-RQ-UNSENT @ IF 2 EXIT THEN
+    BSK-HTTP-STATUS @ DUP 400 < 0= SWAP 500 < AND IF 0 EXIT THEN
+    1 ;
+
+\ _BSK-Q-UNSURE ( entry -- )  Record an op that may have been applied
+: _BSK-Q-UNSURE  ( entry -- )
+    _BSK-Q-MSG-LEN @ IF S" , " _BSK-Q-MSG+ THEN
+    _BSK-QE-LBL + _BSK-Q-STR@ _BSK-Q-MSG+
+    1 BSK-Q-FAILED +!  S"  unconfirmed" _BSK-Q-MSG+ ;
+
+\ _BSK-Q-BATCH ( -- sent? )  Send one batch and pop it
+\   An op that never reached the server stays queued, with those
+\   after it, and sent? is 0.
+: _BSK-Q-BATCH  ( -- sent? )
+    _BSK-Q-BUILD DUP _BSK-Q-N !
+    1 > IF
+        S" /xrpc/com.atproto.repo.applyWrites" _BSK-Q-POST
+        _BSK-Q-VERDICT
+    ELSE 0 THEN                       ( v )
+    DUP 2 = IF DROP 0 EXIT THEN
+    _BSK-Q-N @ 0 DO
+        _BSK-Q-HEAD @ _BSK-QE
+        OVER 0> IF _BSK-Q-UNSURE ELSE
+            OVER IF -1 ELSE
+                DUP _BSK-Q-SEND-ONE
+                DUP 0= _BSK-RQ-UNSENT @ AND IF
+                    2DROP DROP 0 UNLOOP EXIT
+                THEN
+            THEN _BSK-Q-REPORT
+        THEN
+        1 _BSK-Q-HEAD +!
+    LOOP
+    DROP -1 ;
+
+\ BSK-FLUSH ( -- )  Send every queued op now
+: _BSK-FLUSH-DO  ( -- )
+    BSK-PENDING 0= IF EXIT THEN
+    0 _BSK-Q-MSG-LEN !
+    BSK-ACCESS-LEN @ 0= IF
+        S" not logged in" _BSK-Q-MSG+ EXIT
+    THEN
+    BEGIN BSK-PENDING 0> WHILE
+        _BSK-Q-BATCH 0= IF
+            _BSK-Q-MSG-LEN @ IF S" , " _BSK-Q-MSG+ THEN
+            S" not sent, kept" _BSK-Q-MSG+
+            MS@ _BSK-Q-T !                  \ retry after the delay
+            EXIT
+        THEN
+    REPEAT ;
+: BSK-FLUSH  ( -- )  ['] _BSK-FLUSH-DO _BSK-UI-RUN ;
+
+\ BSK-QUEUE ( -- )  Show queue state and the last flush result
+: BSK-QUEUE  ( -- )
+    ." queue: " BSK-PENDING . ." pending, "
+    BSK-Q-SENT @ . ." sent, " BSK-Q-FAILED @ . ." failed" CR
+    _BSK-Q-MSG-LEN @ IF _BSK-Q-MSG _BSK-Q-MSG-LEN @ TYPE CR THEN ;
+
+\ While the background worker (§6.4) runs, it alone talks to the
+\ network; a full ring then refuses the enqueue instead of flushing.
+\ _BSK-Q-ROOM ( -- )  Flush first if the ring is full
+: _BSK-Q-ROOM  ( -- )
+    _BSK-BG-ON @ IF EXIT THEN
+    BSK-PENDING BSK-Q-MAX >= IF BSK-FLUSH THEN ;
+
+\ ── Queued write builders (used by the TUI) ──
+
+: _BSK-Q-POST-TEXT  ( taddr tlen -- ok? )
+    _BSK-Q-ROOM
+    BSK-RESET S" app.bsky.feed.post" _BSK-REC-OPEN
+    _BSK-POST-FIELDS  125 BSK-EMIT
+    S" app.bsky.feed.post" S" post" _BSK-Q-CREATE ;
+
+: _BSK-Q-REPLY  ( uaddr ulen caddr clen taddr tlen -- ok? )
+    _BSK-Q-ROOM
+    BSK-RESET S" app.bsky.feed.post" _BSK-REC-OPEN
+    _BSK-REPLY-FIELDS  125 BSK-EMIT
+    S" app.bsky.feed.post" S" reply" _BSK-Q-CREATE ;
+
+: _BSK-Q-LIKE  ( uaddr ulen caddr clen -- ok? )
+    _BSK-Q-ROOM
+    BSK-RESET S" app.bsky.feed.like" _BSK-REC-OPEN
+    _BSK-SUBJ-FIELDS  125 BSK-EMIT
+    S" app.bsky.feed.like" S" like" _BSK-Q-CREATE ;
+
+: _BSK-Q-REPOST  ( uaddr ulen caddr clen -- ok? )
+    _BSK-Q-ROOM
+    BSK-RESET S" app.bsky.feed.repost" _BSK-REC-OPEN
+    _BSK-SUBJ-FIELDS  125 BSK-EMIT
+    S" app.bsky.feed.repost" S" repost" _BSK-Q-CREATE ;
+
+: _BSK-Q-FOLLOW  ( did-addr did-len -- ok? )
+    _BSK-Q-ROOM
+    BSK-RESET S" app.bsky.graph.follow" _BSK-REC-OPEN
+    S" subject" _BSK-QK _BSK-QV  _BSK-COMMA
+    _BSK-CREATED-AT  125 BSK-EMIT
+    S" app.bsky.graph.follow" S" follow" _BSK-Q-CREATE ;
+
+: _BSK-Q-DEL  ( uaddr ulen -- ok? )
+    _BSK-Q-ROOM
+    S" delete" _BSK-Q-DELETE ;
+
+\ =====================================================================
+\  §5 — End of Write Features
+\ =====================================================================
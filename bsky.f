@@ -1,13 +1,20 @@
 \ bsky.f — Bluesky / AT Protocol client for Megapad-64
 \
-\ Depends on: KDOS v1.1 (network stack, RTC, memory), tools.f (TUI)
+\ Depends on: KDOS v1.1 (network stack, RTC, memory)
 \             Akashic libraries (json, http, atproto, datetime, string)
 \
+\ This is the core: session, transport and the read-only words.  The
+\ rest loads on demand (§4.4):
+\   bsky-profile.f   §4.2  profile viewer
+\   bsky-write.f     §5    posts, likes, follows, deletes, write queue
+\   bsky-tui.f       §6    KDOS screen, caches, background refresh
+\
 \ Prefix conventions:
 \   BSK-    public API words
 \   _BSK-   internal helpers
 \
-\ Load with:   REQUIRE bsky.f
+\ Load with:   REQUIRE bsky.f        (core, read-only)
+\              REQUIRE bsky-tui.f    (the whole client)
 
 PROVIDED bsky.f
 
@@ -20,13 +27,11 @@ REQUIRE utils/json.f
 REQUIRE utils/datetime.f
 REQUIRE net/url.f
 REQUIRE net/headers.f
-REQUIRE net/base64.f
 REQUIRE net/http.f
-REQUIRE net/uri.f
 REQUIRE atproto/xrpc.f
 REQUIRE atproto/session.f
-REQUIRE atproto/aturi.f
-REQUIRE atproto/repo.f
+\ net/base64.f, net/uri.f, atproto/aturi.f and atproto/repo.f are
+\ only needed by the write path and load with bsky-write.f.
 
 \ =====================================================================
 \  §0  Foundation Utilities
@@ -41,29 +46,64 @@ REQUIRE atproto/repo.f
 \  or strings into it; BSK-RESET clears it for reuse.
 \
 \  Pattern:  BSK-RESET  S" hello" BSK-APPEND  BSK-BUF BSK-LEN @ TYPE
+\
+\  There is one buffer per core role: core 0 (the UI) uses the first,
+\  any other core (the background worker, §6.4) the second, so the
+\  worker can build request paths while the UI builds status lines
+\  and queued records.  COREID is looked up by name at load; without
+\  it every caller is core 0.  Words that append many bytes look the
+\  core's buffer up once (_BSK-SLOT) and append with _BSK-PUT.
 
 4096 CONSTANT BSK-BUF-MAX
-CREATE BSK-BUF BSK-BUF-MAX ALLOT
-VARIABLE BSK-LEN   0 BSK-LEN !
+
+\ _BSK-FIND ( addr len -- xt | 0 )  Look up a word by name
+CREATE _BSK-FIND-BUF 32 ALLOT
+: _BSK-FIND  ( addr len -- xt | 0 )
+    31 MIN DUP _BSK-FIND-BUF C!
+    _BSK-FIND-BUF 1+ SWAP CMOVE
+    _BSK-FIND-BUF FIND 0= IF DROP 0 THEN ;
+
+VARIABLE _BSK-COREID-XT   0 _BSK-COREID-XT !
+: _BSK-COREID-INIT  ( -- )  S" COREID" _BSK-FIND _BSK-COREID-XT ! ;
+_BSK-COREID-INIT
+
+\ _BSK-CORE ( -- 0|1 )  Builder slot for the calling core
+: _BSK-CORE  ( -- 0|1 )
+    _BSK-COREID-XT @ DUP IF EXECUTE 0<> 1 AND THEN ;
+
+CREATE _BSK-BUFS  BSK-BUF-MAX 2 * ALLOT
+CREATE _BSK-LENS  2 CELLS ALLOT
+0 _BSK-LENS !  0 _BSK-LENS 1 CELLS + !
+
+\ BSK-BUF ( -- addr )  This core's working buffer
+: BSK-BUF  ( -- addr )  _BSK-CORE BSK-BUF-MAX * _BSK-BUFS + ;
+
+\ BSK-LEN ( -- addr )  This core's buffer length
+: BSK-LEN  ( -- addr )  _BSK-CORE CELLS _BSK-LENS + ;
 
 \ BSK-RESET ( -- )  Clear the working buffer
 : BSK-RESET  ( -- )
     0 BSK-LEN ! ;
 
+\ _BSK-SLOT ( -- buf len-addr )  This core's buffer and length cell
+: _BSK-SLOT  ( -- buf len-addr )
+    _BSK-CORE DUP BSK-BUF-MAX * _BSK-BUFS + SWAP CELLS _BSK-LENS + ;
+
+\ _BSK-PUT ( char buf len-addr -- buf len-addr )  Append one byte
+: _BSK-PUT  ( char buf len-addr -- buf len-addr )
+    DUP @ BSK-BUF-MAX >= IF ROT DROP EXIT THEN
+    ROT >R 2DUP @ + R> SWAP C!  1 OVER +! ;
+
 \ BSK-APPEND ( addr len -- )  Append string to working buffer
 : BSK-APPEND  ( addr len -- )
-    DUP BSK-LEN @ + BSK-BUF-MAX > IF
-        2DROP EXIT                       \ overflow guard
+    _BSK-SLOT >R                         ( addr len buf  R: len-addr )
+    OVER R@ @ + BSK-BUF-MAX > IF
+        R> 2DROP 2DROP EXIT              \ overflow guard
     THEN
-    DUP >R                           \ save len for +! below
-    BSK-BUF BSK-LEN @ + SWAP CMOVE
-    R> BSK-LEN +! ;
+    R@ @ + SWAP DUP R> +! CMOVE ;
 
 \ BSK-EMIT ( char -- )  Append single character to working buffer
-: BSK-EMIT  ( char -- )
-    BSK-LEN @ BSK-BUF-MAX >= IF DROP EXIT THEN
-    BSK-BUF BSK-LEN @ + C!
-    1 BSK-LEN +! ;
+: BSK-EMIT  ( char -- )  _BSK-SLOT _BSK-PUT 2DROP ;
 
 \ BSK-TYPE ( -- )  Print current buffer contents
 : BSK-TYPE  ( -- )
@@ -71,10 +111,16 @@ VARIABLE BSK-LEN   0 BSK-LEN !
 
 \ ── §0.2  Helpers that delegate to akashic ────────────────────────
 
-\ NUM>APPEND ( n -- )  Append decimal number to BSK-BUF
-\   Uses akashic string.f NUM>STR (signed).
+\ _BSK-DIGITS ( u -- )  Append the decimal digits of u to BSK-BUF
+: _BSK-DIGITS  ( u -- )
+    DUP 10 < IF 48 + BSK-EMIT EXIT THEN
+    DUP 10 / RECURSE  10 MOD 48 + BSK-EMIT ;
+
+\ NUM>APPEND ( n -- )  Append decimal number to BSK-BUF (signed)
+\   Not akashic NUM>STR: it formats in one shared buffer, and the
+\   UI core and the refresh worker (§6.4) both build status text.
 : NUM>APPEND  ( n -- )
-    NUM>STR BSK-APPEND ;
+    DUP 0< IF 45 BSK-EMIT NEGATE THEN _BSK-DIGITS ;
 
 \ BSK-NOW ( -- addr len )  ISO 8601 timestamp via akashic datetime.f
 CREATE _BSK-TS-BUF 32 ALLOT
@@ -100,32 +146,39 @@ CREATE _BSK-TS-BUF 32 ALLOT
     DROP 0 ;
 
 : URL-ENCODE  ( addr len -- )
-    0 DO
-        DUP I + C@
+    _BSK-SLOT 2SWAP
+    0 DO                                 ( buf len-addr addr )
+        DUP I + C@ SWAP >R
         DUP _BSK-URL-SAFE? IF
-            BSK-EMIT
+            ROT ROT _BSK-PUT
         ELSE
-            37 BSK-EMIT
-            DUP 4 RSHIFT _BSK-HEX-DIGIT BSK-EMIT
-            15 AND _BSK-HEX-DIGIT BSK-EMIT
+            >R 37 ROT ROT _BSK-PUT
+            R@ 4 RSHIFT _BSK-HEX-DIGIT ROT ROT _BSK-PUT
+            R> 15 AND _BSK-HEX-DIGIT ROT ROT _BSK-PUT
         THEN
-    LOOP DROP ;
+        R>
+    LOOP DROP 2DROP ;
+
+\ _BSK-ESC ( char -- char' esc? )  JSON form of a byte: esc? = it
+\   follows a backslash.
+: _BSK-ESC  ( char -- char' esc? )
+    DUP 34 = OVER 92 = OR IF -1 EXIT THEN       \ " \ → \" \\
+    DUP 10 = IF DROP 110 -1 EXIT THEN           \ LF → \n
+    DUP 13 = IF DROP 114 -1 EXIT THEN           \ CR → \r
+    DUP  9 = IF DROP 116 -1 EXIT THEN           \ TAB → \t
+    DUP 32 < IF DROP 63 THEN  0 ;               \ other ctrl → ?
 
 \ JSON-COPY-ESCAPED ( addr len -- )
 \   Append string to BSK-BUF with JSON escaping for \, ", and
 \   control characters (< 32).  Used by _BSK-QV-ESC in §5.
 : JSON-COPY-ESCAPED  ( addr len -- )
-    0 DO
-        DUP I + C@
-        DUP 34 = IF DROP 92 BSK-EMIT 34 BSK-EMIT        \ " → \"
-        ELSE DUP 92 = IF DROP 92 BSK-EMIT 92 BSK-EMIT   \ \ → \\
-        ELSE DUP 10 = IF DROP 92 BSK-EMIT 110 BSK-EMIT  \ LF → \n
-        ELSE DUP 13 = IF DROP 92 BSK-EMIT 114 BSK-EMIT  \ CR → \r
-        ELSE DUP  9 = IF DROP 92 BSK-EMIT 116 BSK-EMIT  \ TAB → \t
-        ELSE DUP 32 < IF DROP 63 BSK-EMIT               \ other ctrl → ?
-        ELSE BSK-EMIT
-        THEN THEN THEN THEN THEN THEN
-    LOOP DROP ;
+    _BSK-SLOT 2SWAP
+    0 DO                                 ( buf len-addr addr )
+        DUP I + C@ SWAP >R
+        _BSK-ESC IF >R 92 ROT ROT _BSK-PUT R> THEN
+        ROT ROT _BSK-PUT
+        R>
+    LOOP DROP 2DROP ;
 
 \ =====================================================================
 \  §0 — End of Foundation Utilities
@@ -158,6 +211,248 @@ CREATE _BSK-TS-BUF 32 ALLOT
 : JSON-NEXT-ITEM  ( addr len -- addr' len' | 0 0 )
     JSON-NEXT 0= IF 2DROP 0 0 THEN ;
 
+\ ── §1.1  Field Plans ─────────────────────────────────────────────
+\
+\  JSON-FIND-KEY re-enters the object and rescans from the start on
+\  every call, so pulling N keys out of one object costs N walks.
+\  A field plan registers the wanted key paths once; BSK-FP-WALK then
+\  walks the object exactly once and fills every matched slot.
+\
+\  A plan is a table of entries ( parent kaddr klen slot ).  Entries
+\  with a slot receive the value span ( vaddr vlen ) — the same shape
+\  JSON-FIND-KEY returns.  Entries without a slot are branches: their
+\  object value is walked recursively with the entry id as parent.
+\
+\  Pattern:
+\    BSK-FP-PLAN P   BSK-FP-SLOT S-URI   BSK-FP-SLOT S-HANDLE
+\    : BUILD-P  P BSK-FP-BEGIN
+\        BSK-FP-ROOT S" post" BSK-FP-BRANCH      ( post-id )
+\        DUP S" uri" S-URI BSK-FP-FIELD
+\        S" author" BSK-FP-BRANCH S" handle" S-HANDLE BSK-FP-FIELD ;
+\    BUILD-P
+\    ( addr len ) P BSK-FP-WALK   S-URI BSK-FP-STR TYPE
+
+16 CONSTANT BSK-FP-MAX            \ entries per plan
+4 CELLS CONSTANT _BSK-FPE         \ entry: parent kaddr klen slot
+-1 CONSTANT BSK-FP-ROOT           \ parent id of top-level keys
+
+\ BSK-FP-PLAN ( "name" -- )  Create an empty field plan
+: BSK-FP-PLAN  ( "name" -- )
+    CREATE 0 , BSK-FP-MAX _BSK-FPE * ALLOT ;
+
+\ BSK-FP-SLOT ( "name" -- )  Create a value slot ( vaddr vlen )
+: BSK-FP-SLOT  ( "name" -- )
+    CREATE 0 , 0 , ;
+
+VARIABLE _BSK-FP                  \ plan being built or walked
+VARIABLE _BSK-FP-PAR              \ parent id for _BSK-FP-FIND
+
+\ _BSK-FP-ENTRY ( i -- addr )  Address of entry i in current plan
+: _BSK-FP-ENTRY  ( i -- addr )
+    _BSK-FPE * _BSK-FP @ 1 CELLS + + ;
+
+\ BSK-FP-BEGIN ( plan -- )  Select and clear a plan for building
+: BSK-FP-BEGIN  ( plan -- )
+    DUP _BSK-FP !  0 SWAP ! ;
+
+\ _BSK-FP-ADD ( parent kaddr klen slot -- id )  Append an entry
+: _BSK-FP-ADD  ( parent kaddr klen slot -- id )
+    _BSK-FP @ @ BSK-FP-MAX >= ABORT" bsky: field plan full"
+    _BSK-FP @ @ _BSK-FP-ENTRY >R
+    R@ 3 CELLS + !
+    R@ 2 CELLS + !
+    R@ 1 CELLS + !
+    R> !
+    _BSK-FP @ @  1 _BSK-FP @ +! ;
+
+\ BSK-FP-BRANCH ( parent kaddr klen -- id )  Key whose object is walked
+: BSK-FP-BRANCH  ( parent kaddr klen -- id )
+    0 _BSK-FP-ADD ;
+
+\ BSK-FP-FIELD ( parent kaddr klen slot -- )  Key whose value is kept
+: BSK-FP-FIELD  ( parent kaddr klen slot -- )
+    _BSK-FP-ADD DROP ;
+
+\ _BSK-FP-FIND ( kaddr klen parent -- id | -1 )
+\   Find the entry for key under parent in the current plan.
+: _BSK-FP-FIND  ( kaddr klen parent -- id | -1 )
+    _BSK-FP-PAR !
+    _BSK-FP @ @ DUP 0= IF DROP 2DROP -1 EXIT THEN
+    0 DO
+        I _BSK-FP-ENTRY DUP @ _BSK-FP-PAR @ = IF
+            1 CELLS + DUP @ SWAP 1 CELLS + @    ( kaddr klen ek ekl )
+            2OVER COMPARE 0= IF 2DROP I UNLOOP EXIT THEN
+        ELSE DROP THEN
+    LOOP
+    2DROP -1 ;
+
+\ _BSK-FP-OBJ ( addr len parent -- addr' len' )
+\   Walk the members of the object at addr once, filling slots and
+\   descending into branch entries.  Leaves the span past the object,
+\   so a branch is scanned by the descent alone.
+: _BSK-FP-OBJ  ( addr len parent -- addr' len' )
+    >R
+    JSON-SKIP-WS
+    DUP 0= IF R> DROP EXIT THEN
+    OVER C@ 123 <> IF JSON-SKIP-VALUE R> DROP EXIT THEN   \ not {
+    1 /STRING JSON-SKIP-WS
+    BEGIN
+        DUP 0> IF OVER C@ 34 = ELSE 0 THEN     \ member starts with "
+    WHILE
+        2DUP JSON-GET-STRING 2>R                 ( a l  R: par ka kl )
+        JSON-SKIP-STRING JSON-SKIP-WS
+        DUP 0> IF OVER C@ 58 = IF 1 /STRING THEN THEN   \ skip :
+        JSON-SKIP-WS                             ( va vl )
+        2R> R@ _BSK-FP-FIND                      ( va vl id )
+        DUP 0< IF DROP JSON-SKIP-VALUE ELSE
+            DUP _BSK-FP-ENTRY 3 CELLS + @ ?DUP IF
+                NIP >R 2DUP R@ 1 CELLS + ! R@ ! R> DROP
+                JSON-SKIP-VALUE
+            ELSE
+                RECURSE                          \ past the branch
+            THEN
+        THEN
+        JSON-SKIP-WS
+        DUP 0> IF
+            OVER C@ 44 = IF 1 /STRING JSON-SKIP-WS THEN
+        THEN
+    REPEAT
+    DUP 0> IF OVER C@ 125 = IF 1 /STRING THEN THEN   \ past }
+    R> DROP ;
+
+\ BSK-FP-WALK ( addr len plan -- )
+\   Clear every slot of plan, then walk the object at addr once.
+: BSK-FP-WALK  ( addr len plan -- )
+    DUP _BSK-FP !
+    @ DUP 0> IF
+        0 DO
+            I _BSK-FP-ENTRY 3 CELLS + @ ?DUP IF
+                0 OVER !  0 SWAP 1 CELLS + !
+            THEN
+        LOOP
+    ELSE DROP THEN
+    BSK-FP-ROOT _BSK-FP-OBJ 2DROP ;
+
+\ BSK-FP@ ( slot -- vaddr vlen | 0 0 )  Raw value span of a slot
+: BSK-FP@  ( slot -- vaddr vlen )
+    DUP @ SWAP 1 CELLS + @ ;
+
+\ BSK-FP-STR ( slot -- addr len )  String value of a slot (0 0 if absent)
+: BSK-FP-STR  ( slot -- addr len )
+    BSK-FP@ DUP 0> IF JSON-GET-STRING ELSE 2DROP 0 0 THEN ;
+
+\ BSK-FP-NUM ( slot -- n )  Numeric value of a slot (0 if absent)
+: BSK-FP-NUM  ( slot -- n )
+    BSK-FP@ DUP 0> IF JSON-GET-NUMBER ELSE 2DROP 0 THEN ;
+
+\ ── §1.2  Streamed Arrays ─────────────────────────────────────────
+\
+\  A field plan needs the whole object in memory.  For long list
+\  responses ({"feed":[...],"cursor":"..."}) the array is instead
+\  consumed as it arrives: _BSK-SA-FEED takes the bytes received so
+\  far, hands each complete element of the chosen top-level array to
+\  an xt ( addr len -- ), and returns how many bytes it is done with
+\  so the transport can recycle them (§2.4).  One other top-level
+\  string member (the cursor) is copied out on the way past.
+\
+\  A value counts as complete only once a byte follows it; a whole
+\  response always ends in "}", so nothing is lost at the end.  Once
+\  the response is in, _BSK-SA-DONE? tells whether that "}" was
+\  reached: a body cut short (timeout, an element too big for the
+\  buffer) or malformed leaves it false, and the caller must not
+\  keep what it was handed.
+\
+\  Pattern:
+\    S" feed" S" cursor" ['] ITEM _BSK-SA-BEGIN
+\    ( addr len ) _BSK-SA-FEED ( used )   \ repeat as data arrives
+
+VARIABLE _BSK-SA-ST       \ 0 before {  1 members  2 in array  3 done
+                          \ 4 malformed
+VARIABLE _BSK-SA-XT       \ element handler ( addr len -- )
+VARIABLE _BSK-SA-AKA      VARIABLE _BSK-SA-AKL    \ array key
+VARIABLE _BSK-SA-CKA      VARIABLE _BSK-SA-CKL    \ captured key
+VARIABLE _BSK-SA-SEEN     \ array key was found
+CREATE _BSK-SA-STR 128 ALLOT                      \ captured string
+VARIABLE _BSK-SA-SLEN
+
+VARIABLE _BSK-SA-P        \ scan position
+VARIABLE _BSK-SA-L        \ bytes left
+VARIABLE _BSK-SA-KA       VARIABLE _BSK-SA-KL     \ member key
+
+\ _BSK-SA-BEGIN ( akey-a akey-u ckey-a ckey-u xt -- )  Start a response
+: _BSK-SA-BEGIN  ( akey-a akey-u ckey-a ckey-u xt -- )
+    _BSK-SA-XT !  _BSK-SA-CKL !  _BSK-SA-CKA !
+    _BSK-SA-AKL !  _BSK-SA-AKA !
+    0 _BSK-SA-ST !  0 _BSK-SA-SEEN !  0 _BSK-SA-SLEN ! ;
+
+: _BSK-SA-C    ( -- c )  _BSK-SA-P @ C@ ;
+: _BSK-SA-ADV  ( n -- )  DUP _BSK-SA-P +!  NEGATE _BSK-SA-L +! ;
+
+\ _BSK-SA-SKIP ( addr len -- n )  Length of the value at addr, or 0
+\   if it is not complete yet
+: _BSK-SA-SKIP  ( addr len -- n )
+    DUP >R JSON-SKIP-VALUE NIP
+    DUP 0= IF R> 2DROP 0 EXIT THEN
+    R> SWAP - ;
+
+\ _BSK-SA-ITEM ( -- progress? )  In the array: one element, , or ]
+: _BSK-SA-ITEM  ( -- progress? )
+    _BSK-SA-C 44 = IF 1 _BSK-SA-ADV -1 EXIT THEN
+    _BSK-SA-C 93 = IF 1 _BSK-SA-ADV  1 _BSK-SA-ST !  -1 EXIT THEN
+    _BSK-SA-P @ _BSK-SA-L @ _BSK-SA-SKIP
+    ?DUP 0= IF 0 EXIT THEN
+    _BSK-SA-P @ OVER _BSK-SA-XT @ EXECUTE
+    _BSK-SA-ADV -1 ;
+
+\ _BSK-SA-MEMBER ( -- progress? )  Top level: , } or a whole member
+\   ( "key" : value ), or the array's opening [
+: _BSK-SA-MEMBER  ( -- progress? )
+    _BSK-SA-C 44 = IF 1 _BSK-SA-ADV -1 EXIT THEN
+    _BSK-SA-C 125 = IF 1 _BSK-SA-ADV  3 _BSK-SA-ST !  -1 EXIT THEN
+    _BSK-SA-C 34 <> IF 4 _BSK-SA-ST !  -1 EXIT THEN   \ malformed
+    _BSK-SA-P @ _BSK-SA-L @
+    2DUP JSON-GET-STRING _BSK-SA-KL ! _BSK-SA-KA !
+    JSON-SKIP-STRING JSON-SKIP-WS
+    DUP 0= IF 2DROP 0 EXIT THEN
+    OVER C@ 58 <> IF 2DROP 4 _BSK-SA-ST !  -1 EXIT THEN
+    1 /STRING JSON-SKIP-WS
+    DUP 0= IF 2DROP 0 EXIT THEN                 ( va vl )
+    _BSK-SA-KA @ _BSK-SA-KL @ _BSK-SA-AKA @ _BSK-SA-AKL @ COMPARE 0=
+    IF OVER C@ 91 = ELSE 0 THEN IF
+        1 /STRING _BSK-SA-L ! _BSK-SA-P !
+        2 _BSK-SA-ST !  -1 _BSK-SA-SEEN !  -1 EXIT
+    THEN
+    2DUP _BSK-SA-SKIP ?DUP 0= IF 2DROP 0 EXIT THEN   ( va vl n )
+    _BSK-SA-KA @ _BSK-SA-KL @ _BSK-SA-CKA @ _BSK-SA-CKL @ COMPARE 0= IF
+        >R OVER R@ JSON-GET-STRING
+        DUP 128 <= IF
+            DUP _BSK-SA-SLEN !  _BSK-SA-STR SWAP CMOVE
+        ELSE 2DROP THEN
+        R>
+    THEN
+    /STRING _BSK-SA-L ! _BSK-SA-P ! -1 ;
+
+\ _BSK-SA-STEP ( -- progress? )
+: _BSK-SA-STEP  ( -- progress? )
+    _BSK-SA-P @ _BSK-SA-L @ JSON-SKIP-WS _BSK-SA-L ! _BSK-SA-P !
+    _BSK-SA-L @ 0= IF 0 EXIT THEN
+    _BSK-SA-ST @ 3 >= IF _BSK-SA-L @ _BSK-SA-ADV 0 EXIT THEN
+    _BSK-SA-ST @ 0= IF
+        _BSK-SA-C 123 = IF 1 _BSK-SA-ADV 1 ELSE 4 THEN _BSK-SA-ST !
+        -1 EXIT
+    THEN
+    _BSK-SA-ST @ 2 = IF _BSK-SA-ITEM EXIT THEN
+    _BSK-SA-MEMBER ;
+
+\ _BSK-SA-FEED ( addr len -- used )  Consume what is complete
+: _BSK-SA-FEED  ( addr len -- used )
+    _BSK-SA-L !  DUP _BSK-SA-P !
+    BEGIN _BSK-SA-STEP 0= UNTIL
+    _BSK-SA-P @ SWAP - ;
+
+\ _BSK-SA-DONE? ( -- flag )  The closing } of the response was reached
+: _BSK-SA-DONE?  ( -- flag )  _BSK-SA-ST @ 3 = ;
+
 \ =====================================================================
 \  §1 — End of JSON Compat Shims
 \ =====================================================================
@@ -173,7 +468,9 @@ CREATE _BSK-TS-BUF 32 ALLOT
 \  What remains:
 \  - BSK-HANDLE (session.f doesn't store the handle)
 \  - BSK-INIT / BSK-CLEANUP (XMEM allocation, HTTP buffer setup)
-\  - Compat shims for BSK-GET, BSK-POST-JSON, BSK-HTTP-STATUS
+\  - A pooled keep-alive transport for XRPC calls (§2.4)
+\  - Compat shims for BSK-GET, BSK-POST-JSON, BSK-HTTP-STATUS, which
+\    renew the session ahead of token expiry (§2.6)
 
 \ ── §2.1  Handle Storage (session.f doesn't keep this) ────────────
 
@@ -187,25 +484,22 @@ VARIABLE BSK-HANDLE-LEN   0 BSK-HANDLE-LEN !
 VARIABLE BSK-RECV-BUF   0 BSK-RECV-BUF !
 VARIABLE BSK-READY      0 BSK-READY !
 
+\ _BSK-UA ( -- addr len )  User-Agent string
+: _BSK-UA  ( -- addr len )  S" forth-bsky-client/0.1 KDOS/1.1" ;
+
 : BSK-INIT  ( -- )
     BSK-READY @ IF EXIT THEN
     BSK-RECV-MAX XMEM-ALLOT BSK-RECV-BUF !
     BSK-RECV-BUF @ BSK-RECV-MAX HTTP-USE-STATIC
-    S" forth-bsky-client/0.1 KDOS/1.1" HTTP-SET-UA
+    _BSK-UA HTTP-SET-UA
     BSK-HANDLE BSK-HANDLE-MAX 0 FILL  0 BSK-HANDLE-LEN !
     -1 BSK-READY !
     ." bsky: init ok" CR ;
 
-: BSK-CLEANUP  ( -- )
-    BSK-READY @ 0= IF EXIT THEN
-    0 BSK-RECV-BUF !
-    0 BSK-READY ! ;
+\ BSK-CLEANUP is defined in §2.4 — it also closes pooled sessions.
 
 \ ── §2.3  Session Helpers ─────────────────────────────────────────
 
-\ BSK-LOGGED-IN? ( -- flag )  True if session is active
-: BSK-LOGGED-IN?  ( -- flag )  SESS-ACTIVE? ;
-
 \ Compat variables — §4-§6 still reference these directly.
 \ BSK-ACCESS-LEN is used everywhere as `BSK-ACCESS-LEN @ 0=` to
 \ test login state.  Set to 1 after login, 0 on logout/init.
@@ -214,46 +508,1012 @@ VARIABLE BSK-READY      0 BSK-READY !
 \ callers expect BSK-DID (address) + BSK-DID-LEN @ (length).
 VARIABLE BSK-ACCESS-LEN   0 BSK-ACCESS-LEN !
 
+\ BSK-LOGGED-IN? ( -- flag )  True if we hold an access token
+\   (after BSK-LOGIN or BSK-RESUME; BSK-RESUME sets no akashic session).
+: BSK-LOGGED-IN?  ( -- flag )  BSK-ACCESS-LEN @ 0<> ;
+
 128 CONSTANT BSK-DID-MAX
 CREATE BSK-DID BSK-DID-MAX ALLOT
 VARIABLE BSK-DID-LEN      0 BSK-DID-LEN !
 
-\ ── §2.4  Compat Shims (removed in Stage 5+6) ────────────────────
+\ ── §2.4  Pooled Keep-Alive Transport ────────────────────────────
+\
+\  akashic HTTP-GET / HTTP-POST-JSON open a fresh TCP + TLS session
+\  per call ("Connection: close").  A like followed by a refresh pays
+\  two full handshakes.  This transport keeps the session open with
+\  "Connection: keep-alive" and reuses it across XRPC calls.
+\
+\  Pool slots are keyed by server ip + port.  KDOS shares TLS state
+\  between sessions, so BSK-POOL-SIZE defaults to 1; set it to 2 on
+\  builds that can hold two sessions (or for plain-TCP hosts).
+\  A pooled session that has sat idle for BSK-POOL-IDLE-MS is closed
+\  and redialled.  A reused one is read once before the request goes
+\  out: a server that dropped it shows a close or an error there, and
+\  it is redialled before anything is sent.  If it drops as the
+\  request goes out (not one response byte back, then an error or a
+\  close), the server closed it without answering, so it is
+\  redialled once and the request resent, GET or POST alike.  Once
+\  any response byte has arrived nothing is resent.  A TLS session
+\  hides its connection and TLS-RECV only fails on a decrypt error,
+\  so a reused one that sends nothing back before the first response
+\  byte is taken as closed by the server and handled like a close.
+\
+\  Counters:  BSK-POOL-HITS     request reused an open session
+\             BSK-POOL-MISSES   no session for the host — dialled
+\             BSK-POOL-REDIALS  pooled session was dead — redialled
+\  Every hit is a handshake saved.  BSK-POOL-STATS prints them.
+\
+\  The access and refresh tokens are mirrored from the createSession /
+\  refreshSession response (see _BSK-CAPTURE-TOKENS, §3.1).  If no
+\  token was captured the shims fall back to the akashic path.
+
+\ Server.  Set BSK-PORT / BSK-TLS? first, then BSK-SET-HOST, e.g.
+\   8443 BSK-PORT !  S" 10.0.2.2" BSK-SET-HOST      \ local stand-in
+64 CONSTANT BSK-HOST-MAX
+CREATE BSK-HOST BSK-HOST-MAX ALLOT
+VARIABLE BSK-HOST-LEN     0 BSK-HOST-LEN !
+VARIABLE BSK-PORT         443 BSK-PORT !
+VARIABLE BSK-TLS?         -1 BSK-TLS? !
+VARIABLE _BSK-SERVER-IP   0 _BSK-SERVER-IP !
+
+VARIABLE BSK-POOL-ON      -1 BSK-POOL-ON !
+VARIABLE BSK-POOL-SIZE    1 BSK-POOL-SIZE !
+VARIABLE BSK-POOL-IDLE-MS   30000 BSK-POOL-IDLE-MS !
+VARIABLE BSK-RECV-TIMEOUT   10000 BSK-RECV-TIMEOUT !
+
+VARIABLE BSK-POOL-HITS     0 BSK-POOL-HITS !
+VARIABLE BSK-POOL-MISSES   0 BSK-POOL-MISSES !
+VARIABLE BSK-POOL-REDIALS  0 BSK-POOL-REDIALS !
+
+\ Bearer token mirror
+2048 CONSTANT _BSK-BEARER-MAX
+CREATE _BSK-BEARER _BSK-BEARER-MAX ALLOT
+VARIABLE _BSK-BEARER-LEN  0 _BSK-BEARER-LEN !
+
+\ Refresh token mirror — refreshSession (§3.4) authenticates with it
+CREATE _BSK-RFJWT _BSK-BEARER-MAX ALLOT
+VARIABLE _BSK-RFJWT-LEN   0 _BSK-RFJWT-LEN !
+VARIABLE _BSK-RQ-RF?      0 _BSK-RQ-RF? !   \ next request sends it
+
+\ ── Scanning helpers ──
+
+\ _BSK-SEARCH ( addr len pat-a pat-u -- off | -1 )  Substring search
+VARIABLE _BSK-SR-P
+VARIABLE _BSK-SR-N
+: _BSK-SEARCH  ( addr len pat-a pat-u -- off | -1 )
+    _BSK-SR-N ! _BSK-SR-P !
+    DUP _BSK-SR-N @ < IF 2DROP -1 EXIT THEN
+    _BSK-SR-N @ - 1+ 0 DO
+        DUP I + _BSK-SR-N @ _BSK-SR-P @ _BSK-SR-N @ COMPARE 0= IF
+            DROP I UNLOOP EXIT
+        THEN
+    LOOP
+    DROP -1 ;
+
+\ _BSK-LC ( c -- c' )  ASCII lower-case
+: _BSK-LC  ( c -- c' )
+    DUP 65 >= OVER 90 <= AND IF 32 + THEN ;
+
+\ _BSK-CI= ( a1 a2 n -- flag )  Case-insensitive compare of n bytes
+: _BSK-CI=  ( a1 a2 n -- flag )
+    DUP 0= IF DROP 2DROP -1 EXIT THEN
+    0 DO
+        OVER I + C@ _BSK-LC  OVER I + C@ _BSK-LC <> IF
+            2DROP 0 UNLOOP EXIT
+        THEN
+    LOOP
+    2DROP -1 ;
+
+\ _BSK-LF-OFF ( addr len -- off | -1 )  Offset of first LF
+: _BSK-LF-OFF  ( addr len -- off | -1 )
+    DUP 0= IF 2DROP -1 EXIT THEN
+    0 DO
+        DUP I + C@ 10 = IF DROP I UNLOOP EXIT THEN
+    LOOP
+    DROP -1 ;
+
+\ _BSK-CRLF2 ( addr len -- off | -1 )  Offset of first CR LF CR LF
+: _BSK-CRLF2  ( addr len -- off | -1 )
+    DUP 4 < IF 2DROP -1 EXIT THEN
+    3 - 0 DO
+        DUP I + C@ 13 = IF
+            DUP I + 1+ C@ 10 = IF
+                DUP I + 2 + C@ 13 = IF
+                    DUP I + 3 + C@ 10 = IF DROP I UNLOOP EXIT THEN
+                THEN
+            THEN
+        THEN
+    LOOP
+    DROP -1 ;
+
+\ _BSK-DEC> ( addr len -- addr' len' n )  Parse leading decimal digits
+: _BSK-DEC>  ( addr len -- addr' len' n )
+    0 >R
+    BEGIN
+        DUP 0> IF OVER C@ DUP 48 >= SWAP 57 <= AND ELSE 0 THEN
+    WHILE
+        OVER C@ 48 -  R> 10 * + >R
+        1 /STRING
+    REPEAT
+    R> ;
+
+\ _BSK-PARSE-DEC ( addr len -- n )
+: _BSK-PARSE-DEC  ( addr len -- n )  _BSK-DEC> NIP NIP ;
+
+\ _BSK-HEXVAL ( c -- n | -1 )
+: _BSK-HEXVAL  ( c -- n | -1 )
+    DUP 48 >= OVER 57 <= AND IF 48 - EXIT THEN
+    _BSK-LC
+    DUP 97 >= OVER 102 <= AND IF 87 - EXIT THEN
+    DROP -1 ;
+
+\ _BSK-PARSE-HEX ( addr len -- n )  Parse leading hex digits
+: _BSK-PARSE-HEX  ( addr len -- n )
+    0 >R
+    BEGIN
+        DUP 0> IF OVER C@ _BSK-HEXVAL 0< 0= ELSE 0 THEN
+    WHILE
+        OVER C@ _BSK-HEXVAL  R> 16 * + >R
+        1 /STRING
+    REPEAT
+    2DROP R> ;
+
+\ _BSK-PARSE-IP ( addr len -- ip | 0 )  Dotted quad, 0 if not one
+VARIABLE _BSK-IPACC
+: _BSK-PARSE-IP  ( addr len -- ip | 0 )
+    0 _BSK-IPACC !
+    4 0 DO
+        _BSK-DEC>  _BSK-IPACC @ 8 LSHIFT + _BSK-IPACC !
+        I 3 < IF
+            DUP 0= IF 2DROP 0 UNLOOP EXIT THEN
+            OVER C@ 46 <> IF 2DROP 0 UNLOOP EXIT THEN
+            1 /STRING
+        THEN
+    LOOP
+    NIP IF 0 ELSE _BSK-IPACC @ THEN ;
+
+\ _BSK-SPLIT-LINE ( addr len -- rest-a rest-u line-a line-u )
+\   Split off one LF-terminated line; line excludes CR LF.
+VARIABLE _BSK-SL-A
+: _BSK-SPLIT-LINE  ( addr len -- rest-a rest-u line-a line-u )
+    OVER _BSK-SL-A !
+    BEGIN DUP 0> IF OVER C@ 10 <> ELSE 0 THEN WHILE 1 /STRING REPEAT
+    OVER _BSK-SL-A @ -                          ( a' l' n )
+    DUP 0> IF _BSK-SL-A @ OVER + 1- C@ 13 = IF 1- THEN THEN
+    >R
+    DUP 0> IF 1 /STRING THEN                    \ skip LF
+    _BSK-SL-A @ R> ;
+
+\ _BSK-HDR-FIND ( hdr-a hdr-u name-a name-u -- val-a val-u | 0 0 )
+\   Case-insensitive response header lookup.  Skips the status line.
+VARIABLE _BSK-HN-A
+VARIABLE _BSK-HN-L
+: _BSK-HDR-FIND  ( hdr-a hdr-u name-a name-u -- val-a val-u | 0 0 )
+    _BSK-HN-L ! _BSK-HN-A !
+    _BSK-SPLIT-LINE 2DROP                       \ status line
+    BEGIN DUP 0> WHILE
+        _BSK-SPLIT-LINE                         ( ra ru la lu )
+        DUP 0= IF 2DROP 2DROP 0 0 EXIT THEN     \ end of headers
+        DUP _BSK-HN-L @ > IF
+            OVER _BSK-HN-L @ + C@ 58 = IF
+                OVER _BSK-HN-A @ _BSK-HN-L @ _BSK-CI= IF
+                    _BSK-HN-L @ 1+ /STRING
+                    BEGIN DUP 0> IF OVER C@ 32 = ELSE 0 THEN
+                    WHILE 1 /STRING REPEAT
+                    2SWAP 2DROP EXIT
+                THEN
+            THEN
+        THEN
+        2DROP
+    REPEAT
+    2DROP 0 0 ;
+
+\ ── Request builder ──
+\   Requests are built in their own buffer so BSK-BUF / the path
+\   and post buffers stay untouched while a request is in flight.
+
+3072 CONSTANT _BSK-REQ-MAX
+CREATE _BSK-REQ _BSK-REQ-MAX ALLOT
+VARIABLE _BSK-REQ-LEN   0 _BSK-REQ-LEN !
+
+: _BSK-RQ-C  ( c -- )
+    _BSK-REQ-LEN @ _BSK-REQ-MAX >= IF DROP EXIT THEN
+    _BSK-REQ _BSK-REQ-LEN @ + C!
+    1 _BSK-REQ-LEN +! ;
+
+: _BSK-RQ+  ( addr len -- )
+    DUP _BSK-REQ-LEN @ + _BSK-REQ-MAX > IF 2DROP EXIT THEN
+    DUP >R  _BSK-REQ _BSK-REQ-LEN @ + SWAP CMOVE
+    R> _BSK-REQ-LEN +! ;
+
+: _BSK-RQ-EOL  ( -- )  13 _BSK-RQ-C 10 _BSK-RQ-C ;
+
+\ _BSK-RQ-NUM ( u -- )  Append decimal u.  Not NUM>STR: its buffer
+\   is shared with the UI core while the worker (§6.4) sends.
+: _BSK-RQ-NUM  ( u -- )
+    DUP 10 < IF 48 + _BSK-RQ-C EXIT THEN
+    DUP 10 / RECURSE  10 MOD 48 + _BSK-RQ-C ;
+
+\ _BSK-RQ-AUTH ( -- addr len )  Token for the Authorization header
+: _BSK-RQ-AUTH  ( -- addr len )
+    _BSK-RQ-RF? @ IF _BSK-RFJWT _BSK-RFJWT-LEN @ EXIT THEN
+    _BSK-BEARER _BSK-BEARER-LEN @ ;
+
+\ _BSK-REQ-BUILD ( path-a path-u meth-a meth-u body-u -- )
+\   Build the request head.  body-u = -1 for no body (GET).
+: _BSK-REQ-BUILD  ( path-a path-u meth-a meth-u body-u -- )
+    >R
+    0 _BSK-REQ-LEN !
+    _BSK-RQ+ 32 _BSK-RQ-C _BSK-RQ+ 32 _BSK-RQ-C
+    S" HTTP/1.1" _BSK-RQ+ _BSK-RQ-EOL
+    S" Host: " _BSK-RQ+ BSK-HOST BSK-HOST-LEN @ _BSK-RQ+ _BSK-RQ-EOL
+    S" User-Agent: " _BSK-RQ+ _BSK-UA _BSK-RQ+ _BSK-RQ-EOL
+    S" Accept: application/json" _BSK-RQ+ _BSK-RQ-EOL
+    _BSK-RQ-AUTH DUP IF
+        S" Authorization: Bearer " _BSK-RQ+ _BSK-RQ+ _BSK-RQ-EOL
+    ELSE 2DROP THEN
+    S" Connection: keep-alive" _BSK-RQ+ _BSK-RQ-EOL
+    R> DUP 0< IF DROP ELSE
+        S" Content-Type: application/json" _BSK-RQ+ _BSK-RQ-EOL
+        S" Content-Length: " _BSK-RQ+ _BSK-RQ-NUM _BSK-RQ-EOL
+    THEN
+    _BSK-RQ-EOL ;
+
+\ ── Socket dispatch (TLS or plain TCP) ──
+
+: _BSK-IO-SEND  ( h addr len -- )
+    BSK-TLS? @ IF TLS-SEND ELSE TCP-SEND THEN ;
+
+: _BSK-IO-RECV  ( h addr max -- n )
+    BSK-TLS? @ IF TLS-RECV ELSE TCP-POLL TCP-RECV THEN ;
+
+: _BSK-IO-CLOSE  ( h -- )
+    BSK-TLS? @ IF TLS-CLOSE ELSE TCP-CLOSE THEN ;
+
+\ _BSK-IO-EOF? ( h -- flag )  Has the peer closed the session?
+\   Plain TCP returns 0 and the state tells.  A TLS session doesn't
+\   expose its connection and TLS-RECV only fails on a decrypt
+\   error, so a close can't be seen here: 0.  _BSK-POOL-DO counts a
+\   reused TLS session that stays silent as dropped instead.
+: _BSK-IO-EOF?  ( h -- flag )
+    BSK-TLS? @ IF DROP 0 EXIT THEN
+    TCP-STATUS TCPS-ESTABLISHED <> ;
+
+\ _BSK-TCP-WAIT ( tcb -- tcb | 0 )  Wait for ESTABLISHED
+: _BSK-TCP-WAIT  ( tcb -- tcb | 0 )
+    DUP 0= IF EXIT THEN
+    200 0 DO
+        TCP-POLL
+        DUP TCP-STATUS TCPS-ESTABLISHED = IF UNLOOP EXIT THEN
+    LOOP
+    TCP-CLOSE 0 ;
+
+\ _BSK-RESOLVE ( -- ip | 0 )  Cached server address
+: _BSK-RESOLVE  ( -- ip | 0 )
+    _BSK-SERVER-IP @ ?DUP IF EXIT THEN
+    BSK-HOST BSK-HOST-LEN @ _BSK-PARSE-IP
+    ?DUP 0= IF BSK-HOST BSK-HOST-LEN @ DNS-RESOLVE THEN
+    DUP _BSK-SERVER-IP ! ;
+
+\ ── Pool slots ──
+
+2 CONSTANT _BSK-POOL-MAX
+CREATE _BSK-PL-HS _BSK-POOL-MAX CELLS ALLOT     \ handle, 0 = closed
+CREATE _BSK-PL-KS _BSK-POOL-MAX CELLS ALLOT     \ ip<<16 | port
+CREATE _BSK-PL-TS _BSK-POOL-MAX CELLS ALLOT     \ MS@ of last use
+_BSK-PL-HS _BSK-POOL-MAX CELLS 0 FILL
+_BSK-PL-KS _BSK-POOL-MAX CELLS 0 FILL
+_BSK-PL-TS _BSK-POOL-MAX CELLS 0 FILL
+
+: _BSK-PL-H  ( i -- addr )  CELLS _BSK-PL-HS + ;
+: _BSK-PL-K  ( i -- addr )  CELLS _BSK-PL-KS + ;
+: _BSK-PL-T  ( i -- addr )  CELLS _BSK-PL-TS + ;
+
+VARIABLE _BSK-PL-WANT          \ key of the current request
+VARIABLE _BSK-PL-CUR           \ slot of the current request
+VARIABLE _BSK-PL-REUSED        \ true if the slot was already open
+
+: _BSK-POOL-N  ( -- n )  BSK-POOL-SIZE @ 1 MAX _BSK-POOL-MAX MIN ;
+
+\ _BSK-PL-CLOSE ( slot -- )
+: _BSK-PL-CLOSE  ( slot -- )
+    _BSK-PL-H DUP @ ?DUP IF _BSK-IO-CLOSE THEN
+    0 SWAP ! ;
+
+\ BSK-POOL-CLOSE ( -- )  Close every pooled session
+: BSK-POOL-CLOSE  ( -- )
+    _BSK-POOL-MAX 0 DO I _BSK-PL-CLOSE LOOP ;
+
+\ _BSK-PL-DIAL ( slot -- flag )  Open a session to the server
+: _BSK-PL-DIAL  ( slot -- flag )
+    >R
+    BSK-TLS? @ IF
+        BSK-HOST BSK-HOST-LEN @ 64 MIN
+        DUP TLS-SNI-LEN !  TLS-SNI-HOST SWAP CMOVE
+        _BSK-SERVER-IP @ BSK-PORT @ TLS-CONNECT
+    ELSE
+        _BSK-SERVER-IP @ BSK-PORT @ TCP-CONNECT _BSK-TCP-WAIT
+    THEN
+    DUP R@ _BSK-PL-H !
+    _BSK-PL-WANT @ R@ _BSK-PL-K !
+    MS@ R> _BSK-PL-T !
+    0<> ;
+
+\ _BSK-PL-MATCH ( -- slot | -1 )  Open slot for the wanted server
+: _BSK-PL-MATCH  ( -- slot | -1 )
+    _BSK-POOL-N 0 DO
+        I _BSK-PL-H @ IF
+            I _BSK-PL-K @ _BSK-PL-WANT @ = IF I UNLOOP EXIT THEN
+        THEN
+    LOOP
+    -1 ;
+
+\ _BSK-PL-VICTIM ( -- slot )  First closed slot, else least recent
+: _BSK-PL-VICTIM  ( -- slot )
+    _BSK-POOL-N 0 DO
+        I _BSK-PL-H @ 0= IF I UNLOOP EXIT THEN
+    LOOP
+    0
+    _BSK-POOL-N 1 > IF
+        _BSK-POOL-N 1 DO
+            I _BSK-PL-T @ OVER _BSK-PL-T @ < IF DROP I THEN
+        LOOP
+    THEN
+    DUP _BSK-PL-CLOSE ;
+
+\ _BSK-POOL-ACQUIRE ( -- slot | -1 )
+: _BSK-POOL-ACQUIRE  ( -- slot | -1 )
+    0 _BSK-PL-REUSED !
+    _BSK-SERVER-IP @ 16 LSHIFT BSK-PORT @ OR _BSK-PL-WANT !
+    _BSK-PL-MATCH DUP 0< 0= IF
+        MS@ OVER _BSK-PL-T @ - BSK-POOL-IDLE-MS @ < IF
+            1 BSK-POOL-HITS +!  -1 _BSK-PL-REUSED !  EXIT
+        THEN
+        DUP _BSK-PL-CLOSE                       \ idle too long
+        DUP _BSK-PL-DIAL IF 1 BSK-POOL-REDIALS +! EXIT THEN
+        DROP -1 EXIT
+    THEN
+    DROP _BSK-PL-VICTIM
+    DUP _BSK-PL-DIAL IF 1 BSK-POOL-MISSES +! EXIT THEN
+    DROP -1 ;
+
+\ ── Response receive ──
+\   The whole response lands in BSK-RECV-BUF.  Headers are parsed as
+\   soon as CR LF CR LF arrives; the body is complete when
+\   Content-Length bytes are in, or the terminal chunk is seen.
+\   A streamed response (below) is the exception.
+
+VARIABLE _BSK-RX-H              \ handle being read
+VARIABLE _BSK-RX-LEN            \ bytes in BSK-RECV-BUF
+VARIABLE _BSK-RX-HEND           \ body offset, -1 = headers pending
+VARIABLE _BSK-RX-CLEN           \ Content-Length, -1 = absent
+VARIABLE _BSK-RX-CHUNKED        \ Transfer-Encoding: chunked
+VARIABLE _BSK-RX-CLOSE          \ server sent Connection: close
+VARIABLE _BSK-RX-ERR            \ socket error during receive
+VARIABLE _BSK-RX-EOF            \ peer closed during receive
+VARIABLE _BSK-RX-FULL           \ the whole response arrived
+VARIABLE _BSK-RX-T0             \ MS@ of last progress
+VARIABLE _BSK-RQ-UNSENT         \ last request reached no server
+0 _BSK-RQ-UNSENT !
+VARIABLE _BSK-CK-POS            \ next chunk-size line, body-relative
+
+\ Streamed body.  With _BSK-RX-SINK set to an xt ( addr len -- used ),
+\ every receive of a 200 response hands the body so far to the sink,
+\ and the bytes it used are recycled: the rest moves down to the body
+\ start.  BSK-RECV-BUF then has to hold one unconsumed element (plus
+\ a read), not the whole response.  Chunk framing is stripped as the
+\ data arrives.  The caller sets the sink around one request.
+VARIABLE _BSK-RX-SINK   0 _BSK-RX-SINK !
+VARIABLE _BSK-SX-ON             \ this response is streamed
+VARIABLE _BSK-SX-D              \ end of the clean body (buffer offset)
+VARIABLE _BSK-SX-R              \ next raw byte (chunked)
+VARIABLE _BSK-SX-LEFT           \ chunk data bytes still to come
+VARIABLE _BSK-SX-END            \ terminal chunk seen
+VARIABLE _BSK-SX-GONE           \ body bytes recycled
+VARIABLE _BSK-SX-N              \ byte count temp
+
+\ _BSK-RX-HDR-IS? ( name-a name-u val-a val-u -- flag )
+\   True if header "name" is present and its value starts with val.
+: _BSK-RX-HDR-IS?  ( name-a name-u val-a val-u -- flag )
+    2>R
+    BSK-RECV-BUF @ _BSK-RX-HEND @ 2SWAP _BSK-HDR-FIND   ( va vu )
+    R@ < IF DROP 2R> 2DROP 0 EXIT THEN
+    2R> _BSK-CI= ;
+
+: _BSK-RX-HEADERS  ( -- )
+    _BSK-RX-HEND @ 12 >= IF
+        BSK-RECV-BUF @ 9 + 3 _BSK-PARSE-DEC HTTP-STATUS !
+    THEN
+    BSK-RECV-BUF @ _BSK-RX-HEND @ S" content-length" _BSK-HDR-FIND
+    DUP IF _BSK-PARSE-DEC _BSK-RX-CLEN ! ELSE 2DROP THEN
+    S" transfer-encoding" S" chunked" _BSK-RX-HDR-IS? _BSK-RX-CHUNKED !
+    S" connection" S" close" _BSK-RX-HDR-IS? _BSK-RX-CLOSE ! ;
+
+: _BSK-RX-FIND-HEND  ( -- )
+    BSK-RECV-BUF @ _BSK-RX-LEN @ _BSK-CRLF2
+    DUP 0< IF DROP EXIT THEN
+    4 + _BSK-RX-HEND !
+    _BSK-RX-HEADERS ;
+
+\ _BSK-CK-SCAN ( -- done? )  Walk complete chunks; true at last-chunk
+: _BSK-CK-SCAN  ( -- done? )
+    BEGIN
+        BSK-RECV-BUF @ _BSK-RX-HEND @ + _BSK-CK-POS @ +
+        _BSK-RX-LEN @ _BSK-RX-HEND @ - _BSK-CK-POS @ -      ( a l )
+        2DUP _BSK-LF-OFF DUP 0< IF DROP 2DROP 0 EXIT THEN
+        1+ >R                                   ( a l  R: line )
+        2DUP _BSK-PARSE-HEX                     ( a l size )
+        DUP 0= IF DROP NIP R> 2 + >= EXIT THEN
+        R> + 2 +                                ( a l need )
+        SWAP OVER < IF 2DROP 0 EXIT THEN
+        NIP _BSK-CK-POS +!
+    AGAIN ;
+
+: _BSK-RX-DONE?  ( -- flag )
+    _BSK-RX-HEND @ 0< IF 0 EXIT THEN
+    HTTP-STATUS @ DUP 204 = SWAP 304 = OR IF -1 EXIT THEN
+    _BSK-SX-ON @ IF
+        _BSK-RX-CHUNKED @ IF _BSK-SX-END @ EXIT THEN
+        _BSK-RX-CLEN @ 0< IF 0 EXIT THEN
+        _BSK-RX-LEN @ _BSK-RX-HEND @ - _BSK-SX-GONE @ +
+        _BSK-RX-CLEN @ >= EXIT
+    THEN
+    _BSK-RX-CHUNKED @ IF _BSK-CK-SCAN EXIT THEN
+    _BSK-RX-CLEN @ 0< IF 0 EXIT THEN
+    _BSK-RX-LEN @ _BSK-RX-HEND @ - _BSK-RX-CLEN @ >= ;
+
+\ _BSK-SX-START ( -- )  Stream this response if a sink is waiting
+: _BSK-SX-START  ( -- )
+    _BSK-RX-HEND @ 0< IF EXIT THEN
+    _BSK-RX-SINK @ 0= IF EXIT THEN
+    HTTP-STATUS @ 200 <> IF EXIT THEN
+    _BSK-RX-HEND @ DUP _BSK-SX-D !  _BSK-SX-R !
+    0 _BSK-SX-LEFT !  0 _BSK-SX-END !  0 _BSK-SX-GONE !
+    -1 _BSK-SX-ON ! ;
+
+\ _BSK-SX-DECHUNK ( -- )  Move chunk data that has arrived down to
+\   the end of the clean body; a bare CR LF line ends a chunk.
+: _BSK-SX-DECHUNK  ( -- )
+    BEGIN
+        _BSK-SX-END @ IF EXIT THEN
+        _BSK-SX-LEFT @ 0> IF
+            _BSK-RX-LEN @ _BSK-SX-R @ - _BSK-SX-LEFT @ MIN
+            DUP 0= IF DROP EXIT THEN
+            _BSK-SX-N !
+            BSK-RECV-BUF @ DUP _BSK-SX-R @ + SWAP _BSK-SX-D @ +
+            _BSK-SX-N @ CMOVE
+            _BSK-SX-N @ DUP _BSK-SX-R +!  DUP _BSK-SX-D +!
+            NEGATE _BSK-SX-LEFT +!
+        ELSE
+            BSK-RECV-BUF @ _BSK-SX-R @ +  _BSK-RX-LEN @ _BSK-SX-R @ -
+            2DUP _BSK-LF-OFF DUP 0< IF DROP 2DROP EXIT THEN   ( a l off )
+            DUP 2 < IF
+                NIP NIP 1+ _BSK-SX-R +!
+            ELSE
+                1+ >R _BSK-PARSE-HEX
+                DUP 0= IF -1 _BSK-SX-END ! THEN _BSK-SX-LEFT !
+                R> _BSK-SX-R +!
+            THEN
+        THEN
+    AGAIN ;
+
+\ _BSK-SX-PUMP ( -- )  Feed the sink, recycle what it used
+: _BSK-SX-PUMP  ( -- )
+    _BSK-RX-CHUNKED @ IF _BSK-SX-DECHUNK ELSE _BSK-RX-LEN @ _BSK-SX-D ! THEN
+    BSK-RECV-BUF @ _BSK-RX-HEND @ +  _BSK-SX-D @ _BSK-RX-HEND @ -
+    _BSK-RX-SINK @ EXECUTE
+    DUP 0= IF DROP EXIT THEN
+    _BSK-SX-N !
+    BSK-RECV-BUF @ _BSK-RX-HEND @ + DUP _BSK-SX-N @ + SWAP
+    _BSK-RX-LEN @ _BSK-RX-HEND @ - _BSK-SX-N @ -
+    CMOVE
+    _BSK-SX-N @ NEGATE DUP _BSK-RX-LEN +!  DUP _BSK-SX-D +!  _BSK-SX-R +!
+    _BSK-SX-N @ _BSK-SX-GONE +! ;
+
+\ _BSK-DECHUNK ( addr len -- len' )  Strip chunk framing in place
+VARIABLE _BSK-DC-DST
+VARIABLE _BSK-DC-SIZE
+: _BSK-DECHUNK  ( addr len -- len' )
+    OVER _BSK-DC-DST !  OVER >R
+    BEGIN
+        2DUP _BSK-LF-OFF DUP 0< IF DROP 2DROP _BSK-DC-DST @ R> - EXIT THEN
+        >R 2DUP _BSK-PARSE-HEX _BSK-DC-SIZE !  R> 1+ /STRING
+        _BSK-DC-SIZE @ 0= IF 2DROP _BSK-DC-DST @ R> - EXIT THEN
+        _BSK-DC-SIZE @ OVER MIN _BSK-DC-SIZE !
+        OVER _BSK-DC-DST @ _BSK-DC-SIZE @ CMOVE
+        _BSK-DC-SIZE @ _BSK-DC-DST +!
+        _BSK-DC-SIZE @ 2 + OVER MIN /STRING
+    AGAIN ;
+
+\ _BSK-RX-BODY ( -- addr len )  Body of the received response
+: _BSK-RX-BODY  ( -- addr len )
+    _BSK-RX-HEND @ 0< IF 0 0 EXIT THEN
+    _BSK-SX-ON @ IF                    \ what the sink left
+        BSK-RECV-BUF @ _BSK-RX-HEND @ +  _BSK-SX-D @ _BSK-RX-HEND @ -
+        EXIT
+    THEN
+    BSK-RECV-BUF @ _BSK-RX-HEND @ +
+    _BSK-RX-LEN @ _BSK-RX-HEND @ -
+    _BSK-RX-CHUNKED @ IF OVER SWAP _BSK-DECHUNK EXIT THEN
+    _BSK-RX-CLEN @ 0< 0= IF _BSK-RX-CLEN @ MIN THEN ;
+
+\ _BSK-RECV-RESP ( h -- n )
+\   Receive one response.  n = bytes received (0 = nothing arrived).
+\   Stops on a socket error (_BSK-RX-ERR), a close (_BSK-RX-EOF) or
+\   BSK-RECV-TIMEOUT without progress.
+: _BSK-RECV-RESP  ( h -- n )
+    _BSK-RX-H !
+    0 _BSK-RX-LEN !  -1 _BSK-RX-HEND !  -1 _BSK-RX-CLEN !
+    0 _BSK-RX-CHUNKED !  0 _BSK-RX-CLOSE !  0 _BSK-RX-ERR !
+    0 _BSK-RX-EOF !
+    0 _BSK-CK-POS !  0 HTTP-STATUS !  0 _BSK-SX-ON !  0 _BSK-RX-FULL !
+    MS@ _BSK-RX-T0 !
+    BEGIN
+        _BSK-RX-LEN @ BSK-RECV-MAX >= IF _BSK-RX-LEN @ EXIT THEN
+        _BSK-RX-H @
+        BSK-RECV-BUF @ _BSK-RX-LEN @ +
+        BSK-RECV-MAX _BSK-RX-LEN @ -
+        _BSK-IO-RECV                            ( n )
+        DUP 0> IF
+            _BSK-RX-LEN +!
+            MS@ _BSK-RX-T0 !
+            _BSK-RX-HEND @ 0< IF _BSK-RX-FIND-HEND _BSK-SX-START THEN
+            _BSK-SX-ON @ IF _BSK-SX-PUMP THEN
+            _BSK-RX-DONE? IF -1 _BSK-RX-FULL !  _BSK-RX-LEN @ EXIT THEN
+        ELSE
+            0< IF -1 _BSK-RX-ERR !  _BSK-RX-LEN @ EXIT THEN
+            _BSK-RX-H @ _BSK-IO-EOF? IF
+                -1 _BSK-RX-EOF !  _BSK-RX-LEN @ EXIT
+            THEN
+            MS@ _BSK-RX-T0 @ - BSK-RECV-TIMEOUT @ > IF
+                _BSK-RX-LEN @ EXIT
+            THEN
+        THEN
+    AGAIN ;
+
+\ _BSK-PL-XCHG ( body-a body-u slot -- n )
+\   Send the staged request (plus body) on slot, read the response.
+: _BSK-PL-XCHG  ( body-a body-u slot -- n )
+    _BSK-PL-H @ >R
+    R@ _BSK-REQ _BSK-REQ-LEN @ _BSK-IO-SEND
+    DUP 0> IF R@ ROT ROT _BSK-IO-SEND ELSE 2DROP THEN
+    R> _BSK-RECV-RESP ;
+
+\ _BSK-PL-LIVE? ( slot -- flag )  Is a reused session still open?
+\   One read before the request goes out.  An idle keep-alive
+\   session has nothing to say, so an error, a close or stray bytes
+\   all mean the server has dropped it.
+: _BSK-PL-LIVE?  ( slot -- flag )
+    _BSK-PL-H @ DUP BSK-RECV-BUF @ BSK-RECV-MAX _BSK-IO-RECV
+    IF DROP 0 EXIT THEN
+    _BSK-IO-EOF? 0= ;
+
+\ _BSK-PL-REDIAL ( slot -- flag )  Replace a dropped session
+: _BSK-PL-REDIAL  ( slot -- flag )
+    DUP _BSK-PL-CLOSE
+    _BSK-PL-DIAL DUP 0= IF EXIT THEN
+    1 BSK-POOL-REDIALS +!  0 _BSK-PL-REUSED ! ;
+
+\ _BSK-POOL-DO ( body-a body-u -- resp-a resp-u )
+\   Run the staged request on a pooled session.  _BSK-RQ-UNSENT is
+\   set if no session could be had, or the one it went out on was
+\   closed with not one response byte back: nothing was applied.
+: _BSK-POOL-DO  ( body-a body-u -- resp-a resp-u )
+    0 HTTP-STATUS !  -1 _BSK-RQ-UNSENT !
+    _BSK-RESOLVE 0= IF 2DROP 0 0 EXIT THEN
+    _BSK-POOL-ACQUIRE DUP 0< IF DROP 2DROP 0 0 EXIT THEN
+    _BSK-PL-CUR !
+    _BSK-PL-REUSED @ IF
+        _BSK-PL-CUR @ _BSK-PL-LIVE? 0= IF      \ dropped while idle
+            _BSK-PL-CUR @ _BSK-PL-REDIAL 0= IF 2DROP 0 0 EXIT THEN
+        THEN
+    THEN
+    2DUP _BSK-PL-CUR @ _BSK-PL-XCHG            ( ba bu n )
+    0= DUP BSK-TLS? @ AND _BSK-RX-ERR @ 0= AND IF
+        -1 _BSK-RX-EOF !                \ TLS hides the close: silence
+    THEN
+    _BSK-PL-REUSED @ AND
+    _BSK-RX-ERR @ _BSK-RX-EOF @ OR AND IF
+        \ Closed unanswered as the request went out — redial, resend
+        _BSK-PL-CUR @ _BSK-PL-REDIAL 0= IF 2DROP 0 0 EXIT THEN
+        _BSK-PL-CUR @ _BSK-PL-XCHG DROP
+    ELSE
+        2DROP
+    THEN
+    _BSK-RX-LEN @ 0= _BSK-RX-ERR @ _BSK-RX-EOF @ OR AND _BSK-RQ-UNSENT !
+    MS@ _BSK-PL-CUR @ _BSK-PL-T !
+    _BSK-RX-ERR @ _BSK-RX-EOF @ OR _BSK-RX-CLOSE @ OR
+    _BSK-RX-DONE? 0= OR IF
+        _BSK-PL-CUR @ _BSK-PL-CLOSE          \ not reusable
+    THEN
+    _BSK-RX-BODY ;
+
+\ _BSK-POOL? ( -- flag )  Use the pooled transport for this request?
+: _BSK-POOL?  ( -- flag )
+    BSK-POOL-ON @ 0= IF 0 EXIT THEN
+    BSK-RECV-BUF @ 0= IF 0 EXIT THEN
+    BSK-ACCESS-LEN @ 0= _BSK-BEARER-LEN @ 0<> OR ;
+
+\ BSK-SET-HOST ( addr len -- )  Point the client at another server
+: BSK-SET-HOST  ( addr len -- )
+    BSK-POOL-CLOSE
+    BSK-HOST-MAX MIN DUP BSK-HOST-LEN !
+    BSK-HOST SWAP CMOVE
+    0 _BSK-SERVER-IP ! ;
+
+: _BSK-HOST-DEFAULT  ( -- )  S" bsky.social" BSK-SET-HOST ;
+_BSK-HOST-DEFAULT
+
+\ BSK-POOL-RESET ( -- )  Zero the pool counters
+: BSK-POOL-RESET  ( -- )
+    0 BSK-POOL-HITS !  0 BSK-POOL-MISSES !  0 BSK-POOL-REDIALS ! ;
+
+\ BSK-POOL-STATS ( -- )  Print pool counters
+: BSK-POOL-STATS  ( -- )
+    ." pool: hits " BSK-POOL-HITS @ .
+    ." misses " BSK-POOL-MISSES @ .
+    ." redials " BSK-POOL-REDIALS @ .
+    ." handshakes " BSK-POOL-MISSES @ BSK-POOL-REDIALS @ + .
+    ." saved " BSK-POOL-HITS @ . CR ;
+
+\ ── Transport ownership ──
+\   The transport — the pool, the request and receive buffers, the
+\   field-plan slots and HTTP-STATUS — has one owner at a time.
+\   While the TUI's background worker (§6.4) runs, that is the
+\   worker.  A call from the UI core (BSK-GET, BSK-POST-JSON,
+\   BSK-RENEW, a login) first takes it over with _BSK-TAKE: it
+\   raises _BSK-BG-HOLD, and the worker, between steps, answers with
+\   _BSK-BG-HELD and stays off the network.  Each flag has a single
+\   writer, and each side stores its own flag before reading the
+\   other's, so the two never both go ahead.  The UI core keeps the
+\   transport until _BSK-GIVE-BACK, once its use of the body is
+\   done: the public words that make a call and finish with its
+\   answer (BSK-TL, BSK-POST, BSK-LOGIN-WITH ...) run through
+\   _BSK-UI-RUN, which gives it back as the outermost one returns,
+\   and the TUI gives it back on every tick.  BSK-GET and
+\   BSK-POST-JSON hand the body to their caller and keep it.
+\   BSK-BG-STOP asks the worker to park and waits (bounded) until
+\   it has.
+
+VARIABLE _BSK-BG-ON     0 _BSK-BG-ON !     \ worker owns the network
+VARIABLE _BSK-BG-HALT   0 _BSK-BG-HALT !   \ worker: park when set
+VARIABLE _BSK-BG-HOLD   0 _BSK-BG-HOLD !   \ UI core wants it (UI sets)
+VARIABLE _BSK-BG-HELD   0 _BSK-BG-HELD !   \ parked for it (worker sets)
+
+\ _BSK-TAKE ( -- ok? )  Own the transport for the calling core
+\   At once on the worker, or with no worker running.  Otherwise
+\   waits for the worker to finish its step; 0 if it has not after
+\   twice BSK-RECV-TIMEOUT.
+: _BSK-TAKE  ( -- ok? )
+    _BSK-BG-ON @ 0= _BSK-CORE OR IF -1 EXIT THEN
+    -1 _BSK-BG-HOLD !
+    MS@
+    BEGIN
+        _BSK-BG-HELD @ _BSK-BG-ON @ 0= OR IF DROP -1 EXIT THEN
+        MS@ OVER - BSK-RECV-TIMEOUT @ 2 * >
+    UNTIL
+    DROP  0 _BSK-BG-HOLD !  0 ;
+
+\ _BSK-GIVE-BACK ( -- )  Let the worker have the transport again
+: _BSK-GIVE-BACK  ( -- )  0 _BSK-BG-HOLD ! ;
+
+VARIABLE _BSK-UI-DEPTH  0 _BSK-UI-DEPTH !  \ UI-core _BSK-UI-RUN nesting
+
+\ _BSK-UI-RUN ( i*x xt -- j*x )  Run a blocking public word
+\   On the UI core, the transport is given back when the outermost
+\   one returns, so a word run from the REPL does not leave the
+\   worker parked until the TUI's next tick.
+: _BSK-UI-RUN  ( i*x xt -- j*x )
+    _BSK-CORE IF EXECUTE EXIT THEN
+    1 _BSK-UI-DEPTH +!  EXECUTE  -1 _BSK-UI-DEPTH +!
+    _BSK-UI-DEPTH @ 0= IF _BSK-GIVE-BACK THEN ;
+
+\ BSK-BG-STOP ( -- )  Stop the background worker
+: BSK-BG-STOP  ( -- )
+    _BSK-BG-ON @ 0= IF EXIT THEN
+    -1 _BSK-BG-HALT !
+    MS@
+    BEGIN
+        _BSK-BG-ON @ 0= IF DROP EXIT THEN
+        MS@ OVER - BSK-RECV-TIMEOUT @ 2 * >
+    UNTIL
+    DROP ;
+
+\ BSK-CLEANUP ( -- )  Stop the worker, close the pool
+\   A worker that did not stop in time may still be mid-request, so
+\   the pool is then left alone.
+: BSK-CLEANUP  ( -- )
+    BSK-READY @ 0= IF EXIT THEN
+    BSK-BG-STOP
+    _BSK-BG-ON @ IF
+        ." bsky: worker still busy, pool left open" CR EXIT
+    THEN
+    BSK-POOL-CLOSE
+    0 BSK-RECV-BUF !
+    0 BSK-READY ! ;
+
+\ ── §2.5  Metrics ─────────────────────────────────────────────────
+\
+\  Per-endpoint counters for the XRPC calls made through BSK-GET and
+\  BSK-POST-JSON (§2.6), printed by BSK-STATS and shown on the Stats
+\  subscreen.  Off until BSK-METRICS-ON; while off each shim pays one
+\  variable fetch and a branch, and every other hook a fetch and a
+\  compare.
+\
+\  An endpoint is the NSID of the request path, e.g.
+\  app.bsky.feed.getTimeline.  The first _BSK-MX-MAX - 1 seen get a
+\  row each; any later ones share a final "other" row.  Per row:
+\    +CALLS  requests made        +ERRS  not 200, or cut short
+\    +BYTES  body bytes received, streamed ones included
+\    +LAST +SUM +MAXMS  latency, request out to last byte in
+\    +PARSE  time in the stream sink (§2.4) plus the caller's work
+\            after the call, up to _BSK-MX-PARSED
+\    +FILLS  cache entries stored from its responses
+\  Times are MS@ milliseconds, so latency includes streamed parsing
+\  and a handler under a millisecond adds 0.
+
+16 CONSTANT _BSK-MX-MAX           \ endpoint rows, "other" included
+40 CONSTANT _BSK-MX-NAME-MAX
+
+0       CONSTANT _BSK-MX-CALLS
+1 CELLS CONSTANT _BSK-MX-ERRS
+2 CELLS CONSTANT _BSK-MX-BYTES
+3 CELLS CONSTANT _BSK-MX-LAST
+4 CELLS CONSTANT _BSK-MX-SUM
+5 CELLS CONSTANT _BSK-MX-MAXMS
+6 CELLS CONSTANT _BSK-MX-PARSE
+7 CELLS CONSTANT _BSK-MX-FILLS
+8 CELLS CONSTANT _BSK-MX-NLEN
+9 CELLS CONSTANT _BSK-MX-NAME
+_BSK-MX-NAME _BSK-MX-NAME-MAX + CONSTANT _BSK-MX-SIZE
+
+CREATE _BSK-MX _BSK-MX-MAX _BSK-MX-SIZE * ALLOT
+VARIABLE _BSK-MX-N                      \ rows in use
+VARIABLE BSK-METRICS?     0 BSK-METRICS? !
+VARIABLE _BSK-MX-CUR     -1 _BSK-MX-CUR !   \ row of the current call
+VARIABLE _BSK-MX-T0                     \ MS@ when the request went out
+VARIABLE _BSK-MX-T1                     \ MS@ when the response was in
+VARIABLE _BSK-MX-XT       0 _BSK-MX-XT !    \ stream sink being timed
+
+\ _BSK-MX-ROW ( i -- row )  Address of row i
+: _BSK-MX-ROW  ( i -- row )  _BSK-MX-SIZE * _BSK-MX + ;
+
+\ _BSK-MX-R ( -- row )  Row of the current call
+: _BSK-MX-R  ( -- row )  _BSK-MX-CUR @ _BSK-MX-ROW ;
+
+\ _BSK-MX-AVG ( row -- ms )  Mean latency
+: _BSK-MX-AVG  ( row -- ms )
+    DUP _BSK-MX-SUM + @ SWAP _BSK-MX-CALLS + @ 1 MAX / ;
+
+\ _BSK-MX-NSID ( path-a path-u -- a u )  NSID part of an XRPC path
+: _BSK-MX-NSID  ( path-a path-u -- a u )
+    DUP 6 > IF OVER 6 S" /xrpc/" COMPARE 0= IF 6 /STRING THEN THEN
+    DUP 0= IF EXIT THEN
+    DUP 0 DO
+        OVER I + C@ 63 = IF DROP I UNLOOP EXIT THEN
+    LOOP ;
+
+\ _BSK-MX-NEW ( a u -- i )  Claim the next row for a name
+\   The row is filled before _BSK-MX-N counts it, so a screen on the
+\   other core never shows a half-made row.
+: _BSK-MX-NEW  ( a u -- i )
+    _BSK-MX-NAME-MAX MIN
+    _BSK-MX-N @ _BSK-MX-ROW                 ( a u row )
+    DUP _BSK-MX-SIZE 0 FILL
+    2DUP _BSK-MX-NLEN + !
+    _BSK-MX-NAME + SWAP CMOVE
+    _BSK-MX-N @  1 _BSK-MX-N +! ;
+
+\ _BSK-MX-FIND ( a u -- i )  Row for an endpoint, claimed if new
+: _BSK-MX-FIND  ( a u -- i )
+    _BSK-MX-NAME-MAX MIN
+    _BSK-MX-N @ 0> IF
+        _BSK-MX-N @ 0 DO
+            2DUP I _BSK-MX-ROW DUP _BSK-MX-NAME + SWAP _BSK-MX-NLEN + @
+            COMPARE 0= IF 2DROP I UNLOOP EXIT THEN
+        LOOP
+    THEN
+    _BSK-MX-N @ _BSK-MX-MAX 1- < IF _BSK-MX-NEW EXIT THEN
+    2DROP
+    _BSK-MX-N @ _BSK-MX-MAX < IF S" other" _BSK-MX-NEW DROP THEN
+    _BSK-MX-MAX 1- ;
+
+\ _BSK-MX-SINK ( addr len -- used )  Stream sink, timed
+: _BSK-MX-SINK  ( addr len -- used )
+    _BSK-MX-CUR @ 0< IF _BSK-MX-XT @ EXECUTE EXIT THEN
+    MS@ >R  _BSK-MX-XT @ EXECUTE
+    MS@ R> - _BSK-MX-R _BSK-MX-PARSE + +! ;
+
+\ _BSK-MX-BEGIN ( path-a path-u -- )  A request is about to go out
+\   Called by the shims only while BSK-METRICS? is set.
+: _BSK-MX-BEGIN  ( path-a path-u -- )
+    _BSK-MX-NSID _BSK-MX-FIND _BSK-MX-CUR !
+    1 _BSK-MX-R _BSK-MX-CALLS + +!
+    0 _BSK-SX-GONE !
+    _BSK-RX-SINK @ DUP _BSK-MX-XT ! IF
+        ['] _BSK-MX-SINK _BSK-RX-SINK !
+    THEN
+    MS@ DUP _BSK-MX-T0 ! _BSK-MX-T1 ! ;
+
+\ _BSK-MX-END ( body-a body-u -- body-a body-u )  Response is in
+\   Puts the caller's stream sink back first, even if metrics were
+\   switched off during the call.
+: _BSK-MX-END  ( body-a body-u -- body-a body-u )
+    _BSK-MX-XT @ ?DUP IF _BSK-RX-SINK !  0 _BSK-MX-XT ! THEN
+    _BSK-MX-CUR @ 0< IF EXIT THEN
+    MS@ DUP _BSK-MX-T1 !  _BSK-MX-T0 @ -     ( a u ms )
+    DUP _BSK-MX-R _BSK-MX-LAST + !
+    DUP _BSK-MX-R _BSK-MX-SUM + +!
+    _BSK-MX-R _BSK-MX-MAXMS + DUP @ ROT MAX SWAP !
+    DUP _BSK-SX-GONE @ + _BSK-MX-R _BSK-MX-BYTES + +!
+    \ A streamed body is all used up by the sink, so its length is
+    \ no sign of failure; whether the response arrived whole is
+    HTTP-STATUS @ 200 <> _BSK-RX-FULL @ 0= OR IF
+        1 _BSK-MX-R _BSK-MX-ERRS + +!
+    THEN ;
+
+\ _BSK-MX-PARSED ( -- )  The caller is done with the response
+: _BSK-MX-PARSED  ( -- )
+    _BSK-MX-CUR @ 0< IF EXIT THEN
+    MS@ _BSK-MX-T1 @ - _BSK-MX-R _BSK-MX-PARSE + +!
+    -1 _BSK-MX-CUR ! ;
+
+\ _BSK-MX-FILL ( -- )  One cache entry stored from the response
+: _BSK-MX-FILL  ( -- )
+    _BSK-MX-CUR @ 0< IF EXIT THEN
+    1 _BSK-MX-R _BSK-MX-FILLS + +! ;
+
+\ BSK-STATS-RESET ( -- )  Forget every endpoint and counter
+: BSK-STATS-RESET  ( -- )
+    -1 _BSK-MX-CUR !  0 _BSK-MX-N ! ;
+BSK-STATS-RESET
+
+: BSK-METRICS-ON   ( -- )  -1 BSK-METRICS? ! ;
+: BSK-METRICS-OFF  ( -- )  0 BSK-METRICS? !  -1 _BSK-MX-CUR ! ;
+
+\ BSK-STATS ( -- )  Print the metrics, one endpoint per two lines
+: BSK-STATS  ( -- )
+    ." metrics " BSK-METRICS? @ IF ." on" ELSE ." off" THEN
+    ." , endpoints " _BSK-MX-N @ . CR
+    _BSK-MX-N @ 0> IF
+        _BSK-MX-N @ 0 DO
+            I _BSK-MX-ROW >R
+            R@ _BSK-MX-NAME + R@ _BSK-MX-NLEN + @ TYPE CR
+            ."   calls " R@ _BSK-MX-CALLS + @ .
+            ." errors " R@ _BSK-MX-ERRS + @ .
+            ." bytes " R@ _BSK-MX-BYTES + @ .
+            ." ms last " R@ _BSK-MX-LAST + @ .
+            ." avg " R@ _BSK-MX-AVG .
+            ." max " R@ _BSK-MX-MAXMS + @ .
+            ." parse " R@ _BSK-MX-PARSE + @ .
+            ." fills " R> _BSK-MX-FILLS + @ . CR
+        LOOP
+    THEN ;
+
+\ ── §2.6  Compat Shims (removed in Stage 5+6) ────────────────────
 \
 \  BSK-GET and BSK-POST-JSON bridge old path-based callers to the
-\  akashic HTTP stack.  These build full URLs from paths.
+\  pooled transport (§2.4), or to the akashic HTTP stack when the
+\  pool is off.  The akashic path builds full URLs from paths.
 
 \ BSK-HTTP-STATUS — alias for akashic HTTP-STATUS
 : BSK-HTTP-STATUS  ( -- addr )  HTTP-STATUS ;
 
 \ _BSK-PATH-TO-URL ( path-a path-u -- )
-\   Build "https://bsky.social<path>" into BSK-BUF.
+\   Build "https://<host><path>" into BSK-BUF.
 : _BSK-PATH-TO-URL  ( path-a path-u -- )
     BSK-RESET
-    S" https://bsky.social" BSK-APPEND
+    BSK-TLS? @ IF S" https://" ELSE S" http://" THEN BSK-APPEND
+    BSK-HOST BSK-HOST-LEN @ BSK-APPEND
+    BSK-PORT @ DUP 443 <> SWAP 80 <> AND IF
+        58 BSK-EMIT BSK-PORT @ NUM>APPEND
+    THEN
     BSK-APPEND ;
 
+\ ── Token expiry ──
+\   An access token is good until the exp claim it carries, which
+\   §3.1 decodes into BSK-ACCESS-EXP (0 = unknown).  Each call first
+\   renews the session when that is less than BSK-REFRESH-AHEAD
+\   seconds away, so no call goes out only to be turned down.  A call
+\   the server still rejects for its token (401, or 400 ExpiredToken,
+\   which is what a PDS answers for a stale one) renews and is resent
+\   once.  Renewal is BSK-RENEW (§3.4), reached through _BSK-RENEW-XT.
+\
+\  Counters:  BSK-RENEWS    sessions renewed, ahead of time or not
+\             BSK-RESENDS   calls sent twice because of a rejection
+
+VARIABLE BSK-ACCESS-EXP     0 BSK-ACCESS-EXP !      \ epoch s, 0 = unknown
+VARIABLE BSK-REFRESH-AHEAD  300 BSK-REFRESH-AHEAD ! \ s before exp
+VARIABLE BSK-RENEWS         0 BSK-RENEWS !
+VARIABLE BSK-RESENDS        0 BSK-RESENDS !
+VARIABLE _BSK-RENEW-XT      0 _BSK-RENEW-XT !       \ ( -- ok? )
+
+\ BSK-TOKEN-DUE? ( -- flag )  Access token expires within the margin
+: BSK-TOKEN-DUE?  ( -- flag )
+    BSK-ACCESS-LEN @ 0= BSK-ACCESS-EXP @ 0= OR IF 0 EXIT THEN
+    EPOCH@ 1000 / BSK-REFRESH-AHEAD @ + BSK-ACCESS-EXP @ >= ;
+
+\ _BSK-RENEW-DUE ( -- )  Renew the session now if it is due
+: _BSK-RENEW-DUE  ( -- )
+    BSK-TOKEN-DUE? 0= IF EXIT THEN
+    _BSK-RENEW-XT @ ?DUP IF EXECUTE DROP THEN ;
+
+\ _BSK-REJECTED? ( body-a body-u -- body-a body-u flag )
+\   Was the call turned down for its token?
+: _BSK-REJECTED?  ( body-a body-u -- body-a body-u flag )
+    HTTP-STATUS @ 401 = IF -1 EXIT THEN
+    HTTP-STATUS @ 400 <> IF 0 EXIT THEN
+    2DUP S" ExpiredToken" _BSK-SEARCH 0< 0= ;
+
+\ _BSK-RESEND? ( body-a body-u -- body-a body-u flag )
+\   True if the call was rejected for its token and a renewal was
+\   tried; the caller drops the body and sends the call once more.
+\   The renewal reused the receive buffer, so the call is resent
+\   even if it failed — the server's second answer is what the
+\   caller sees.
+: _BSK-RESEND?  ( body-a body-u -- body-a body-u flag )
+    BSK-ACCESS-LEN @ 0= _BSK-RENEW-XT @ 0= OR IF 0 EXIT THEN
+    _BSK-REJECTED? 0= IF 0 EXIT THEN
+    _BSK-RENEW-XT @ EXECUTE DROP
+    1 BSK-RESENDS +!  -1 ;
+
+\ _BSK-HTTP-FULL ( -- )  After an akashic call: it returns only once
+\   the response is in, so any status means the body is whole
+: _BSK-HTTP-FULL  ( -- )  HTTP-STATUS @ 0<> _BSK-RX-FULL ! ;
+
 \ BSK-GET ( path-addr path-len -- body-addr body-len )
-\   Compat shim: build URL, call HTTP-GET.
-: BSK-GET  ( path-addr path-len -- body-addr body-len )
+\   Compat shim: pooled GET, or build URL and call HTTP-GET.
+: _BSK-GET-ONCE  ( path-addr path-len -- body-addr body-len )
+    _BSK-POOL? IF
+        S" GET" -1 _BSK-REQ-BUILD
+        0 0 _BSK-POOL-DO EXIT
+    THEN
+    0 _BSK-RQ-UNSENT !
     _BSK-PATH-TO-URL
     BSK-BUF BSK-LEN @
-    HTTP-GET ;
+    HTTP-GET  _BSK-HTTP-FULL ;
+
+: BSK-GET  ( path-addr path-len -- body-addr body-len )
+    -1 _BSK-RQ-UNSENT !
+    _BSK-TAKE 0= IF 2DROP 0 0 EXIT THEN
+    BSK-METRICS? @ IF 2DUP _BSK-MX-BEGIN THEN
+    _BSK-RENEW-DUE
+    2DUP _BSK-GET-ONCE
+    _BSK-RESEND? IF 2DROP _BSK-GET-ONCE ELSE 2SWAP 2DROP THEN
+    _BSK-MX-END ;
 
 \ BSK-POST-JSON ( path-a path-u json-a json-u -- body-a body-u )
-\   Compat shim: build URL, call HTTP-POST-JSON.
+\   Compat shim: pooled POST, or build URL and call HTTP-POST-JSON.
 CREATE _BSK-URL-TMP 512 ALLOT
 VARIABLE _BSK-URL-LEN
 
-: BSK-POST-JSON  ( path-a path-u json-a json-u -- body-a body-u )
+: _BSK-POST-ONCE  ( path-a path-u json-a json-u -- body-a body-u )
     2>R                              \ save json
+    _BSK-POOL? IF
+        S" POST" R@ _BSK-REQ-BUILD
+        2R> _BSK-POOL-DO EXIT
+    THEN
+    0 _BSK-RQ-UNSENT !
     _BSK-PATH-TO-URL
     \ Copy URL to temp buf (BSK-BUF will be overwritten by HTTP)
     BSK-LEN @ _BSK-URL-LEN !
     BSK-BUF _BSK-URL-TMP BSK-LEN @ CMOVE
     _BSK-URL-TMP _BSK-URL-LEN @
     2R>                              \ restore json
-    HTTP-POST-JSON ;
+    HTTP-POST-JSON  _BSK-HTTP-FULL ;
+
+: BSK-POST-JSON  ( path-a path-u json-a json-u -- body-a body-u )
+    -1 _BSK-RQ-UNSENT !
+    _BSK-TAKE 0= IF 2DROP 2DROP 0 0 EXIT THEN
+    BSK-METRICS? @ IF 2OVER _BSK-MX-BEGIN THEN
+    _BSK-RENEW-DUE
+    2OVER 2OVER _BSK-POST-ONCE       ( pa pu ja ju ba bu )
+    _BSK-RESEND? IF
+        2DROP _BSK-POST-ONCE
+    ELSE
+        2>R 2DROP 2DROP 2R>
+    THEN
+    _BSK-MX-END ;
 
 \ =====================================================================
 \  §3  Authentication — REPLACED by akashic session.f
@@ -271,15 +1531,218 @@ VARIABLE _BSK-URL-LEN
 \
 \  After SESS-LOGIN or SESS-REFRESH succeeds, copy DID to local buf
 \  and set BSK-ACCESS-LEN to 1 (compat flag for login-check guards).
+\  The pooled transport (§2.4) writes its own Authorization header,
+\  so accessJwt and refreshJwt are mirrored from the session
+\  response, which is still sitting in BSK-RECV-BUF (HTTP-USE-STATIC
+\  or the pool's own receive), and the access token's expiry is
+\  decoded for the refresh-ahead check (§2.6).  The pool knows how
+\  much it received (_BSK-RX-LEN); akashic does not say, so its
+\  responses are searched up to BSK-RECV-MAX.
+
+\ _BSK-CAPTURE ( a l dst max key-a key-u -- len )
+\   Copy the string value of key, looked for in the response a l,
+\   to dst (at most max bytes).  0 if it is not there.
+: _BSK-CAPTURE  ( a l dst max key-a key-u -- len )
+    2>R 2SWAP 2R> 2SWAP                         ( dst max ka ku a l )
+    OVER 0= OVER 0= OR IF 2DROP 2DROP 2DROP 0 EXIT THEN
+    2SWAP DUP >R                                ( dst max a l ka ku )
+    2OVER 2SWAP _BSK-SEARCH                     ( dst max a l off )
+    DUP 0< IF R> 2DROP 2DROP 2DROP 0 EXIT THEN
+    R> + 1+ /STRING                             \ past key"
+    JSON-SKIP-WS
+    DUP 0> IF OVER C@ 58 = IF 1 /STRING THEN THEN
+    JSON-SKIP-WS
+    JSON-GET-STRING                             ( dst max s-a s-u )
+    ROT MIN DUP >R ROT SWAP CMOVE R> ;
+
+\ _BSK-CAPTURE-TOKENS ( a l -- )  Mirror accessJwt and refreshJwt
+: _BSK-CAPTURE-TOKENS  ( a l -- )
+    2DUP _BSK-BEARER _BSK-BEARER-MAX S" accessJwt" _BSK-CAPTURE
+    _BSK-BEARER-LEN !
+    _BSK-RFJWT _BSK-BEARER-MAX S" refreshJwt" _BSK-CAPTURE
+    _BSK-RFJWT-LEN ! ;
+
+\ ── JWT expiry ──
+\   The access token's payload (the part between the dots) is
+\   unpadded base64url JSON; its exp claim, in epoch seconds, goes
+\   to BSK-ACCESS-EXP (§2.6).  The decoder is local because the
+\   alphabet is the URL-safe one and the padding is left off.
+
+512 CONSTANT _BSK-JWT-MAX
+CREATE _BSK-JWT-BUF _BSK-JWT-MAX ALLOT
+VARIABLE _BSK-JWT-LEN
+VARIABLE _BSK-B64-ACC
+VARIABLE _BSK-B64-BITS
+
+\ _BSK-B64U ( c -- n | -1 )  Value of a base64url digit
+: _BSK-B64U  ( c -- n | -1 )
+    DUP 65 >= OVER 90 <= AND IF 65 - EXIT THEN
+    DUP 97 >= OVER 122 <= AND IF 71 - EXIT THEN
+    DUP 48 >= OVER 57 <= AND IF 4 + EXIT THEN
+    DUP 45 = IF DROP 62 EXIT THEN
+    95 = IF 63 EXIT THEN
+    -1 ;
+
+\ _BSK-B64U-DECODE ( addr len -- )  Decode into _BSK-JWT-BUF
+\   Stops at the first byte that is not a digit ("." or "=").
+: _BSK-B64U-DECODE  ( addr len -- )
+    0 _BSK-JWT-LEN !  0 _BSK-B64-ACC !  0 _BSK-B64-BITS !
+    DUP 0> 0= IF 2DROP EXIT THEN
+    0 DO
+        DUP I + C@ _BSK-B64U
+        DUP 0< IF 2DROP UNLOOP EXIT THEN
+        _BSK-B64-ACC @ 6 LSHIFT OR _BSK-B64-ACC !
+        6 _BSK-B64-BITS +!
+        _BSK-B64-BITS @ 8 >=  _BSK-JWT-LEN @ _BSK-JWT-MAX <  AND IF
+            -8 _BSK-B64-BITS +!
+            _BSK-B64-ACC @ _BSK-B64-BITS @ RSHIFT 255 AND
+            _BSK-JWT-BUF _BSK-JWT-LEN @ + C!
+            1 _BSK-JWT-LEN +!
+        THEN
+    LOOP
+    DROP ;
+
+\ _BSK-JWT-EXP ( jwt-a jwt-u -- exp | 0 )  exp claim of a JWT
+: _BSK-JWT-EXP  ( jwt-a jwt-u -- exp | 0 )
+    2DUP S" ." _BSK-SEARCH
+    DUP 0< IF DROP 2DROP 0 EXIT THEN
+    1+ /STRING _BSK-B64U-DECODE
+    _BSK-JWT-BUF _BSK-JWT-LEN @ S" exp" JSON-FIND-KEY
+    DUP 0= IF 2DROP 0 EXIT THEN
+    JSON-GET-NUMBER ;
+
+\ _BSK-SYNC-TOKENS ( a l -- )  Mirror the tokens, decode the expiry
+\   A token that is due the moment it arrives means this clock and
+\   the server's disagree; its exp is dropped so every call does not
+\   renew, and a rejected call still renews (§2.6).
+: _BSK-SYNC-TOKENS  ( a l -- )
+    _BSK-CAPTURE-TOKENS
+    _BSK-BEARER _BSK-BEARER-LEN @ _BSK-JWT-EXP BSK-ACCESS-EXP !
+    BSK-TOKEN-DUE? IF 0 BSK-ACCESS-EXP ! THEN ;
 
 : _BSK-SYNC-SESSION  ( -- )
     SESS-DID                         ( did-a did-u )
     BSK-DID-MAX MIN                  ( did-a clamped )
     DUP BSK-DID-LEN !               ( did-a clamped )
     BSK-DID SWAP CMOVE              ( )
-    1 BSK-ACCESS-LEN ! ;
+    1 BSK-ACCESS-LEN !
+    BSK-RECV-BUF @ BSK-RECV-MAX _BSK-SYNC-TOKENS ;
+
+\ ── §3.2  Session File ────────────────────────────────────────────
+\
+\  The refresh token, DID and handle are kept in bsky.ses so the next
+\  boot can resume with one refreshSession (§3.5) instead of a full
+\  createSession.  The file is sealed with AES-256-GCM under a key
+\  derived from the login credentials, HMAC-SHA256(password, handle),
+\  so it is useless without them and a different account or a
+\  changed password simply fails to open it.  It is rewritten after
+\  every login and renewal, since a refresh token is good only once.
+\
+\  Layout (cells little-endian):
+\    +0   "BSKSES01"
+\    +8   IV (12 bytes from RANDOM, padded to 16)
+\    +24  GCM tag (16 bytes)
+\    +40  plaintext length
+\    +48  ciphertext of:  handle-len, did-len, refresh-len, then the
+\                          three strings back to back
+\  The file is always _BSK-SS-SIZE bytes, so a rewrite never has to
+\  grow it.
+
+\ BSK-SESS-FILE ( -- addr len )  Name of the session file
+: BSK-SESS-FILE  ( -- addr len )  S" bsky.ses" ;
+
+48 CONSTANT _BSK-SS-HDR
+24 BSK-HANDLE-MAX + BSK-DID-MAX + _BSK-BEARER-MAX + CONSTANT _BSK-SS-PT-MAX
+_BSK-SS-HDR _BSK-SS-PT-MAX + CONSTANT _BSK-SS-SIZE
+
+VARIABLE BSK-SESS-SAVE?   -1 BSK-SESS-SAVE? !   \ write bsky.ses
+CREATE _BSK-SS-KEY 32 ALLOT
+VARIABLE _BSK-SS-KEYED    0 _BSK-SS-KEYED !
+VARIABLE _BSK-SS-DIRTY    0 _BSK-SS-DIRTY !     \ save owed by core 1
+CREATE _BSK-SS-IMG _BSK-SS-SIZE ALLOT           \ the file
+CREATE _BSK-SS-PT  _BSK-SS-PT-MAX ALLOT         \ plaintext
+VARIABLE _BSK-SS-P                              \ pack / unpack cursor
+
+\ _BSK-SS-KEY-SET ( handle-a handle-u pass-a pass-u -- )  Derive the key
+: _BSK-SS-KEY-SET  ( handle-a handle-u pass-a pass-u -- )
+    2SWAP _BSK-SS-KEY HMAC-SHA256
+    -1 _BSK-SS-KEYED ! ;
+
+\ _BSK-SS-PUT ( addr len -- )  Append a string to the plaintext
+: _BSK-SS-PUT  ( addr len -- )
+    DUP >R _BSK-SS-P @ SWAP CMOVE  R> _BSK-SS-P +! ;
+
+\ _BSK-SS-TAKE ( dst len -- )  Copy the next string out
+: _BSK-SS-TAKE  ( dst len -- )
+    DUP >R _BSK-SS-P @ ROT ROT CMOVE  R> _BSK-SS-P +! ;
+
+\ _BSK-SS-SEAL ( -- )  Encrypt the current session into _BSK-SS-IMG
+: _BSK-SS-SEAL  ( -- )
+    _BSK-SS-IMG _BSK-SS-SIZE 0 FILL
+    S" BSKSES01" _BSK-SS-IMG SWAP CMOVE
+    RANDOM _BSK-SS-IMG 8 + !  RANDOM _BSK-SS-IMG 16 + !
+    _BSK-SS-IMG 20 + 4 0 FILL                   \ 12-byte IV
+    BSK-HANDLE-LEN @ _BSK-SS-PT !
+    BSK-DID-LEN @    _BSK-SS-PT 8 + !
+    _BSK-RFJWT-LEN @ _BSK-SS-PT 16 + !
+    _BSK-SS-PT 24 + _BSK-SS-P !
+    BSK-HANDLE BSK-HANDLE-LEN @ _BSK-SS-PUT
+    BSK-DID BSK-DID-LEN @ _BSK-SS-PUT
+    _BSK-RFJWT _BSK-RFJWT-LEN @ _BSK-SS-PUT
+    _BSK-SS-P @ _BSK-SS-PT - DUP _BSK-SS-IMG 40 + !
+    >R _BSK-SS-KEY _BSK-SS-IMG 8 + _BSK-SS-PT
+    _BSK-SS-IMG _BSK-SS-HDR + R> AES-ENCRYPT
+    _BSK-SS-IMG 24 + 16 CMOVE
+    _BSK-SS-PT _BSK-SS-PT-MAX 0 FILL ;
+
+\ _BSK-SS-UNSEAL ( -- ok? )  Decrypt _BSK-SS-IMG into the session
+\   Nothing is installed unless the tag checks and every length fits.
+: _BSK-SS-UNSEAL  ( -- ok? )
+    _BSK-SS-KEYED @ 0= IF 0 EXIT THEN
+    _BSK-SS-IMG 8 S" BSKSES01" COMPARE IF 0 EXIT THEN
+    _BSK-SS-IMG 40 + @ DUP 24 < OVER _BSK-SS-PT-MAX > OR IF
+        DROP 0 EXIT
+    THEN
+    >R _BSK-SS-KEY _BSK-SS-IMG 8 + _BSK-SS-IMG _BSK-SS-HDR +
+    _BSK-SS-PT R> _BSK-SS-IMG 24 + AES-DECRYPT
+    0= IF _BSK-SS-PT _BSK-SS-PT-MAX 0 FILL 0 EXIT THEN
+    _BSK-SS-PT @ BSK-HANDLE-MAX >
+    _BSK-SS-PT 8 + @ BSK-DID-MAX > OR
+    _BSK-SS-PT 16 + @ _BSK-BEARER-MAX > OR IF
+        _BSK-SS-PT _BSK-SS-PT-MAX 0 FILL 0 EXIT
+    THEN
+    _BSK-SS-PT 24 + _BSK-SS-P !
+    _BSK-SS-PT @ DUP BSK-HANDLE-LEN !  BSK-HANDLE SWAP _BSK-SS-TAKE
+    _BSK-SS-PT 8 + @ DUP BSK-DID-LEN !  BSK-DID SWAP _BSK-SS-TAKE
+    _BSK-SS-PT 16 + @ DUP _BSK-RFJWT-LEN !  _BSK-RFJWT SWAP _BSK-SS-TAKE
+    _BSK-SS-PT _BSK-SS-PT-MAX 0 FILL
+    -1 ;
 
-\ ── §3.2  Login ───────────────────────────────────────────────────
+\ BSK-SAVE-SESSION ( -- ok? )  Write bsky.ses
+\   Only once a login or resume has given the key, and only from
+\   core 0; a renewal on the background worker leaves _BSK-SS-DIRTY
+\   for the UI core to pick up (§6.4), so the file layer is only ever
+\   driven from one core.
+: BSK-SAVE-SESSION  ( -- ok? )
+    BSK-SESS-SAVE? @ 0= _BSK-SS-KEYED @ 0= OR IF 0 EXIT THEN
+    _BSK-RFJWT-LEN @ 0= IF 0 EXIT THEN
+    _BSK-CORE IF -1 _BSK-SS-DIRTY ! 0 EXIT THEN
+    0 _BSK-SS-DIRTY !
+    _BSK-SS-SEAL
+    BSK-SESS-FILE FILE-OPEN ?DUP 0= IF BSK-SESS-FILE FILE-CREATE THEN
+    DUP 0= IF EXIT THEN >R
+    _BSK-SS-IMG _BSK-SS-SIZE R@ FILE-WRITE _BSK-SS-SIZE =
+    R> FILE-CLOSE ;
+
+\ _BSK-SS-LOAD ( -- ok? )  Read bsky.ses and unseal it
+: _BSK-SS-LOAD  ( -- ok? )
+    BSK-SESS-FILE FILE-OPEN DUP 0= IF EXIT THEN >R
+    _BSK-SS-IMG _BSK-SS-SIZE R@ FILE-READ
+    R> FILE-CLOSE
+    _BSK-SS-SIZE <> IF 0 EXIT THEN
+    _BSK-SS-UNSEAL ;
+
+\ ── §3.3  Login ───────────────────────────────────────────────────
 
 \ Temp parse buffers (used only during login)
 CREATE _BSK-LOGIN-HANDLE 128 ALLOT
@@ -290,13 +1753,18 @@ VARIABLE _BSK-LOGIN-PLEN   0 _BSK-LOGIN-PLEN !
 
 
 \ BSK-LOGIN-WITH ( handle-a handle-u pass-a pass-u -- )
-\   Programmatic login.  Saves handle locally, delegates to SESS-LOGIN.
-: BSK-LOGIN-WITH  ( handle-a handle-u pass-a pass-u -- )
+\   Programmatic login.  Saves handle locally, delegates to SESS-LOGIN,
+\   then writes the session file (§3.2).
+: _BSK-LOGIN-WITH-DO  ( handle-a handle-u pass-a pass-u -- )
+    _BSK-TAKE 0= IF
+        2DROP 2DROP ." bsky: network busy" CR EXIT
+    THEN
     BSK-INIT
     \ Save handle before SESS-LOGIN (it doesn't store it)
     2OVER BSK-HANDLE-MAX MIN         ( h-a h-u p-a p-u h-a h-u' )
     >R BSK-HANDLE R@ CMOVE
     R> BSK-HANDLE-LEN !
+    2OVER 2OVER _BSK-SS-KEY-SET
     SESS-LOGIN                       ( ior )
     DUP 0<> IF
         ." bsky: login failed (ior=" . ." )" CR
@@ -304,7 +1772,10 @@ VARIABLE _BSK-LOGIN-PLEN   0 _BSK-LOGIN-PLEN !
         EXIT
     THEN DROP
     _BSK-SYNC-SESSION
+    BSK-SAVE-SESSION DROP
     ." Logged in as " BSK-HANDLE BSK-HANDLE-LEN @ TYPE CR ;
+: BSK-LOGIN-WITH  ( handle-a handle-u pass-a pass-u -- )
+    ['] _BSK-LOGIN-WITH-DO _BSK-UI-RUN ;
 
 \ BSK-LOGIN ( "handle" "password" -- )
 \   User-facing word.  Reads handle and password from input stream.
@@ -324,20 +1795,101 @@ VARIABLE _BSK-LOGIN-PLEN   0 _BSK-LOGIN-PLEN !
     \ Clear password from memory
     _BSK-LOGIN-PASS 128 0 FILL  0 _BSK-LOGIN-PLEN ! ;
 
-\ ── §3.3  Token Refresh ──────────────────────────────────────────
+\ ── §3.4  Token Refresh ──────────────────────────────────────────
+\
+\  BSK-RENEW renews the session without printing.  The shims (§2.6)
+\  call it when the access token comes due and when a call is turned
+\  down for its token; the TUI's background step (§6.4) calls it as
+\  soon as the token is due, so the renewal is normally done before
+\  any call needs it.  On the pooled transport it POSTs
+\  refreshSession with the mirrored refresh token, which works on
+\  any server the pool can reach; otherwise it is SESS-REFRESH.
+\  A pooled renewal hands the new access token to HTTP-SET-BEARER;
+\  session.f keeps its old refresh token, so once the pool has
+\  renewed, renewals stay on the pool.
+
+\ _BSK-RENEW-POOL ( -- ok? )  refreshSession on a pooled session
+\   The caller's stream sink is set aside: this response is ours.
+\   The POST has no body but still says Content-Length: 0.
+: _BSK-RENEW-POOL  ( -- ok? )
+    _BSK-RX-SINK @ >R  0 _BSK-RX-SINK !
+    S" /xrpc/com.atproto.server.refreshSession" S" POST"
+    -1 _BSK-RQ-RF? !  0 _BSK-REQ-BUILD  0 _BSK-RQ-RF? !
+    0 0 _BSK-POOL-DO NIP
+    R> _BSK-RX-SINK !
+    0<> HTTP-STATUS @ 200 = AND ;
+
+\ BSK-RENEW ( -- ok? )  Renew the session quietly
+: BSK-RENEW  ( -- ok? )
+    BSK-ACCESS-LEN @ 0= IF 0 EXIT THEN
+    _BSK-TAKE 0= IF 0 EXIT THEN
+    _BSK-POOL? _BSK-RFJWT-LEN @ 0<> AND IF
+        _BSK-RENEW-POOL
+        DUP IF
+            BSK-RECV-BUF @ _BSK-RX-LEN @
+            _BSK-SYNC-TOKENS                \ same account, same DID
+            _BSK-BEARER _BSK-BEARER-LEN @ HTTP-SET-BEARER
+        THEN
+    ELSE
+        SESS-REFRESH 0=
+        DUP IF _BSK-SYNC-SESSION THEN
+    THEN
+    DUP IF
+        1 BSK-RENEWS +!  BSK-SAVE-SESSION DROP
+    ELSE
+        0 BSK-ACCESS-EXP !
+    THEN ;
+' BSK-RENEW _BSK-RENEW-XT !
 
-: BSK-REFRESH  ( -- )
+: _BSK-REFRESH-DO  ( -- )
     BSK-ACCESS-LEN @ 0= IF
         ." bsky: not logged in — login first" CR EXIT
     THEN
-    SESS-REFRESH                     ( ior )
-    DUP 0<> IF
-        ." bsky: refresh failed (ior=" . ." )" CR EXIT
-    THEN DROP
-    _BSK-SYNC-SESSION
+    BSK-RENEW 0= IF
+        ." bsky: refresh failed (HTTP " HTTP-STATUS @ . ." )" CR EXIT
+    THEN
     ." bsky: tokens refreshed" CR ;
+: BSK-REFRESH  ( -- )  ['] _BSK-REFRESH-DO _BSK-UI-RUN ;
+
+\ ── §3.5  Resume ──────────────────────────────────────────────────
+\
+\  BSK-RESUME opens bsky.ses with the given credentials and trades
+\  its refresh token for a fresh pair with one refreshSession on the
+\  pooled transport: no createSession, and the pooled session it
+\  opens is the one the first fetch goes out on.  akashic session.f
+\  is not involved, so a resumed session renews on the pool (§3.4).
+\  BSK-LOGIN-RESUME falls back to a full login when the file is
+\  missing, sealed for someone else, or its token was refused.
+
+\ BSK-RESUME ( handle-a handle-u pass-a pass-u -- ok? )
+: _BSK-RESUME-DO  ( handle-a handle-u pass-a pass-u -- ok? )
+    _BSK-TAKE 0= IF 2DROP 2DROP 0 EXIT THEN
+    BSK-INIT
+    _BSK-SS-KEY-SET
+    0 BSK-ACCESS-LEN !  0 _BSK-BEARER-LEN !  0 BSK-ACCESS-EXP !
+    _BSK-SS-LOAD 0= IF 0 EXIT THEN
+    _BSK-POOL? 0= IF 0 EXIT THEN
+    _BSK-RENEW-POOL 0= IF 0 _BSK-RFJWT-LEN ! 0 EXIT THEN
+    1 BSK-ACCESS-LEN !
+    BSK-RECV-BUF @ _BSK-RX-LEN @ _BSK-SYNC-TOKENS
+    _BSK-BEARER-LEN @ 0= IF 0 BSK-ACCESS-LEN ! 0 EXIT THEN
+    _BSK-BEARER _BSK-BEARER-LEN @ HTTP-SET-BEARER
+    BSK-SAVE-SESSION DROP
+    -1 ;
+: BSK-RESUME  ( handle-a handle-u pass-a pass-u -- ok? )
+    ['] _BSK-RESUME-DO _BSK-UI-RUN ;
+
+\ BSK-LOGIN-RESUME ( handle-a handle-u pass-a pass-u -- )
+\   Resume the saved session, or log in.  What autoexec.f runs.
+: BSK-LOGIN-RESUME  ( handle-a handle-u pass-a pass-u -- )
+    2OVER 2OVER BSK-RESUME IF
+        2DROP 2DROP
+        ." Resumed session for " BSK-HANDLE BSK-HANDLE-LEN @ TYPE CR
+        EXIT
+    THEN
+    BSK-LOGIN-WITH ;
 
-\ ── §3.4  Session Info ────────────────────────────────────────────
+\ ── §3.6  Session Info ────────────────────────────────────────────
 
 : BSK-WHO  ( -- )
     BSK-ACCESS-LEN @ 0= IF
@@ -358,6 +1910,7 @@ VARIABLE _BSK-LOGIN-PLEN   0 _BSK-LOGIN-PLEN !
 \  View timeline, profiles, and notifications.
 \  All words require a valid session (BSK-LOGIN first).
 \  Uses BSK-GET from Stage 2 and JSON parser from Stage 1.
+\  The profile viewer (§4.2) is in bsky-profile.f.
 
 \ ── §4.0  Display Helpers ─────────────────────────────────────────
 \
@@ -397,48 +1950,50 @@ VARIABLE _BSK-PATH-LEN   0 _BSK-PATH-LEN !
 \  Endpoint: GET /xrpc/app.bsky.feed.getTimeline?limit=5
 \  Response: {"cursor":"...","feed":[{"post":{"author":{"handle":"...","displayName":"..."},"record":{"text":"..."},...},...},...]}
 \
-\  Each feed item has a deep "post" object.  We use JSON-FIND-KEY
-\  to navigate into nested objects since it scans forward.
+\  Each feed item has a deep "post" object.  The fields we need are
+\  described once by _BSK-TL-PLAN and pulled out in a single walk.
 
 \ Cursor storage for pagination
 CREATE BSK-TL-CURSOR 128 ALLOT
 VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
 
+\ Feed item field plan — one walk fills every slot (§1.1).
+\   post { uri cid author { handle did displayName } record { text } }
+BSK-FP-PLAN _BSK-TL-PLAN
+BSK-FP-SLOT _BSK-TLF-URI
+BSK-FP-SLOT _BSK-TLF-CID
+BSK-FP-SLOT _BSK-TLF-HANDLE
+BSK-FP-SLOT _BSK-TLF-DID
+BSK-FP-SLOT _BSK-TLF-NAME
+BSK-FP-SLOT _BSK-TLF-TEXT
+
+: _BSK-TL-PLAN-BUILD  ( -- )
+    _BSK-TL-PLAN BSK-FP-BEGIN
+    BSK-FP-ROOT S" post" BSK-FP-BRANCH          ( post )
+    DUP S" uri" _BSK-TLF-URI BSK-FP-FIELD
+    DUP S" cid" _BSK-TLF-CID BSK-FP-FIELD
+    DUP S" author" BSK-FP-BRANCH                ( post author )
+    DUP S" handle" _BSK-TLF-HANDLE BSK-FP-FIELD
+    DUP S" did" _BSK-TLF-DID BSK-FP-FIELD
+    S" displayName" _BSK-TLF-NAME BSK-FP-FIELD
+    S" record" BSK-FP-BRANCH
+    S" text" _BSK-TLF-TEXT BSK-FP-FIELD ;
+_BSK-TL-PLAN-BUILD
+
 \ _BSK-TL-PRINT-POST ( item-addr item-len -- )
 \   Print one timeline post entry (feed item).
 \   Expects addr/len to point at the start of a feed item object.
 : _BSK-TL-PRINT-POST  ( addr len -- )
-    \ Find post object first
-    S" post" JSON-FIND-KEY         ( post-addr post-len )
-    DUP 0= IF 2DROP EXIT THEN
-    \ Navigate post → author for handle + displayName
-    2DUP S" author" JSON-FIND-KEY   ( post-a post-l auth-a auth-l )
-    DUP 0> IF
-        2DUP S" handle" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING
-            ." @" 76 _BSK-TYPE-TRUNC
-        ELSE 2DROP THEN
-        S" displayName" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING
-            DUP 0> IF
-                ."  (" 60 _BSK-TYPE-TRUNC ." )"
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
+    _BSK-TL-PLAN BSK-FP-WALK
+    _BSK-TLF-HANDLE BSK-FP@ NIP
+    _BSK-TLF-TEXT BSK-FP@ NIP OR 0= IF EXIT THEN   \ no post object
+    _BSK-TLF-HANDLE BSK-FP-STR
+    DUP 0> IF ." @" 76 _BSK-TYPE-TRUNC ELSE 2DROP THEN
+    _BSK-TLF-NAME BSK-FP-STR
+    DUP 0> IF ."  (" 60 _BSK-TYPE-TRUNC ." )" ELSE 2DROP THEN
     CR
-    \ Navigate post → record → text
-    S" record" JSON-FIND-KEY
-    DUP 0> IF
-        S" text" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING
-            DUP 0> IF
-                ."   " 200 _BSK-TYPE-TRUNC CR
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
+    _BSK-TLF-TEXT BSK-FP-STR
+    DUP 0> IF ."   " 200 _BSK-TYPE-TRUNC CR ELSE 2DROP THEN
     ." ---" CR ;
 
 \ _BSK-TL-PATH ( -- addr len )
@@ -454,7 +2009,7 @@ VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
     _BSK-SAVE-PATH ;
 
 \ BSK-TL ( -- )   Display recent timeline posts
-: BSK-TL  ( -- )
+: _BSK-TL-DO  ( -- )
     BSK-ACCESS-LEN @ 0= IF ." bsky: login first" CR EXIT THEN
     _BSK-TL-PATH BSK-GET           ( body-addr body-len )
     DUP 0= IF 2DROP ." bsky: timeline fetch failed" CR EXIT THEN
@@ -492,6 +2047,7 @@ VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
         THEN
     REPEAT
     2DROP 2DROP ;
+: BSK-TL  ( -- )  ['] _BSK-TL-DO _BSK-UI-RUN ;
 
 \ BSK-TL-NEXT ( -- )   Show next page of timeline
 : BSK-TL-NEXT  ( -- )
@@ -500,86 +2056,6 @@ VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
     THEN
     BSK-TL ;
 
-\ ── §4.2  Profile Viewer ─────────────────────────────────────────
-\
-\  BSK-PROFILE ( "handle" -- )  View a user's profile.
-\
-\  Endpoint: GET /xrpc/app.bsky.actor.getProfile?actor=<handle>
-\  Response: {"did":"...","handle":"...","displayName":"...",
-\             "description":"...","followersCount":N,
-\             "followsCount":N,"postsCount":N,...}
-
-\ _BSK-PROFILE-PATH ( actor-addr actor-len -- path-addr path-len )
-\   Build profile request path with URL-encoded actor parameter.
-: _BSK-PROFILE-PATH  ( addr len -- path-addr path-len )
-    BSK-RESET
-    S" /xrpc/app.bsky.actor.getProfile?actor=" BSK-APPEND
-    URL-ENCODE
-    _BSK-SAVE-PATH ;
-
-: BSK-PROFILE  ( "handle" -- )
-    BSK-ACCESS-LEN @ 0= IF ." bsky: login first" CR EXIT THEN
-    BL WORD COUNT                   ( addr len )
-    DUP 0= IF 2DROP ." Usage: BSK-PROFILE handle" CR EXIT THEN
-    _BSK-PROFILE-PATH BSK-GET      ( body-addr body-len )
-    DUP 0= IF 2DROP ." bsky: profile fetch failed" CR EXIT THEN
-    BSK-HTTP-STATUS @ 200 <> IF
-        ." bsky: profile error (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-        2DROP EXIT
-    THEN
-    \ Display profile info
-    2DUP S" displayName" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" handle" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF ." @" 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" description" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF 200 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" followersCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." followers  " ELSE 2DROP THEN
-    2DUP S" followsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." following  " ELSE 2DROP THEN
-    2DUP S" postsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." posts" ELSE 2DROP THEN
-    CR
-    2DROP ;
-
-\ _BSK-PROFILE-WITH ( actor-addr actor-len -- )
-\   Stack-based profile viewer (no input stream parsing).
-: _BSK-PROFILE-WITH  ( addr len -- )
-    BSK-ACCESS-LEN @ 0= IF 2DROP ." bsky: login first" CR EXIT THEN
-    _BSK-PROFILE-PATH BSK-GET      ( body-addr body-len )
-    DUP 0= IF 2DROP ." bsky: profile fetch failed" CR EXIT THEN
-    BSK-HTTP-STATUS @ 200 <> IF
-        ." bsky: profile error (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-        2DROP EXIT
-    THEN
-    2DUP S" displayName" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" handle" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF ." @" 64 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" description" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-STRING DUP 0> IF 200 _BSK-TYPE-TRUNC ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    CR
-    2DUP S" followersCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." followers  " ELSE 2DROP THEN
-    2DUP S" followsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." following  " ELSE 2DROP THEN
-    2DUP S" postsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER . ." posts" ELSE 2DROP THEN
-    CR
-    2DROP ;
-
 \ ── §4.3  Notifications ──────────────────────────────────────────
 \
 \  BSK-NOTIF ( -- )  List recent notifications (10 items).
@@ -590,32 +2066,32 @@ VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
 \     "author":{"handle":"...","displayName":"..."},
 \     ...},...]}
 
+\ Notification field plan:  reason  author { handle did }
+BSK-FP-PLAN _BSK-NF-PLAN
+BSK-FP-SLOT _BSK-NFF-REASON
+BSK-FP-SLOT _BSK-NFF-HANDLE
+BSK-FP-SLOT _BSK-NFF-DID
+
+: _BSK-NF-PLAN-BUILD  ( -- )
+    _BSK-NF-PLAN BSK-FP-BEGIN
+    BSK-FP-ROOT S" reason" _BSK-NFF-REASON BSK-FP-FIELD
+    BSK-FP-ROOT S" author" BSK-FP-BRANCH
+    DUP S" handle" _BSK-NFF-HANDLE BSK-FP-FIELD
+    S" did" _BSK-NFF-DID BSK-FP-FIELD ;
+_BSK-NF-PLAN-BUILD
+
 \ _BSK-NOTIF-PRINT ( item-addr item-len -- )
 \   Print one notification entry.
 : _BSK-NOTIF-PRINT  ( addr len -- )
-    \ Extract reason — top-level key
-    2DUP S" reason" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING
-        DUP 0> IF
-            20 _BSK-TYPE-TRUNC
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
+    _BSK-NF-PLAN BSK-FP-WALK
+    _BSK-NFF-REASON BSK-FP-STR
+    DUP 0> IF 20 _BSK-TYPE-TRUNC ELSE 2DROP THEN
     ."  from "
-    \ Navigate author → handle (handle is inside author object)
-    S" author" JSON-FIND-KEY
-    DUP 0> IF
-        S" handle" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING
-            DUP 0> IF
-                ." @" 40 _BSK-TYPE-TRUNC
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
+    _BSK-NFF-HANDLE BSK-FP-STR
+    DUP 0> IF ." @" 40 _BSK-TYPE-TRUNC ELSE 2DROP THEN
     CR ;
 
-: BSK-NOTIF  ( -- )
+: _BSK-NOTIF-DO  ( -- )
     BSK-ACCESS-LEN @ 0= IF ." bsky: login first" CR EXIT THEN
     BSK-RESET
     S" /xrpc/app.bsky.notification.listNotifications?limit=10" BSK-APPEND
@@ -644,960 +2120,65 @@ VARIABLE BSK-TL-CURSOR-LEN  0 BSK-TL-CURSOR-LEN !
         THEN
     REPEAT
     2DROP 2DROP ;
+: BSK-NOTIF  ( -- )  ['] _BSK-NOTIF-DO _BSK-UI-RUN ;
 
-\ =====================================================================
-\  §4 — End of Read-Only Features
-\ =====================================================================
-
-\ =====================================================================
-\  §5  Write Features
-\ =====================================================================
-\
-\  BSK-POST   — post a new skeet
-\  BSK-REPLY  — reply to a post
-\  BSK-LIKE   — like a post
-\  BSK-REPOST — repost
-\
-\  All four use POST /xrpc/com.atproto.repo.createRecord with
-\  different collection and record schemas.
-
-\ ── §5.1  JSON Body Builder ───────────────────────────────────────
-\
-\  Staging buffer: JSON body is built in BSK-BUF, then copied here
-\  before BSK-BUILD-POST overwrites BSK-BUF with HTTP headers.
-
-CREATE _BSK-POST-BUF 2048 ALLOT
-VARIABLE _BSK-POST-LEN   0 _BSK-POST-LEN !
-
-\ _BSK-STAGE-BODY ( -- )  Copy BSK-BUF → _BSK-POST-BUF
-: _BSK-STAGE-BODY  ( -- )
-    BSK-LEN @ 2048 MIN DUP _BSK-POST-LEN !
-    BSK-BUF _BSK-POST-BUF ROT CMOVE ;
-
-\ _BSK-QK ( addr len -- )  Append "key":  (quoted key + colon)
-: _BSK-QK  ( addr len -- )
-    34 BSK-EMIT  BSK-APPEND  34 BSK-EMIT  58 BSK-EMIT ;
-
-\ _BSK-QV ( addr len -- )  Append "value" (quoted value)
-: _BSK-QV  ( addr len -- )
-    34 BSK-EMIT  BSK-APPEND  34 BSK-EMIT ;
-
-\ _BSK-QV-ESC ( addr len -- )  Append "value" with JSON escaping
-: _BSK-QV-ESC  ( addr len -- )
-    34 BSK-EMIT  JSON-COPY-ESCAPED  34 BSK-EMIT ;
-
-\ _BSK-COMMA ( -- )  Append comma
-: _BSK-COMMA  ( -- )  44 BSK-EMIT ;
-
-\ _BSK-CR-OPEN ( collection-addr collection-len -- )
-\   Begin a createRecord JSON body with common fields.
-\   Emits: {"repo":"<DID>","collection":"<col>","record":{"$type":"<col>",
-: _BSK-CR-OPEN  ( caddr clen -- )
-    BSK-RESET
-    123 BSK-EMIT                      \ {
-    S" repo" _BSK-QK
-    BSK-DID BSK-DID-LEN @ _BSK-QV
-    _BSK-COMMA
-    S" collection" _BSK-QK
-    2DUP _BSK-QV
-    _BSK-COMMA
-    S" record" _BSK-QK
-    123 BSK-EMIT                      \ {
-    S" $type" _BSK-QK
-    _BSK-QV
-    _BSK-COMMA ;
-
-\ _BSK-CREATED-AT ( -- )  Append "createdAt":"<ISO8601>"
-: _BSK-CREATED-AT  ( -- )
-    S" createdAt" _BSK-QK
-    BSK-NOW _BSK-QV ;
-
-\ _BSK-CR-CLOSE ( -- )  Close record and outer braces: }}
-: _BSK-CR-CLOSE  ( -- )
-    125 BSK-EMIT  125 BSK-EMIT ;  \ }}
-
-\ _BSK-SUBJECT ( uri-addr uri-len cid-addr cid-len -- )
-\   Append "subject":{"uri":"...","cid":"..."}
-: _BSK-SUBJECT  ( uaddr ulen caddr clen -- )
-    2>R
-    S" subject" _BSK-QK
-    123 BSK-EMIT
-    S" uri" _BSK-QK  _BSK-QV  _BSK-COMMA
-    S" cid" _BSK-QK  2R> _BSK-QV
-    125 BSK-EMIT ;
-
-\ _BSK-DO-CREATE ( -- ok? )  Stage body, POST, check response.
-: _BSK-DO-CREATE  ( -- ok? )
-    BSK-ACCESS-LEN @ 0= IF
-        ." bsky: login first" CR 0 EXIT
-    THEN
-    _BSK-STAGE-BODY
-    S" /xrpc/com.atproto.repo.createRecord"
-    _BSK-POST-BUF _BSK-POST-LEN @
-    BSK-POST-JSON
-    DUP 0= IF 2DROP ." bsky: create failed (network)" CR 0 EXIT THEN
-    2DROP
-    BSK-HTTP-STATUS @ 200 = ;
-
-\ ── §5.2  BSK-POST ────────────────────────────────────────────────
-\
-\  BSK-POST ( text-addr text-len -- )
-\  Post a new skeet.
-
-: BSK-POST  ( addr len -- )
-    S" app.bsky.feed.post" _BSK-CR-OPEN
-    S" text" _BSK-QK
-    _BSK-QV-ESC
-    _BSK-COMMA
-    _BSK-CREATED-AT
-    _BSK-CR-CLOSE
-    _BSK-DO-CREATE IF
-        ." Posted!" CR
-    ELSE
-        ." bsky: post failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ ── §5.3  BSK-REPLY ───────────────────────────────────────────────
-\
-\  BSK-REPLY ( uri-addr uri-len cid-addr cid-len text-addr text-len -- )
-\  Reply to a post.  For simplicity, root = parent (no deep threading).
-
-VARIABLE _BSK-REPLY-UADDR   VARIABLE _BSK-REPLY-ULEN
-VARIABLE _BSK-REPLY-CADDR   VARIABLE _BSK-REPLY-CLEN
-
-: BSK-REPLY  ( uaddr ulen caddr clen taddr tlen -- )
-    \ Save reply target
-    2>R 2>R
-    _BSK-REPLY-ULEN !  _BSK-REPLY-UADDR !
-    2R> _BSK-REPLY-CLEN !  _BSK-REPLY-CADDR !
-    2R>                               ( text-addr text-len )
-    S" app.bsky.feed.post" _BSK-CR-OPEN
-    S" text" _BSK-QK
-    _BSK-QV-ESC
-    _BSK-COMMA
-    \ Build reply object (root = parent for simplicity)
-    S" reply" _BSK-QK
-    123 BSK-EMIT                      \ {
-    \ root
-    S" root" _BSK-QK
-    123 BSK-EMIT
-    S" uri" _BSK-QK
-    _BSK-REPLY-UADDR @ _BSK-REPLY-ULEN @ _BSK-QV  _BSK-COMMA
-    S" cid" _BSK-QK
-    _BSK-REPLY-CADDR @ _BSK-REPLY-CLEN @ _BSK-QV
-    125 BSK-EMIT  _BSK-COMMA         \ },
-    \ parent = root
-    S" parent" _BSK-QK
-    123 BSK-EMIT
-    S" uri" _BSK-QK
-    _BSK-REPLY-UADDR @ _BSK-REPLY-ULEN @ _BSK-QV  _BSK-COMMA
-    S" cid" _BSK-QK
-    _BSK-REPLY-CADDR @ _BSK-REPLY-CLEN @ _BSK-QV
-    125 BSK-EMIT                      \ }
-    125 BSK-EMIT  _BSK-COMMA         \ },  (close reply)
-    _BSK-CREATED-AT
-    _BSK-CR-CLOSE
-    _BSK-DO-CREATE IF
-        ." Replied!" CR
-    ELSE
-        ." bsky: reply failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ ── §5.4  BSK-LIKE ────────────────────────────────────────────────
-\
-\  BSK-LIKE ( uri-addr uri-len cid-addr cid-len -- )
-\  Like a post.
-
-: BSK-LIKE  ( uaddr ulen caddr clen -- )
-    S" app.bsky.feed.like" _BSK-CR-OPEN
-    _BSK-SUBJECT
-    _BSK-COMMA
-    _BSK-CREATED-AT
-    _BSK-CR-CLOSE
-    _BSK-DO-CREATE IF
-        ." Liked!" CR
-    ELSE
-        ." bsky: like failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ ── §5.5  BSK-REPOST ─────────────────────────────────────────────
-\
-\  BSK-REPOST ( uri-addr uri-len cid-addr cid-len -- )
-\  Repost (reshare).
-
-: BSK-REPOST  ( uaddr ulen caddr clen -- )
-    S" app.bsky.feed.repost" _BSK-CR-OPEN
-    _BSK-SUBJECT
-    _BSK-COMMA
-    _BSK-CREATED-AT
-    _BSK-CR-CLOSE
-    _BSK-DO-CREATE IF
-        ." Reposted!" CR
-    ELSE
-        ." bsky: repost failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ ── §5.5  BSK-FOLLOW / BSK-UNFOLLOW ───────────────────────────────
+\ ── §4.4  Deferred Modules ────────────────────────────────────────
 \
-\  BSK-FOLLOW ( did-addr did-len -- )
-\  Follow a user by DID.
-
-: BSK-FOLLOW  ( addr len -- )
-    S" app.bsky.graph.follow" _BSK-CR-OPEN
-    S" subject" _BSK-QK
-    _BSK-QV
-    _BSK-COMMA
-    _BSK-CREATED-AT
-    _BSK-CR-CLOSE
-    _BSK-DO-CREATE IF
-        ." Followed!" CR
-    ELSE
-        ." bsky: follow failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ _BSK-DO-DELETE ( -- ok? )  Stage body, POST deleteRecord, check.
-: _BSK-DO-DELETE  ( -- ok? )
-    BSK-ACCESS-LEN @ 0= IF
-        ." bsky: login first" CR 0 EXIT
-    THEN
-    _BSK-STAGE-BODY
-    S" /xrpc/com.atproto.repo.deleteRecord"
-    _BSK-POST-BUF _BSK-POST-LEN @
-    BSK-POST-JSON
-    DUP 0= IF 2DROP ." bsky: delete failed (network)" CR 0 EXIT THEN
-    2DROP
-    BSK-HTTP-STATUS @ 200 = ;
-
-\ _BSK-DR-OPEN ( collection-addr collection-len rkey-addr rkey-len -- )
-\   Build deleteRecord JSON: {"repo":"<DID>","collection":"...","rkey":"..."}
-: _BSK-DR-OPEN  ( caddr clen rkaddr rklen -- )
-    2>R
-    BSK-RESET
-    123 BSK-EMIT
-    S" repo" _BSK-QK
-    BSK-DID BSK-DID-LEN @ _BSK-QV  _BSK-COMMA
-    S" collection" _BSK-QK
-    _BSK-QV  _BSK-COMMA
-    S" rkey" _BSK-QK
-    2R> _BSK-QV
-    125 BSK-EMIT ;
-
-\ BSK-UNFOLLOW ( rkey-addr rkey-len -- )
-\   Unfollow by rkey (the record key of the follow record).
-: BSK-UNFOLLOW  ( addr len -- )
-    S" app.bsky.graph.follow" 2SWAP
-    _BSK-DR-OPEN
-    _BSK-DO-DELETE IF
-        ." Unfollowed!" CR
-    ELSE
-        ." bsky: unfollow failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ ── §5.6  BSK-DELETE ──────────────────────────────────────────────
+\  The profile viewer, the write path and the TUI are separate files
+\  so a headless reader compiles none of them.  Each of their public
+\  words starts out here as a stub that REQUIREs its module on first
+\  use and hands over to the real word; once loaded, the real word
+\  is also what the interpreter finds.  A module that did not load,
+\  or does not define the word, leaves FIND on the stub itself; the
+\  stubs are compiled between _BSK-STUB-LO and _BSK-STUB-HI so that
+\  is caught instead of the stub calling itself forever.  Variables
+\  of a module (e.g. BSK-Q-BATCH) exist only once it is loaded.
 \
-\  BSK-DELETE ( uri-addr uri-len -- )
-\  Delete a record by AT URI.
-\  AT URI format: at://did:plc:xxx/app.bsky.feed.post/3abc...
-\  We extract the collection and rkey from the last two path segments.
-
-\ _BSK-RFIND-SLASH ( addr len -- offset | -1 )
-\   Find the last '/' in string.  Returns offset from addr.
-: _BSK-RFIND-SLASH  ( addr len -- offset )
-    1- BEGIN
-        DUP 0< IF NIP EXIT THEN
-        2DUP + C@ 47 = IF NIP EXIT THEN
-        1-
-    AGAIN ;
-
-\ _BSK-URI-PARSE ( uri-addr uri-len -- col-a col-l rkey-a rkey-l ok? )
-\   Extract collection and rkey from AT URI.
-\   Returns addresses pointing into the original string.
-VARIABLE _BUP-ADDR   VARIABLE _BUP-LEN
-VARIABLE _BUP-S2     VARIABLE _BUP-S1
-
-: _BSK-URI-PARSE  ( uaddr ulen -- ca cl ra rl flag )
-    _BUP-LEN !  _BUP-ADDR !
-    \ Find last slash (separates collection/rkey)
-    _BUP-ADDR @  _BUP-LEN @  _BSK-RFIND-SLASH
-    DUP 0< IF 0 0 0 0 0 EXIT THEN
-    _BUP-S2 !
-    \ Find second-to-last slash (separates repo/collection)
-    _BUP-ADDR @  _BUP-S2 @  _BSK-RFIND-SLASH
-    DUP 0< IF 0 0 0 0 0 EXIT THEN
-    _BUP-S1 !
-    \ collection = addr+s1+1, length = s2-s1-1
-    _BUP-ADDR @ _BUP-S1 @ + 1+
-    _BUP-S2 @ _BUP-S1 @ - 1-
-    \ rkey = addr+s2+1, length = total-s2-1
-    _BUP-ADDR @ _BUP-S2 @ + 1+
-    _BUP-LEN @ _BUP-S2 @ - 1-
-    -1 ;
-
-\ BSK-DELETE ( uri-addr uri-len -- )
-\   Delete any record by AT-URI.
-: BSK-DELETE  ( uaddr ulen -- )
-    _BSK-URI-PARSE 0= IF
-        ." bsky: invalid AT-URI" CR EXIT
+\    BSK-PROFILE                                 bsky-profile.f
+\    BSK-POST BSK-REPLY BSK-LIKE BSK-REPOST
+\    BSK-FOLLOW BSK-UNFOLLOW BSK-DELETE
+\    BSK-PENDING BSK-FLUSH BSK-QUEUE              bsky-write.f
+\    BSK-BG-START BSK-MEM                        bsky-tui.f
+
+CREATE _BSK-LAZY-CMD 64 ALLOT
+VARIABLE _BSK-STUB-LO     0 _BSK-STUB-LO !
+VARIABLE _BSK-STUB-HI     0 _BSK-STUB-HI !
+
+\ _BSK-STUB? ( xt -- flag )  Is xt one of the stubs below?
+: _BSK-STUB?  ( xt -- flag )
+    DUP _BSK-STUB-LO @ < 0= SWAP _BSK-STUB-HI @ < AND ;
+
+\ _BSK-LAZY ( name-a name-u mod-a mod-u -- )
+\   REQUIRE mod, then run the newest word called name
+: _BSK-LAZY  ( name-a name-u mod-a mod-u -- )
+    S" REQUIRE " _BSK-LAZY-CMD SWAP CMOVE
+    48 MIN DUP >R _BSK-LAZY-CMD 8 + SWAP CMOVE
+    _BSK-LAZY-CMD R> 8 + EVALUATE
+    2DUP _BSK-FIND DUP _BSK-STUB? 0= OVER AND IF
+        NIP NIP EXECUTE EXIT
     THEN
-    \ ( col-a col-l rkey-a rkey-l )
-    _BSK-DR-OPEN
-    _BSK-DO-DELETE IF
-        ." Deleted!" CR
-    ELSE
-        ." bsky: delete failed (HTTP " BSK-HTTP-STATUS @ . ." )" CR
-    THEN ;
-
-\ =====================================================================
-\  §5 — End of Write Features
-\ =====================================================================
+    DROP ." bsky: cannot load " TYPE CR ;
+
+: _BSK-LAZY-PR  ( name-a name-u -- )  S" bsky-profile.f" _BSK-LAZY ;
+: _BSK-LAZY-WR  ( name-a name-u -- )  S" bsky-write.f" _BSK-LAZY ;
+: _BSK-LAZY-UI  ( name-a name-u -- )  S" bsky-tui.f" _BSK-LAZY ;
+
+HERE _BSK-STUB-LO !
+: BSK-PROFILE   ( "handle" -- )          S" BSK-PROFILE" _BSK-LAZY-PR ;
+: BSK-POST      ( addr len -- )          S" BSK-POST" _BSK-LAZY-WR ;
+: BSK-REPLY     ( ua ul ca cl ta tl -- ) S" BSK-REPLY" _BSK-LAZY-WR ;
+: BSK-LIKE      ( ua ul ca cl -- )       S" BSK-LIKE" _BSK-LAZY-WR ;
+: BSK-REPOST    ( ua ul ca cl -- )       S" BSK-REPOST" _BSK-LAZY-WR ;
+: BSK-FOLLOW    ( addr len -- )          S" BSK-FOLLOW" _BSK-LAZY-WR ;
+: BSK-UNFOLLOW  ( addr len -- )          S" BSK-UNFOLLOW" _BSK-LAZY-WR ;
+: BSK-DELETE    ( uaddr ulen -- )        S" BSK-DELETE" _BSK-LAZY-WR ;
+: BSK-PENDING   ( -- n )                 S" BSK-PENDING" _BSK-LAZY-WR ;
+: BSK-FLUSH     ( -- )                   S" BSK-FLUSH" _BSK-LAZY-WR ;
+: BSK-QUEUE     ( -- )                   S" BSK-QUEUE" _BSK-LAZY-WR ;
+: BSK-BG-START  ( -- )                   S" BSK-BG-START" _BSK-LAZY-UI ;
+: BSK-MEM       ( -- )                   S" BSK-MEM" _BSK-LAZY-UI ;
+HERE _BSK-STUB-HI !
 
 \ =====================================================================
-\  §6  Interactive TUI (KDOS Screens Integration)
-\ =====================================================================
-\
-\  Registers a Bluesky screen [9] with three subscreens:
-\    [Timeline]  [Notifs]  [Profile]
-\
-\  The screen is selectable (flag=1) — n/p navigates posts/items,
-\  Enter activates.  Per-screen key handler:
-\    f = fetch/refresh   l = like   t = repost   d = delete
-\    c = compose post    y = reply to selected post
-\
-\  Data is cached in fixed-size arrays to avoid re-fetching on each
-\  screen redraw.  Press 'f' to fetch fresh data from the API.
-
-\ ── §6.1  Cache Data Model ────────────────────────────────────────
-\
-\  Fixed-size slot arrays for timeline posts, notifications, and
-\  profile data.  Separate length arrays track actual stored length
-\  per slot.
-
-10 CONSTANT _BSK-TL-MAX      \ max cached timeline posts
-32 CONSTANT _BSK-HS          \ handle slot size (bytes)
-600 CONSTANT _BSK-TS         \ text slot size (up to 300-char post + URLs)
-100 CONSTANT _BSK-US         \ URI slot size
-64 CONSTANT _BSK-CS          \ CID slot size
-
-\ Timeline post cache arrays
-CREATE _BSK-TL-H   _BSK-TL-MAX _BSK-HS * ALLOT    \ handles
-CREATE _BSK-TL-HL  _BSK-TL-MAX CELLS ALLOT         \ handle lengths
-CREATE _BSK-TL-T   _BSK-TL-MAX _BSK-TS * ALLOT    \ post texts
-CREATE _BSK-TL-TL  _BSK-TL-MAX CELLS ALLOT         \ text lengths
-CREATE _BSK-TL-U   _BSK-TL-MAX _BSK-US * ALLOT    \ AT URIs
-CREATE _BSK-TL-UL  _BSK-TL-MAX CELLS ALLOT         \ URI lengths
-CREATE _BSK-TL-C   _BSK-TL-MAX _BSK-CS * ALLOT    \ CIDs
-CREATE _BSK-TL-CL  _BSK-TL-MAX CELLS ALLOT         \ CID lengths
-VARIABLE _BSK-TL-N   0 _BSK-TL-N !                 \ cached count
-
-\ Notification cache arrays
-10 CONSTANT _BSK-NF-MAX
-20 CONSTANT _BSK-RS           \ reason slot size
-
-CREATE _BSK-NF-R   _BSK-NF-MAX _BSK-RS * ALLOT    \ reasons
-CREATE _BSK-NF-RL  _BSK-NF-MAX CELLS ALLOT         \ reason lengths
-CREATE _BSK-NF-H   _BSK-NF-MAX _BSK-HS * ALLOT    \ author handles
-CREATE _BSK-NF-HL  _BSK-NF-MAX CELLS ALLOT         \ handle lengths
-VARIABLE _BSK-NF-N   0 _BSK-NF-N !                 \ cached count
-
-\ Profile cache
-CREATE _BSK-PR-DN   64 ALLOT   VARIABLE _BSK-PR-DNL  0 _BSK-PR-DNL !
-CREATE _BSK-PR-H    40 ALLOT   VARIABLE _BSK-PR-HL   0 _BSK-PR-HL !
-CREATE _BSK-PR-D   200 ALLOT   VARIABLE _BSK-PR-DL   0 _BSK-PR-DL !
-VARIABLE _BSK-PR-FC  0 _BSK-PR-FC !    \ followersCount
-VARIABLE _BSK-PR-FG  0 _BSK-PR-FG !    \ followsCount
-VARIABLE _BSK-PR-PC  0 _BSK-PR-PC !    \ postsCount
-VARIABLE _BSK-PR-OK  0 _BSK-PR-OK !    \ profile loaded?
-
-\ Compose buffer
-CREATE _BSK-COMP-BUF 300 ALLOT
-
-\ Status message for feedback
-CREATE _BSK-STATUS 64 ALLOT
-VARIABLE _BSK-STATUS-LEN  0 _BSK-STATUS-LEN !
-
-\ ── §6.2  Cache Accessors ─────────────────────────────────────────
-\
-\  Store:  _BSK-TL-H!  ( addr len i -- )   copy string into slot i
-\  Fetch:  _BSK-TL-HANDLE  ( i -- addr len )   return pointer+length
-
-VARIABLE _BSK-CI   \ cache index temp
-
-\ Timeline handle
-: _BSK-TL-H!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-HS MIN DUP _BSK-CI @ CELLS _BSK-TL-HL + !
-    _BSK-CI @ _BSK-HS * _BSK-TL-H + SWAP CMOVE ;
-: _BSK-TL-HANDLE  ( i -- addr len )
-    DUP _BSK-HS * _BSK-TL-H +  SWAP CELLS _BSK-TL-HL + @ ;
-
-\ Timeline text
-: _BSK-TL-T!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-TS MIN DUP _BSK-CI @ CELLS _BSK-TL-TL + !
-    _BSK-CI @ _BSK-TS * _BSK-TL-T + SWAP CMOVE ;
-: _BSK-TL-TEXT  ( i -- addr len )
-    DUP _BSK-TS * _BSK-TL-T +  SWAP CELLS _BSK-TL-TL + @ ;
-
-\ Timeline URI
-: _BSK-TL-U!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-US MIN DUP _BSK-CI @ CELLS _BSK-TL-UL + !
-    _BSK-CI @ _BSK-US * _BSK-TL-U + SWAP CMOVE ;
-: _BSK-TL-URI  ( i -- addr len )
-    DUP _BSK-US * _BSK-TL-U +  SWAP CELLS _BSK-TL-UL + @ ;
-
-\ Timeline CID
-: _BSK-TL-C!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-CS MIN DUP _BSK-CI @ CELLS _BSK-TL-CL + !
-    _BSK-CI @ _BSK-CS * _BSK-TL-C + SWAP CMOVE ;
-: _BSK-TL-CID  ( i -- addr len )
-    DUP _BSK-CS * _BSK-TL-C +  SWAP CELLS _BSK-TL-CL + @ ;
-
-\ Notification reason
-: _BSK-NF-R!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-RS MIN DUP _BSK-CI @ CELLS _BSK-NF-RL + !
-    _BSK-CI @ _BSK-RS * _BSK-NF-R + SWAP CMOVE ;
-: _BSK-NF-REASON  ( i -- addr len )
-    DUP _BSK-RS * _BSK-NF-R +  SWAP CELLS _BSK-NF-RL + @ ;
-
-\ Notification handle
-: _BSK-NF-H!  ( addr len i -- )
-    _BSK-CI !
-    _BSK-HS MIN DUP _BSK-CI @ CELLS _BSK-NF-HL + !
-    _BSK-CI @ _BSK-HS * _BSK-NF-H + SWAP CMOVE ;
-: _BSK-NF-HANDLE  ( i -- addr len )
-    DUP _BSK-HS * _BSK-NF-H +  SWAP CELLS _BSK-NF-HL + @ ;
-
-\ Status message
-: _BSK-SET-STATUS  ( addr len -- )
-    64 MIN DUP _BSK-STATUS-LEN !
-    _BSK-STATUS SWAP CMOVE ;
-: _BSK-CLR-STATUS  ( -- )  0 _BSK-STATUS-LEN ! ;
-
-\ _BSK-HTTP-ERR-STATUS ( -- )  Set status to "HTTP <code>".
-: _BSK-HTTP-ERR-STATUS  ( -- )
-    BSK-RESET
-    S" HTTP " BSK-APPEND
-    BSK-HTTP-STATUS @ NUM>APPEND
-    BSK-BUF BSK-LEN @ _BSK-SET-STATUS ;
-
-\ ── §6.3  Fetch & Populate ────────────────────────────────────────
-\
-\  Fetch data from the API, parse JSON, fill cache arrays.
-
-\ _BSK-TL-CACHE-ITEM ( item-addr item-len idx -- )
-\   Parse one feed item JSON and cache handle, text, URI, CID.
-VARIABLE _BSK-FI
-
-: _BSK-TL-CACHE-ITEM  ( addr len idx -- )
-    _BSK-FI !
-    \ Navigate to "post" object within feed item
-    2DUP S" post" JSON-FIND-KEY
-    DUP 0= IF 2DROP 2DROP EXIT THEN
-    \ Cache post.uri
-    2DUP S" uri" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-TL-U!
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache post.cid
-    2DUP S" cid" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-TL-C!
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache author.handle — navigate post → author → handle
-    2DUP S" author" JSON-FIND-KEY
-    DUP 0> IF
-        S" handle" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-TL-H!
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache record.text — navigate post → record → text
-    2DUP S" record" JSON-FIND-KEY
-    DUP 0> IF
-        S" text" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-TL-T!
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    2DROP       \ drop post scope
-    2DROP ;     \ drop item scope
-
-\ _BSK-TL-FETCH ( -- )   Fetch timeline and populate cache.
-: _BSK-TL-FETCH  ( -- )
-    BSK-ACCESS-LEN @ 0= IF
-        S" Not logged in" _BSK-SET-STATUS EXIT
-    THEN
-    _BSK-TL-PATH BSK-GET
-    DUP 0= IF 2DROP
-        S" Fetch failed" _BSK-SET-STATUS EXIT
-    THEN
-    BSK-HTTP-STATUS @ 200 <> IF 2DROP
-        _BSK-HTTP-ERR-STATUS EXIT
-    THEN
-    \ Save cursor for pagination
-    2DUP S" cursor" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 128 <= IF
-            DUP BSK-TL-CURSOR-LEN !
-            BSK-TL-CURSOR SWAP CMOVE
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Reset cache
-    0 _BSK-TL-N !
-    \ Navigate to feed array
-    2DUP S" feed" JSON-FIND-KEY
-    DUP 0= IF 2DROP 2DROP
-        S" No feed data" _BSK-SET-STATUS EXIT
-    THEN
-    JSON-SKIP-WS
-    OVER C@ 91 <> IF 2DROP 2DROP EXIT THEN
-    1 /STRING JSON-SKIP-WS
-    \ Iterate items, cache up to _BSK-TL-MAX
-    BEGIN
-        DUP 0> IF OVER C@ 93 <> ELSE 0 THEN
-        _BSK-TL-N @ _BSK-TL-MAX < AND
-    WHILE
-        2DUP _BSK-TL-N @ _BSK-TL-CACHE-ITEM
-        1 _BSK-TL-N +!
-        JSON-SKIP-VALUE
-        JSON-SKIP-WS
-        DUP 0> IF
-            OVER C@ 44 = IF 1 /STRING JSON-SKIP-WS THEN
-        THEN
-    REPEAT
-    2DROP 2DROP
-    S" Timeline loaded" _BSK-SET-STATUS ;
-
-\ _BSK-NF-CACHE-ITEM ( item-addr item-len idx -- )
-\   Parse one notification and cache reason + handle.
-: _BSK-NF-CACHE-ITEM  ( addr len idx -- )
-    _BSK-FI !
-    \ Cache reason
-    2DUP S" reason" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-NF-R!
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache author.handle — navigate author → handle
-    S" author" JSON-FIND-KEY
-    DUP 0> IF
-        S" handle" JSON-FIND-KEY
-        DUP 0> IF
-            JSON-GET-STRING DUP 0> IF _BSK-FI @ _BSK-NF-H!
-            ELSE 2DROP THEN
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN ;
-
-\ _BSK-NF-FETCH ( -- )   Fetch notifications and populate cache.
-: _BSK-NF-FETCH  ( -- )
-    BSK-ACCESS-LEN @ 0= IF
-        S" Not logged in" _BSK-SET-STATUS EXIT
-    THEN
-    BSK-RESET
-    S" /xrpc/app.bsky.notification.listNotifications?limit=10" BSK-APPEND
-    _BSK-SAVE-PATH BSK-GET
-    DUP 0= IF 2DROP
-        S" Fetch failed" _BSK-SET-STATUS EXIT
-    THEN
-    BSK-HTTP-STATUS @ 200 <> IF 2DROP
-        _BSK-HTTP-ERR-STATUS EXIT
-    THEN
-    0 _BSK-NF-N !
-    2DUP S" notifications" JSON-FIND-KEY
-    DUP 0= IF 2DROP 2DROP
-        S" No notifications" _BSK-SET-STATUS EXIT
-    THEN
-    JSON-SKIP-WS
-    OVER C@ 91 <> IF 2DROP 2DROP EXIT THEN
-    1 /STRING JSON-SKIP-WS
-    BEGIN
-        DUP 0> IF OVER C@ 93 <> ELSE 0 THEN
-        _BSK-NF-N @ _BSK-NF-MAX < AND
-    WHILE
-        2DUP _BSK-NF-N @ _BSK-NF-CACHE-ITEM
-        1 _BSK-NF-N +!
-        JSON-SKIP-VALUE
-        JSON-SKIP-WS
-        DUP 0> IF
-            OVER C@ 44 = IF 1 /STRING JSON-SKIP-WS THEN
-        THEN
-    REPEAT
-    2DROP 2DROP
-    S" Notifications loaded" _BSK-SET-STATUS ;
-
-\ _BSK-PR-FETCH ( -- )   Fetch own profile and populate cache.
-: _BSK-PR-FETCH  ( -- )
-    BSK-ACCESS-LEN @ 0= IF
-        S" Not logged in" _BSK-SET-STATUS EXIT
-    THEN
-    BSK-DID BSK-DID-LEN @ _BSK-PROFILE-PATH BSK-GET
-    DUP 0= IF 2DROP
-        S" Fetch failed" _BSK-SET-STATUS EXIT
-    THEN
-    BSK-HTTP-STATUS @ 200 <> IF 2DROP
-        _BSK-HTTP-ERR-STATUS EXIT
-    THEN
-    \ Cache displayName
-    2DUP S" displayName" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF
-            64 MIN DUP _BSK-PR-DNL !
-            _BSK-PR-DN SWAP CMOVE
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache handle
-    2DUP S" handle" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF
-            40 MIN DUP _BSK-PR-HL !
-            _BSK-PR-H SWAP CMOVE
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache description
-    2DUP S" description" JSON-FIND-KEY
-    DUP 0> IF
-        JSON-GET-STRING DUP 0> IF
-            200 MIN DUP _BSK-PR-DL !
-            _BSK-PR-D SWAP CMOVE
-        ELSE 2DROP THEN
-    ELSE 2DROP THEN
-    \ Cache numeric stats
-    2DUP S" followersCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER _BSK-PR-FC ! ELSE 2DROP THEN
-    2DUP S" followsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER _BSK-PR-FG ! ELSE 2DROP THEN
-    2DUP S" postsCount" JSON-FIND-KEY
-    DUP 0> IF JSON-GET-NUMBER _BSK-PR-PC ! ELSE 2DROP THEN
-    2DROP
-    -1 _BSK-PR-OK !
-    S" Profile loaded" _BSK-SET-STATUS ;
-
-\ ── §6.4  Row Renderers ───────────────────────────────────────────
-\
-\  Called by W.LIST for each item.  Signature: ( i -- )
-
-\ .BSK-TL-ROW ( i -- )   Print one timeline post row.
-: .BSK-TL-ROW  ( i -- )
-    DUP _BSK-TL-HANDLE
-    DUP 0> IF
-        ." @" 20 _BSK-TYPE-TRUNC
-    ELSE 2DROP THEN
-    ."  "
-    _BSK-TL-TEXT
-    DUP 0> IF
-        50 _BSK-TYPE-TRUNC
-    ELSE 2DROP THEN ;
-
-\ .BSK-NF-ROW ( i -- )   Print one notification row.
-: .BSK-NF-ROW  ( i -- )
-    DUP _BSK-NF-REASON
-    DUP 0> IF
-        18 _BSK-TYPE-TRUNC
-    ELSE 2DROP THEN
-    ."  @"
-    _BSK-NF-HANDLE
-    DUP 0> IF
-        40 _BSK-TYPE-TRUNC
-    ELSE 2DROP THEN ;
-
-\ .BSK-TL-DETAIL ( -- )   Show detail for selected timeline post.
-: .BSK-TL-DETAIL  ( -- )
-    SCR-SEL @
-    DUP _BSK-TL-HANDLE
-    DUP 0> IF
-        BOLD ."   @" TYPE RESET-COLOR CR
-    ELSE 2DROP THEN
-    DUP _BSK-TL-TEXT
-    DUP 0> IF
-        CR ."   " TYPE CR
-    ELSE 2DROP THEN
-    CR
-    _BSK-TL-URI
-    DUP 0> IF
-        DIM ."   " 78 _BSK-TYPE-TRUNC RESET-COLOR CR
-    ELSE 2DROP THEN ;
-
-\ ── §6.5  Screen Renderers ────────────────────────────────────────
-\
-\  Each subscreen is a word that calls W.xxx widgets.
-
-\ Profile value printers (for W.KV-XT)
-: .BSK-PR-DN  ( -- )  _BSK-PR-DN _BSK-PR-DNL @ TYPE ;
-: .BSK-PR-HA  ( -- )  ." @" _BSK-PR-H _BSK-PR-HL @ TYPE ;
-
-\ Show whose feed this is in the title
-: .BSK-TL-TITLE  ( -- )
-    _BSK-TL-N @ 0> IF
-        ." @" BSK-HANDLE BSK-HANDLE-LEN @ TYPE ."  "
-    THEN ;
-
-\ Common hint bar for timeline subscreen
-: .BSK-TL-HINTS  ( -- )
-    _BSK-TL-N @ 0> IF
-        S" [l]Like [t]Repost [y]Reply [d]Delete [c]Compose [f]Refresh  [Enter]Open" W.HINT
-    THEN ;
-
-\ SCR-BSKY-TL ( -- )   Timeline subscreen
-: SCR-BSKY-TL  ( -- )
-    _BSK-TL-N @ 0= IF
-        S" Timeline" W.TITLE
-        S" Press [f] to fetch your timeline" W.HINT
-    ELSE
-        _BSK-TL-N @ S" Timeline" W.TITLE-N
-        W.GAP
-        ['] .BSK-TL-TITLE W.CUSTOM
-        _BSK-TL-N @ ['] .BSK-TL-ROW W.LIST
-        _BSK-TL-N @ ['] .BSK-TL-DETAIL W.DETAIL
-        W.GAP
-        .BSK-TL-HINTS
-    THEN
-    _BSK-STATUS-LEN @ 0> IF
-        W.GAP
-        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
-    THEN ;
-
-\ SCR-BSKY-NF ( -- )   Notifications subscreen
-: SCR-BSKY-NF  ( -- )
-    _BSK-NF-N @ 0= IF
-        S" Notifications" W.TITLE
-        S" Press [f] to fetch notifications" W.HINT
-    ELSE
-        _BSK-NF-N @ S" Notifications" W.TITLE-N
-        _BSK-NF-N @ ['] .BSK-NF-ROW W.LIST
-        W.GAP
-        S" [f]Refresh  [n/p]Navigate" W.HINT
-    THEN
-    _BSK-STATUS-LEN @ 0> IF
-        W.GAP
-        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
-    THEN ;
-
-\ SCR-BSKY-PR ( -- )   Profile subscreen
-: SCR-BSKY-PR  ( -- )
-    _BSK-PR-OK @ 0= IF
-        S" Profile" W.TITLE
-        S" Press [f] to fetch your profile" W.HINT
-    ELSE
-        S" Profile" W.TITLE
-        ['] .BSK-PR-DN S" Name" W.KV-XT
-        ['] .BSK-PR-HA S" Handle" W.KV-XT
-        _BSK-PR-FC @ S" Followers" W.KV
-        _BSK-PR-FG @ S" Following" W.KV
-        _BSK-PR-PC @ S" Posts" W.KV
-        W.GAP
-        _BSK-PR-DL @ 0> IF
-            S" Bio" W.SECTION
-            _BSK-PR-D _BSK-PR-DL @ W.LINE
-        THEN
-        W.GAP
-        S" [f]Refresh" W.HINT
-    THEN
-    _BSK-STATUS-LEN @ 0> IF
-        W.GAP
-        _BSK-STATUS _BSK-STATUS-LEN @ W.HINT
-    THEN ;
-
-\ SCR-BSKY-HELP ( -- )   Help / controls subscreen
-: SCR-BSKY-HELP  ( -- )
-    S" Bluesky Controls" W.TITLE
-    W.GAP
-    S" Navigation" W.SECTION
-    S" [n/p] Select next / previous post" W.LINE
-    S" [[/]] Switch subscreen ([ = prev, ] = next)" W.LINE
-    S" Enter  Open selected post full-screen" W.LINE
-    S" [0-9] Switch to another KDOS screen" W.LINE
-    W.GAP
-    S" Timeline Actions" W.SECTION
-    S" [f]   Fetch / refresh current view" W.LINE
-    S" [l]   Like selected post" W.LINE
-    S" [t]   Repost selected post" W.LINE
-    S" [y]   Reply to selected post (Esc to cancel)" W.LINE
-    S" [d]   Delete selected post (yours only)" W.LINE
-    W.GAP
-    S" Compose" W.SECTION
-    S" [c]   Write a new post (Enter to send, Esc to cancel)" W.LINE
-    W.GAP
-    S" System" W.SECTION
-    S" [q]   Quit SCREENS, return to Forth prompt" W.LINE
-    S" [r]   Force screen redraw" W.LINE
-    S" [A]   Toggle auto-refresh" W.LINE ;
-
-\ SCR-BSKY ( -- )   Main screen (fallback if no subscreens)
-: SCR-BSKY  ( -- )
-    SCR-BSKY-TL ;
-
-\ ── §6.6  Key Handler & Actions ──────────────────────────────────
-\
-\  BSKY-KEYS ( c -- consumed )
-\  Per-screen key handler.  Priority dispatch via CALL-SCREEN-KEY.
-
-\ _BSK-SWITCH-SUB ( delta -- )
-\   Move to adjacent subscreen (wrapping), reset selection state.
-: _BSK-SWITCH-SUB  ( delta -- )
-    SUBSCREEN-ID @ + DUP 0 < IF DROP SCREEN-SUBS 1- THEN
-    DUP SCREEN-SUBS >= IF DROP 0 THEN
-    SUBSCREEN-ID !
-    0 SCR-SEL !  0 SCR-MAX !
-    RENDER-SCREEN ;
-
-\ _BSK-ACT-LIKE ( -- )   Like the selected post
-: _BSK-ACT-LIKE  ( -- )
-    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
-        DUP _BSK-TL-URI ROT _BSK-TL-CID
-        BSK-LIKE
-        S" Liked!" _BSK-SET-STATUS
-    ELSE DROP THEN ;
-
-\ _BSK-ACT-REPOST ( -- )   Repost the selected post
-: _BSK-ACT-REPOST  ( -- )
-    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
-        DUP _BSK-TL-URI ROT _BSK-TL-CID
-        BSK-REPOST
-        S" Reposted!" _BSK-SET-STATUS
-    ELSE DROP THEN ;
-
-\ _BSK-ACT-DELETE ( -- )   Delete the selected post
-: _BSK-ACT-DELETE  ( -- )
-    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
-        _BSK-TL-URI BSK-DELETE
-        S" Deleted!" _BSK-SET-STATUS
-    ELSE DROP THEN ;
-
-\ _BSK-ACT-REPLY ( -- )   Reply to the selected post
-: _BSK-ACT-REPLY  ( -- )
-    SCR-SEL @ DUP -1 <> OVER _BSK-TL-N @ < AND IF
-        DUP _BSK-TL-URI ROT _BSK-TL-CID
-        _BSK-COMP-BUF 280 S" Reply> " W.INPUT
-        DUP 0> IF
-            _BSK-COMP-BUF SWAP BSK-REPLY
-            S" Replied!" _BSK-SET-STATUS
-        ELSE DROP 2DROP 2DROP THEN
-    ELSE DROP THEN ;
-
-\ _BSK-ACT-COMPOSE ( -- )   Compose a new post
-: _BSK-ACT-COMPOSE  ( -- )
-    _BSK-COMP-BUF 280 S" Post> " W.INPUT
-    DUP 0> IF
-        _BSK-COMP-BUF SWAP BSK-POST
-        S" Posted!" _BSK-SET-STATUS
-    ELSE DROP THEN ;
-
-\ _BSK-TYPE-DECODED ( addr len -- )
-\   TYPE a raw JSON string, decoding backslash escapes:
-\   \n -> newline+indent   \t -> space   \\ -> \   \" -> "
-: _BSK-TYPE-DECODED  ( addr len -- )
-    BEGIN DUP 0> WHILE
-        OVER C@ 92 = IF              \ backslash
-            1 /STRING DUP 0> IF
-                OVER C@
-                DUP 110 = IF DROP CR ."   " ELSE  \ \n -> newline
-                DUP 116 = IF DROP SPACE       ELSE  \ \t -> space
-                DUP  92 = IF DROP 92 EMIT     ELSE  \ \\
-                DUP  34 = IF DROP 34 EMIT     ELSE  \ \"
-                              EMIT                   \ other: pass through
-                THEN THEN THEN THEN
-                1 /STRING
-            THEN
-        ELSE
-            OVER C@ EMIT
-            1 /STRING
-        THEN
-    REPEAT 2DROP ;
-
-\ _BSK-VIEW-POST ( -- )   Show full text of selected post, full-screen.
-: _BSK-VIEW-POST  ( -- )
-    SUBSCREEN-ID @ 0 <> IF EXIT THEN      \ only on Timeline subscreen
-    SCR-SEL @ DUP -1 = IF DROP EXIT THEN
-    DUP _BSK-TL-N @ >= IF DROP EXIT THEN
-    PAGE
-    CR
-    DUP _BSK-TL-HANDLE DUP 0> IF BOLD ."   @" TYPE RESET-COLOR ELSE 2DROP THEN
-    CR CR
-    ."   "
-    _BSK-TL-TEXT DUP 0> IF
-        _BSK-TYPE-DECODED CR
-    ELSE 2DROP THEN
-    CR
-    SCR-SEL @ _BSK-TL-URI DUP 0> IF
-        DIM ."   " TYPE RESET-COLOR CR
-    ELSE 2DROP THEN
-    CR HBAR CR
-    DIM ."   [y] Reply    any other key returns" RESET-COLOR CR
-    KEY DUP 121 = IF DROP _BSK-ACT-REPLY ELSE DROP THEN
-    RENDER-SCREEN ;
-
-\ BSKY-KEYS ( c -- consumed )
-\   Key handler for the Bluesky screen.
-: BSKY-KEYS  ( c -- consumed )
-    \ '['  = previous subscreen (with state reset)
-    DUP 91 = IF DROP -1 _BSK-SWITCH-SUB -1 EXIT THEN
-    \ ']'  = next subscreen (with state reset)
-    DUP 93 = IF DROP  1 _BSK-SWITCH-SUB -1 EXIT THEN
-    \ 'f' = fetch/refresh (subscreen-dependent)
-    DUP 102 = IF DROP
-        _BSK-CLR-STATUS
-        SUBSCREEN-ID @ 0 = IF
-            0 BSK-TL-CURSOR-LEN !      \ reset cursor for fresh fetch
-            _BSK-TL-FETCH
-        THEN
-        SUBSCREEN-ID @ 1 = IF _BSK-NF-FETCH THEN
-        SUBSCREEN-ID @ 2 = IF _BSK-PR-FETCH THEN
-        RENDER-SCREEN -1 EXIT
-    THEN
-    \ 'c' = compose (any subscreen)
-    DUP 99 = IF DROP
-        _BSK-ACT-COMPOSE
-        RENDER-SCREEN -1 EXIT
-    THEN
-    \ Post actions (timeline subscreen only)
-    SUBSCREEN-ID @ 0 <> IF DROP 0 EXIT THEN
-    \ 'l' = like
-    DUP 108 = IF DROP
-        _BSK-ACT-LIKE RENDER-SCREEN -1 EXIT
-    THEN
-    \ 't' = repost
-    DUP 116 = IF DROP
-        _BSK-ACT-REPOST RENDER-SCREEN -1 EXIT
-    THEN
-    \ 'd' = delete
-    DUP 100 = IF DROP
-        _BSK-ACT-DELETE RENDER-SCREEN -1 EXIT
-    THEN
-    \ 'y' = reply
-    DUP 121 = IF DROP
-        _BSK-ACT-REPLY RENDER-SCREEN -1 EXIT
-    THEN
-    DROP 0 ;       \ not consumed
-
-\ ── §6.7  Screen Registration ─────────────────────────────────────
-\
-\  Register Bluesky as screen [9] with three subscreens.
-
-: LBL-BSKY     ." Bsky" ;
-: LBL-BSKY-TL  ." Timeline" ;
-: LBL-BSKY-NF  ." Notifs" ;
-: LBL-BSKY-PR  ." Profile" ;
-: LBL-BSKY-HLP ." Help" ;
-
-VARIABLE _BSK-SCR-ID
-
-' SCR-BSKY ' LBL-BSKY 1 REGISTER-SCREEN _BSK-SCR-ID !
-
-' BSKY-KEYS      _BSK-SCR-ID @ SET-SCREEN-KEYS
-' _BSK-VIEW-POST _BSK-SCR-ID @ SET-SCREEN-ACT
-
-' SCR-BSKY-TL   ' LBL-BSKY-TL  _BSK-SCR-ID @ ADD-SUBSCREEN
-' SCR-BSKY-NF   ' LBL-BSKY-NF  _BSK-SCR-ID @ ADD-SUBSCREEN
-' SCR-BSKY-PR   ' LBL-BSKY-PR  _BSK-SCR-ID @ ADD-SUBSCREEN
-' SCR-BSKY-HELP ' LBL-BSKY-HLP _BSK-SCR-ID @ ADD-SUBSCREEN
-
-\ =====================================================================
-\  §6 — End of Interactive TUI
+\  §4 — End of Read-Only Features
 \ =====================================================================
@@ -0,0 +1,752 @@
+#!/usr/bin/env python3
+"""Offline stand-in for the Bluesky XRPC endpoints bsky.f talks to.
+
+FakePDS answers createSession, refreshSession, getTimeline,
+listNotifications, getProfile, createRecord, deleteRecord and
+applyWrites from canned, generated data.  TcpHost puts it on the
+emulator's NIC: it answers ARP for every address but the guest's own,
+runs just enough TCP (handshake, in-order data, windowing, FIN) to
+serve HTTP/1.1 keep-alive, and counts what crosses the wire.
+
+No TAP device or sockets are involved; frames go straight between the
+NIC and this module inside the harness process.  Point the client at
+it with plain TCP, e.g.
+
+    0 BSK-TLS? !  8443 BSK-PORT !  S" 10.64.0.1" BSK-SET-HOST
+
+Recorder wraps FakePDS or Upstream (a live PDS, reached over HTTPS
+from the host) and saves every exchange; Replay serves such a file
+back byte for byte, either at once or as slowly as it was recorded.
+
+Usage from test_bsky.py:  check(..., net={...FakePDS options...})
+                          test_bsky.py --record FILE / --replay FILE
+"""
+
+import base64
+import json
+import struct
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import parse_qs, urlsplit
+
+SERVER_IP = "10.64.0.1"
+SERVER_MAC = bytes.fromhex("020000000001")
+
+ETH_ARP = 0x0806
+ETH_IP = 0x0800
+IP_TCP = 6
+
+FIN, SYN, RST, PSH, ACK = 0x01, 0x02, 0x04, 0x08, 0x10
+
+
+class NetUnavailable(RuntimeError):
+    """The emulator build has no NIC the stand-in can attach to."""
+
+
+# ---------------------------------------------------------------------------
+#  XRPC application
+# ---------------------------------------------------------------------------
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def make_jwt(sub, scope, iat, exp):
+    """An unsigned-looking HS256 JWT carrying sub / scope / iat / exp."""
+    head = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+    body = _b64url(json.dumps({"scope": scope, "sub": sub, "iat": iat,
+                               "exp": exp}, separators=(",", ":")).encode())
+    return f"{head}.{body}.{_b64url(f'sig:{sub}:{scope}:{iat}'.encode())}"
+
+
+class FakePDS:
+    """XRPC handlers over an in-memory repo.
+
+    posts           posts in the home timeline
+    text_len        length of each generated post text
+    notifications   notifications available
+    access_ttl      seconds an access token stays valid
+    chunked         send bodies with Transfer-Encoding: chunked
+    chunk_size      bytes per chunk when chunked
+    clock           callable returning the current epoch seconds
+    """
+
+    HANDLE = "alice.test"
+    DID = "did:plc:alicetest0000000000000"
+    PASSWORD = "hunter2"
+
+    def __init__(self, posts=50, text_len=80, notifications=20,
+                 access_ttl=7200, chunked=False, chunk_size=1024,
+                 clock=time.time):
+        self.text_len = text_len
+        self.access_ttl = access_ttl
+        self.chunked = chunked
+        self.chunk_size = chunk_size
+        self.clock = clock
+        self.records = {}          # uri -> (collection, record)
+        self.feed = [self._post_view(i) for i in range(posts)]
+        self.notifs = [self._notif(i) for i in range(notifications)]
+        self._rev = 0
+        self._issue_tokens()
+
+    # -- data ---------------------------------------------------------------
+
+    def _text(self, i):
+        text = f"Post {i} from the stand-in. "
+        return (text * (self.text_len // len(text) + 1))[:self.text_len]
+
+    def _post_view(self, i, did=None, handle=None, text=None, rkey=None):
+        did = did or f"did:plc:author{i % 9:022d}"
+        rkey = rkey or f"3kfake{i:07d}"
+        return {"post": {
+            "uri": f"at://{did}/app.bsky.feed.post/{rkey}",
+            "cid": f"bafyreifake{rkey}",
+            "author": {"did": did,
+                       "handle": handle or f"author{i % 9}.test",
+                       "displayName": f"Author {i % 9}"},
+            "record": {"$type": "app.bsky.feed.post",
+                       "text": text if text is not None else self._text(i),
+                       "createdAt": "2026-01-01T00:00:00.000Z"},
+            "replyCount": 0, "repostCount": i % 4, "likeCount": i % 11,
+            "indexedAt": "2026-01-01T00:00:00.000Z"}}
+
+    def _notif(self, i):
+        did = f"did:plc:fan{i:025d}"
+        return {"uri": f"at://{did}/app.bsky.feed.like/3knotif{i:06d}",
+                "cid": f"bafyreinotif{i:06d}",
+                "author": {"did": did, "handle": f"fan{i}.test",
+                           "displayName": f"Fan {i}"},
+                "reason": ("like", "repost", "follow", "reply")[i % 4],
+                "isRead": False, "indexedAt": "2026-01-01T00:00:00.000Z"}
+
+    def _issue_tokens(self):
+        now = int(self.clock())
+        self.access = make_jwt(self.DID, "com.atproto.access", now,
+                               now + self.access_ttl)
+        self.refresh = make_jwt(self.DID, "com.atproto.refresh", now,
+                                now + 90 * 86400)
+        self.access_exp = now + self.access_ttl
+
+    def expire_access(self):
+        """Make the current access token stale (server-side)."""
+        self.access_exp = 0
+
+    def _session(self):
+        return {"accessJwt": self.access, "refreshJwt": self.refresh,
+                "did": self.DID, "handle": self.HANDLE, "active": True}
+
+    # -- dispatch -----------------------------------------------------------
+
+    def handle(self, method, target, headers, body):
+        """Serve one request: returns (status, JSON-able body)."""
+        url = urlsplit(target)
+        nsid = url.path.rsplit("/", 1)[-1]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            args = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "InvalidRequest",
+                         "message": "body is not JSON"}
+        bearer = headers.get("authorization", "")
+        bearer = bearer[7:] if bearer.lower().startswith("bearer ") else ""
+
+        if nsid == "com.atproto.server.createSession":
+            if (args.get("identifier") not in (self.HANDLE, self.DID)
+                    or args.get("password") != self.PASSWORD):
+                return 401, {"error": "AuthenticationRequired",
+                             "message": "Invalid identifier or password"}
+            self._issue_tokens()
+            return 200, self._session()
+        if nsid == "com.atproto.server.refreshSession":
+            if "content-length" not in headers:
+                return 411, {"error": "LengthRequired",
+                             "message": "POST without Content-Length"}
+            if bearer != self.refresh:
+                return 400, {"error": "ExpiredToken",
+                             "message": "Token has expired"}
+            self._issue_tokens()
+            return 200, self._session()
+
+        if bearer != self.access:
+            return 401, {"error": "InvalidToken", "message": "Bad token"}
+        if self.clock() >= self.access_exp:
+            return 400, {"error": "ExpiredToken",
+                         "message": "Token has expired"}
+
+        handler = getattr(self, "_x_" + nsid.replace(".", "_"), None)
+        if handler is None:
+            return 501, {"error": "MethodNotImplemented",
+                         "message": f"{nsid} is not served here"}
+        return handler(query, args)
+
+    def _x_app_bsky_feed_getTimeline(self, query, args):
+        limit = max(1, min(100, int(query.get("limit", 50))))
+        start = int(query.get("cursor") or 0)
+        page = self.feed[start:start + limit]
+        out = {"feed": page}
+        if start + limit < len(self.feed):
+            out["cursor"] = str(start + limit)
+        return 200, out
+
+    def _x_app_bsky_notification_listNotifications(self, query, args):
+        limit = max(1, min(100, int(query.get("limit", 50))))
+        return 200, {"notifications": self.notifs[:limit],
+                     "cursor": "2026-01-01T00:00:00.000Z"}
+
+    def _x_app_bsky_actor_getProfile(self, query, args):
+        actor = query.get("actor", "")
+        if actor not in (self.HANDLE, self.DID):
+            return 400, {"error": "InvalidRequest",
+                         "message": "Profile not found"}
+        return 200, {"did": self.DID, "handle": self.HANDLE,
+                     "displayName": "Alice Stand-in",
+                     "description": "Offline test account.",
+                     "followersCount": 42, "followsCount": 7,
+                     "postsCount": sum(1 for c, _ in self.records.values()
+                                       if c == "app.bsky.feed.post")}
+
+    def _create(self, collection, record):
+        self._rev += 1
+        rkey = f"3kself{self._rev:07d}"
+        uri = f"at://{self.DID}/{collection}/{rkey}"
+        self.records[uri] = (collection, record)
+        if collection == "app.bsky.feed.post":
+            self.feed.insert(0, self._post_view(
+                0, self.DID, self.HANDLE, record.get("text", ""), rkey))
+        return {"uri": uri, "cid": f"bafyreiself{rkey}"}
+
+    def _delete(self, collection, rkey):
+        uri = f"at://{self.DID}/{collection}/{rkey}"
+        self.records.pop(uri, None)
+        self.feed = [p for p in self.feed if p["post"]["uri"] != uri]
+
+    def _x_com_atproto_repo_createRecord(self, query, args):
+        if args.get("repo") != self.DID or "record" not in args:
+            return 400, {"error": "InvalidRequest", "message": "bad repo"}
+        return 200, self._create(args.get("collection", ""), args["record"])
+
+    def _x_com_atproto_repo_deleteRecord(self, query, args):
+        if args.get("repo") != self.DID:
+            return 400, {"error": "InvalidRequest", "message": "bad repo"}
+        self._delete(args.get("collection", ""), args.get("rkey", ""))
+        return 200, {}
+
+    def _x_com_atproto_repo_applyWrites(self, query, args):
+        if args.get("repo") != self.DID:
+            return 400, {"error": "InvalidRequest", "message": "bad repo"}
+        results = []
+        for w in args.get("writes", []):
+            kind = w.get("$type", "").rsplit("#", 1)[-1]
+            if kind == "create":
+                out = self._create(w.get("collection", ""),
+                                   w.get("value", {}))
+                out["$type"] = "com.atproto.repo.applyWrites#createResult"
+            else:
+                self._delete(w.get("collection", ""), w.get("rkey", ""))
+                out = {"$type": "com.atproto.repo.applyWrites#deleteResult"}
+            results.append(out)
+        return 200, {"results": results}
+
+
+# ---------------------------------------------------------------------------
+#  Record / replay
+# ---------------------------------------------------------------------------
+
+REPLAY_FORMAT = 1
+CYCLES_PER_SECOND = 100_000_000    # nominal clock for --replay-realtime
+
+
+def _encode(obj):
+    """Response body bytes for a handler result (bytes pass through)."""
+    if isinstance(obj, (bytes, bytearray)):
+        return bytes(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _nsid(target):
+    return urlsplit(target).path.rsplit("/", 1)[-1]
+
+
+class Upstream:
+    """A live PDS, reached from the host over HTTPS.  The guest talks
+    plain HTTP to TcpHost and this forwards each request unchanged."""
+
+    chunked = False
+
+    def __init__(self, base="https://bsky.social", timeout=30):
+        self.base = base.rstrip("/")
+        self.timeout = timeout
+
+    def handle(self, method, target, headers, body):
+        keep = {k: v for k, v in headers.items()
+                if k in ("authorization", "content-type", "accept")}
+        req = urllib.request.Request(self.base + target, data=body or None,
+                                     headers=keep, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+        except OSError as e:
+            raise NetUnavailable(f"{self.base}: {e}") from e
+
+
+def _unsign(jwt):
+    """*jwt* with its signature replaced: the claims a replay reads
+    (exp) are kept, but the token no longer authenticates."""
+    head, _, rest = jwt.partition(".")
+    body = rest.partition(".")[0]
+    return f"{head}.{body}.{_b64url(b'redacted')}" if body else ""
+
+
+def _redact(data, keys=("password", "refreshJwt"), tokens=("accessJwt",)):
+    """*data* with the secrets a recording must not keep blanked out,
+    and access tokens unsigned (left byte for byte alone when it has
+    none)."""
+    try:
+        obj = json.loads(data)
+    except ValueError:
+        return data
+    if not isinstance(obj, dict) \
+            or not any(k in obj for k in keys + tokens):
+        return data
+    return _encode({k: "" if k in keys
+                    else _unsign(v) if k in tokens and isinstance(v, str)
+                    else v for k, v in obj.items()})
+
+
+class Recorder:
+    """Wraps an app (FakePDS, Upstream) and keeps every exchange, with
+    how long the app took to answer, for save().  Passwords and
+    refresh tokens are blanked in what is kept, and access tokens lose
+    their signature."""
+
+    def __init__(self, app):
+        self.app = app
+        self.exchanges = []
+
+    chunked = property(lambda self: getattr(self.app, "chunked", False))
+    chunk_size = property(lambda self: getattr(self.app, "chunk_size", 1024))
+
+    def handle(self, method, target, headers, body):
+        t0 = time.perf_counter()
+        status, obj = self.app.handle(method, target, headers, body)
+        data = _encode(obj)
+        self.exchanges.append({
+            "method": method, "target": target,
+            "body": _redact(bytes(body)).decode("latin-1"),
+            "status": status, "response": _redact(data).decode("latin-1"),
+            "elapsed": round(time.perf_counter() - t0, 6)})
+        return status, data
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"format": REPLAY_FORMAT, "exchanges": self.exchanges},
+                      f, indent=1)
+            f.write("\n")
+
+
+class Replay:
+    """Serves a Recorder file back in order, byte for byte.
+
+    A request is matched to the next recorded exchange by method and
+    XRPC method name; anything else gets 502 ReplayDiverged and is
+    counted in *diverged*.  With *realtime* each response is held back
+    for as long as the recorded one took, in cycles at *hz*; otherwise
+    it is ready at once.
+    """
+
+    chunked = False
+
+    def __init__(self, path, realtime=False, hz=CYCLES_PER_SECOND):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("format") != REPLAY_FORMAT:
+            raise ValueError(f"{path}: not a replay file of format "
+                             f"{REPLAY_FORMAT}")
+        self.exchanges = data["exchanges"]
+        self.realtime = realtime
+        self.hz = hz
+        self.pos = 0
+        self.diverged = 0
+        self.delay = 0             # cycles to hold the last response
+
+    def session(self):
+        """The recorded createSession response (for installing the
+        login without a round trip)."""
+        for ex in self.exchanges:
+            if _nsid(ex["target"]) == "com.atproto.server.createSession" \
+                    and ex["status"] == 200:
+                return json.loads(ex["response"].encode("latin-1"))
+        raise ValueError("recording has no successful createSession")
+
+    def skip(self, nsid):
+        """Consume the next exchange if it is *nsid* (one the harness
+        made itself when recording, e.g. the login)."""
+        if self.pos < len(self.exchanges) \
+                and _nsid(self.exchanges[self.pos]["target"]) == nsid:
+            self.pos += 1
+
+    def handle(self, method, target, headers, body):
+        ex = self.exchanges[self.pos] if self.pos < len(self.exchanges) \
+            else None
+        if ex is None or ex["method"] != method \
+                or _nsid(ex["target"]) != _nsid(target):
+            self.diverged += 1
+            self.delay = 0
+            return 502, {"error": "ReplayDiverged",
+                         "message": f"unexpected {method} {_nsid(target)}"}
+        self.pos += 1
+        self.delay = round(ex["elapsed"] * self.hz) if self.realtime else 0
+        return ex["status"], ex["response"].encode("latin-1")
+
+
+# ---------------------------------------------------------------------------
+#  Wire: Ethernet / ARP / IPv4 / TCP / HTTP
+# ---------------------------------------------------------------------------
+
+def _csum(data):
+    if len(data) % 2:
+        data += b"\0"
+    s = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    while s >> 16:
+        s = (s & 0xFFFF) + (s >> 16)
+    return ~s & 0xFFFF
+
+
+def _ip(text):
+    return bytes(int(p) for p in text.split("."))
+
+
+class NetStats:
+    """What crossed the wire during one session."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.endpoints = {}        # nsid -> calls
+        self.bytes_up = 0          # TCP payload guest -> server
+        self.bytes_down = 0        # TCP payload server -> guest
+        self.segments_up = 0
+        self.segments_down = 0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def summary(self):
+        return (f"{self.requests} requests over {self.connections} "
+                f"connection{'s' if self.connections != 1 else ''}, "
+                f"{self.bytes_up:,} B up / {self.bytes_down:,} B down, "
+                f"{self.segments_up + self.segments_down} segments")
+
+
+class _Conn:
+    def __init__(self, key, iss, rcv_nxt, mss, window):
+        self.key = key             # (guest ip, guest port, our ip, our port)
+        self.snd_una = self.snd_nxt = iss
+        self.rcv_nxt = rcv_nxt
+        self.mss = mss
+        self.window = window
+        self.inbuf = b""
+        self.outbuf = b""
+        self.close_after = False   # FIN once outbuf drains
+        self.fin_sent = False
+        self.peer_fin = False
+        self.hold_until = 0        # no data out before this cycle
+        self.served = 0            # requests answered
+        self.last = 0              # cycle of the last answer
+
+
+class TcpHost:
+    """Every host on the guest's network but itself, serving *app* over
+    HTTP on any TCP port.
+
+    latency     cycles a frame spends in flight to the guest
+    drop_after  close a connection after this many requests, the way
+                a server times out an idle keep-alive session: the
+                response still says keep-alive (0 = never)
+    drop_idle   a request on a connection idle this many cycles is not
+                answered: the connection is closed instead, as when a
+                server times it out just as the request goes out
+                (0 = never)
+    refuse      answer every SYN with a reset: no connection opens
+
+    An app with a ``delay`` attribute (Replay) holds each response back
+    that many more cycles.
+    """
+
+    def __init__(self, app, latency=0, drop_after=0, drop_idle=0,
+                 refuse=False, ip=SERVER_IP, mac=SERVER_MAC):
+        self.app = app
+        self.refuse = refuse
+        self.latency = latency
+        self.drop_after = drop_after
+        self.drop_idle = drop_idle
+        self.ip = _ip(ip)
+        self.mac = mac
+        self.stats = NetStats()
+        self.conns = {}
+        self._out = []             # (due cycle, frame)
+        self._guest_mac = b"\xff" * 6
+        self._ip_id = 0
+        self._sys = None
+        self._restore = None
+
+    # -- NIC plumbing -------------------------------------------------------
+
+    def attach(self, sys_obj):
+        """Take the place of the NIC's TAP backend.
+
+        The NIC hands every transmitted frame to ``backend.send(frame)``
+        and polls ``backend.recv()`` (a frame or None) for received
+        ones, so the stand-in is swapped in as that backend and the old
+        one is put back by detach().
+        """
+        nic = getattr(sys_obj, "nic", None)
+        if nic is None or not hasattr(nic, "backend"):
+            raise NetUnavailable("this emulator build has no NIC backend")
+        self._sys = sys_obj
+        old = nic.backend
+        if old is not None and hasattr(old, "stop"):
+            old.stop()
+        nic.backend = _Backend(self)
+        self._restore = lambda: setattr(nic, "backend", old)
+        if hasattr(nic, "link_up"):
+            nic.link_up = True
+
+    def detach(self):
+        if self._restore is not None:
+            self._restore()
+            self._restore = None
+
+    def _now(self):
+        return self._sys.cpu.cycle_count if self._sys is not None else 0
+
+    def due(self):
+        """Frames whose latency has elapsed, oldest first.  A guest that
+        is idle is only waiting on us, so its clock skips ahead to the
+        next frame, as it would sleeping through the wait."""
+        if not self._out:
+            return []
+        now = self._now()
+        if self._sys is not None and self._sys.cpu.idle:
+            first = min(t for t, _ in self._out)
+            if first > now:
+                self._sys.cpu.cycle_count = now = first
+        ready = [f for t, f in self._out if t <= now]
+        self._out = [(t, f) for t, f in self._out if t > now]
+        return ready
+
+    def pending(self):
+        return bool(self._out)
+
+    def _send(self, frame, at=None):
+        at = self._now() if at is None else max(at, self._now())
+        self._out.append((at + self.latency, frame))
+
+    # -- frames -------------------------------------------------------------
+
+    def receive(self, frame):
+        """A frame transmitted by the guest."""
+        frame = bytes(frame)
+        if len(frame) < 14:
+            return
+        etype = struct.unpack("!H", frame[12:14])[0]
+        if etype == ETH_ARP:
+            self._arp(frame[14:])
+        elif etype == ETH_IP:
+            self._guest_mac = frame[6:12]
+            self._ipv4(frame[14:])
+
+    def _eth(self, etype, payload):
+        return self._guest_mac + self.mac + struct.pack("!H", etype) + payload
+
+    def _arp(self, pkt):
+        if len(pkt) < 28:
+            return
+        op = struct.unpack("!H", pkt[6:8])[0]
+        sha, spa, tpa = pkt[8:14], pkt[14:18], pkt[24:28]
+        if op != 1 or tpa == spa:
+            return
+        self._guest_mac = sha
+        reply = (struct.pack("!HHBBH", 1, ETH_IP, 6, 4, 2)
+                 + self.mac + tpa + sha + spa)
+        self._send(self._eth(ETH_ARP, reply))
+
+    def _ipv4(self, pkt):
+        if len(pkt) < 20 or pkt[0] >> 4 != 4:
+            return
+        ihl = (pkt[0] & 15) * 4
+        total = struct.unpack("!H", pkt[2:4])[0]
+        if pkt[9] != IP_TCP:
+            return
+        self._tcp(pkt[12:16], pkt[16:20], pkt[ihl:total])
+
+    def _segment(self, conn, flags, payload=b"", opts=b""):
+        gip, gport, sip, sport = conn.key
+        hdr_len = 20 + len(opts)
+        tcp = struct.pack("!HHIIBBHHH", sport, gport,
+                          conn.snd_nxt & 0xFFFFFFFF,
+                          conn.rcv_nxt & 0xFFFFFFFF,
+                          (hdr_len // 4) << 4, flags, 65535, 0, 0)
+        tcp += opts + payload
+        pseudo = sip + gip + struct.pack("!BBH", 0, IP_TCP, len(tcp))
+        tcp = tcp[:16] + struct.pack("!H", _csum(pseudo + tcp)) + tcp[18:]
+        self._ip_id = (self._ip_id + 1) & 0xFFFF
+        ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp),
+                         self._ip_id, 0x4000, 64, IP_TCP, 0, sip, gip)
+        ip = ip[:10] + struct.pack("!H", _csum(ip)) + ip[12:]
+        self.stats.segments_down += 1
+        self.stats.bytes_down += len(payload)
+        self._send(self._eth(ETH_IP, ip + tcp), conn.hold_until)
+
+    def _tcp(self, src, dst, seg):
+        if len(seg) < 20:
+            return
+        sport, dport, seq, ack, off, flags, win = \
+            struct.unpack("!HHIIBBH", seg[:16])
+        hlen = (off >> 4) * 4
+        payload = seg[hlen:]
+        key = (src, sport, dst, dport)
+        conn = self.conns.get(key)
+        self.stats.segments_up += 1
+
+        if flags & RST:
+            self.conns.pop(key, None)
+            return
+        if flags & SYN:
+            mss = 536
+            opts = seg[20:hlen]
+            i = 0
+            while i < len(opts) and opts[i] != 0:
+                if opts[i] == 1:
+                    i += 1
+                    continue
+                if opts[i] == 2 and i + 3 < len(opts):
+                    mss = struct.unpack("!H", opts[i + 2:i + 4])[0]
+                i += max(2, opts[i + 1] if i + 1 < len(opts) else 2)
+            if self.refuse:
+                self._segment(_Conn(key, 0, (seq + 1) & 0xFFFFFFFF, 536,
+                                    win), RST | ACK)
+                return
+            self.stats.connections += 1
+            conn = _Conn(key, self.stats.connections << 16,
+                         (seq + 1) & 0xFFFFFFFF, min(mss, 1460), win)
+            self.conns[key] = conn
+            self._segment(conn, SYN | ACK, opts=struct.pack("!BBH", 2, 4, 1460))
+            conn.snd_nxt += 1
+            return
+        if conn is None:
+            return
+
+        if flags & ACK:
+            conn.snd_una = ack
+            conn.window = win
+        if payload:
+            if seq == conn.rcv_nxt:
+                conn.rcv_nxt = (conn.rcv_nxt + len(payload)) & 0xFFFFFFFF
+                conn.inbuf += payload
+                self.stats.bytes_up += len(payload)
+                self._serve(conn)
+            self._segment(conn, ACK)      # (re-)acknowledge
+        if flags & FIN and not conn.peer_fin \
+                and (seq + len(payload)) & 0xFFFFFFFF == conn.rcv_nxt:
+            conn.rcv_nxt = (conn.rcv_nxt + 1) & 0xFFFFFFFF
+            conn.peer_fin = conn.close_after = True
+            if not conn.outbuf:
+                self._segment(conn, ACK)
+        if conn.peer_fin and conn.fin_sent and ack == conn.snd_nxt:
+            self.conns.pop(key, None)
+            return
+        self._flush(conn)
+
+    def _flush(self, conn):
+        """Send as much of outbuf as the guest's window allows."""
+        while conn.outbuf:
+            room = conn.window - ((conn.snd_nxt - conn.snd_una) & 0xFFFFFFFF)
+            n = min(conn.mss, room, len(conn.outbuf))
+            if n <= 0:
+                return
+            chunk, conn.outbuf = conn.outbuf[:n], conn.outbuf[n:]
+            self._segment(conn, PSH | ACK, chunk)
+            conn.snd_nxt = (conn.snd_nxt + n) & 0xFFFFFFFF
+        if conn.close_after and not conn.fin_sent:
+            self._segment(conn, FIN | ACK)
+            conn.snd_nxt = (conn.snd_nxt + 1) & 0xFFFFFFFF
+            conn.fin_sent = True
+
+    # -- HTTP ---------------------------------------------------------------
+
+    def _serve(self, conn):
+        while True:
+            end = conn.inbuf.find(b"\r\n\r\n")
+            if end < 0:
+                return
+            head = conn.inbuf[:end].decode("latin-1").split("\r\n")
+            headers = {}
+            for line in head[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            need = int(headers.get("content-length", 0) or 0)
+            if len(conn.inbuf) < end + 4 + need:
+                return
+            if self.drop_idle and conn.served \
+                    and self._now() - conn.last >= self.drop_idle:
+                conn.inbuf = b""
+                conn.close_after = True
+                return
+            body = conn.inbuf[end + 4:end + 4 + need]
+            conn.inbuf = conn.inbuf[end + 4 + need:]
+            method, target = (head[0].split(" ") + ["", ""])[:2]
+            self.stats.requests += 1
+            nsid = urlsplit(target).path.rsplit("/", 1)[-1]
+            self.stats.endpoints[nsid] = self.stats.endpoints.get(nsid, 0) + 1
+            status, obj = self.app.handle(method, target, headers, body)
+            conn.hold_until = self._now() + getattr(self.app, "delay", 0)
+            close = headers.get("connection", "").lower() == "close"
+            conn.outbuf += self._response(status, obj, close)
+            conn.served += 1
+            conn.last = self._now()
+            if close or conn.served == self.drop_after:
+                conn.close_after = True
+
+    def _response(self, status, obj, close):
+        body = _encode(obj)
+        reason = {200: "OK", 400: "Bad Request", 401: "Unauthorized",
+                  501: "Not Implemented", 502: "Bad Gateway"}.get(status, "Error")
+        head = [f"HTTP/1.1 {status} {reason}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Connection: {'close' if close else 'keep-alive'}"]
+        if getattr(self.app, "chunked", False):
+            head.append("Transfer-Encoding: chunked")
+            n = self.app.chunk_size
+            parts = [b"%x\r\n%s\r\n" % (len(body[i:i + n]), body[i:i + n])
+                     for i in range(0, len(body), n)]
+            body = b"".join(parts) + b"0\r\n\r\n"
+        else:
+            head.append(f"Content-Length: {len(body)}")
+        return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+class _Backend:
+    """NIC backend object: the NIC pushes guest frames with send() and
+    pulls frames for the guest with recv()."""
+
+    def __init__(self, host):
+        self.host = host
+        self._ready = []
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def send(self, frame):
+        self.host.receive(frame)
+
+    def recv(self):
+        if not self._ready:
+            self._ready = self.host.due()
+        return self._ready.pop(0) if self._ready else None
@@ -0,0 +1,185 @@
+\ freeze.f — Frozen dictionary images for KDOS
+\
+\ REQUIRE bsky-tui.f interprets the bsky modules and twelve akashic
+\ modules from source on every boot.  A frozen image is the memory that load
+\ changed, captured once by freeze.py on the host and written back
+\ here with a few bulk reads.
+\
+\ Usage (autoexec.f, once everything the image sits on is loaded):
+\     FRZ-LOAD bsky.img bsky-tui.f
+\ restores bsky.img when it matches the sources on this disk, and
+\ otherwise does REQUIRE bsky-tui.f exactly as before.
+\
+\ Depends on: KDOS v1.1 (MP64FS file words, SHA256, XMEM)
+\
+\ Prefix conventions:
+\   FRZ-    public API words
+\   _FRZ-   internal helpers
+\
+\ Load with:   REQUIRE freeze.f   (before ENTER-USERLAND, so the
+\              restore code is not in the region it restores)
+
+PROVIDED freeze.f
+
+\ ── Image layout ─────────────────────────────────────────────────
+\
+\  Cells are 8 bytes, little-endian.
+\
+\    +0   "BSKFRZ01"
+\    +8   source hash (32 bytes, see below)
+\    +40  number of sources       +48  staging address
+\    +56  number of RAM extents   +64  bytes of RAM extent records
+\    +72  number of XMEM extents
+\    +80  sources:       len, path padded to a cell
+\         RAM extents:   addr, len, bytes
+\         XMEM extents:  addr, len, bytes
+\
+\  The sources are every file the image was built from.  Their hash
+\  chains 4 KiB chunks of each in turn, h = SHA256(h || chunk) from
+\  h = 0, so one file's worth of buffer is never needed.  Extents
+\  are cell aligned, so lengths need no padding.
+\
+\  XMEM extents (the new userland dictionary and its buffers) are
+\  read straight into place.  RAM extents (dictionary pointers,
+\  variables, the REQUIRE list) are read to the staging address,
+\  free XMEM past the image, and copied in only after the image is
+\  closed, so the file layer is never rewritten under a read in
+\  progress.
+
+80   CONSTANT _FRZ-HDR-SIZE
+8    CONSTANT _FRZ-H-HASH
+40   CONSTANT _FRZ-H-NSRC
+48   CONSTANT _FRZ-H-STAGE
+56   CONSTANT _FRZ-H-NRAM
+64   CONSTANT _FRZ-H-RAMB
+72   CONSTANT _FRZ-H-NXMEM
+4096 CONSTANT _FRZ-CHUNK
+128  CONSTANT _FRZ-PATH-MAX
+
+CREATE _FRZ-HDR  _FRZ-HDR-SIZE ALLOT
+CREATE _FRZ-TMP  16 ALLOT
+CREATE _FRZ-H    32 ALLOT                 \ running source hash
+CREATE _FRZ-BUF  32 _FRZ-CHUNK + ALLOT    \ h || chunk
+CREATE _FRZ-PATH _FRZ-PATH-MAX ALLOT
+VARIABLE _FRZ-FD                          \ image file
+VARIABLE _FRZ-SFD                         \ source being hashed
+
+: _FRZ-HDR@  ( off -- n )  _FRZ-HDR + @ ;
+
+\ _FRZ-READ ( addr len -- ok? )  Read exactly len bytes of the image
+: _FRZ-READ  ( addr len -- ok? )
+    DUP >R _FRZ-FD @ FILE-READ R> = ;
+
+\ ── Source hash ──────────────────────────────────────────────────
+
+\ _FRZ-HASH-FILE ( path-a path-u -- ok? )  Chain one source into _FRZ-H
+: _FRZ-HASH-FILE  ( path-a path-u -- ok? )
+    FILE-OPEN DUP 0= IF EXIT THEN _FRZ-SFD !
+    BEGIN
+        _FRZ-H _FRZ-BUF 32 CMOVE
+        _FRZ-BUF 32 + _FRZ-CHUNK _FRZ-SFD @ FILE-READ
+        DUP 0>
+    WHILE
+        _FRZ-BUF SWAP 32 + _FRZ-H SHA256
+    REPEAT
+    DROP _FRZ-SFD @ FILE-CLOSE -1 ;
+
+\ _FRZ-SOURCES? ( -- flag )  Read the source list; true if it hashes
+\   to what the image was built from
+: _FRZ-SOURCES?  ( -- flag )
+    _FRZ-H 32 0 FILL
+    _FRZ-H-NSRC _FRZ-HDR@ DUP 0> IF
+        0 DO
+            _FRZ-TMP 8 _FRZ-READ 0= IF UNLOOP 0 EXIT THEN
+            _FRZ-TMP @ DUP _FRZ-PATH-MAX > IF DROP UNLOOP 0 EXIT THEN
+            _FRZ-PATH OVER 7 + -8 AND _FRZ-READ 0= IF
+                DROP UNLOOP 0 EXIT
+            THEN
+            _FRZ-PATH SWAP _FRZ-HASH-FILE 0= IF UNLOOP 0 EXIT THEN
+        LOOP
+    ELSE DROP THEN
+    _FRZ-H 32 _FRZ-HDR _FRZ-H-HASH + 32 COMPARE 0= ;
+
+\ ── Restore ──────────────────────────────────────────────────────
+
+\ _FRZ-READ-IMAGE ( -- ok? )  Check the image and read its extents:
+\   XMEM into place, RAM to the staging address
+: _FRZ-READ-IMAGE  ( -- ok? )
+    _FRZ-HDR _FRZ-HDR-SIZE _FRZ-READ 0= IF 0 EXIT THEN
+    _FRZ-HDR 8 S" BSKFRZ01" COMPARE IF 0 EXIT THEN
+    _FRZ-SOURCES? 0= IF 0 EXIT THEN
+    _FRZ-H-STAGE _FRZ-HDR@ _FRZ-H-RAMB _FRZ-HDR@ _FRZ-READ 0= IF
+        0 EXIT
+    THEN
+    _FRZ-H-NXMEM _FRZ-HDR@ DUP 0> IF
+        0 DO
+            _FRZ-TMP 16 _FRZ-READ 0= IF UNLOOP 0 EXIT THEN
+            _FRZ-TMP @ _FRZ-TMP 8 + @ _FRZ-READ 0= IF UNLOOP 0 EXIT THEN
+        LOOP
+    ELSE DROP THEN
+    -1 ;
+
+\ _FRZ-APPLY ( -- )  Copy the staged RAM extents into place
+: _FRZ-APPLY  ( -- )
+    _FRZ-H-STAGE _FRZ-HDR@                 ( p )
+    _FRZ-H-NRAM _FRZ-HDR@ DUP 0> IF
+        0 DO
+            DUP 16 +  OVER @  2 PICK 8 + @  ( p src dst len )
+            DUP >R CMOVE  R> + 16 +
+        LOOP
+    ELSE DROP THEN
+    DROP ;
+
+\ FRZ-RESTORE ( img-a img-u -- flag )
+\   Restore a frozen image.  False if the file is missing, foreign
+\   or stale, or there is no XMEM to put it in; RAM is then left
+\   as it was and the caller can load from source.
+: FRZ-RESTORE  ( img-a img-u -- flag )
+    XMEM? 0= IF 2DROP 0 EXIT THEN
+    FILE-OPEN DUP 0= IF EXIT THEN _FRZ-FD !
+    _FRZ-READ-IMAGE
+    _FRZ-FD @ FILE-CLOSE
+    DUP IF _FRZ-APPLY THEN ;
+
+\ ── Load ─────────────────────────────────────────────────────────
+\
+\  With a file named frz.build on the disk, FRZ-LOAD skips the
+\  restore, and around the REQUIRE prints "#FRZ# i" and waits for a
+\  key, so freeze.py can capture memory on both sides of the load.
+\  Both stops are the same call at the same depth, so the stacks and
+\  the input state match and only what the load itself changed
+\  differs.  The first stop also prints HERE and marks the bytes
+\  there for freeze.py to find XMEM by.
+
+CREATE _FRZ-IMG 64 ALLOT   VARIABLE _FRZ-IMG-LEN
+CREATE _FRZ-CMD 80 ALLOT   VARIABLE _FRZ-CMD-LEN    \ "REQUIRE <source>"
+VARIABLE _FRZ-BUILD?
+
+\ _FRZ-SYNC ( i -- )  Build mode: stop for the host
+: _FRZ-SYNC  ( i -- )
+    CR ." #FRZ# " DUP .
+    0= IF
+        HERE .
+        16 0 DO I 13 * 71 + 255 AND HERE I + C! LOOP
+    THEN
+    CR KEY DROP ;
+
+\ FRZ-LOAD ( "image" "source" -- )
+\   Restore image, or REQUIRE source if it cannot be.
+\   Usage:  FRZ-LOAD bsky.img bsky-tui.f
+: FRZ-LOAD  ( "image" "source" -- )
+    BL WORD COUNT 64 MIN DUP _FRZ-IMG-LEN !
+    _FRZ-IMG SWAP CMOVE
+    S" REQUIRE " DUP _FRZ-CMD-LEN ! _FRZ-CMD SWAP CMOVE
+    BL WORD COUNT 64 MIN                   ( addr len )
+    DUP >R _FRZ-CMD _FRZ-CMD-LEN @ + SWAP CMOVE R> _FRZ-CMD-LEN +!
+    S" frz.build" FILE-OPEN DUP IF FILE-CLOSE -1 THEN _FRZ-BUILD? !
+    _FRZ-BUILD? @ 0= IF
+        _FRZ-IMG _FRZ-IMG-LEN @ FRZ-RESTORE IF
+            ." [freeze] restored " _FRZ-IMG _FRZ-IMG-LEN @ TYPE CR EXIT
+        THEN
+    THEN
+    2 0 DO
+        _FRZ-BUILD? @ IF I _FRZ-SYNC THEN
+        I 0= IF _FRZ-CMD _FRZ-CMD-LEN @ EVALUATE THEN
+    LOOP ;
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Build frozen dictionary images for freeze.f.
+
+A frozen image is the memory REQUIRE bsky-tui.f changes, saved as a
+data file so FRZ-LOAD can write it back on the next boot instead of
+interpreting the bsky and akashic modules again.  See freeze.f for
+the file layout and the restore side.
+
+The image is captured from a real boot.  Put a file named frz.build
+on the disk (any contents) and FRZ-LOAD stops before and after the
+load; freeze() waits for each stop, snapshots RAM and XMEM, and packs
+the difference.  Both stops are the same call at the same depth, so
+the difference is what the load left behind plus scratch below the
+stack pointers, which is dropped.
+
+Usage from a disk builder (emulator objects as in test_bsky.py):
+
+    fs.inject_file("frz.build", b"", ftype=FTYPE_DATA)
+    sys_obj = make_system(disk_image=bytes(fs.img))
+    buf = capture_uart(sys_obj)
+    ...load BIOS, boot...
+    image = freeze.freeze(sys_obj, buf, [(path, data), ...])
+    # then build the shipped disk without frz.build, plus bsky.img
+
+The sources must be every file on the disk whose contents went into
+the image, with the disk paths FRZ-LOAD will open to hash them.
+"""
+
+import hashlib
+import re
+import struct
+
+MAGIC = b"BSKFRZ01"
+HEADER = 80
+CELL = 8
+CHUNK = 4096          # source hash chunk; matches _FRZ-CHUNK
+PATH_MAX = 128        # matches _FRZ-PATH-MAX
+GAP = 16              # differing runs closer than this are merged
+STACK_WINDOW = 16 * 1024
+DSP_REG = 14          # the BIOS Forth data-stack pointer
+PROBE = bytes((i * 13 + 71) & 255 for i in range(16))
+
+_SYNC = re.compile(rb"#FRZ# (\d+) ?(-?\d+)?")
+
+
+class FreezeError(RuntimeError):
+    """The guest did not reach a build stop, or the capture is unusable."""
+
+
+def source_hash(blobs):
+    """Chained SHA-256 over 4 KiB chunks of each blob, from 32 zero bytes."""
+    h = bytes(32)
+    for data in blobs:
+        for i in range(0, len(data), CHUNK):
+            h = hashlib.sha256(h + data[i:i + CHUNK]).digest()
+    return h
+
+
+def extents(old, new, base=0, skip=(), gap=GAP):
+    """Cell-aligned [(addr, bytes)] where *new* differs from *old*.
+
+    *base* is the guest address of offset 0; *skip* holds guest
+    (start, end) ranges to leave out.  Runs less than *gap* bytes
+    apart are merged, which costs a few unchanged bytes and saves a
+    record header each.
+    """
+    n = min(len(old), len(new)) // CELL * CELL
+    runs = []
+    block = 64 * 1024
+    for b in range(0, n, block):
+        be = min(b + block, n)
+        if old[b:be] == new[b:be]:
+            continue
+        for a in range(b, be, CELL):
+            if old[a:a + CELL] == new[a:a + CELL]:
+                continue
+            g = base + a
+            if any(s <= g < e for s, e in skip):
+                continue
+            if runs and a - runs[-1][1] < gap:
+                runs[-1][1] = a + CELL
+            else:
+                runs.append([a, a + CELL])
+    return [(base + s, bytes(new[s:e])) for s, e in runs]
+
+
+def _cells(*values):
+    return struct.pack(f"<{len(values)}Q", *values)
+
+
+def _records(exts):
+    return b"".join(_cells(addr, len(data)) + data for addr, data in exts)
+
+
+def pack(sources, ram, xmem, stage):
+    """Image bytes for *sources* [(path, data)] and the two extent lists.
+
+    *stage* is where FRZ-RESTORE reads the RAM records before copying
+    them in; it must be XMEM nothing is using once the image is in.
+    """
+    paths = b""
+    for path, _ in sources:
+        p = path.encode("ascii")
+        if len(p) > PATH_MAX:
+            raise FreezeError(f"source path too long: {path}")
+        paths += _cells(len(p)) + p + bytes(-len(p) % CELL)
+    ram_records = _records(ram)
+    head = (MAGIC + source_hash(data for _, data in sources)
+            + _cells(len(sources), stage, len(ram), len(ram_records),
+                     len(xmem)))
+    assert len(head) == HEADER
+    return head + paths + ram_records + _records(xmem)
+
+
+def unpack(image):
+    """Inverse of pack(): dict of hash, stage, paths, ram and xmem."""
+    if image[:8] != MAGIC:
+        raise FreezeError("not a frozen image")
+    nsrc, stage, nram, _, nxmem = struct.unpack_from("<5Q", image, 40)
+    pos = HEADER
+    paths = []
+    for _ in range(nsrc):
+        (n,) = struct.unpack_from("<Q", image, pos)
+        paths.append(image[pos + 8:pos + 8 + n].decode("ascii"))
+        pos += 8 + n + (-n % CELL)
+    out = {"hash": image[8:40], "stage": stage, "paths": paths}
+    for key, count in (("ram", nram), ("xmem", nxmem)):
+        exts = []
+        for _ in range(count):
+            addr, n = struct.unpack_from("<2Q", image, pos)
+            exts.append((addr, image[pos + 16:pos + 16 + n]))
+            pos += 16 + n
+        out[key] = exts
+    return out
+
+
+def _run_to_stop(sys_obj, buf, start, max_steps):
+    """Run until the guest prints a "#FRZ#" stop and idles in KEY.
+
+    Returns (match, end of output seen).
+    """
+    total = 0
+    while total < max_steps:
+        cpu = sys_obj.cpu
+        if cpu.halted:
+            break
+        text = bytes(buf[start:])
+        m = _SYNC.search(text)
+        if m and cpu.idle and not sys_obj.uart.has_rx_data:
+            return m, len(buf)
+        total += max(sys_obj.run_batch(min(5_000_000, max_steps - total)), 1)
+    tail = bytes(buf[start:])[-400:].decode("ascii", "replace")
+    raise FreezeError(f"no FRZ-LOAD build stop (frz.build on disk?):\n{tail}")
+
+
+def _capture(sys_obj):
+    cpu = sys_obj.cpu
+    regs = list(cpu.regs)
+    return (bytes(cpu.mem), bytes(sys_obj._ext_mem),
+            (regs[DSP_REG], regs[cpu.spsel]))
+
+
+def freeze(sys_obj, buf, sources, max_steps=10_000_000_000):
+    """Drive a build-mode boot through FRZ-LOAD and return the image.
+
+    *sys_obj* is booted (BIOS loaded, boot() called) from a disk that
+    has frz.build on it; *buf* collects its UART output as a list of
+    byte values.  The guest is released from the second stop; run it
+    on to finish the boot.
+    """
+    m, seen = _run_to_stop(sys_obj, buf, 0, max_steps)
+    if m.group(1) != b"0" or m.group(2) is None:
+        raise FreezeError(f"unexpected first stop: {m.group(0)!r}")
+    here = int(m.group(2))
+    ram0, ext0, sps0 = _capture(sys_obj)
+    at = ext0.find(PROBE)
+    if at < 0:
+        raise FreezeError("HERE is not in XMEM (no ENTER-USERLAND?)")
+    xbase = here - at
+
+    sys_obj.uart.inject_input(b"\r")
+    m, _ = _run_to_stop(sys_obj, buf, seen, max_steps)
+    if m.group(1) != b"1":
+        raise FreezeError(f"unexpected second stop: {m.group(0)!r}")
+    ram1, ext1, sps1 = _capture(sys_obj)
+    sys_obj.uart.inject_input(b"\r")
+
+    # What differs just below the data and return stack pointers is
+    # call scratch that the restore's own calls would be standing on.
+    # Both stops are at the same depth, so the pointers must match.
+    for name, v, w in zip(("data", "return"), sps0, sps1):
+        if v != w or not 0 < v < len(ram0):
+            raise FreezeError(f"no {name} stack pointer in RAM "
+                              f"({v:#x} then {w:#x})")
+    skip = [(max(v - STACK_WINDOW, 0), v + 64) for v in sps0]
+    ram = extents(ram0, ram1, skip=skip)
+    xmem = extents(ext0, ext1, base=xbase)
+    if not xmem:
+        raise FreezeError("the load changed no XMEM")
+    end = max(addr + len(data) for addr, data in xmem)
+    stage = (end + 4095) & ~4095
+    if stage - xbase + sum(16 + len(d) for _, d in ram) > len(ext1):
+        raise FreezeError("no free XMEM to stage the RAM extents in")
+    return pack(sources, ram, xmem, stage)
@@ -6,11 +6,75 @@ Disk-image boot is orders of magnitude faster than the old UART-injection
 approach because disk reads are instantaneous DMA copies.
 
 Usage:  cd bsky/ && emu/.venv/bin/python test_bsky.py
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --bench
+            [--bench-out FILE] [--bench-baseline FILE]
+            [--bench-threshold PCT]
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --profile [BENCH]
+            [--profile-every N] [--profile-out FILE]
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --no-cache
+        cd bsky/ && emu/.venv/bin/python test_bsky.py -j 1
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --full-restore
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --no-batch
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --line-input
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --net-out FILE
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --record FILE
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --replay FILE
+            [--replay-realtime] [--bench ...]
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --freeze-check
+            [--freeze-out FILE]
+        cd bsky/ && emu/.venv/bin/python test_bsky.py --bench-boot
+            [--bench-out FILE]
+
+Checks run on a forked process pool, one worker per CPU unless -j N
+says otherwise; results are reported in declaration order.  Checks
+marked pure share a session, split apart by printed markers
+(--no-batch gives every check its own).  A session's input is queued
+in the UART in one go (--line-input feeds it a line per idle instead),
+and test strings are loaded as fixtures into a reserved XMEM region
+rather than typed in a character at a time.
+
+Between checks one long-lived system is rewound by rewriting only the
+memory pages the previous check dirtied; --full-restore builds a fresh
+system per check instead.
+
+Stage 7 runs the client end to end with no network: fake_pds.py answers
+XRPC over TCP straight on the emulated NIC, and each such check prints
+its round trips, connections, bytes and segments (--net-out saves them
+as JSON so they can be compared across changes).  --record saves a
+login and timeline fetch (live with BSKY_HANDLE/BSKY_PASSWORD set,
+else against the stand-in); --replay serves it back byte for byte and
+times _BSK-TL-FETCH, and with --bench adds it to the benchmark results.
+
+--freeze-check builds a frozen image of the test disk with freeze.py
+(--freeze-out saves it), then boots from source, from the image and
+from a stale image, and checks the three answer alike and only the
+second skips the source load.
+
+--bench-boot boots the core alone (bsky.f) and the whole client
+(bsky-tui.f) and reports boot steps and dictionary bytes for each,
+then what the core-only system's first write and profile words cost
+to load their modules.
+
+The booted snapshot is cached on disk (SNAPSHOT_CACHE) and reused while
+bios.asm, kdos.f, tools.f, the emulator's Python sources, the akashic
+libs, the bsky modules and the test autoexec are unchanged.  --no-cache
+forces a fresh boot.
 """
 
+import bisect
+import collections
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import pickle
+import re
 import sys
 import traceback
+import zlib
 
 # Add emulator directory to path
 EMU_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emu")
@@ -20,9 +84,12 @@ from accel_wrapper import Megapad64, HaltError
 from system import MegapadSystem
 from devices import UART
 from asm import assemble
-from diskutil import MP64FS, FTYPE_FORTH
+from diskutil import MP64FS, FTYPE_FORTH, FTYPE_DATA
 from pathlib import Path
 
+import fake_pds
+import freeze
+
 # ---------------------------------------------------------------------------
 #  Paths
 # ---------------------------------------------------------------------------
@@ -30,8 +97,16 @@ BIOS_ASM = os.path.join(EMU_DIR, "bios.asm")
 KDOS_F   = os.path.join(EMU_DIR, "kdos.f")
 TOOLS_F  = os.path.join(EMU_DIR, "tools.f")
 BSKY_F   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bsky.f")
+# bsky.f is the core; the rest load on first use (bsky.f §4.4), and
+# bsky-tui.f pulls in all of them.
+BSKY_MODULES = [BSKY_F] + [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    for name in ("bsky-write.f", "bsky-profile.f", "bsky-tui.f")]
+FREEZE_F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "freeze.f")
 AKASHIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                            "akashic", "akashic")
+SNAPSHOT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              ".test_snapshot.cache")
 
 # Akashic library files — (disk-path, host-path) pairs.
 # Files are placed in subdirectories matching the akashic source tree
@@ -56,10 +131,13 @@ AKASHIC_LIBS = [
 #  Disk image builder — test variant
 # ---------------------------------------------------------------------------
 
-# Test autoexec.f — loads tools.f + bsky.f + test helpers, then returns
-# to the KDOS prompt.  No networking, no login, no TUI.
+# Test autoexec.f — loads tools.f + the whole client + test helpers,
+# then returns to the KDOS prompt.  No networking, no login, and the
+# TUI is loaded but not entered.  The client goes through FRZ-LOAD as
+# in production; with no bsky.img on the disk that is a plain REQUIRE.
 _TEST_AUTOEXEC = """\
 PROVIDED autoexec.f
+REQUIRE freeze.f
 
 \\ Switch to userland (ext mem) to conserve system dictionary
 : _ENTER-UL  XMEM? IF ENTER-USERLAND THEN ;
@@ -67,7 +145,7 @@ _ENTER-UL
 
 \\ Load modules from disk
 REQUIRE tools.f
-REQUIRE bsky.f
+FRZ-LOAD bsky.img bsky-tui.f
 
 \\ Test helper words: separate buffer for building test inputs
 CREATE _TB 512 ALLOT  VARIABLE _TL
@@ -77,11 +155,24 @@ CREATE _TB 512 ALLOT  VARIABLE _TL
 : TS  ( addr u -- ) >R _TB _TL @ + R@ CMOVE  R> _TL +! ;
 : TA  ( -- addr u ) _TB _TL @ ;
 
+\\ Fixture region: the harness writes test blobs straight into it and
+\\ tests refer to them as _TFX off + len.  The 32-byte header pattern
+\\ is computed so the harness can find the region in XMEM.
+262144 CONSTANT _TFX-SIZE
+: _TFX-INIT  ( -- addr )
+    _TFX-SIZE XMEM-ALLOT  DUP _TFX-SIZE 0 FILL
+    32 0 DO I 7 * 90 + 255 AND OVER I + C! LOOP ;
+_TFX-INIT CONSTANT _TFX
+
 """
 
 
-def build_test_disk() -> MP64FS:
-    """Build an in-memory disk image for testing."""
+def build_test_disk(extra=(), autoexec=_TEST_AUTOEXEC) -> MP64FS:
+    """Build an in-memory disk image for testing.
+
+    *extra* holds (name, bytes) data files to add, e.g. a frozen image;
+    *autoexec* replaces the test autoexec.
+    """
     fs = MP64FS()
     fs.format()
 
@@ -89,9 +180,11 @@ def build_test_disk() -> MP64FS:
     fs.inject_file("kdos.f", Path(KDOS_F).read_bytes(),
                    ftype=FTYPE_FORTH, flags=0x02)
 
-    # 2. tools.f
+    # 2. tools.f, freeze.f
     fs.inject_file("tools.f", Path(TOOLS_F).read_bytes(),
                    ftype=FTYPE_FORTH)
+    fs.inject_file("freeze.f", Path(FREEZE_F).read_bytes(),
+                   ftype=FTYPE_FORTH)
 
     # 3. Akashic libraries — in subdirectories matching source tree
     _created_dirs = set()
@@ -106,14 +199,18 @@ def build_test_disk() -> MP64FS:
         fs.inject_file(p.name, p.read_bytes(), ftype=FTYPE_FORTH,
                        path=f"/{disk_dir}")
 
-    # 4. bsky.f
-    fs.inject_file("bsky.f", Path(BSKY_F).read_bytes(),
-                   ftype=FTYPE_FORTH)
+    # 4. bsky.f and its deferred modules
+    for path in BSKY_MODULES:
+        fs.inject_file(os.path.basename(path), Path(path).read_bytes(),
+                       ftype=FTYPE_FORTH)
 
     # 5. Test autoexec (no login/TUI — just load modules + helpers)
-    fs.inject_file("autoexec.f", _TEST_AUTOEXEC.encode("ascii"),
+    fs.inject_file("autoexec.f", autoexec.encode("ascii"),
                    ftype=FTYPE_FORTH)
 
+    for name, data in extra:
+        fs.inject_file(name, data, ftype=FTYPE_DATA)
+
     return fs
 
 
@@ -200,32 +297,19 @@ def _restore_cpu_state(cpu, state):
         setattr(cpu, k, state.get(k, 0))
 
 
-def build_snapshot():
-    """Build disk image -> boot KDOS -> autoexec loads bsky.f -> snapshot."""
-    global _snapshot, _bios_code
-
-    print("  Assembling BIOS ...")
-    with open(BIOS_ASM) as f:
-        _bios_code = assemble(f.read())
-    print(f"  BIOS: {len(_bios_code)} bytes")
-
-    # Build in-memory disk image
-    print("  Building disk image ...")
-    fs = build_test_disk()
-    files = fs.list_files()
-    total_bytes = sum(e.used_bytes for e in files)
-    print(f"    {len(files)} files, {total_bytes:,} bytes on disk")
-    disk_bytes = bytes(fs.img)
-
-    # Boot with disk attached
+def _boot_disk(disk_bytes):
+    """Return (system, uart buffer) booting from *disk_bytes*."""
     sys_obj = make_system(ram_kib=1024, ext_mem_mib=16, disk_image=disk_bytes)
     buf = capture_uart(sys_obj)
     sys_obj.load_binary(0, _bios_code)
     sys_obj.boot()
+    return sys_obj, buf
+
 
-    # Run until KDOS reaches the interactive prompt (idle + no pending UART).
-    # Full boot (KDOS + akashic libs + bsky.f) takes ~4-5 billion steps.
-    max_steps = 10_000_000_000
+def _run_to_prompt(sys_obj, max_steps=10_000_000_000):
+    """Run until KDOS reaches the interactive prompt (idle + no pending
+    UART); return the steps taken.  Full boot (KDOS + akashic libs +
+    bsky.f) takes ~4-5 billion steps."""
     total = 0
     while total < max_steps:
         if sys_obj.cpu.halted:
@@ -234,6 +318,34 @@ def build_snapshot():
             break
         batch = sys_obj.run_batch(min(5_000_000, max_steps - total))
         total += max(batch, 1)
+    return total
+
+
+def _assemble_bios():
+    global _bios_code
+    if _bios_code is None:
+        print("  Assembling BIOS ...")
+        with open(BIOS_ASM) as f:
+            _bios_code = assemble(f.read())
+        print(f"  BIOS: {len(_bios_code)} bytes")
+
+
+def build_snapshot():
+    """Build disk image -> boot KDOS -> autoexec loads bsky.f -> snapshot."""
+    global _snapshot
+
+    _assemble_bios()
+
+    # Build in-memory disk image
+    print("  Building disk image ...")
+    fs = build_test_disk()
+    files = fs.list_files()
+    total_bytes = sum(e.used_bytes for e in files)
+    print(f"    {len(files)} files, {total_bytes:,} bytes on disk")
+    disk_bytes = bytes(fs.img)
+
+    sys_obj, buf = _boot_disk(disk_bytes)
+    total = _run_to_prompt(sys_obj)
 
     boot_text = uart_text(buf)
     print(f"  Boot steps: {total:,}")
@@ -249,38 +361,329 @@ def build_snapshot():
     return boot_text
 
 
-def run_forth(lines, max_steps=50_000_000):
-    """Restore from snapshot, evaluate Forth lines via UART, return output."""
-    mem_bytes, ext_mem_bytes, cpu_state, disk_bytes = _snapshot
+# Bump when the cached tuple or the CPU state layout changes.
+_SNAPSHOT_FORMAT = 1
+
+
+def snapshot_key():
+    """Hash of everything the booted snapshot is built from."""
+    h = hashlib.sha256(f"format {_SNAPSHOT_FORMAT}\n".encode())
+    inputs = [BIOS_ASM, KDOS_F, TOOLS_F, FREEZE_F] + \
+             [p for _, p in AKASHIC_LIBS] + BSKY_MODULES + \
+             sorted(str(p) for p in Path(EMU_DIR).glob("*.py"))
+    for path in inputs:
+        h.update(os.path.basename(path).encode() + b"\0")
+        try:
+            h.update(Path(path).read_bytes())
+        except FileNotFoundError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    h.update(_TEST_AUTOEXEC.encode("ascii"))
+    return h.hexdigest()
+
+
+def load_snapshot(use_cache=True):
+    """Return boot text, restoring _snapshot from SNAPSHOT_CACHE when its
+    key matches the current inputs, else booting and refreshing it."""
+    global _snapshot
+    key = snapshot_key()
+    if use_cache and os.path.exists(SNAPSHOT_CACHE):
+        try:
+            with open(SNAPSHOT_CACHE, "rb") as f:
+                cached = pickle.loads(zlib.decompress(f.read()))
+            if cached.get("key") == key:
+                _snapshot = cached["snapshot"]
+                print(f"  Snapshot cache hit ({key[:12]}).\n")
+                return cached["boot_text"]
+            print("  Snapshot cache stale, rebuilding ...")
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError,
+                KeyError, AttributeError) as e:
+            print(f"  Snapshot cache unreadable ({e}), rebuilding ...")
+
+    boot_text = build_snapshot()
+    blob = zlib.compress(pickle.dumps(
+        {"key": key, "snapshot": _snapshot, "boot_text": boot_text},
+        protocol=pickle.HIGHEST_PROTOCOL), 1)
+    tmp = SNAPSHOT_CACHE + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, SNAPSHOT_CACHE)
+    except OSError as e:
+        print(f"  WARNING: could not write snapshot cache: {e}")
+    return boot_text
+
+
+# Restore granularity.  Blocks are compared first so untouched memory is
+# skipped in large strides; only differing blocks are scanned page by page.
+_PAGE = 4096
+_BLOCK = 64 * 1024
+
+_session = None       # long-lived MegapadSystem, reset between checks
+_session_devices = None  # _device_state() of _session when it was fresh
+FULL_RESTORE = False  # --full-restore: fresh system per check (old path)
+LINE_INPUT = False    # --line-input: inject one line per idle (old path)
+
+
+def _dirty_pages(cur, ref):
+    """Yield (start, end) for each _PAGE of cur that differs from ref.
+    Every block of ref is compared, so the cost grows with its size."""
+    n = len(ref)
+    with memoryview(cur) as c, memoryview(ref) as r:
+        for b in range(0, n, _BLOCK):
+            be = min(b + _BLOCK, n)
+            if c[b:be] == r[b:be]:
+                continue
+            for p in range(b, be, _PAGE):
+                pe = min(p + _PAGE, be)
+                if c[p:pe] != r[p:pe]:
+                    yield p, pe
+
+
+def _restore_pages(cur, ref):
+    """Copy back the pages of cur dirtied since ref; return how many."""
+    dirty = list(_dirty_pages(cur, ref))
+    for p, pe in dirty:
+        cur[p:pe] = ref[p:pe]
+    return len(dirty)
 
+
+def _fresh_system():
+    mem_bytes, ext_mem_bytes, cpu_state, disk_bytes = _snapshot
     sys_obj = make_system(ram_kib=1024, ext_mem_mib=16, disk_image=disk_bytes)
-    buf = capture_uart(sys_obj)
     sys_obj.cpu.mem[:len(mem_bytes)] = mem_bytes
     sys_obj._ext_mem[:len(ext_mem_bytes)] = ext_mem_bytes
     _restore_cpu_state(sys_obj.cpu, cpu_state)
+    return sys_obj
+
+
+_SCALARS = (bool, int, float, str, bytes, type(None))
+_CONTAINERS = (list, dict, set, bytearray, collections.deque)
+
+
+def _devices(sys_obj):
+    """Yield (key, device) for every device of sys_obj besides the ones
+    the rewind copies back itself (core 0, XMEM, disk, UART): timers,
+    the other cores, the NIC."""
+    skip = {id(sys_obj.cpu), id(sys_obj._ext_mem), id(sys_obj.storage),
+            id(sys_obj.uart)}
+    for name, v in vars(sys_obj).items():
+        for i, dev in enumerate(v if isinstance(v, (list, tuple)) else (v,)):
+            if id(dev) not in skip and hasattr(dev, "__dict__"):
+                yield (name, i), dev
+
+
+def _device_state(sys_obj):
+    """{(key, field): value} of every device's plain fields: scalars as
+    they are, containers copied.  Memory shared with core 0 is left
+    out, since the pages cover it."""
+    shared = {id(sys_obj.cpu.mem), id(sys_obj._ext_mem)}
+    state = {}
+    for key, dev in _devices(sys_obj):
+        for field, v in vars(dev).items():
+            if isinstance(v, _SCALARS):
+                state[key, field] = v
+            elif isinstance(v, _CONTAINERS) and id(v) not in shared:
+                state[key, field] = copy.copy(v)
+    return state
+
+
+def _rewind_devices(sys_obj, ref):
+    """Put the devices' scalar fields back to *ref* (_device_state()).
+    False when a container differs (a frame queued on the NIC, a core
+    that ran), which a field-by-field rewind cannot undo."""
+    devices = dict(_devices(sys_obj))
+    for (key, field), v in ref.items():
+        dev = devices.get(key)
+        if dev is None:
+            return False
+        cur = getattr(dev, field, None)
+        if isinstance(v, _SCALARS):
+            if cur != v:
+                setattr(dev, field, v)
+        elif cur != v:
+            return False
+    return True
+
+
+def _reset_system():
+    """Return a system in the snapshot state.
+
+    The first call builds one; later calls rewind the same system by
+    rewriting only the RAM, XMEM and disk pages the previous check
+    dirtied.  The emulator does not track which pages were written, so
+    finding them still compares all of RAM, XMEM and the disk image
+    against the snapshot (_dirty_pages, a 64 KiB block at a time) and
+    that part grows with the configured memory size; what shrinks is
+    the copying, which follows what a test touched, and the system
+    build it saves.  The other devices' fields are put back to
+    what the fresh system had (_rewind_devices).  A session that ended
+    with input still queued (step limit hit), or whose devices hold
+    state a field copy cannot undo, is discarded instead.
+    """
+    global _session, _session_devices
+    _install_fixtures()
+    sys_obj = _session
+    if FULL_RESTORE or sys_obj is None or sys_obj.uart.has_rx_data \
+            or not _rewind_devices(sys_obj, _session_devices):
+        sys_obj = _session = _fresh_system()
+        _session_devices = _device_state(sys_obj)
+        return sys_obj
+    mem_bytes, ext_mem_bytes, cpu_state, disk_bytes = _snapshot
+    _restore_pages(sys_obj.cpu.mem, mem_bytes)
+    _restore_pages(sys_obj._ext_mem, ext_mem_bytes)
+    _restore_pages(sys_obj.storage._image_data, disk_bytes)
+    sys_obj.storage.status = 0x80
+    _restore_cpu_state(sys_obj.cpu, cpu_state)
+    return sys_obj
 
-    payload = "\n".join(lines) + "\nBYE\n"
-    data = payload.encode()
-    pos = 0
+
+# Fixture blobs registered by fx(), laid out end to end after the
+# region header.  _install_fixtures() patches new ones into the
+# snapshot's XMEM image, so every restore carries them for free.
+_TFX_HDR = 32
+_TFX_SIZE = 256 * 1024
+_TFX_MAGIC = bytes((i * 7 + 90) & 255 for i in range(_TFX_HDR))
+_fixtures = bytearray()
+_fixture_offs = {}
+_fixtures_installed = 0
+
+
+def fx(data):
+    """Register *data* (str or bytes) as a fixture and return the Forth
+    phrase that pushes its ( addr u )."""
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+    off = _fixture_offs.get(data)
+    if off is None:
+        off = _TFX_HDR + len(_fixtures)
+        if off + len(data) > _TFX_SIZE:
+            raise ValueError(f"fixture region full ({_TFX_SIZE} bytes)")
+        _fixture_offs[data] = off
+        _fixtures.extend(data)
+        _fixtures.extend(bytes(-len(_fixtures) % 8))
+    return f"_TFX {off} + {len(data)}"
+
+
+def _install_fixtures():
+    global _snapshot, _fixtures_installed
+    if len(_fixtures) == _fixtures_installed:
+        return
+    mem_bytes, ext_mem_bytes, cpu_state, disk_bytes = _snapshot
+    base = ext_mem_bytes.find(_TFX_MAGIC)
+    if base < 0:
+        raise RuntimeError("fixture region not found in XMEM snapshot")
+    ext = bytearray(ext_mem_bytes)
+    start = base + _TFX_HDR
+    ext[start:start + len(_fixtures)] = _fixtures
+    _snapshot = (mem_bytes, bytes(ext), cpu_state, disk_bytes)
+    _fixtures_installed = len(_fixtures)
+
+
+def _run_session(lines, max_steps=50_000_000, step=100_000, on_step=None,
+                 host=None):
+    """Restore from snapshot and evaluate Forth lines via UART.
+
+    The CPU runs *step* instructions at a time; *on_step*, if given, is
+    called with the system after each such batch (see the profiler).
+    A fake_pds.TcpHost *host* is put on the NIC of a fresh system (NIC
+    state is not rewound); the NIC polls it for frames, and the session
+    is not over while it still has frames in flight.
+
+    Returns (sys_obj, uart_buf) so callers can inspect CPU state.
+    """
+    if host is not None:
+        _install_fixtures()
+        sys_obj = _fresh_system()
+        host.attach(sys_obj)
+    else:
+        sys_obj = _reset_system()
+    buf = capture_uart(sys_obj)
+
+    payload = ("\n".join(lines) + "\nBYE\n").encode()
     steps = 0
+    if not LINE_INPUT:
+        # Queue the whole payload in the RX FIFO once; KDOS drains it
+        # line by line without the harness waking up in between.
+        sys_obj.uart.inject_input(payload)
+        pos = len(payload)
+    else:
+        pos = 0
 
     while steps < max_steps:
         if sys_obj.cpu.halted:
             break
-        if sys_obj.cpu.idle and not sys_obj.uart.has_rx_data:
-            if pos < len(data):
-                chunk = _next_line_chunk(data, pos)
+        if sys_obj.cpu.idle and not sys_obj.uart.has_rx_data \
+                and not (host is not None and host.pending()):
+            if pos < len(payload):
+                chunk = _next_line_chunk(payload, pos)
                 sys_obj.uart.inject_input(chunk)
                 pos += len(chunk)
             else:
                 break
             continue
-        batch = sys_obj.run_batch(min(100_000, max_steps - steps))
+        batch = sys_obj.run_batch(min(step, max_steps - steps))
         steps += max(batch, 1)
+        if on_step is not None:
+            on_step(sys_obj)
+
+    if host is not None:
+        host.detach()
+    return sys_obj, buf
+
 
+def run_forth(lines, max_steps=50_000_000):
+    """Restore from snapshot, evaluate Forth lines via UART, return output."""
+    _, buf = _run_session(lines, max_steps)
     return uart_text(buf)
 
 
+# Wall clock the stand-in server runs on, so the tokens it issues (and
+# the tests that present them) are the same in every process.
+_NET_EPOCH = 1767225600          # 2026-01-01T00:00:00Z
+
+
+_HOST_OPTS = ("latency", "drop_after", "drop_idle", "refuse")   # TcpHost's, not FakePDS's
+
+
+def _host_opts(net):
+    """The TcpHost options in a check's *net* options."""
+    opts = net if isinstance(net, dict) else {}
+    return {k: opts[k] for k in _HOST_OPTS if k in opts}
+
+
+def fake_server(net):
+    """The FakePDS a check's *net* options (dict or True) describe,
+    and the TcpHost options to serve it with."""
+    opts = dict(net) if isinstance(net, dict) else {}
+    host_opts = _host_opts(opts)
+    for k in host_opts:
+        del opts[k]
+    opts.setdefault("clock", lambda: _NET_EPOCH)
+    return fake_pds.FakePDS(**opts), host_opts
+
+
+def run_forth_net(lines, net, max_steps=500_000_000, app=None):
+    """Evaluate Forth lines with the stand-in XRPC server on the NIC
+    (or *app*, e.g. a fake_pds.Replay, in its place).
+    Returns (output, fake_pds.NetStats, cycles)."""
+    if app is None:
+        app, host_opts = fake_server(net)
+    else:
+        host_opts = _host_opts(net)
+    host = fake_pds.TcpHost(app, **host_opts)
+    sys_obj, buf = _run_session(lines, max_steps, host=host)
+    return (uart_text(buf), host.stats,
+            sys_obj.cpu.cycle_count - _snapshot[2]['cycle_count'])
+
+
+def run_forth_cycles(lines, max_steps=200_000_000):
+    """Like run_forth() but also return the CPU cycles spent past the
+    snapshot: (output, cycles)."""
+    sys_obj, buf = _run_session(lines, max_steps)
+    return uart_text(buf), sys_obj.cpu.cycle_count - _snapshot[2]['cycle_count']
+
+
 # ---------------------------------------------------------------------------
 #  Test framework
 # ---------------------------------------------------------------------------
@@ -289,25 +692,68 @@ _fail = 0
 _errors = []
 
 
-def check(name, forth_lines, expected, check_fn=None):
-    """Run a test case.
+_pending = None   # list of queued checks while collecting
+_capture = None   # stdout buffer while collecting
 
-    forth_lines: list of Forth lines to evaluate
-    expected: substring that must appear in the output
-    check_fn: optional callable(output) -> bool for custom checks
+BATCH = True      # --no-batch: one restored session per check
+BATCH_MAX = 16    # checks sharing one session
+
+# Session prologue: _TMARK prints "###n #" with n counting up from 1.
+# The marker text is built with EMIT so the echoed input never matches.
+_MARK_DEF = ("VARIABLE _TMK  0 _TMK !  : _TMARK 1 _TMK +! CR "
+             "35 EMIT 35 EMIT 35 EMIT _TMK @ . 35 EMIT CR ;  _TMARK")
+_MARK_RE = re.compile(r"###(\d+) #")
+
+
+def run_forth_batch(batch, max_steps=50_000_000):
+    """Evaluate several checks' lines in one restored session.
+
+    Each check is followed by a _TMARK line and the UART text is split
+    back at the markers.  Returns one output string per check, or None
+    when the markers do not come back exactly 1..n+1 (a check swallowed
+    its marker, e.g. by leaving a definition open, or the session ran
+    out of steps).
     """
-    global _pass, _fail
-    try:
-        output = run_forth(forth_lines)
-        # Strip "ok" prompts and clean up for matching
-        clean = output.strip()
+    lines = [_MARK_DEF]
+    for forth_lines in batch:
+        lines += forth_lines
+        lines.append("_TMARK")
+    parts = _MARK_RE.split(run_forth(lines, max_steps * len(batch)))
+    marks = [int(m) for m in parts[1::2]]
+    if marks != list(range(1, len(batch) + 2)):
+        return None
+    return parts[2:-1:2]
+
+
+def _passes(expected, check_fn, output):
+    clean = output.strip()
+    if check_fn:
+        return check_fn(clean)
+    return expected in clean
 
-        if check_fn:
-            ok = check_fn(clean)
-        else:
-            ok = expected in clean
 
-        if ok:
+_net_totals = {}     # check name -> NetStats.as_dict(), for --net-out
+
+
+def _report(name, expected, check_fn, output, error, net=None):
+    """Judge one finished check and print its PASS/FAIL/ERR line,
+    followed by its network totals (*net*, a NetStats) if it had any."""
+    global _pass, _fail
+    if net is not None:
+        _net_totals[name] = net.as_dict()
+        try:
+            _report(name, expected, check_fn, output, error)
+        finally:
+            print(f"        net: {net.summary()}")
+        return
+    if error is not None:
+        _fail += 1
+        _errors.append(name)
+        print(f"  ERR   {name}: {error.strip().splitlines()[-1]}")
+        print(error, end="", file=sys.stderr)
+        return
+    try:
+        if _passes(expected, check_fn, output):
             _pass += 1
             print(f"  PASS  {name}")
         else:
@@ -315,7 +761,7 @@ def check(name, forth_lines, expected, check_fn=None):
             _errors.append(name)
             print(f"  FAIL  {name}")
             print(f"        expected: {expected!r}")
-            print(f"        got:      {clean!r}")
+            print(f"        got:      {output.strip()!r}")
     except Exception as e:
         _fail += 1
         _errors.append(name)
@@ -323,39 +769,147 @@ def check(name, forth_lines, expected, check_fn=None):
         traceback.print_exc()
 
 
+def check(name, forth_lines, expected, check_fn=None, pure=False,
+          net=None):
+    """Run a test case.
+
+    forth_lines: list of Forth lines to evaluate
+    expected: substring that must appear in the output
+    check_fn: optional callable(output) -> bool for custom checks
+    pure: the check leaves nothing a later check could see (it only
+          reads state, or writes the TR scratch buffer and its own
+          definitions), so it may share a session with other pure
+          checks.  Any other check gets a session of its own.
+    net: run against the stand-in XRPC server (fake_pds); True or a
+         dict of FakePDS options plus the TcpHost ones: "latency"
+         (cycles), "drop_after" (requests per connection),
+         "drop_idle" (cycles) and "refuse".  Always isolated.
+
+    While collecting (run_checks) the check is queued, together with
+    whatever was printed since the previous one.
+    """
+    if _pending is not None:
+        _pending.append((_capture.getvalue(), name, forth_lines,
+                         expected, check_fn, not pure or bool(net), net))
+        _capture.seek(0)
+        _capture.truncate()
+        return
+    _report(name, expected, check_fn, *_run_lines(forth_lines, net))
+
+
+def _run_lines(forth_lines, net):
+    """(output, error, net stats) of one check in a session of its own."""
+    try:
+        if net:
+            output, stats, _ = run_forth_net(forth_lines, net)
+            return output, None, stats
+        return run_forth(forth_lines), None, None
+    except Exception:
+        return None, traceback.format_exc(), None
+
+
+def _run_one(i):
+    return _run_lines(_pending[i][2], _pending[i][6])
+
+
+def _run_unit(unit):
+    """Run queued checks *unit* (a list of indices) in one session and
+    return (output, error, net stats) for each.
+
+    A batched check that does not pass is rerun in a session of its
+    own, so a batch can only ever save restores, never add a failure.
+    """
+    if len(unit) == 1:
+        return [_run_one(unit[0])]
+    try:
+        outs = run_forth_batch([_pending[i][2] for i in unit])
+    except Exception:
+        outs = None
+    if outs is None:
+        return [_run_one(i) for i in unit]
+    results = []
+    for i, out in zip(unit, outs):
+        expected, check_fn = _pending[i][3:5]
+        try:
+            ok = _passes(expected, check_fn, out)
+        except Exception:
+            ok = False
+        results.append((out, None, None) if ok else _run_one(i))
+    return results
+
+
+def _units(queued):
+    """Group queued checks: runs of batchable checks up to BATCH_MAX,
+    every isolated check alone."""
+    units, run = [], []
+    for i, rec in enumerate(queued):
+        if BATCH and not rec[5]:
+            run.append(i)
+            if len(run) == BATCH_MAX:
+                units.append(run)
+                run = []
+            continue
+        if run:
+            units.append(run)
+            run = []
+        units.append([i])
+    if run:
+        units.append(run)
+    return units
+
+
+def run_checks(stages, jobs):
+    """Collect every check of *stages*, run them in batched sessions
+    (on a forked pool of *jobs* workers when jobs > 1) and report in
+    declaration order."""
+    global _pending, _capture
+    _pending, _capture = [], io.StringIO()
+    with contextlib.redirect_stdout(_capture):
+        for i, stage in enumerate(stages):
+            if i:
+                print()
+            stage()
+    trailer = _capture.getvalue()
+    queued, _capture = _pending, None
+    _install_fixtures()
+    units = _units(queued)
+    print(f"  Running {len(queued)} checks in {len(units)} sessions"
+          f" on {jobs} worker{'s' if jobs > 1 else ''}.\n")
+
+    def report(results):
+        flat = (r for unit in results for r in unit)
+        for rec, result in zip(queued, flat):
+            preamble, name, _, expected, check_fn = rec[:5]
+            print(preamble, end="")
+            _report(name, expected, check_fn, *result)
+
+    if jobs > 1:
+        # Workers are forked after the snapshot is built, so they share
+        # it copy-on-write instead of each unpickling 17 MB.
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(jobs) as pool:
+            report(pool.imap(_run_unit, units, chunksize=1))
+    else:
+        report(map(_run_unit, units))
+    _pending = None
+    print(trailer, end="")
+
+
 def jstr(s):
-    """Return Forth lines that build string *s* in the test buffer
-    using only TC calls (prompt-compatible, no S\\" needed).
+    """Return Forth lines that build string *s* in the test buffer.
 
-    Use ``TA`` inside a colon definition to retrieve (addr u).
+    The bytes come from a fixture (see fx()), copied in with one TS
+    instead of a TC call per character.  Use ``TA`` inside a colon
+    definition to retrieve (addr u).
     """
-    # Build string at prompt using character codes
-    parts = ['TR']
-    for ch in s:
-        parts.append(f'{ord(ch)} TC')
-    # Split into multiple lines of ~70 chars to avoid TIB overflow
-    lines = []
-    cur = []
-    cur_len = 0
-    for p in parts:
-        if cur_len + len(p) + 1 > 70 and cur:
-            lines.append(' '.join(cur))
-            cur = [p]
-            cur_len = len(p)
-        else:
-            cur.append(p)
-            cur_len += len(p) + 1
-    if cur:
-        lines.append(' '.join(cur))
-    return lines
+    return [jstr_inline(s)]
 
 
 def jstr_inline(s):
     """Like jstr() but returns a single Forth line (for embedding)."""
-    parts = ['TR']
-    for ch in s:
-        parts.append(f'{ord(ch)} TC')
-    return ' '.join(parts)
+    if len(s) > 512:
+        raise ValueError("jstr: string longer than the 512-byte _TB")
+    return f"TR {fx(s)} TS"
 
 
 # ---------------------------------------------------------------------------
@@ -390,24 +944,29 @@ def test_stage0():
     # S0.1 Number conversion
     check("NUM>STR zero",
           [': T 0 NUM>STR TYPE ; T'],
-          "0")
+          "0", pure=True)
 
     check("NUM>STR 42",
           [': T 42 NUM>STR TYPE ; T'],
-          "42")
+          "42", pure=True)
 
     check("NUM>STR 12345",
           [': T 12345 NUM>STR TYPE ; T'],
-          "12345")
+          "12345", pure=True)
 
     check("NUM>STR 1",
           [': T 1 NUM>STR TYPE ; T'],
-          "1")
+          "1", pure=True)
 
     check("NUM>APPEND",
           [': T BSK-RESET S" count=" BSK-APPEND 99 NUM>APPEND BSK-TYPE ; T'],
           "count=99")
 
+    check("NUM>APPEND zero and negative",
+          [': T BSK-RESET 0 NUM>APPEND 32 BSK-EMIT -407 NUM>APPEND'
+           ' BSK-TYPE ; T'],
+          "0 -407")
+
     # S0.2 JSON Escaping -- JSON-COPY-ESCAPED (inline escaper)
     check("JSON-COPY-ESCAPED plain",
           [': T BSK-RESET S" hello" JSON-COPY-ESCAPED BSK-TYPE ; T'],
@@ -428,11 +987,11 @@ def test_stage0():
           lambda out: any(
               "Z" in line and len([c for c in line if c in "0123456789-T:.Z"]) >= 20
               for line in out.split("\n")
-          ))
+          ), pure=True)
 
     check("BSK-NOW length",
           [': T BSK-NOW NIP . ; T'],
-          "20 ")
+          "20 ", pure=True)
 
     # S0.4 URL Encoding
     check("URL-ENCODE plain",
@@ -463,87 +1022,143 @@ def test_stage1():
     check("JSON-FIND-KEY simple",
           jstr('{"name":"alice"}') +
           [': _T TA S" name" JSON-FIND-KEY JSON-GET-STRING TYPE ;', '_T'],
-          "alice")
+          "alice", pure=True)
 
     check("JSON-FIND-KEY second key",
           jstr('{"x":1,"y":"bob"}') +
           [': _T TA S" y" JSON-FIND-KEY JSON-GET-STRING TYPE ;', '_T'],
-          "bob")
+          "bob", pure=True)
 
     check("JSON-FIND-KEY missing",
           jstr('{"a":1}') +
           [': _T TA S" z" JSON-FIND-KEY NIP . ;', '_T'],
-          "0 ")
+          "0 ", pure=True)
 
     # S1.2 Value extractors
     check("JSON-GET-STRING basic",
           jstr('"hello"') +
           [': _T TA JSON-GET-STRING TYPE ;', '_T'],
-          "hello")
+          "hello", pure=True)
 
     check("JSON-GET-STRING with escape",
           jstr('"ab\\"cd"') +
           [': _T TA JSON-GET-STRING TYPE ;', '_T'],
           None,
-          lambda out: 'ab' in out and 'cd' in out)
+          lambda out: 'ab' in out and 'cd' in out, pure=True)
 
     check("JSON-GET-STRING empty",
           jstr('""') +
           [': _T TA JSON-GET-STRING NIP . ;', '_T'],
-          "0 ")
+          "0 ", pure=True)
 
     check("JSON-GET-NUMBER positive",
           jstr('{"val":42}') +
           [': _T TA S" val" JSON-FIND-KEY JSON-GET-NUMBER . ;', '_T'],
-          "42 ")
+          "42 ", pure=True)
 
     check("JSON-GET-NUMBER negative",
           jstr('{"val":-7}') +
           [': _T TA S" val" JSON-FIND-KEY JSON-GET-NUMBER . ;', '_T'],
-          "-7 ")
+          "-7 ", pure=True)
 
     check("JSON-GET-NUMBER zero",
           jstr('{"n":0}') +
           [': _T TA S" n" JSON-FIND-KEY JSON-GET-NUMBER . ;', '_T'],
-          "0 ")
+          "0 ", pure=True)
 
     # S1.2 Skip value
     check("JSON-SKIP-STRING",
           jstr('"hello",rest') +
           [': _T TA JSON-SKIP-STRING TYPE ;', '_T'],
-          ",rest")
+          ",rest", pure=True)
 
     check("JSON-SKIP-VALUE number",
           jstr('42,next') +
           [': _T TA JSON-SKIP-VALUE TYPE ;', '_T'],
-          ",next")
+          ",next", pure=True)
 
     check("JSON-SKIP-VALUE nested object",
           jstr('{"a":1},rest') +
           [': _T TA JSON-SKIP-VALUE TYPE ;', '_T'],
-          ",rest")
+          ",rest", pure=True)
 
     # S1.3 Array iterator
     check("JSON-GET-ARRAY",
           jstr('{"items":[1,2,3]}') +
           [': _T TA S" items" JSON-GET-ARRAY JSON-GET-NUMBER . ;', '_T'],
-          "1 ")
+          "1 ", pure=True)
 
     check("JSON-NEXT-ITEM",
           jstr('1,2,3]}') +
           [': _T TA JSON-SKIP-VALUE JSON-NEXT-ITEM JSON-GET-NUMBER . ;', '_T'],
-          "2 ")
+          "2 ", pure=True)
 
     # Combined: find key in nested JSON (depth-aware: must navigate user → did)
     check("Nested key lookup",
           jstr('{"user":{"did":"plc:123","handle":"alice"},"ok":true}') +
           [': _T TA S" user" JSON-FIND-KEY S" did" JSON-FIND-KEY JSON-GET-STRING TYPE ;', '_T'],
-          "plc:123")
+          "plc:123", pure=True)
+
+    # S1.1 Field plans -- one walk fills every registered slot
+    fp_setup = [
+        'BSK-FP-PLAN _TP  BSK-FP-SLOT _TU  BSK-FP-SLOT _TH  BSK-FP-SLOT _TN',
+        ': _TPB _TP BSK-FP-BEGIN BSK-FP-ROOT S" post" BSK-FP-BRANCH',
+        '  DUP S" uri" _TU BSK-FP-FIELD',
+        '  S" author" BSK-FP-BRANCH S" handle" _TH BSK-FP-FIELD',
+        '  BSK-FP-ROOT S" n" _TN BSK-FP-FIELD ; _TPB',
+    ]
+
+    check("BSK-FP-WALK fills nested slots",
+          fp_setup +
+          jstr('{"a":1,"post":{"uri":"u1","author":{"handle":"h1"}},"n":7}') +
+          [': _T TA _TP BSK-FP-WALK _TU BSK-FP-STR TYPE ." |"',
+           '  _TH BSK-FP-STR TYPE ." |" _TN BSK-FP-NUM . ; _T'],
+          "u1|h1|7 ")
+
+    check("BSK-FP-WALK resumes after a branch it descended into",
+          fp_setup +
+          jstr('{"post":{"author":{"handle":"h1"} , "uri":"u1"} ,"n":7}') +
+          [': _T TA _TP BSK-FP-WALK _TU BSK-FP-STR TYPE ." |"',
+           '  _TH BSK-FP-STR TYPE ." |" _TN BSK-FP-NUM . ; _T'],
+          "u1|h1|7 ")
+
+    check("BSK-FP-WALK ignores keys outside the plan path",
+          fp_setup +
+          jstr('{"x":{"uri":"bad"},"post":{"cid":"c","uri":"good"}}') +
+          [': _T TA _TP BSK-FP-WALK _TU BSK-FP-STR TYPE ; _T'],
+          None,
+          lambda out: 'good' in out and 'bad' not in out)
+
+    check("BSK-FP-WALK clears slots from the previous walk",
+          fp_setup +
+          jstr('{"post":{"author":{"handle":"h1"}}}') +
+          [': _T1 TA _TP BSK-FP-WALK ; _T1'] +
+          jstr('{"post":{"uri":"u1"}}') +
+          [': _T2 TA _TP BSK-FP-WALK _TH BSK-FP@ NIP . ; _T2'],
+          "0 ")
+
+    # S1.2 Streamed arrays -- elements handed over as they complete
+    check("Streamed array across two reads",
+          ["VARIABLE _TCN  : _TI 2DROP 1 _TCN +! ;",
+           ": _TB2 0 _TCN ! S\" feed\" S\" cursor\" ['] _TI _BSK-SA-BEGIN ; _TB2"] +
+          jstr('{"feed":[{"a":1},{"a":22}],"cursor":"cz"}') +
+          [': _T TA DROP 23 _BSK-SA-FEED DUP . _TCN @ .',
+           '  TA ROT /STRING _BSK-SA-FEED DROP _TCN @ .',
+           '  _BSK-SA-STR _BSK-SA-SLEN @ TYPE ; _T'],
+          "17 1 2 cz")
+
+    check("Streamed array is done only at the closing brace",
+          ["VARIABLE _TCN  : _TI 2DROP 1 _TCN +! ;",
+           ": _TB2 0 _TCN ! S\" feed\" S\" cursor\" ['] _TI _BSK-SA-BEGIN ; _TB2"] +
+          jstr('{"feed":[{"a":1},{"a":22}],"cursor":"cz"}') +
+          [': _T TA 1- _BSK-SA-FEED DROP _BSK-SA-DONE? . _TB2',
+           '  TA _BSK-SA-FEED DROP _BSK-SA-DONE? . _TCN @ . ; _T'],
+          "0 -1 2 ")
 
     # /STRING
     check("/STRING basic",
           [': _T S" abcdef" 2 /STRING TYPE ;', '_T'],
-          "cdef")
+          "cdef", pure=True)
 
 
 def test_stage2():
@@ -578,20 +1193,154 @@ def test_stage2():
     # S2.2 -- High-level wrappers exist (compilation check)
     check("BSK-GET word exists",
           ["' BSK-GET 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-POST-JSON word exists",
           ["' BSK-POST-JSON 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-HTTP-STATUS word exists",
           ["' BSK-HTTP-STATUS 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-LOGGED-IN? word exists",
           ["' BSK-LOGGED-IN? 0> ."],
+          "-1 ", pure=True)
+
+    check("BSK-LOGGED-IN? follows the access token",
+          ["0 BSK-ACCESS-LEN ! BSK-LOGGED-IN? .",
+           "1 BSK-ACCESS-LEN ! BSK-LOGGED-IN? . 0 BSK-ACCESS-LEN !"],
+          "0 -1 ")
+
+    # S2.3 -- Pooled keep-alive transport (offline parts)
+    check("Request line for pooled GET",
+          [': _T S" /xrpc/a" S" GET" -1 _BSK-REQ-BUILD _BSK-REQ 20 TYPE ;',
+           '_T'],
+          "GET /xrpc/a HTTP/1.1")
+
+    check("Pooled request asks for keep-alive",
+          [': _T S" /x" S" GET" -1 _BSK-REQ-BUILD',
+           '  _BSK-REQ _BSK-REQ-LEN @ S" Connection: keep-alive" _BSK-SEARCH',
+           '  0> . ;', '_T'],
+          "-1 ")
+
+    check("Pooled POST carries Content-Length",
+          [': _T S" /p" S" POST" 17 _BSK-REQ-BUILD',
+           '  _BSK-REQ _BSK-REQ-LEN @ S" Content-Length: 17" _BSK-SEARCH',
+           '  0> . ;', '_T'],
+          "-1 ")
+
+    check("Bodyless POST says Content-Length: 0",
+          [': _T S" /p" S" POST" 0 _BSK-REQ-BUILD',
+           '  _BSK-REQ _BSK-REQ-LEN @ S" Content-Length: 0" _BSK-SEARCH',
+           '  0> . ;', '_T'],
           "-1 ")
 
+    check("Dotted-quad host parses without DNS",
+          [': _T S" 10.64.0.1" _BSK-PARSE-IP . S" bsky.social" _BSK-PARSE-IP . ;',
+           '_T'],
+          "171966465 0 ", pure=True)
+
+    check("Response header lookup is case-insensitive",
+          [*jstr("HTTP/1.1 200 OK\r\nContent-Length: 42\r\n\r\n"),
+           ': _T TA S" content-length" _BSK-HDR-FIND _BSK-PARSE-DEC . ;', '_T'],
+          "42 ", pure=True)
+
+    check("Chunked body decodes in place",
+          [*jstr("3\r\nabc\r\n2\r\nde\r\n0\r\n\r\n"),
+           'TA _BSK-DECHUNK _TB SWAP TYPE'],
+          "abcde", pure=True)
+
+    check("Streamed chunks decode as they arrive",
+          ['BSK-INIT', *jstr("3\r\nabc\r\n2\r\nde\r\n0\r\n\r\n"),
+           ': _T TA BSK-RECV-BUF @ SWAP CMOVE  0 _BSK-RX-HEND !',
+           '  0 _BSK-SX-D ! 0 _BSK-SX-R ! 0 _BSK-SX-LEFT ! 0 _BSK-SX-END !',
+           '  5 _BSK-RX-LEN ! _BSK-SX-DECHUNK',
+           '  BSK-RECV-BUF @ _BSK-SX-D @ TYPE ." |"',
+           '  TA NIP _BSK-RX-LEN ! _BSK-SX-DECHUNK',
+           '  BSK-RECV-BUF @ _BSK-SX-D @ TYPE _BSK-SX-END @ . ; _T'],
+          "ab|abcde-1 ")
+
+    check("Pool counters start at zero",
+          ['BSK-POOL-HITS @ BSK-POOL-MISSES @ BSK-POOL-REDIALS @ + + .'],
+          "0 ", pure=True)
+
+    check("BSK-SET-HOST resets cached server address",
+          ['123 _BSK-SERVER-IP !',
+           ': _T S" 10.0.2.2" BSK-SET-HOST _BSK-SERVER-IP @ . BSK-HOST-LEN @ . ; _T'],
+          "0 8 ")
+
+    check("UI core takes the transport once the worker parks",
+          [': _T _BSK-TAKE . -1 _BSK-BG-ON ! -1 _BSK-BG-HELD !',
+           '  _BSK-TAKE . _BSK-BG-HOLD @ . _BSK-GIVE-BACK _BSK-BG-HOLD @ .',
+           '  0 _BSK-BG-ON ! 0 _BSK-BG-HELD ! ; _T'],
+          "-1 -1 -1 0 ")
+
+    check("Outermost public word gives the transport back",
+          [': _IN _BSK-TAKE . _BSK-BG-HOLD @ . ;',
+           ": _MID ['] _IN _BSK-UI-RUN _BSK-BG-HOLD @ . ;",
+           ': _T -1 _BSK-BG-ON ! -1 _BSK-BG-HELD !',
+           "  ['] _MID _BSK-UI-RUN _BSK-BG-HOLD @ .",
+           '  0 _BSK-BG-ON ! 0 _BSK-BG-HELD ! ; _T'],
+          "-1 -1 -1 0 ")
+
+    check("Cleanup leaves the pool to a worker that did not stop",
+          [': _T BSK-RECV-TIMEOUT @ 10 BSK-RECV-TIMEOUT !',
+           '  BSK-READY @ -1 BSK-READY !  -1 _BSK-BG-ON !',
+           '  BSK-CLEANUP BSK-READY @ .  0 _BSK-BG-ON ! 0 _BSK-BG-HALT !',
+           '  BSK-READY !  BSK-RECV-TIMEOUT ! ; _T'],
+          None,
+          lambda out: 'pool left open' in out and '-1 ' in out)
+
+    # S2.4 -- Metrics
+    check("Metrics are off by default",
+          ['BSK-METRICS? @ . BSK-STATS'],
+          "0 metrics off, endpoints 0", pure=True)
+
+    check("Endpoint is the NSID of the path",
+          [': _T S" /xrpc/app.bsky.feed.getTimeline?limit=10" _BSK-MX-NSID',
+           '  TYPE ." |" S" /xrpc/a.b" _BSK-MX-NSID TYPE ; _T'],
+          "app.bsky.feed.getTimeline|a.b", pure=True)
+
+    check("Metrics count calls, bytes, errors and fills",
+          ['BSK-METRICS-ON',
+           ': _T S" /xrpc/a.b?x=1" _BSK-MX-BEGIN HTTP-STATUS !',
+           '  -1 _BSK-RX-FULL !',
+           '  0 5 _BSK-MX-END 2DROP _BSK-MX-FILL _BSK-MX-PARSED ;',
+           '200 _T 401 _T  BSK-STATS'],
+          None,
+          lambda out: ('a.b' in out and 'calls 2 errors 1 bytes 10 ' in out
+                       and 'fills 2 ' in out))
+
+    check("Metrics judge a streamed 200 by whether it arrived whole",
+          ['BSK-METRICS-ON',
+           ': _T S" /xrpc/c.d" _BSK-MX-BEGIN 200 HTTP-STATUS ! _BSK-RX-FULL !',
+           '  100 _BSK-SX-GONE !  0 0 _BSK-MX-END 2DROP _BSK-MX-PARSED ;',
+           '-1 _T 0 _T  BSK-STATS'],
+          None,
+          lambda out: 'c.d' in out and 'calls 2 errors 1 bytes 200 ' in out)
+
+    check("Metrics rows overflow into other",
+          ['CREATE _TN 1 ALLOT',
+           ': _T 20 0 DO 65 I + _TN C! _TN 1 _BSK-MX-FIND DROP LOOP',
+           '  _BSK-MX-N @ . 3 _TN C! _TN 1 _BSK-MX-FIND .',
+           '  15 _BSK-MX-ROW DUP _BSK-MX-NAME + SWAP _BSK-MX-NLEN + @ TYPE ;',
+           '_T'],
+          "16 15 other")
+
+    check("Metrics time the stream sink and put it back",
+          ['BSK-METRICS-ON  \' DUP _BSK-RX-SINK !',
+           ': _T S" /x" _BSK-MX-BEGIN _BSK-RX-SINK @ [\'] _BSK-MX-SINK = .',
+           '  0 0 _BSK-MX-END 2DROP _BSK-RX-SINK @ [\'] DUP = . ; _T'],
+          "-1 -1 ")
+
+    check("Metrics off leaves the sink alone",
+          ['BSK-METRICS-OFF  \' DUP _BSK-RX-SINK !',
+           ': _T S" /x" BSK-METRICS? @ IF _BSK-MX-BEGIN ELSE 2DROP THEN',
+           '  0 0 _BSK-MX-END 2DROP _BSK-RX-SINK @ [\'] DUP = .',
+           '  _BSK-MX-N @ . ; _T'],
+          "-1 0 ")
+
 
 def test_stage3():
     """Stage 3: Authentication (akashic session.f wrappers)."""
@@ -601,15 +1350,15 @@ def test_stage3():
     # S3.1 -- BSK-LOGIN / BSK-REFRESH words exist
     check("BSK-LOGIN word exists",
           ["' BSK-LOGIN 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-REFRESH word exists",
           ["' BSK-REFRESH 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-LOGIN-WITH word exists",
           ["' BSK-LOGIN-WITH 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     # S3.2 -- BSK-WHO with no session
     check("BSK-WHO no session",
@@ -617,6 +1366,57 @@ def test_stage3():
            ': _T BSK-WHO ; _T'],
           "Not logged in")
 
+    # S3.3 -- Token mirror and expiry
+    check("Session response mirrors both tokens",
+          ['BSK-INIT',
+           *jstr('{"accessJwt":"aaa.bb.c", "refreshJwt" : "rrrr.s.t"}'),
+           ': _T TA BSK-RECV-BUF @ SWAP CMOVE',
+           '  BSK-RECV-BUF @ TA NIP _BSK-CAPTURE-TOKENS',
+           '  _BSK-BEARER _BSK-BEARER-LEN @ TYPE ." |"',
+           '  _BSK-RFJWT _BSK-RFJWT-LEN @ TYPE ; _T'],
+          "aaa.bb.c|rrrr.s.t")
+
+    check("Token capture stops at the received length",
+          ['BSK-INIT',
+           *jstr('{"accessJwt":"aaa.bb.c", "refreshJwt" : "rrrr.s.t"}'),
+           ': _T TA BSK-RECV-BUF @ SWAP CMOVE',
+           '  BSK-RECV-BUF @ 24 _BSK-CAPTURE-TOKENS',
+           '  _BSK-BEARER-LEN @ . _BSK-RFJWT-LEN @ . ; _T'],
+          "8 0 ")
+
+    check("JWT exp claim decodes",
+          [fx(fake_pds.make_jwt("did:plc:x", "com.atproto.access",
+                                1767225600, 1767232800))
+           + ' _BSK-JWT-EXP .',
+           'S" no-dots" _BSK-JWT-EXP .'],
+          "1767232800 0 ")
+
+    check("Session file seals and unseals the refresh token",
+          ['BSK-INIT',
+           ': _T S" alice.test" S" hunter2" _BSK-SS-KEY-SET',
+           '  S" did:plc:x" DUP BSK-DID-LEN ! BSK-DID SWAP CMOVE',
+           '  S" r.e.f" DUP _BSK-RFJWT-LEN ! _BSK-RFJWT SWAP CMOVE',
+           '  S" alice.test" DUP BSK-HANDLE-LEN ! BSK-HANDLE SWAP CMOVE',
+           '  _BSK-SS-SEAL 0 BSK-DID-LEN ! 0 _BSK-RFJWT-LEN !',
+           '  _BSK-SS-UNSEAL . BSK-DID BSK-DID-LEN @ TYPE ." |"',
+           '  _BSK-RFJWT _BSK-RFJWT-LEN @ TYPE ; _T'],
+          "-1 did:plc:x|r.e.f")
+
+    check("Session file will not open with another password",
+          ['BSK-INIT',
+           ': _T S" alice.test" S" hunter2" _BSK-SS-KEY-SET',
+           '  S" r.e.f" DUP _BSK-RFJWT-LEN ! _BSK-RFJWT SWAP CMOVE',
+           '  _BSK-SS-SEAL 0 _BSK-RFJWT-LEN !',
+           '  S" alice.test" S" hunter3" _BSK-SS-KEY-SET',
+           '  _BSK-SS-UNSEAL . _BSK-RFJWT-LEN @ . ; _T'],
+          "0 0 ")
+
+    check("Token is due inside the refresh margin",
+          ['1 BSK-ACCESS-LEN !',
+           '1 BSK-ACCESS-EXP ! BSK-TOKEN-DUE? .',
+           '0 BSK-ACCESS-EXP ! BSK-TOKEN-DUE? .'],
+          "-1 0 ")
+
 
 def test_stage4():
     """Stage 4: Read-Only Features -- timeline, profile, notifications."""
@@ -626,15 +1426,15 @@ def test_stage4():
     # S4.0 -- Display helpers
     check("Type-trunc short string",
           [': _T S" hello" 10 _BSK-TYPE-TRUNC ; _T'],
-          "hello")
+          "hello", pure=True)
 
     check("Type-trunc at limit",
           [': _T S" hello" 5 _BSK-TYPE-TRUNC ; _T'],
-          "hello")
+          "hello", pure=True)
 
     check("Type-trunc over limit",
           [': _T S" hello world" 8 _BSK-TYPE-TRUNC ; _T'],
-          "hello...")
+          "hello...", pure=True)
 
     # S4.1 -- Timeline path builder
     check("TL path without cursor",
@@ -690,15 +1490,15 @@ def test_stage4():
     # S4.2 -- Word existence checks
     check("BSK-PROFILE word exists",
           ["' BSK-PROFILE 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-TL word exists",
           ["' BSK-TL 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-TL-NEXT word exists",
           ["' BSK-TL-NEXT 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     # S4.3 -- Notification printer
     check("Notif print extracts reason",
@@ -721,7 +1521,7 @@ def test_stage4():
 
     check("BSK-NOTIF word exists",
           ["' BSK-NOTIF 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-TL requires login",
           ['BSK-INIT',
@@ -844,19 +1644,29 @@ def test_stage5():
     # S5 -- Word existence checks
     check("BSK-POST word exists",
           ["' BSK-POST 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-REPLY word exists",
           ["' BSK-REPLY 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-LIKE word exists",
           ["' BSK-LIKE 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
 
     check("BSK-REPOST word exists",
           ["' BSK-REPOST 0> ."],
-          "-1 ")
+          "-1 ", pure=True)
+
+    # S4.4 -- a stub of a loaded module runs the real word
+    check("Deferred stub hands over to bsky-write.f",
+          ['S" BSK-PENDING" S" bsky-write.f" _BSK-LAZY 1000 + .'],
+          "1000 ")
+
+    check("Loaded words are told apart from their stubs",
+          ["_BSK-STUB-LO @ _BSK-STUB? . ' BSK-PENDING _BSK-STUB? .",
+           "' _BSK-LAZY _BSK-STUB? ."],
+          "-1 0 0 ", pure=True)
 
     # S5.2 -- BSK-POST requires login
     check("BSK-POST requires login",
@@ -886,12 +1696,12 @@ def test_stage5():
     check("BSK-FOLLOW word exists",
           [': _T S" test" BSK-FOLLOW ; '],
           None,
-          lambda out: "login first" in out or "?" not in out)
+          lambda out: "login first" in out or "?" not in out, pure=True)
 
     check("BSK-UNFOLLOW word exists",
           [': _T S" abc123" BSK-UNFOLLOW ; '],
           None,
-          lambda out: "login first" in out or "?" not in out)
+          lambda out: "login first" in out or "?" not in out, pure=True)
 
     # S5.5 -- _BSK-DR-OPEN (deleteRecord JSON builder)
     check("_BSK-DR-OPEN builds deleteRecord JSON",
@@ -910,25 +1720,26 @@ def test_stage5():
            '  ." rkey=" TYPE CR ." col=" TYPE CR',
            '  ELSE ." FAIL" THEN ; _T'],
           None,
-          lambda out: 'rkey=3xyz' in out and 'col=app.bsky.feed.post' in out)
+          lambda out: 'rkey=3xyz' in out and 'col=app.bsky.feed.post' in out,
+          pure=True)
 
     check("_BSK-URI-PARSE no slashes fails",
           [': _T S" noslashes" _BSK-URI-PARSE IF',
            '  ." OK" ELSE ." FAIL" THEN ; _T'],
-          "FAIL")
+          "FAIL", pure=True)
 
     check("_BSK-RFIND-SLASH finds last slash",
           [': _T S" a/b/c" _BSK-RFIND-SLASH . ; _T'],
-          "3")
+          "3", pure=True)
 
     check("_BSK-RFIND-SLASH no slash returns -1",
           [': _T S" abc" _BSK-RFIND-SLASH . ; _T'],
-          "-1")
+          "-1", pure=True)
 
     check("BSK-DELETE word exists",
           [': _T S" at://x/y/z" BSK-DELETE ; '],
           None,
-          lambda out: "login first" in out or "?" not in out)
+          lambda out: "login first" in out or "?" not in out, pure=True)
 
     # S5.6 -- BSK-DELETE end-to-end JSON
     check("BSK-DELETE parses URI and builds deleteRecord JSON",
@@ -942,6 +1753,56 @@ def test_stage5():
                       and '"collection":"app.bsky.feed.post"' in out
                       and '"rkey":"3xyz789"' in out))
 
+    # S5.7 -- Write queue
+    q_setup = (
+        did_setup +
+        ['CREATE _QU 256 ALLOT  VARIABLE _QUL',
+         'CREATE _QC 256 ALLOT  VARIABLE _QCL'] +
+        jstr('at://did:plc:abc/app.bsky.feed.post/3xyz') +
+        ['TA DUP _QUL !  _QU SWAP CMOVE'] +
+        jstr('bafyq') +
+        ['TA DUP _QCL !  _QC SWAP CMOVE']
+    )
+
+    check("Queued like is held without a round trip",
+          q_setup +
+          [': _T _QU _QUL @ _QC _QCL @ _BSK-Q-LIKE . BSK-PENDING . ; _T'],
+          "-1 1 ")
+
+    check("applyWrites batch carries create and delete ops",
+          q_setup +
+          [': _T _QU _QUL @ _QC _QCL @ _BSK-Q-LIKE DROP',
+           '  _QU _QUL @ _BSK-Q-DEL DROP',
+           '  _BSK-Q-BUILD . BSK-TYPE ; _T'],
+          None,
+          lambda out: ('2 {"repo":' in out
+                       and '"writes":[' in out
+                       and 'applyWrites#create' in out
+                       and '"value":{"$type":"app.bsky.feed.like"' in out
+                       and 'applyWrites#delete' in out
+                       and '"rkey":"3xyz"' in out))
+
+    check("Only a refused batch is resent op by op",
+          [': _T BSK-HTTP-STATUS @',
+           '  200 BSK-HTTP-STATUS ! -1 _BSK-Q-VERDICT .',
+           '  400 BSK-HTTP-STATUS ! 0 _BSK-Q-VERDICT .',
+           '  0 BSK-HTTP-STATUS ! 0 _BSK-Q-VERDICT .',
+           '  503 BSK-HTTP-STATUS ! 0 _BSK-Q-VERDICT .',
+           '  BSK-HTTP-STATUS ! ; _T'],
+          "-1 0 1 1 ")
+
+    check("A batch that never reached the server stays queued",
+          [': _T BSK-HTTP-STATUS @  0 BSK-HTTP-STATUS !',
+           '  -1 _BSK-RQ-UNSENT ! 0 _BSK-Q-VERDICT .',
+           '  0 _BSK-RQ-UNSENT ! BSK-HTTP-STATUS ! ; _T'],
+          "2 ")
+
+    check("BSK-FLUSH keeps ops while logged out",
+          q_setup +
+          [': _T _QU _QUL @ _QC _QCL @ _BSK-Q-LIKE DROP',
+           '  BSK-FLUSH BSK-PENDING . _BSK-Q-MSG _BSK-Q-MSG-LEN @ TYPE ; _T'],
+          "1 not logged in")
+
 
 def test_stage6():
     """Test S6 Interactive TUI (cache data model, accessors, renderers)."""
@@ -951,19 +1812,19 @@ def test_stage6():
 
     check("TL cache init zero",
           ['_BSK-TL-N @ .'],
-          "0 ")
+          "0 ", pure=True)
 
     check("NF cache init zero",
           ['_BSK-NF-N @ .'],
-          "0 ")
+          "0 ", pure=True)
 
     check("PR cache init zero",
           ['_BSK-PR-OK @ .'],
-          "0 ")
+          "0 ", pure=True)
 
     check("Screen registered (10 total)",
           ['NSCREENS @ .'],
-          "10 ")
+          "10 ", pure=True)
 
     # -- S6.2 Cache accessors: roundtrip store/fetch --
 
@@ -1013,7 +1874,7 @@ def test_stage6():
            ': _TISO 0 _BSK-TL-HANDLE TYPE ." |" 1 _BSK-TL-HANDLE TYPE ." |" 2 _BSK-TL-HANDLE TYPE ; _TISO'],
           "A|B|C")
 
-    check("TL handle truncation",
+    check("TL long handle kept whole",
           ['TR',
            '65 TC 66 TC 67 TC 68 TC 69 TC 70 TC 71 TC 72 TC',
            '65 TC 66 TC 67 TC 68 TC 69 TC 70 TC 71 TC 72 TC',
@@ -1022,7 +1883,57 @@ def test_stage6():
            '65 TC 66 TC 67 TC 68 TC',
            'TA 4 _BSK-TL-H!',
            '4 _BSK-TL-HANDLE DUP .'],
-          "32 ")
+          "36 ")
+
+    check("NF long reason kept whole",
+          ['TR',
+           '65 TC 66 TC 67 TC 68 TC 69 TC 70 TC 71 TC 72 TC',
+           '65 TC 66 TC 67 TC 68 TC 69 TC 70 TC 71 TC 72 TC',
+           '65 TC 66 TC 67 TC 68 TC 69 TC',
+           'TA 0 _BSK-NF-R!',
+           '0 _BSK-NF-REASON NIP .'],
+          "21 ")
+
+    check("Arena strings packed end to end",
+          ['_BSK-TL-RB _BSK-TL-CLEAR',
+           'TR 97 TC 98 TC TA 0 _BSK-TL-T!',
+           'TR 99 TC TA 0 _BSK-TL-U!',
+           '_BSK-TL-RB _BSK-TL-USED .',
+           '0 2 _BSK-TL-RB _BSK-TL-PAIR @ .'],
+          "3 2 ")
+
+    check("Handle interned once",
+          ['TR 122 TC 101 TC 100 TC TA 5 _BSK-TL-H!',
+           '_BSK-IN-N @',
+           'TR 122 TC 101 TC 100 TC TA 6 _BSK-TL-H!',
+           '_BSK-IN-N @ = .  5 _BSK-TL-HID 6 _BSK-TL-HID = .'],
+          "-1 -1 ")
+
+    check("TL and NF share handle IDs",
+          ['TR 122 TC 101 TC 100 TC TA 5 _BSK-TL-H!',
+           'TR 122 TC 101 TC 100 TC TA 2 _BSK-NF-H!',
+           '5 _BSK-TL-HID 2 _BSK-NF-HID = .  2 _BSK-NF-HANDLE TYPE'],
+          "-1 zed")
+
+    check("Full intern table keeps the handle inline",
+          ['_BSK-IN-N @ _BSK-IN-CAP _BSK-IN-N !',
+           'TR 113 TC 117 TC 121 TC TA 5 _BSK-TL-H!',
+           ': _T 5 _BSK-TL-HID 0< . 5 _BSK-TL-HANDLE TYPE',
+           '  5 5 _BSK-TL-SAME? . ; _T',
+           '_BSK-IN-N !'],
+          "-1 quy0 ")
+
+    check("Same author by DID",
+          ['TR 100 TC 58 TC 120 TC TA 5 _BSK-TL-D!',
+           'TR 100 TC 58 TC 120 TC TA 6 _BSK-TL-D!',
+           'TR 100 TC 58 TC 121 TC TA 7 _BSK-TL-D!',
+           '5 6 _BSK-TL-SAME? .  5 7 _BSK-TL-SAME? .'],
+          "-1 0 ")
+
+    check("BSK-MEM reports bytes",
+          ['BSK-MEM'],
+          None,
+          lambda out: 'bytes (slots' in out and 'XMEM' in out)
 
     # -- S6.2 Status message --
 
@@ -1054,7 +1965,130 @@ def test_stage6():
           None,
           lambda out: 'follow|bob.bsky.social' in out)
 
-    # -- S6.4 Row renderers --
+    # -- S6.3 Timeline history --
+
+    check("Carry evicts oldest page to fit budget",
+          ['_BSK-TL-RB _BSK-TL-CLEAR  _BSK-TL-RB _BSK-TL-PAGE+',
+           'TR 97 TC 97 TC 97 TC 97 TC 97 TC 97 TC 97 TC 97 TC',
+           'TA 0 _BSK-TL-T!  TA 1 _BSK-TL-T!',
+           '2 _BSK-TL-N !  _BSK-TL-RB _BSK-TL-PAGE+',
+           'TR 98 TC 111 TC 98 TC TA 2 _BSK-TL-T!',
+           '3 _BSK-TL-N !  _BSK-TL-PG-RESERVE 10 + BSK-TL-BUDGET !',
+           ': _T _BSK-TL-RB _BSK-TL-GEN @ 1 XOR _BSK-TL-BLK _BSK-TL-CARRY',
+           '  _BSK-TL-PUBLISH _BSK-TL-N @ . _BSK-TL-RB _BSK-TLB-DROP + @ .',
+           '  0 _BSK-TL-TEXT TYPE ; _T',
+           '32768 BSK-TL-BUDGET !'],
+          None,
+          lambda out: '1 2 bob' in out)
+
+    check("Splice puts history under new posts",
+          ['_BSK-TL-RB _BSK-TL-CLEAR  _BSK-TL-RB _BSK-TL-PAGE+',
+           'TR 111 TC 108 TC 100 TC TA 0 _BSK-TL-T!  1 _BSK-TL-N !',
+           '_BSK-TL-GEN @ 1 XOR _BSK-TL-WG !',
+           '_BSK-TL-WB _BSK-TL-CLEAR  _BSK-TL-WB _BSK-TL-PAGE+',
+           'TR 110 TC 101 TC 119 TC TA 0 _BSK-TL-T!  1 _BSK-TL-WN !',
+           ': _T _BSK-TL-RB _BSK-TL-WB _BSK-TL-MERGE',
+           '  _BSK-TL-GEN @ _BSK-TL-WG !  _BSK-TL-PUBLISH',
+           '  _BSK-TL-N @ . _BSK-TL-RB _BSK-TLB-NP + @ .',
+           '  _BSK-TL-RB _BSK-TLB-DROP + @ .',
+           '  0 _BSK-TL-TEXT TYPE 1 _BSK-TL-TEXT TYPE ; _T'],
+          None,
+          lambda out: '2 1 -1 newold' in out)
+
+    check("Splice drops oldest pages and takes their cursor",
+          ['_BSK-TL-RB _BSK-TL-CLEAR',
+           ': _F 20 0 DO _BSK-TL-RB _BSK-TL-PAGE+ 1 _BSK-TL-N +!',
+           '  I BSK-TL-CURSOR C! 1 BSK-TL-CURSOR-LEN !',
+           '  _BSK-TL-RB _BSK-TL-PC! LOOP ; _F',
+           '_BSK-TL-GEN @ 1 XOR _BSK-TL-WG !',
+           '_BSK-TL-WB _BSK-TL-CLEAR  _BSK-TL-WB _BSK-TL-PAGE+',
+           '_BSK-TL-WB _BSK-TLB-IX + 10 _BSK-TLE-SIZE * 0 FILL',
+           '10 _BSK-TL-WN !',
+           ': _T _BSK-TL-RB _BSK-TL-WB _BSK-TL-MERGE',
+           '  _BSK-TL-WN @ . _BSK-TL-WB _BSK-TLB-NP + @ .',
+           '  BSK-TL-CURSOR C@ . _BSK-TL-RCL @ . ; _T',
+           '_BSK-TL-GEN @ _BSK-TL-WG !  0 BSK-TL-CURSOR-LEN !'],
+          None,
+          lambda out: '29 19 18 0 ' in out)
+
+    check("Item room counts only the fields stored",
+          jstr('{"post":{"uri":"at://x","cid":"c","author":{"handle":"bob.test"},"record":{"text":"hi","langs":["en","fr","de"]}},"reason":{"by":"someone"}}') +
+          [': _T TA _BSK-TL-PLAN BSK-FP-WALK _BSK-TL-NEED . ; _T'],
+          "9 ")
+
+    check("Page stored short resumes after its last post",
+          jstr('{"post":{"uri":"at://x","cid":"cid2","author":{"handle":"bob.test"},"record":{"text":"hi"}}}') +
+          ['S" cid2" DUP _BSK-TL-RCL ! _BSK-TL-RCID SWAP CMOVE',
+           ': _T TA _BSK-TL-PLAN BSK-FP-WALK _BSK-TL-RESUME? .',
+           '  1 _BSK-TL-RCL ! _BSK-TL-RESUME? . ; _T',
+           '0 _BSK-TL-RCL !'],
+          "-1 0 ")
+
+    check("n on last post requests next page",
+          ['0 SUBSCREEN-ID !  1 _BSK-TL-N !  0 SCR-SEL !',
+           ': _T 110 BSKY-KEYS . _BSK-BG-WANT-MORE @ . ; _T',
+           '0 _BSK-BG-WANT-MORE !'],
+          None,
+          lambda out: '0 -1 ' in out)
+
+    # -- S6.4 Background refresh --
+
+    check("Back generation hidden until swap",
+          jstr('{"post":{"uri":"at://x","cid":"c","author":{"handle":"bob.test"},"record":{"text":"hi"}}}') +
+          ['0 _BSK-TL-N !',
+           '_BSK-TL-GEN @ 1 XOR _BSK-TL-WG !',
+           'TA 0 _BSK-TL-CACHE-ITEM  1 _BSK-TL-WN !',
+           '_BSK-TL-GEN @ _BSK-TL-WG !  -1 _BSK-TL-FRESH !',
+           ': _T _BSK-TL-N @ . _BSK-CACHE-SWAP _BSK-TL-N @ .',
+           '  0 _BSK-TL-HANDLE TYPE _BSK-TL-FRESH @ . ; _T'],
+          None,
+          lambda out: '0 1 bob.test0 ' in out)
+
+    check("Publish flips generation without copying",
+          [': _T _BSK-TL-GEN @ _BSK-TL-BLK',
+           '  _BSK-TL-PUBLISH DUP _BSK-TL-GEN @ _BSK-TL-BLK <> .',
+           '  _BSK-TL-PUBLISH _BSK-TL-GEN @ _BSK-TL-BLK = . ; _T'],
+          None,
+          lambda out: '-1 -1 ' in out)
+
+    check("f only requests a fetch when worker runs",
+          ['0 SUBSCREEN-ID !  -1 _BSK-BG-ON !',
+           ': _T 102 BSKY-KEYS DROP _BSK-BG-WANT-TL @ . _BSK-BG-WANT-NF @ . ; _T',
+           '0 _BSK-BG-ON !  0 _BSK-BG-WANT-TL !  0 _BSK-BG-WANT-Q !'],
+          None,
+          lambda out: '-1 0 ' in out)
+
+    check("UI core uses builder slot 0",
+          ['_BSK-CORE . BSK-BUF _BSK-BUFS = .'],
+          "0 -1 ", pure=True)
+
+    # -- S6.5 Frame output --
+
+    check("Frame text wraps at a space or line feed",
+          [': _T S" aaa bbb ccc" 6 _BSK-FR-BREAK .',
+           '  S" ab\\ncd" _BSK-FR-DECODE 10 _BSK-FR-BREAK . ; _T'],
+          "3 2 ")
+
+    check("Frame text decodes \\r and \\uXXXX escapes as UTF-8",
+          [': _T S" a\\u00e9b\\rc\\u2603d\\u0007" _BSK-FR-DECODE',
+           '  DUP . 0 DO DUP I + C@ . LOOP DROP ; _T'],
+          "11 97 195 169 98 32 99 226 152 131 100 63 ", pure=True)
+
+    check("Frame text joins a surrogate pair, not a lone half",
+          [': _T S" \\ud83d\\ude00!\\ud83dx\\ude00" _BSK-FR-DECODE',
+           '  DUP . 0 DO DUP I + C@ . LOOP DROP ; _T'],
+          "8 240 159 152 128 33 63 120 63 ", pure=True)
+
+    check("Frame row hash tracks the selection",
+          jstr('{"post":{"uri":"at://x","cid":"c","author":{"handle":"alice.test"},"record":{"text":"one"}}}') +
+          ['TA 0 _BSK-TL-CACHE-ITEM  TA 1 _BSK-TL-CACHE-ITEM',
+           '2 _BSK-TL-N !  0 SCR-SEL !  0 SUBSCREEN-ID !  SCR-BSKY-TL',
+           ': _T _BSK-FR-SHADOW 2 CELLS + @  1 SCR-SEL ! _BSK-FR-UPDATE',
+           '  _BSK-FR-SHADOW 2 CELLS + @ <> . BSK-FR-LAST @ 0> . ; _T'],
+          None,
+          lambda out: '-1 -1 ' in out)
+
+    # -- S6.6 Row renderers --
 
     check("TL row renderer",
           jstr('{"post":{"uri":"at://x","cid":"c","author":{"handle":"alice.test"},"record":{"text":"My first post"}}}') +
@@ -1072,7 +2106,7 @@ def test_stage6():
           None,
           lambda out: 'like' in out and '@charlie.bsky.social' in out)
 
-    # -- S6.5 Screen renderers --
+    # -- S6.7 Screen renderers --
 
     check("TL screen empty",
           ['0 _BSK-TL-N !',
@@ -1101,7 +2135,22 @@ def test_stage6():
           None,
           lambda out: 'Profile' in out and 'fetch' in out.lower())
 
-    # -- S6.6 Key handler --
+    check("Stats screen with metrics off",
+          ['BSK-METRICS-OFF BSK-STATS-RESET',
+           'SCR-BSKY-STATS'],
+          None,
+          lambda out: 'Stats' in out and 'Metrics are off' in out)
+
+    check("Stats screen lists endpoints",
+          ['BSK-METRICS-ON',
+           ': _T S" /xrpc/app.bsky.actor.getProfile" _BSK-MX-BEGIN',
+           '  200 HTTP-STATUS ! 0 2048 _BSK-MX-END 2DROP ; _T',
+           'SCR-BSKY-STATS'],
+          None,
+          lambda out: ('app.bsky.actor.getProfile' in out
+                       and 'x1 ' in out and '2 KB' in out))
+
+    # -- S6.8 Key handler --
 
     check("Unknown key not consumed",
           ['0 SUBSCREEN-ID !',
@@ -1113,31 +2162,922 @@ def test_stage6():
            ': TKL2  108 BSKY-KEYS . ; TKL2'],
           "0 ")
 
-    # -- S6.7 Registration --
+    check("Key m toggles metrics on stats sub",
+          ['3 SUBSCREEN-ID !  BSK-METRICS-OFF',
+           ': TKM  109 BSKY-KEYS DROP BSK-METRICS? @ .',
+           '  109 BSKY-KEYS DROP BSK-METRICS? @ . ; TKM'],
+          None,
+          lambda out: '-1 0 ' in out)
+
+    check("Key z zeroes metrics on stats sub",
+          ['3 SUBSCREEN-ID !  BSK-METRICS-ON',
+           ': TKZ  S" /x" _BSK-MX-BEGIN 0 0 _BSK-MX-END 2DROP',
+           '  _BSK-MX-N @ . 122 BSKY-KEYS DROP _BSK-MX-N @ . ; TKZ'],
+          None,
+          lambda out: '1 0 ' in out)
+
+    check("n on a frame resends only the rows it changed",
+          jstr('{"post":{"uri":"at://did:plc:x/app.bsky.feed.post/alice","cid":"c","author":{"handle":"alice.test"},"record":{"text":"A first post that runs on for a while"}}}') +
+          ['TA 0 _BSK-TL-CACHE-ITEM'] +
+          jstr('{"post":{"uri":"at://did:plc:x/app.bsky.feed.post/bob","cid":"c","author":{"handle":"bob.test"},"record":{"text":"Second post, also with some length"}}}') +
+          ['TA 1 _BSK-TL-CACHE-ITEM'] +
+          jstr('{"post":{"uri":"at://did:plc:x/app.bsky.feed.post/carol","cid":"c","author":{"handle":"carol.test"},"record":{"text":"Third"}}}') +
+          ['TA 2 _BSK-TL-CACHE-ITEM',
+           '3 _BSK-TL-N !  0 SCR-SEL !  0 SUBSCREEN-ID !  SCR-BSKY-TL',
+           ': _T 110 BSKY-KEYS . SCR-SEL @ .',
+           '  BSK-FR-LAST @ 0> . BSK-FR-LAST @ BSK-FR-WHOLE @ < .',
+           '  _BSK-FR-UPDATE BSK-FR-LAST @ . ; _T'],
+          None,
+          lambda out: '-1 1 -1 -1 0 ' in out)
+
+    check("p on the first row of a frame stays put",
+          jstr('{"post":{"uri":"at://did:plc:x/app.bsky.feed.post/alice","cid":"c","author":{"handle":"alice.test"},"record":{"text":"hi"}}}') +
+          ['TA 0 _BSK-TL-CACHE-ITEM',
+           '1 _BSK-TL-N !  0 SCR-SEL !  0 SUBSCREEN-ID !  SCR-BSKY-TL',
+           ': _T 112 BSKY-KEYS . SCR-SEL @ . ; _T'],
+          None,
+          lambda out: '-1 0 ' in out)
+
+    check("Open post draws in the frame with line breaks",
+          jstr('{"post":{"uri":"at://did:plc:x/app.bsky.feed.post/alice","cid":"c","author":{"handle":"alice.test"},"record":{"text":"line one\\nline two"}}}') +
+          ['TA 0 _BSK-TL-CACHE-ITEM',
+           '1 _BSK-TL-N !  0 SCR-SEL !  0 SUBSCREEN-ID !  SCR-BSKY-TL',
+           '0 _BSK-FR-VIEW'],
+          None,
+          lambda out: ('line one\x1b[K' in out and 'line two' in out
+                       and '\x1b[2J' not in out))
+
+    # -- S6.9 Registration --
 
     check("Bsky screen selectable",
           ['_BSK-SCR-ID @ CELLS SCR-FLAGS + @ .'],
-          "1 ")
+          "1 ", pure=True)
 
-    check("Bsky has 4 subscreens",
+    check("Bsky has 5 subscreens",
           ['_BSK-SCR-ID @ CELLS SUB-COUNTS + @ .'],
-          "4 ")
+          "5 ", pure=True)
+
+
+# Guest side of the stand-in network (fake_pds): the static setup
+# autoexec.f falls back to, and plain HTTP to 10.64.0.1:8443.
+_NET_SETUP = [
+    '10 64 0 2 IP-SET',
+    '10 GW-IP C!  64 GW-IP 1+ C!  0 GW-IP 2 + C!  1 GW-IP 3 + C!',
+    '255 NET-MASK C!  255 NET-MASK 1+ C!  255 NET-MASK 2 + C!'
+    '  0 NET-MASK 3 + C!',
+    '0 BSK-TLS? !  8443 BSK-PORT !',
+    ': _TH S" 10.64.0.1" BSK-SET-HOST ; _TH',
+]
+
+
+def _session_lines(handle, did, access, refresh=""):
+    """Lines that install a createSession result the way
+    _BSK-SYNC-SESSION does, without the round trip.  The access
+    token's expiry is left unknown, so nothing is renewed ahead."""
+    return _NET_SETUP + [
+        ': _TLOGIN  BSK-INIT',
+        f'  {fx(handle)} DUP BSK-HANDLE-LEN ! BSK-HANDLE SWAP CMOVE',
+        f'  {fx(did)} DUP BSK-DID-LEN ! BSK-DID SWAP CMOVE',
+        f'  {fx(access)} DUP _BSK-BEARER-LEN ! _BSK-BEARER SWAP CMOVE',
+        f'  {fx(refresh)} DUP _BSK-RFJWT-LEN ! _BSK-RFJWT SWAP CMOVE',
+        '  1 BSK-ACCESS-LEN ! ;',
+        '_TLOGIN',
+    ]
+
+
+def _net_login(net=True):
+    """Lines that leave the stand-in account logged in."""
+    app, _ = fake_server(net)
+    return _session_lines(app.HANDLE, app.DID, app.access, app.refresh)
+
+
+_TL_STATUS = '_BSK-STATUS _BSK-STATUS-LEN @ TYPE'
+
+
+def test_stage7():
+    """Test S7 Offline end-to-end flows against the stand-in server."""
+    print("-- Stage 7: Offline end-to-end (fake XRPC) --\n")
+
+    check("E2E timeline fetch fills the cache",
+          _net_login() +
+          ['_BSK-TL-FETCH _BSK-TL-N @ . 0 _BSK-TL-HANDLE TYPE CR',
+           _TL_STATUS],
+          None,
+          lambda out: '10 author0.test' in out and 'Timeline loaded' in out,
+          net=True)
+
+    check("E2E next page reuses the pooled connection",
+          _net_login() +
+          ['_BSK-TL-FETCH _BSK-TL-MORE _BSK-TL-N @ . BSK-POOL-STATS'],
+          None,
+          lambda out: '20 ' in out and 'hits 1 misses 1 ' in out,
+          net=True)
+
+    check("E2E connection the server dropped is redialled",
+          _net_login({"drop_after": 1}) +
+          ['_BSK-TL-FETCH _BSK-TL-MORE _BSK-TL-N @ . BSK-POOL-STATS',
+           _TL_STATUS],
+          None,
+          lambda out: ('20 ' in out and 'redials 1 ' in out
+                       and 'HTTP' not in out),
+          net={"drop_after": 1})
+
+    check("E2E POST on a connection dropped unanswered is resent",
+          _net_login({"drop_idle": 1}) +
+          ['_BSK-TL-FETCH',
+           ': _T S" after the drop" BSK-POST ; _T',
+           'BSK-POOL-STATS _BSK-TL-FETCH 0 _BSK-TL-TEXT TYPE'],
+          None,
+          lambda out: ('Posted!' in out and 'redials 1 ' in out
+                       and 'after the drop' in out),
+          net={"drop_idle": 1})
+
+    check("E2E refresh with nothing new",
+          _net_login() +
+          ['_BSK-TL-FETCH _BSK-TL-FETCH _BSK-TL-N @ .', _TL_STATUS],
+          None,
+          lambda out: '10 ' in out and 'No new posts' in out,
+          net=True)
+
+    check("E2E page with no room for its first post changes nothing",
+          _net_login() +
+          ['BSK-TL-BUDGET @ 16 BSK-TL-BUDGET !',
+           '_BSK-TL-FETCH _BSK-TL-N @ . _BSK-TL-RCL @ .'
+           ' BSK-TL-CURSOR-LEN @ .', _TL_STATUS,
+           'BSK-TL-BUDGET ! _BSK-TL-FETCH CR _BSK-TL-N @ .'],
+          None,
+          lambda out: ('0 0 0 No room for the next post' in out
+                       and '\n10 ' in out),
+          net=True)
+
+    check("E2E notifications fetch",
+          _net_login() +
+          ['_BSK-NF-FETCH _BSK-NF-N @ . 0 _BSK-NF-REASON TYPE'],
+          "10 like",
+          net=True)
+
+    check("E2E metrics per endpoint",
+          _net_login() +
+          ['BSK-METRICS-ON _BSK-TL-FETCH _BSK-TL-MORE _BSK-NF-FETCH BSK-STATS'],
+          None,
+          lambda out: ('app.bsky.feed.getTimeline' in out
+                       and 'calls 2 errors 0 ' in out
+                       and 'fills 20 ' in out
+                       and 'app.bsky.notification.listNotifications' in out
+                       and 'fills 10 ' in out),
+          net=True)
+
+    check("E2E profile fetch",
+          _net_login() + ['_BSK-PR-FETCH .BSK-PR-HA'],
+          "@alice.test",
+          net=True)
+
+    check("E2E post shows up at the top of the timeline",
+          _net_login() +
+          [': _T S" hello from the stand-in" BSK-POST ; _T',
+           '_BSK-TL-FETCH 0 _BSK-TL-HANDLE TYPE 0 _BSK-TL-TEXT TYPE'],
+          None,
+          lambda out: ('Posted!' in out
+                       and 'alice.testhello from the stand-in' in out),
+          net=True)
+
+    check("E2E like and delete own post",
+          _net_login() +
+          [': _T S" short-lived" BSK-POST ; _T',
+           '_BSK-TL-FETCH',
+           '1 _BSK-TL-URI 1 _BSK-TL-CID BSK-LIKE',
+           '0 _BSK-TL-URI BSK-DELETE'],
+          None,
+          lambda out: 'Liked!' in out and 'Deleted!' in out,
+          net=True)
+
+    check("E2E queued writes flush as one applyWrites",
+          _net_login() +
+          ['_BSK-TL-FETCH',
+           ': _T 0 _BSK-TL-URI 0 _BSK-TL-CID _BSK-Q-LIKE DROP',
+           '  1 _BSK-TL-URI 1 _BSK-TL-CID _BSK-Q-REPOST DROP',
+           '  BSK-FLUSH BSK-QUEUE ; _T'],
+          "0 pending, 2 sent, 0 failed",
+          net=True)
+
+    check("E2E writes the server never got stay queued",
+          _net_login({"refuse": True}) +
+          [': _T S" at://did:plc:abc/app.bsky.feed.post/3xyz"',
+           '  S" bafyq" 2OVER 2OVER _BSK-Q-LIKE DROP _BSK-Q-REPOST DROP',
+           '  BSK-FLUSH BSK-QUEUE ; _T'],
+          None,
+          lambda out: ('2 pending, 0 sent, 0 failed' in out
+                       and 'not sent, kept' in out),
+          net={"refuse": True})
+
+    check("E2E chunked responses decode while streaming",
+          _net_login({"chunked": True, "chunk_size": 300}) +
+          ['_BSK-TL-FETCH _BSK-TL-N @ . 9 _BSK-TL-HANDLE TYPE'],
+          "10 author0.test",
+          net={"chunked": True, "chunk_size": 300})
+
+    check("E2E fetch survives network latency",
+          _net_login({"latency": 200_000}) +
+          ['_BSK-TL-FETCH _BSK-TL-N @ .'],
+          "10 ",
+          net={"latency": 200_000})
+
+    check("E2E token that stays expired reports the HTTP status",
+          _net_login({"access_ttl": 0}) +
+          ['_BSK-TL-FETCH _BSK-TL-N @ . BSK-RESENDS @ .', _TL_STATUS],
+          "0 1 HTTP 400",
+          net={"access_ttl": 0})
+
+    check("E2E rejected token renews and resends once",
+          _net_login() +
+          ['88 _BSK-BEARER 40 + C!',
+           '_BSK-TL-FETCH _BSK-TL-N @ . BSK-RENEWS @ . BSK-RESENDS @ .',
+           _TL_STATUS],
+          None,
+          lambda out: '10 1 1 ' in out and 'Timeline loaded' in out,
+          net=True)
+
+    check("E2E due token renews before the call goes out",
+          _net_login() +
+          ['1 BSK-ACCESS-EXP !',
+           '_BSK-TL-FETCH _BSK-TL-N @ . BSK-RENEWS @ . BSK-RESENDS @ .'],
+          "10 1 0 ",
+          net=True)
+
+    check("E2E saved session resumes with one refreshSession",
+          _net_login() +
+          [': _T S" alice.test" S" hunter2" _BSK-SS-KEY-SET',
+           '  BSK-SAVE-SESSION . ; _T',
+           '0 BSK-ACCESS-LEN ! 0 _BSK-BEARER-LEN ! 0 _BSK-RFJWT-LEN !',
+           '0 BSK-DID-LEN ! 0 BSK-HANDLE-LEN !',
+           'BSK-LOGGED-IN? .',
+           ': _T S" alice.test" S" hunter2" BSK-RESUME .',
+           '  BSK-HANDLE BSK-HANDLE-LEN @ TYPE ; _T',
+           'BSK-LOGGED-IN? . _BSK-TL-FETCH _BSK-TL-N @ . BSK-POOL-STATS'],
+          None,
+          lambda out: ('-1 0 -1 alice.test-1 ' in out and '10 ' in out
+                       and 'hits 1 misses 1 ' in out),
+          net=True)
+
+    check("E2E BSK-REFRESH renews over the pool",
+          _net_login() +
+          ['BSK-REFRESH _BSK-TL-FETCH _BSK-TL-N @ . BSK-POOL-STATS'],
+          None,
+          lambda out: ('tokens refreshed' in out and '10 ' in out
+                       and 'hits 1 misses 1 ' in out),
+          net=True)
+
+
+# ---------------------------------------------------------------------------
+#  Benchmarks  (test_bsky.py --bench)
+# ---------------------------------------------------------------------------
+
+# A representative getTimeline feed item (trimmed: no embeds).
+_BENCH_FEED_ITEM = (
+    '{"post":{"uri":"at://did:plc:bench/app.bsky.feed.post/3kbench",'
+    '"cid":"bafyreibench","author":{"did":"did:plc:bench",'
+    '"handle":"bench.bsky.social","displayName":"Bench"},'
+    '"record":{"$type":"app.bsky.feed.post","text":"Benchmark post body",'
+    '"createdAt":"2026-01-01T00:00:00.000Z"},"replyCount":0,'
+    '"repostCount":1,"likeCount":3}}'
+)
+
+# Pre-plan item parser: one JSON-FIND-KEY rescan per field.
+_BENCH_LEGACY_ITEM = [
+    ': _BOLD  ( a l -- )',
+    '  S" post" JSON-FIND-KEY DUP 0= IF 2DROP EXIT THEN',
+    '  2DUP S" uri" JSON-FIND-KEY DUP 0> IF JSON-GET-STRING THEN 2DROP',
+    '  2DUP S" cid" JSON-FIND-KEY DUP 0> IF JSON-GET-STRING THEN 2DROP',
+    '  2DUP S" author" JSON-FIND-KEY DUP 0> IF',
+    '    S" handle" JSON-FIND-KEY DUP 0> IF JSON-GET-STRING THEN THEN 2DROP',
+    '  S" record" JSON-FIND-KEY DUP 0> IF',
+    '    S" text" JSON-FIND-KEY DUP 0> IF JSON-GET-STRING THEN THEN 2DROP ;',
+    ': _BNEW  ( a l -- )  _BSK-TL-PLAN BSK-FP-WALK',
+    '  _BSK-TLF-URI BSK-FP-STR 2DROP  _BSK-TLF-CID BSK-FP-STR 2DROP',
+    '  _BSK-TLF-HANDLE BSK-FP-STR 2DROP  _BSK-TLF-TEXT BSK-FP-STR 2DROP ;',
+    ': _BNOP  ( a l -- )  2DROP ;',
+]
+
+
+def _bench_cycles(setup, body, nop, n):
+    """Cycles per iteration of *body*, net of a loop running *nop*
+    after the same *setup* lines."""
+    loop = f': _BLOOP {n} 0 DO {{}} LOOP ; _BLOOP'
+    _, base = run_forth_cycles(setup + [loop.format(nop)])
+    _, cyc = run_forth_cycles(setup + [loop.format(body)])
+    return (cyc - base) / n
+
+
+def _bench_per_item(word, n=50):
+    """Cycles per call of *word* on the bench feed item, net of the
+    loop and setup overhead (measured against _BNOP)."""
+    setup = jstr(_BENCH_FEED_ITEM) + _BENCH_LEGACY_ITEM
+    return _bench_cycles(setup, f'TA {word}', 'TA _BNOP', n)
+
+
+def bench_field_plan():
+    """Compare the field-plan walk with the JSON-FIND-KEY chain."""
+    print("-- Bench: feed item parse (cycles per item) --\n")
+    legacy = _bench_per_item('_BOLD')
+    plan = _bench_per_item('_BNEW')
+    print(f"  JSON-FIND-KEY chain : {legacy:12,.0f}")
+    print(f"  field plan walk     : {plan:12,.0f}")
+    if legacy > 0:
+        print(f"  saved per item      : {legacy - plan:12,.0f}"
+              f"  ({100.0 * (legacy - plan) / legacy:.1f}%)")
+
+
+# Canned API responses, loaded as fixtures (fx()).
+def _bench_post(i):
+    did = f"did:plc:bench{i % 7:04d}"
+    return {"post": {
+        "uri": f"at://{did}/app.bsky.feed.post/3kbench{i:04d}",
+        "cid": f"bafyreibench{i:04d}",
+        "author": {"did": did, "handle": f"user{i % 7}.bsky.social",
+                   "displayName": f"User {i % 7}"},
+        "record": {"$type": "app.bsky.feed.post",
+                   "text": f"Benchmark post {i}: \"quoted\" text with a "
+                           f"line break\nand some more words after it.",
+                   "createdAt": "2026-01-01T00:00:00.000Z"},
+        "replyCount": i % 3, "repostCount": i % 5, "likeCount": i}}
+
+
+def _bench_notif(i):
+    did = f"did:plc:fan{i:04d}"
+    return {"uri": f"at://{did}/app.bsky.feed.like/3knotif{i:04d}",
+            "cid": f"bafyreinotif{i:04d}",
+            "author": {"did": did, "handle": f"fan{i}.bsky.social",
+                       "displayName": f"Fan {i}"},
+            "reason": ("like", "repost", "follow", "reply")[i % 4],
+            "isRead": False, "indexedAt": "2026-01-01T00:00:00.000Z"}
+
+
+def _compact(obj):
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# One full page: _BSK-TL-MAX posts, getTimeline's limit.
+_BENCH_TIMELINE = _compact({"feed": [_bench_post(i) for i in range(10)],
+                            "cursor": "2026-01-01T00:00:00.000Z::bench"})
+_BENCH_POST = _compact(_bench_post(0))
+# One full page: _BSK-NF-MAX notifications, listNotifications' limit.
+_BENCH_NOTIFS = _compact({"notifications": [_bench_notif(i)
+                                            for i in range(10)],
+                          "cursor": "2026-01-01T00:00:00.000Z"})
+_BENCH_PROFILE = _compact({
+    "did": "did:plc:bench0000", "handle": "user0.bsky.social",
+    "displayName": "User 0",
+    "description": "Benchmarks things.\nPosts about \"cycles\".",
+    "followersCount": 1234, "followsCount": 321, "postsCount": 4567})
+_BENCH_URL = "did:plc:bench/app.bsky.feed.post?a=b&c=d e+f/g:h#i~j_k.l-m"
+_BENCH_TEXT = 'He said "hi"\\ then\nleft.\tTabs and\rreturns too.' * 2
+_BENCH_URL_ENC = ("did%3Aplc%3Abench%2Fapp.bsky.feed.post%3Fa%3Db%26c%3Dd"
+                  "%20e%2Bf%2Fg%3Ah%23i~j_k.l-m")
+
+# _BTLP ( a u -- )  Stream a getTimeline body into the cache the way
+# _BSK-TL-LOAD does for a newest page, minus the request.
+_BENCH_TL_PAGE = [
+    ': _BTLP  ( a u -- )',
+    '  _BSK-TL-GEN @ 1 XOR _BSK-TL-WG !  _BSK-TL-WB _BSK-TL-CLEAR',
+    '  _BSK-TL-WN @ _BSK-TL-P0 !  _BSK-TL-WB _BSK-TL-PAGE+',
+    '  0 _BSK-TL-HIT !  0 _BSK-TL-STOP !  0 _BSK-TL-INC !',
+    '  S" feed" S" cursor" [\'] _BSK-TL-ITEM _BSK-SA-BEGIN',
+    '  _BSK-SA-FEED DROP',
+    '  _BSK-TL-GEN @ _BSK-TL-WG !  _BSK-TL-PUBLISH ;',
+]
+
+# _BNFP ( a u -- )  Parse a listNotifications body into the cache the
+# way _BSK-NF-FETCH does, minus the request.
+_BENCH_NF_PAGE = [
+    ': _BNFP  ( a u -- )',
+    '  S" notifications" JSON-FIND-KEY JSON-SKIP-WS 1 /STRING JSON-SKIP-WS',
+    '  _BSK-NF-GEN @ 1 XOR _BSK-NF-WG !  _BSK-NF-WB _BSK-NF-CLEAR',
+    '  BEGIN',
+    '    DUP 0> IF OVER C@ 93 <> ELSE 0 THEN',
+    '    _BSK-NF-WN @ _BSK-NF-MAX < AND',
+    '    DUP IF DROP 2DUP _BSK-ITEM-LEN _BSK-IL !',
+    '      2DUP _BSK-NF-PLAN BSK-FP-WALK',
+    '      _BSK-NFF-REASON BSK-FP-STR NIP _BSK-NF-RMAX MIN',
+    '      _BSK-NFF-HANDLE BSK-FP-STR NIP _BSK-IN-NEED +',
+    '      _BSK-NFF-DID BSK-FP-STR NIP _BSK-IN-NEED +',
+    '      _BSK-NF-WB _BSK-NFB-AR + _BSK-AR-ROOM <= THEN',
+    '  WHILE',
+    '    _BSK-NF-WN @ _BSK-NF-CACHE-SLOTS  1 _BSK-NF-WN +!',
+    '    _BSK-IL @ /STRING JSON-SKIP-WS',
+    '    DUP 0> IF OVER C@ 44 = IF 1 /STRING JSON-SKIP-WS THEN THEN',
+    '  REPEAT 2DROP',
+    '  _BSK-NF-GEN @ _BSK-NF-WG !  _BSK-NF-PUBLISH ;',
+]
+
+
+def _bench_suite():
+    """(name, setup, body, nop, n, probe, expected) for each hot-path
+    benchmark.  *probe* runs the word once after *setup* and must print
+    *expected* (see _bench_verify)."""
+    tl, post, nf = fx(_BENCH_TIMELINE), fx(_BENCH_POST), fx(_BENCH_NOTIFS)
+    pr, url, text = fx(_BENCH_PROFILE), fx(_BENCH_URL), fx(_BENCH_TEXT)
+    tl_up = _BENCH_TL_PAGE + [f"{tl} _BTLP", "0 SCR-SEL !"]
+    return [
+        ("tl.page-parse", _BENCH_TL_PAGE,
+         f"{tl} _BTLP", f"{tl} 2DROP", 3,
+         f"{tl} _BTLP _BSK-TL-N @ . 0 _BSK-TL-HANDLE TYPE",
+         "10 user0.bsky.social"),
+        ("tl.cache-item", ["_BSK-TL-WB _BSK-TL-CLEAR"],
+         f"{post} I _BSK-TL-CACHE-ITEM", f"{post} I DROP 2DROP", 10,
+         f"{post} 0 _BSK-TL-CACHE-ITEM 0 _BSK-TL-CID TYPE",
+         "bafyreibench0000"),
+        ("nf.page-parse", _BENCH_NF_PAGE,
+         f"{nf} _BNFP", f"{nf} 2DROP", 3,
+         f"{nf} _BNFP _BSK-NF-N @ . 9 _BSK-NF-HANDLE TYPE",
+         "10 fan9.bsky.social"),
+        ("pr.walk", [],
+         f"{pr} _BSK-PR-PLAN BSK-FP-WALK", f"{pr} 2DROP", 10,
+         f"{pr} _BSK-PR-PLAN BSK-FP-WALK _BSK-PRF-PC BSK-FP-NUM .",
+         "4567 "),
+        ("url-encode", [],
+         f"BSK-RESET {url} URL-ENCODE", f"BSK-RESET {url} 2DROP", 20,
+         f"BSK-RESET {url} URL-ENCODE BSK-TYPE", _BENCH_URL_ENC),
+        ("json-escape", [],
+         f"BSK-RESET {text} JSON-COPY-ESCAPED", f"BSK-RESET {text} 2DROP", 20,
+         f"BSK-RESET {text} JSON-COPY-ESCAPED BSK-TYPE",
+         json.dumps(_BENCH_TEXT)[1:-1]),
+        ("tl.render", tl_up,
+         "SCR-BSKY-TL", "", 5,
+         "SCR-BSKY-TL", "user0.bsky.social"),
+        ("tl.redraw", tl_up + ["0 SUBSCREEN-ID !  SCR-BSKY-TL"],
+         "SCR-SEL @ 1 XOR SCR-SEL ! _BSK-FR-UPDATE", "", 5,
+         "1 SCR-SEL ! _BSK-FR-UPDATE", "user1.bsky.social"),
+    ]
+
+
+def _bench_verify(setup, probe, expected):
+    """True when *probe*, run once after *setup*, prints *expected*.
+    Only what follows a ### marker counts, so the setup's own output
+    cannot satisfy it."""
+    out = run_forth(setup + ["35 EMIT 35 EMIT 35 EMIT", probe])
+    return expected in out.rpartition("###")[2]
+
+
+_BENCH_FORMAT = 1
+
+
+def bench_hot_words(out_path=None, baseline_path=None, threshold=2.0,
+                    extra=None):
+    """Cycles per call of the bsky.f hot paths on canned responses.
+
+    Writes the results as JSON to *out_path* and, given a baseline
+    file of the same shape, flags every benchmark that got more than
+    *threshold* percent slower.  *extra* adds results measured
+    elsewhere (bench_replay).  A benchmark whose word does not print
+    what it should is left out of the results.  Returns the number of
+    regressions plus wrong outputs.
+    """
+    print("-- Bench: hot words (cycles per call) --\n")
+    suite = _bench_suite()
+    _install_fixtures()
+    results = {}
+    wrong = 0
+    for name, setup, body, nop, n, probe, expected in suite:
+        if not _bench_verify(setup, probe, expected):
+            wrong += 1
+            print(f"  {name:16} {'':>12}  WRONG OUTPUT")
+            continue
+        results[name] = round(_bench_cycles(setup, body, nop, n))
+    results.update(extra or {})
+
+    base = {}
+    if baseline_path:
+        with open(baseline_path) as f:
+            base = json.load(f).get("results", {})
+    regressions = 0
+    for name, cyc in results.items():
+        line = f"  {name:16} {cyc:12,}"
+        if base.get(name):
+            delta = 100.0 * (cyc - base[name]) / base[name]
+            line += f"  {delta:+7.1f}%"
+            if delta > threshold:
+                regressions += 1
+                line += "  REGRESSION"
+        print(line)
+
+    if out_path:
+        with open(out_path, "w") as f:
+            json.dump({"format": _BENCH_FORMAT, "unit": "cycles",
+                       "snapshot": snapshot_key(), "results": results},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n  Results written to {out_path}")
+    if baseline_path:
+        print(f"  {regressions} regression(s) over {threshold:g}%"
+              f" against {baseline_path}")
+    return regressions + wrong
+
+
+# ---------------------------------------------------------------------------
+#  Record / replay  (test_bsky.py --record FILE, --replay FILE)
+# ---------------------------------------------------------------------------
+
+# The recorded session: one timeline fetch after the login.
+_REPLAY_LINES = ['_BSK-TL-FETCH _BSK-TL-N @ . 0 _BSK-TL-HANDLE TYPE CR',
+                 _TL_STATUS]
+
+
+def record_session(path):
+    """Record a login and a timeline fetch to *path*.
+
+    With BSKY_HANDLE and BSKY_PASSWORD set, the exchanges go to the
+    live PDS at BSKY_PDS (default https://bsky.social); otherwise to
+    FakePDS.  The login is made from the harness (the guest's akashic
+    SESS-LOGIN cannot be routed through the stand-in) and installed as
+    in stage 7; the fetch goes over the emulated NIC.
+    """
+    handle = os.environ.get("BSKY_HANDLE")
+    password = os.environ.get("BSKY_PASSWORD")
+    if handle and password:
+        upstream = fake_pds.Upstream(
+            os.environ.get("BSKY_PDS", "https://bsky.social"))
+    else:
+        upstream, _ = fake_server(True)
+        handle, password = upstream.HANDLE, upstream.PASSWORD
+    app = fake_pds.Recorder(upstream)
+    status, data = app.handle(
+        "POST", "/xrpc/com.atproto.server.createSession",
+        {"content-type": "application/json"},
+        json.dumps({"identifier": handle, "password": password}).encode())
+    if status != 200:
+        print(f"  login failed: HTTP {status} {data[:200]!r}")
+        return 1
+    sess = json.loads(data)
+    output, stats, _ = run_forth_net(
+        _session_lines(sess["handle"], sess["did"], sess["accessJwt"])
+        + _REPLAY_LINES, None, app=app)
+    app.save(path)
+    print(f"  {output.strip()}")
+    print(f"  net: {stats.summary()}")
+    print(f"  {len(app.exchanges)} exchange(s) written to {path}")
+    return 0
+
+
+def bench_replay(path, realtime=False):
+    """Cycles the recorded timeline fetch takes when *path* is served
+    back, net of the same session without it.  Returns (cycles,
+    output, NetStats, diverged requests)."""
+    sess = fake_pds.Replay(path).session()
+    login = _session_lines(sess["handle"], sess["did"], sess["accessJwt"])
+
+    def run(lines):
+        app = fake_pds.Replay(path, realtime)
+        app.skip("com.atproto.server.createSession")
+        return app, run_forth_net(login + lines, None, app=app)
+
+    _, (_, _, base) = run([])
+    app, (output, stats, cycles) = run(_REPLAY_LINES)
+    return cycles - base, output, stats, app.diverged
+
+
+def replay_session(path, realtime=False):
+    """Run the recorded session against *path* and report it."""
+    cycles, output, stats, diverged = bench_replay(path, realtime)
+    print(f"  {output.strip()}")
+    print(f"  net: {stats.summary()}")
+    print(f"  _BSK-TL-FETCH: {cycles:,} cycles"
+          f" ({'recorded' if realtime else 'zero'} latency)")
+    if diverged:
+        print(f"  {diverged} request(s) did not match {path}")
+    return 1 if diverged else 0
+
+
+# ---------------------------------------------------------------------------
+#  Frozen image  (test_bsky.py --freeze-check)
+# ---------------------------------------------------------------------------
+
+# Exercised on every boot of the check; the output must not depend on
+# whether bsky.f came from source or from the image.
+_FREEZE_PROBE = ['BSK-RESET S" frozen" BSK-APPEND BSK-BUF BSK-LEN @ TYPE CR',
+                 'BSK-INIT BSK-METRICS-ON BSK-STATS',
+                 'S" bsky.f" TYPE CR']
+
+
+def _image_sources():
+    """(disk path, bytes) of every file a frozen image of the test disk
+    is built from, in load order."""
+    sources = [("kdos.f", Path(KDOS_F).read_bytes()),
+               ("autoexec.f", _TEST_AUTOEXEC.encode("ascii")),
+               ("freeze.f", Path(FREEZE_F).read_bytes()),
+               ("tools.f", Path(TOOLS_F).read_bytes())]
+    for disk_dir, lib_path in AKASHIC_LIBS:
+        p = Path(lib_path)
+        if p.exists():
+            sources.append((f"{disk_dir}/{p.name}", p.read_bytes()))
+    sources += [(os.path.basename(p), Path(p).read_bytes())
+                for p in BSKY_MODULES]
+    return sources
+
+
+def _boot_and_probe(extra):
+    """Boot the test disk plus *extra*, run _FREEZE_PROBE.  Returns
+    (boot steps, boot text, probe output)."""
+    sys_obj, buf = _boot_disk(bytes(build_test_disk(extra).img))
+    steps = _run_to_prompt(sys_obj)
+    boot_text = uart_text(buf)
+    del buf[:]
+    sys_obj.uart.inject_input(
+        ("\n".join(_FREEZE_PROBE) + "\n").encode("ascii"))
+    _run_to_prompt(sys_obj, 500_000_000)
+    return steps, boot_text, uart_text(buf)
+
+
+def freeze_check(out_path=None):
+    """Build a frozen image of the test disk and boot from it.
+
+    Passes when the image boot restores rather than loads, answers
+    _FREEZE_PROBE exactly as a source boot does, and an image whose
+    source hash no longer matches falls back to loading from source.
+    """
+    _assemble_bios()
+    print("  Building image ...")
+    sys_obj, buf = _boot_disk(
+        bytes(build_test_disk([("frz.build", b"")]).img))
+    image = freeze.freeze(sys_obj, buf, _image_sources())
+    info = freeze.unpack(image)
+    print(f"  Image: {len(image):,} bytes, {len(info['ram'])} RAM and"
+          f" {len(info['xmem'])} XMEM extent(s),"
+          f" {len(info['paths'])} sources")
+    if out_path:
+        with open(out_path, "wb") as f:
+            f.write(image)
+        print(f"  Image written to {out_path}")
+
+    stale = bytearray(image)
+    stale[8] ^= 1                      # as if a source had been edited
+    boots = {}
+    for label, extra in (("source", []), ("image", [("bsky.img", image)]),
+                         ("stale", [("bsky.img", bytes(stale))])):
+        boots[label] = _boot_and_probe(extra)
+        print(f"  Boot from {label:6} {boots[label][0]:15,} steps")
+
+    failures = []
+    if "[freeze] restored" not in boots["image"][1]:
+        failures.append("image boot did not restore bsky.img")
+    if "[freeze] restored" in boots["stale"][1]:
+        failures.append("stale image was restored")
+    for label in ("image", "stale"):
+        if boots[label][2] != boots["source"][2]:
+            failures.append(f"{label} boot answers differently:\n"
+                            f"    source: {boots['source'][2]!r}\n"
+                            f"    {label}: {boots[label][2]!r}")
+    if not failures:
+        print(f"  Image boot takes {boots['image'][0] / boots['source'][0]:.1%}"
+              f" of the steps of a source boot")
+    for f in failures:
+        print(f"  FAIL: {f}")
+    return 1 if failures else 0
+
+
+# ---------------------------------------------------------------------------
+#  Boot benchmark  (test_bsky.py --bench-boot)
+# ---------------------------------------------------------------------------
+
+# (name, load line) — what each configuration's autoexec loads where the
+# test autoexec loads the whole client.
+_BOOT_CONFIGS = [("core", "REQUIRE bsky.f"),
+                 ("full", "REQUIRE bsky-tui.f")]
+
+# Run on the core-only system: the first use of a stubbed word loads its
+# module (bsky.f §4.4).
+_LAZY_PROBE = "35 EMIT BSK-PENDING . 35 EMIT CR BSK-PROFILE"
+
+
+def _config_autoexec(load):
+    """The test autoexec up to the client load, with *load* in its place
+    and HERE recorded on either side."""
+    head = _TEST_AUTOEXEC.split("FRZ-LOAD ")[0]
+    return (f"{head}VARIABLE _TH0  HERE _TH0 !\n{load}\n"
+            f"VARIABLE _TH1  HERE _TH1 !\n")
+
+
+def _boot_config(load):
+    """Boot with _config_autoexec(*load*).  Returns (system, uart
+    buffer, boot steps, dictionary bytes the load took)."""
+    fs = build_test_disk(autoexec=_config_autoexec(load))
+    sys_obj, buf = _boot_disk(bytes(fs.img))
+    steps = _run_to_prompt(sys_obj)
+    del buf[:]
+    sys_obj.uart.inject_input(b"35 EMIT _TH1 @ _TH0 @ - . 35 EMIT\n")
+    _run_to_prompt(sys_obj, 100_000_000)
+    m = re.search(r"#(-?\d+) #", uart_text(buf))
+    return sys_obj, buf, steps, int(m.group(1)) if m else -1
+
+
+def bench_boot(out_path=None):
+    """Boot steps and dictionary bytes for each of _BOOT_CONFIGS, then
+    the cost of the core-only client's first write and profile words.
+
+    Returns 1 if those words did not load their modules.
+    """
+    _assemble_bios()
+    results = {}
+    lazy = None
+    for name, load in _BOOT_CONFIGS:
+        sys_obj, buf, steps, here = _boot_config(load)
+        results[f"boot.{name}"] = steps
+        results[f"dict.{name}"] = here
+        print(f"  {name:6} {steps:15,} steps  {here:10,} dictionary bytes")
+        if name == "core":
+            del buf[:]
+            sys_obj.uart.inject_input((_LAZY_PROBE + "\n").encode("ascii"))
+            lazy = (_run_to_prompt(sys_obj, 2_000_000_000), uart_text(buf))
+
+    steps, out = lazy
+    ok = "#0 #" in out and "login first" in out
+    results["boot.lazy"] = steps
+    print(f"  first write + profile word on core: {steps:,} steps"
+          f" ({'modules loaded' if ok else 'FAILED'})")
+    if not ok:
+        print(f"    | {out.strip()[-300:]}")
+
+    if out_path:
+        with open(out_path, "w") as f:
+            json.dump({"format": _BENCH_FORMAT, "unit": "steps",
+                       "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n  Results written to {out_path}")
+    return 0 if ok else 1
+
+
+# ---------------------------------------------------------------------------
+#  Profiler  (test_bsky.py --profile BENCH)
+# ---------------------------------------------------------------------------
+
+# Defining words whose next token names a dictionary entry.
+_DEF_RE = re.compile(r"(?:^|\s)(?::|VARIABLE|CONSTANT|CREATE|BSK-FP-SLOT|"
+                     r"BSK-FP-PLAN)\s+(\S+)")
+_XT_RE = re.compile(r"#(\d+) (-?\d+) ")
+_MAX_WORD = 64 * 1024     # a pc further than this past an xt is unknown
+_MAX_FRAMES = 64          # return-stack cells scanned per sample
+
+_symbols = None           # (sorted xts, names) for the snapshot
+
+
+def _symbol_table():
+    """Map the snapshot's dictionary: (sorted xts, names).
+
+    KDOS is subroutine-threaded, so a word's xt is the start of its
+    code and a pc belongs to the nearest xt at or below it.  Names
+    come from WORDS plus every definition in the loaded sources;
+    each is ticked in a session to get its xt (names that no longer
+    resolve are dropped).
+    """
+    global _symbols
+    if _symbols is not None:
+        return _symbols
+    names = set(run_forth(["WORDS"]).split()) - {"ok", "WORDS", "BYE"}
+    sources = [KDOS_F, TOOLS_F] + BSKY_MODULES + [p for _, p in AKASHIC_LIBS]
+    for path in sources:
+        try:
+            names.update(_DEF_RE.findall(Path(path).read_text("latin-1")))
+        except OSError:
+            pass
+    names.update(_DEF_RE.findall(_TEST_AUTOEXEC))
+    names = sorted(names)
+    lines = [f"' {name} {i} 35 EMIT . ." for i, name in enumerate(names)]
+    xts = {}
+    for m in _XT_RE.finditer(run_forth(lines, 500_000_000)):
+        xt = int(m.group(2)) & ((1 << 64) - 1)
+        xts.setdefault(xt, names[int(m.group(1))])
+    order = sorted(xts)
+    _symbols = (order, [xts[a] for a in order])
+    return _symbols
+
+
+def _word_at(pc):
+    xts, names = _symbol_table()
+    i = bisect.bisect_right(xts, pc) - 1
+    if i < 0 or pc - xts[i] > _MAX_WORD:
+        return None
+    return names[i]
+
+
+def _call_stack(sys_obj, rsp_base):
+    """Words on the path to the current pc, outermost first.
+
+    The return stack is scanned from the stack pointer up to where it
+    stood at the snapshot prompt; every cell that points into a known
+    word counts as a return address.  Cells that happen to look like
+    code addresses can add spurious frames, so treat the stacks as a
+    guide rather than an exact unwinding.
+    """
+    cpu = sys_obj.cpu
+    stack = [_word_at(cpu.pc) or f"?{cpu.pc:#x}"]
+    sp = cpu.regs[cpu.spsel]
+    end = min(rsp_base, sp + 8 * _MAX_FRAMES, len(cpu.mem) - 7)
+    for a in range(sp, end, 8):
+        word = _word_at(int.from_bytes(cpu.mem[a:a + 8], "little"))
+        if word is not None:
+            stack.append(word)
+    stack.reverse()
+    return stack
+
+
+def profile_forth(lines, every=1000, max_steps=500_000_000):
+    """Run *lines* sampling the call stack every *every* instructions.
+
+    Returns {stack tuple: samples}, idle samples excluded.
+    """
+    _symbol_table()
+    rsp_base = _snapshot[2]['regs'][_snapshot[2]['spsel']]
+    samples = {}
+
+    def sample(sys_obj):
+        if sys_obj.cpu.idle or sys_obj.cpu.halted:
+            return
+        stack = tuple(_call_stack(sys_obj, rsp_base))
+        samples[stack] = samples.get(stack, 0) + 1
+
+    _run_session(lines, max_steps, step=every, on_step=sample)
+    return samples
+
+
+def profile_report(samples, folded_path=None, top=25):
+    """Print flat (self) and inclusive profiles; write folded stacks
+    (flamegraph.pl / speedscope input) to *folded_path*."""
+    total = sum(samples.values()) or 1
+    flat, incl = {}, {}
+    for stack, n in samples.items():
+        flat[stack[-1]] = flat.get(stack[-1], 0) + n
+        for word in set(stack):
+            incl[word] = incl.get(word, 0) + n
+
+    for title, table in (("self", flat), ("inclusive", incl)):
+        print(f"  {title:>9}  samples      %  word")
+        ranked = sorted(table.items(), key=lambda kv: (-kv[1], kv[0]))
+        for word, n in ranked[:top]:
+            print(f"  {'':>9}  {n:7,}  {100.0 * n / total:5.1f}  {word}")
+        print()
+
+    if folded_path:
+        with open(folded_path, "w") as f:
+            for stack, n in sorted(samples.items()):
+                f.write(";".join(stack) + f" {n}\n")
+        print(f"  Folded stacks written to {folded_path}")
+
+
+def profile_bench(name, every, folded_path):
+    """Profile the body loop of bench *name* (see _bench_suite())."""
+    suite = {b[0]: b for b in _bench_suite()}
+    if name not in suite:
+        print(f"  Unknown bench {name!r}; one of: {', '.join(suite)}")
+        return 1
+    _, setup, body, _, n, _, _ = suite[name]
+    _install_fixtures()
+    print(f"-- Profile: {name} (every {every} steps) --\n")
+    samples = profile_forth(
+        setup + [f': _BLOOP {n} 0 DO {body} LOOP ; _BLOOP'], every)
+    print(f"  {sum(samples.values()):,} samples,"
+          f" {len(_symbols[0]):,} words resolved\n")
+    profile_report(samples, folded_path)
+    return 0
 
 
 # ---------------------------------------------------------------------------
 #  Main
 # ---------------------------------------------------------------------------
 
+def _arg_value(flags, default=None):
+    """Value following the first of *flags* on the command line;
+    *default* when the flag is last or followed by another flag."""
+    args = sys.argv[1:]
+    for flag in flags:
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 < len(args) and not args[i + 1].startswith("--"):
+                return args[i + 1]
+    return default
+
+
+def _jobs_arg():
+    """Worker count from -j N / --jobs N (default: CPU count)."""
+    jobs = _arg_value(("-j", "--jobs"))
+    if jobs is not None:
+        return max(1, int(jobs))
+    return os.cpu_count() or 1
+
+
 def main():
-    global _pass, _fail, _errors
+    global _pass, _fail, _errors, FULL_RESTORE, BATCH, LINE_INPUT
 
     print("=" * 60)
     print("  bsky.f Test Suite")
     print("=" * 60)
     print()
 
+    if "--freeze-check" in sys.argv[1:]:
+        return freeze_check(_arg_value(("--freeze-out",)))
+    if "--bench-boot" in sys.argv[1:]:
+        return bench_boot(_arg_value(("--bench-out",)))
+
     print("Building snapshot (disk image -> KDOS -> bsky.f) ...")
-    boot_text = build_snapshot()
+    boot_text = load_snapshot(use_cache="--no-cache" not in sys.argv[1:])
 
     # Show last few lines of boot output
     boot_lines = boot_text.strip().split("\n")
@@ -1154,19 +3094,56 @@ def main():
             print(f"    | {el}")
         print()
 
-    test_stage0()
-    print()
-    test_stage1()
-    print()
-    test_stage2()
-    print()
-    test_stage3()
-    print()
-    test_stage4()
-    print()
-    test_stage5()
-    print()
-    test_stage6()
+    FULL_RESTORE = "--full-restore" in sys.argv[1:]
+    BATCH = "--no-batch" not in sys.argv[1:]
+    LINE_INPUT = "--line-input" in sys.argv[1:]
+
+    if "--profile" in sys.argv[1:]:
+        return profile_bench(
+            _arg_value(("--profile",), "tl.page-parse"),
+            int(_arg_value(("--profile-every",), "1000")),
+            _arg_value(("--profile-out",), "profile.folded"))
+
+    replay = _arg_value(("--replay",))
+    realtime = "--replay-realtime" in sys.argv[1:]
+
+    if "--record" in sys.argv[1:]:
+        return record_session(_arg_value(("--record",), "session.replay"))
+
+    if "--bench" in sys.argv[1:]:
+        bench_field_plan()
+        print()
+        extra = {}
+        diverged = 0
+        if replay:
+            cycles, _, _, diverged = bench_replay(replay, realtime)
+            if diverged:
+                print(f"  {diverged} request(s) did not match {replay};"
+                      f" tl.fetch.replay not timed")
+            else:
+                extra["tl.fetch.replay"] = cycles
+        regressions = bench_hot_words(
+            _arg_value(("--bench-out",)),
+            _arg_value(("--bench-baseline",)),
+            float(_arg_value(("--bench-threshold",), "2")),
+            extra)
+        return 1 if regressions or diverged else 0
+
+    if replay:
+        return replay_session(replay, realtime)
+
+    stages = [test_stage0, test_stage1, test_stage2, test_stage3,
+              test_stage4, test_stage5, test_stage6, test_stage7]
+    jobs = _jobs_arg()
+    if "fork" not in multiprocessing.get_all_start_methods():
+        jobs = 1
+    run_checks(stages, jobs)
+
+    net_out = _arg_value(("--net-out",))
+    if net_out:
+        with open(net_out, "w") as f:
+            json.dump(_net_totals, f, indent=1, sort_keys=True)
+        print(f"  Network totals written to {net_out}")
 
     print()
     print("=" * 60)